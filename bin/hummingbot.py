@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 import path_util        # noqa: F401
+import argparse
 import asyncio
 import errno
 import socket
@@ -23,6 +24,18 @@ from hummingbot import (
 from hummingbot.client.ui import login_prompt
 from hummingbot.client.ui.stdout_redirection import patch_stdout
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.import_profiler import (
+    format_import_profile,
+    profile_imports,
+)
+
+
+class CmdlineParser(argparse.ArgumentParser):
+    def __init__(self):
+        super().__init__()
+        self.add_argument("--profile-startup",
+                          action="store_true",
+                          help="Print how long the client's modules take to import at startup, and exit.")
 
 
 def detect_available_port(starting_port: int) -> int:
@@ -69,7 +82,11 @@ async def main():
 
 
 if __name__ == "__main__":
-    chdir_to_data_directory()
-    if login_prompt():
-        ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
-        ev_loop.run_until_complete(main())
+    args = CmdlineParser().parse_args()
+    if args.profile_startup:
+        print(format_import_profile(profile_imports()))
+    else:
+        chdir_to_data_directory()
+        if login_prompt():
+            ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+            ev_loop.run_until_complete(main())
@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+
+import asyncio
+import logging
+import os
+import time
+from decimal import Decimal
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from hummingbot.backtest.backtest_recorder import (
+    BacktestRecorder,
+    BacktestResult,
+)
+from hummingbot.backtest.recorded_market_data import (
+    RecordedMarketData,
+    RecordedOrderBookTracker,
+    RecordedTargetMarket,
+)
+from hummingbot.connector.exchange.paper_trade.market_config import MarketConfig
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.logger import HummingbotLogger
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.strategy_base import StrategyBase
+
+s_logger = None
+
+
+class BacktestApplication:
+    """
+    Takes the place of HummingbotApplication for a strategy's start() function, so strategies are set up for a
+    backtest by their own unmodified start files. The markets it initializes are paper trade connectors whose order
+    books are replayed from recorded market data.
+
+    Recorded data is looked up in the `{data_path}/{connector name}` directory, the layout order book message captures
+    are written in, or in `data_path` itself when there's no such directory.
+    """
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global s_logger
+        if s_logger is None:
+            s_logger = logging.getLogger(__name__)
+        return s_logger
+
+    def __init__(self,
+                 strategy_name: str,
+                 strategy_file_name: str,
+                 data_path: str,
+                 balances: Dict[str, Decimal],
+                 tick_size: float = 1.0,
+                 queue_position_fill: bool = False):
+        self.strategy_name: str = strategy_name
+        self.strategy_file_name: str = strategy_file_name
+        self.strategy: Optional[StrategyBase] = None
+        self.markets: Dict[str, ExchangeBase] = {}
+        self.market_trading_pairs_map: Dict[str, List[str]] = {}
+        self.market_trading_pair_tuples: List[MarketTradingPairTuple] = []
+        self.market_data: List[RecordedMarketData] = []
+        self.assets: Set[str] = set()
+        self.notifications: List[str] = []
+        # Strategy start files only look these up for features backtests don't support.
+        self.trade_fill_db = None
+        self.wallet = None
+        self._data_path: str = data_path
+        self._balances: Dict[str, Decimal] = balances
+        self._tick_size: float = tick_size
+        self._queue_position_fill: bool = queue_position_fill
+
+    def capture_path(self, connector_name: str) -> str:
+        connector_path: str = os.path.join(self._data_path, connector_name)
+        return connector_path if os.path.isdir(connector_path) else self._data_path
+
+    def _notify(self, msg: str):
+        self.notifications.append(msg)
+        self.logger().info(msg)
+
+    @staticmethod
+    def _initialize_market_assets(market_name: str, trading_pairs: List[str]) -> List[Tuple[str, str]]:
+        market_trading_pairs: List[Tuple[str, str]] = [(trading_pair.split('-')) for trading_pair in trading_pairs]
+        return market_trading_pairs
+
+    def _initialize_wallet(self, token_trading_pairs: List[str]):
+        pass
+
+    def _initialize_markets(self, market_names: List[Tuple[str, List[str]]]):
+        for market_name, trading_pairs in market_names:
+            if market_name not in self.market_trading_pairs_map:
+                self.market_trading_pairs_map[market_name] = []
+            for hb_trading_pair in trading_pairs:
+                self.market_trading_pairs_map[market_name].append(hb_trading_pair)
+
+        for connector_name, trading_pairs in self.market_trading_pairs_map.items():
+            market_data = RecordedMarketData(self.capture_path(connector_name), trading_pairs, self._tick_size)
+            connector = PaperTradeExchange(RecordedOrderBookTracker(connector_name, market_data),
+                                           MarketConfig.default_config(),
+                                           RecordedTargetMarket,
+                                           queue_position_fill=self._queue_position_fill)
+            for asset, balance in self._balances.items():
+                connector.set_balance(asset, balance)
+            self.market_data.append(market_data)
+            self.markets[connector_name] = connector
+
+    def run(self,
+            start_time: Optional[float] = None,
+            end_time: Optional[float] = None,
+            sample_interval: float = 60.0) -> BacktestResult:
+        """
+        Runs the strategy against the recorded market data, on a fast forwarding backtest clock that only runs the
+        ticks with market data or strategy timers due. Inventory and PnL are sampled every `sample_interval` seconds of
+        market time.
+
+        :param start_time: defaults to the capture time of the first recorded message
+        :param end_time: defaults to the end of the recorded messages
+        """
+        if start_time is None:
+            start_time = min(market_data.first_timestamp for market_data in self.market_data)
+        if end_time is None:
+            end_time = float("inf")
+        if not start_time < end_time:
+            raise ValueError(f"{self._data_path} has no recorded market data for the backtest.")
+        clock = Clock(ClockMode.BACKTEST, self._tick_size, start_time, end_time, fast_forward=True)
+        # Market data first, so the markets and the strategy see the order books of the current tick.
+        for market_data in self.market_data:
+            clock.add_iterator(market_data)
+        for market in self.markets.values():
+            clock.add_iterator(market)
+        clock.add_iterator(self.strategy)
+        recorder = BacktestRecorder(self.market_trading_pair_tuples[0])
+        ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+        run_start: float = time.perf_counter()
+        timestamp: float = start_time
+        while timestamp < end_time and not all(market_data.finished for market_data in self.market_data):
+            timestamp = min(timestamp + sample_interval, end_time)
+            clock.backtest_til(timestamp)
+            # Run the order events the markets scheduled on the event loop.
+            ev_loop.run_until_complete(asyncio.sleep(0))
+            recorder.sample(clock.current_timestamp)
+        return BacktestResult(trades=recorder.trades,
+                              inventory=recorder.inventory,
+                              start_time=start_time,
+                              end_time=clock.current_timestamp,
+                              ticks=clock.ticks,
+                              messages_applied=sum(market_data.messages_applied for market_data in self.market_data),
+                              run_time=time.perf_counter() - run_start)
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+
+from decimal import Decimal
+from typing import (
+    Any,
+    Dict,
+    List,
+    NamedTuple,
+    Tuple,
+)
+
+import numpy as np
+
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import (
+    MarketEvent,
+    OrderFilledEvent,
+    TradeType,
+)
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+
+TRADES_DTYPE = np.dtype([
+    ("timestamp", np.float64),
+    # 1 for buys, -1 for sells
+    ("side", np.int8),
+    ("price", np.float64),
+    ("amount", np.float64),
+    # In the quote asset
+    ("fee", np.float64),
+])
+
+INVENTORY_DTYPE = np.dtype([
+    ("timestamp", np.float64),
+    ("mid_price", np.float64),
+    ("base_balance", np.float64),
+    ("quote_balance", np.float64),
+    # Portfolio value in the quote asset, at the mid price
+    ("value", np.float64),
+    # Portfolio value less the value of the starting balances at the mid price, as in the history command
+    ("pnl", np.float64),
+])
+
+
+class BacktestResult(NamedTuple):
+    trades: np.ndarray
+    inventory: np.ndarray
+    start_time: float
+    end_time: float
+    ticks: int
+    messages_applied: int
+    # Wall clock seconds the backtest took to run
+    run_time: float
+
+    @property
+    def summary(self) -> Dict[str, Any]:
+        trades: np.ndarray = self.trades
+        return {
+            "trades": len(trades),
+            "buys": int(np.count_nonzero(trades["side"] > 0)),
+            "sells": int(np.count_nonzero(trades["side"] < 0)),
+            "volume": float(np.sum(trades["price"] * trades["amount"])),
+            "fees": float(np.sum(trades["fee"])),
+            "final_value": float(self.inventory["value"][-1]) if len(self.inventory) > 0 else np.nan,
+            "pnl": float(self.inventory["pnl"][-1]) if len(self.inventory) > 0 else np.nan,
+            "ticks": self.ticks,
+            "run_time": self.run_time,
+        }
+
+
+class BacktestRecorder:
+    """
+    Records the fills of a backtest's market, and samples its inventory and PnL whenever sample() is called.
+    """
+
+    def __init__(self, market_info: MarketTradingPairTuple):
+        self._market_info: MarketTradingPairTuple = market_info
+        self._trades: List[Tuple[float, int, float, float, float]] = []
+        self._inventory: List[Tuple[float, float, float, float, float, float]] = []
+        self._start_balances: Tuple[Decimal, Decimal] = (market_info.base_balance, market_info.quote_balance)
+        self._fill_forwarder: EventForwarder = EventForwarder(self._did_fill_order)
+        market_info.market.add_listener(MarketEvent.OrderFilled, self._fill_forwarder)
+
+    @property
+    def trades(self) -> np.ndarray:
+        return np.array(self._trades, dtype=TRADES_DTYPE)
+
+    @property
+    def inventory(self) -> np.ndarray:
+        return np.array(self._inventory, dtype=INVENTORY_DTYPE)
+
+    def _did_fill_order(self, event: OrderFilledEvent):
+        if event.trading_pair != self._market_info.trading_pair:
+            return
+        fee: Decimal = event.trade_fee.fee_amount_in_quote(event.trading_pair, event.price, event.amount)
+        self._trades.append((event.timestamp,
+                             1 if event.trade_type is TradeType.BUY else -1,
+                             float(event.price),
+                             float(event.amount),
+                             float(fee)))
+
+    def sample(self, timestamp: float):
+        if not self._market_info.market.ready:
+            return
+        mid_price: Decimal = self._market_info.get_mid_price()
+        if not mid_price.is_finite():
+            return
+        base_balance: Decimal = self._market_info.base_balance
+        quote_balance: Decimal = self._market_info.quote_balance
+        start_base_balance, start_quote_balance = self._start_balances
+        value: Decimal = base_balance * mid_price + quote_balance
+        hold_value: Decimal = start_base_balance * mid_price + start_quote_balance
+        self._inventory.append((timestamp,
+                                float(mid_price),
+                                float(base_balance),
+                                float(quote_balance),
+                                float(value),
+                                float(value - hold_value)))
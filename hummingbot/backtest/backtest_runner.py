@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+
+import argparse
+import itertools
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.backtest.backtest_application import BacktestApplication
+from hummingbot.backtest.backtest_recorder import BacktestResult
+from hummingbot.client.config.config_helpers import (
+    get_strategy_config_map,
+    get_strategy_starter_file,
+    missing_required_configs,
+    parse_cvar_value,
+    strategy_name_from_file,
+    yaml_parser,
+)
+from hummingbot.client.config.config_var import ConfigVar
+
+SUPPORTED_STRATEGIES = ["pure_market_making", "avellaneda_market_making"]
+OUTPUT_FORMATS = ["npy", "parquet"]
+
+
+def load_strategy_config(strategy_file_path: str, overrides: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Loads a strategy config file, and the overridden values on top of it, into the strategy's config map.
+
+    Unlike when a strategy is imported into the client, values are only parsed. Validators check values against the
+    live exchanges, which has no bearing on a backtest.
+
+    :return: the strategy name
+    """
+    overrides = overrides or {}
+    strategy: Optional[str] = strategy_name_from_file(strategy_file_path)
+    if strategy not in SUPPORTED_STRATEGIES:
+        raise ValueError(f"Backtests can run the {', '.join(SUPPORTED_STRATEGIES)} strategies, "
+                         f"{strategy_file_path} is a {strategy} config.")
+    config_map: Dict[str, ConfigVar] = get_strategy_config_map(strategy)
+    unknown_keys: List[str] = [key for key in overrides if key not in config_map]
+    if len(unknown_keys) > 0:
+        raise ValueError(f"Invalid {strategy} config keys: {', '.join(unknown_keys)}.")
+    with open(strategy_file_path) as stream:
+        data: Dict[str, Any] = yaml_parser.load(stream) or {}
+    for key, cvar in config_map.items():
+        value = overrides.get(key, data.get(key))
+        if (value is None or value == "") and cvar.default is not None:
+            cvar.value = cvar.default
+        else:
+            cvar.value = parse_cvar_value(cvar, value)
+
+    price_source: Optional[ConfigVar] = config_map.get("price_source")
+    if price_source is not None and price_source.value not in (None, "current_market"):
+        raise ValueError("Backtests only support the current_market price source.")
+    price_type: Optional[ConfigVar] = config_map.get("price_type")
+    if price_type is not None and price_type.value == "inventory_cost":
+        raise ValueError("Backtests don't support the inventory_cost price type.")
+    missing_configs: List[ConfigVar] = missing_required_configs(config_map)
+    if len(missing_configs) > 0:
+        raise ValueError(f"Missing {strategy} configs: {', '.join(c.key for c in missing_configs)}.")
+    return strategy
+
+
+def run_backtest(strategy_file_path: str,
+                 data_path: str,
+                 balances: Dict[str, Decimal],
+                 overrides: Optional[Dict[str, Any]] = None,
+                 start_time: Optional[float] = None,
+                 end_time: Optional[float] = None,
+                 tick_size: float = 1.0,
+                 sample_interval: float = 60.0,
+                 queue_position_fill: bool = False) -> BacktestResult:
+    """
+    Runs a strategy, set up by its own start file from a config file, against recorded order book messages.
+
+    The strategy and its paper trade markets are driven by a fast forwarding backtest clock, which only runs the ticks
+    with market data or timers due. Inventory and PnL are sampled every `sample_interval` seconds of market time.
+
+    :param strategy_file_path: strategy config file
+    :param data_path: order book message capture directory, see BacktestApplication
+    :param balances: starting balances of the paper trade markets
+    :param overrides: strategy config values to use instead of those from the config file
+    :param start_time: defaults to the capture time of the first recorded message
+    :param end_time: defaults to the end of the recorded messages
+    """
+    from hummingbot.client.hummingbot_application import HummingbotApplication
+    strategy: str = load_strategy_config(strategy_file_path, overrides)
+    app = BacktestApplication(strategy, os.path.basename(strategy_file_path), data_path, balances,
+                              tick_size=tick_size,
+                              queue_position_fill=queue_position_fill)
+    main_app: Optional[HummingbotApplication] = HummingbotApplication._main_app
+    # Strategies notify the main application about their orders and fills.
+    HummingbotApplication._main_app = app
+    try:
+        get_strategy_starter_file(strategy)(app)
+        if app.strategy is None:
+            raise ValueError(f"Could not start the {strategy} strategy. {' '.join(app.notifications)}")
+        return app.run(start_time, end_time, sample_interval)
+    finally:
+        HummingbotApplication._main_app = main_app
+
+
+def write_backtest_result(result: BacktestResult, output_dir: str, output_format: str = "npy"):
+    """
+    Writes the trades and inventory time series of a backtest to `trades` and `inventory` files in the output
+    directory, as NumPy structured arrays or Parquet tables (which needs pyarrow or fastparquet installed).
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    for name, series in (("trades", result.trades), ("inventory", result.inventory)):
+        if output_format == "npy":
+            np.save(os.path.join(output_dir, f"{name}.npy"), series)
+        elif output_format == "parquet":
+            pd.DataFrame(series).to_parquet(os.path.join(output_dir, f"{name}.parquet"))
+        else:
+            raise ValueError(f"Unknown backtest output format {output_format}, expected one of {OUTPUT_FORMATS}.")
+
+
+def run_parameter_set(strategy_file_path: str,
+                      data_path: str,
+                      output_dir: Optional[str],
+                      output_format: str,
+                      parameters: Dict[str, Any],
+                      **kwargs) -> Dict[str, Any]:
+    result: BacktestResult = run_backtest(strategy_file_path, data_path, overrides=parameters, **kwargs)
+    if output_dir is not None:
+        write_backtest_result(result, output_dir, output_format)
+    return dict(parameters, **result.summary)
+
+
+def run_parameter_sets(strategy_file_path: str,
+                       data_path: str,
+                       parameter_sets: List[Dict[str, Any]],
+                       output_dir: Optional[str] = None,
+                       output_format: str = "npy",
+                       workers: Optional[int] = None,
+                       **kwargs) -> pd.DataFrame:
+    """
+    Backtests each parameter set, a dict of strategy config overrides, in its own process of a process pool. The
+    results of the i-th parameter set are written to the `run_{i}` sub directory of the output directory.
+
+    :param workers: number of processes, defaults to the number of CPUs
+    :param kwargs: run_backtest() arguments
+    :return: one summary row per parameter set
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_parameter_set,
+                                   strategy_file_path,
+                                   data_path,
+                                   os.path.join(output_dir, f"run_{i}") if output_dir is not None else None,
+                                   output_format,
+                                   parameters,
+                                   **kwargs)
+                   for i, parameters in enumerate(parameter_sets)]
+        summaries: List[Dict[str, Any]] = [future.result() for future in futures]
+    return pd.DataFrame(summaries)
+
+
+def parameter_grid(parameters: List[str]) -> List[Dict[str, str]]:
+    """
+    Every combination of the values of `key=value1,value2,...` parameters.
+    """
+    keys: List[str] = []
+    values: List[List[str]] = []
+    for parameter in parameters:
+        key, _, parameter_values = parameter.partition("=")
+        keys.append(key.strip())
+        values.append([value.strip() for value in parameter_values.split(",")])
+    return [dict(zip(keys, combination)) for combination in itertools.product(*values)]
+
+
+def parse_balances(balances: List[str]) -> Dict[str, Decimal]:
+    parsed: Dict[str, Decimal] = {}
+    for balance in balances:
+        asset, _, amount = balance.partition("=")
+        parsed[asset.strip().upper()] = Decimal(amount)
+    return parsed
+
+
+class CmdlineParser(argparse.ArgumentParser):
+    def __init__(self):
+        super().__init__(description="Backtests a strategy config against recorded order book data.")
+        self.add_argument("config_file",
+                          type=str,
+                          help="Strategy config file.")
+        self.add_argument("data_path",
+                          type=str,
+                          help="Directory of the recorded order book messages, see order_book_capture_dir.")
+        self.add_argument("--balance", "-b",
+                          action="append",
+                          required=True,
+                          help="Starting balance of an asset, e.g. --balance BTC=1 --balance USDT=10000.")
+        self.add_argument("--param",
+                          action="append",
+                          default=[],
+                          help="Strategy config values to backtest, e.g. --param bid_spread=0.1,0.2 runs a backtest "
+                               "for each value. Several parameters run every combination of their values.")
+        self.add_argument("--output-dir", "-o",
+                          type=str,
+                          required=False,
+                          help="Directory to write the trades and inventory time series to.")
+        self.add_argument("--format",
+                          choices=OUTPUT_FORMATS,
+                          default="npy",
+                          help="Output file format.")
+        self.add_argument("--workers",
+                          type=int,
+                          required=False,
+                          help="Number of parameter sets backtested in parallel, defaults to the number of CPUs.")
+        self.add_argument("--start-time",
+                          type=float,
+                          required=False,
+                          help="Unix timestamp to start the backtest at, defaults to the start of the data.")
+        self.add_argument("--end-time",
+                          type=float,
+                          required=False,
+                          help="Unix timestamp to end the backtest at, defaults to the end of the data.")
+        self.add_argument("--tick-size",
+                          type=float,
+                          default=1.0,
+                          help="Clock tick size in seconds.")
+        self.add_argument("--sample-interval",
+                          type=float,
+                          default=60.0,
+                          help="Seconds between inventory and PnL samples.")
+        self.add_argument("--queue-position-fill",
+                          action="store_true",
+                          help="Only fill limit orders once the volume ahead of them has traded.")
+        self.add_argument("--log-level",
+                          type=str,
+                          default="WARNING",
+                          help="Log level.")
+
+
+def main():
+    args = CmdlineParser().parse_args()
+    logging.basicConfig(level=args.log_level.upper())
+    backtest_kwargs = {
+        "balances": parse_balances(args.balance),
+        "start_time": args.start_time,
+        "end_time": args.end_time,
+        "tick_size": args.tick_size,
+        "sample_interval": args.sample_interval,
+        "queue_position_fill": args.queue_position_fill,
+    }
+    parameter_sets: List[Dict[str, str]] = parameter_grid(args.param)
+    if len(parameter_sets) > 1:
+        summaries: pd.DataFrame = run_parameter_sets(args.config_file, args.data_path, parameter_sets,
+                                                     output_dir=args.output_dir,
+                                                     output_format=args.format,
+                                                     workers=args.workers,
+                                                     **backtest_kwargs)
+    else:
+        summaries = pd.DataFrame([run_parameter_set(args.config_file, args.data_path, args.output_dir, args.format,
+                                                    parameter_sets[0], **backtest_kwargs)])
+    if args.output_dir is not None:
+        summaries.to_csv(os.path.join(args.output_dir, "summary.csv"), index=False)
+    print(summaries.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessageType
+from hummingbot.core.data_type.order_book_message_capture import (
+    CapturedOrderBookMessage,
+    OrderBookMessageCaptureReader,
+)
+from hummingbot.core.event.events import (
+    OrderBookTradeEvent,
+    TradeType,
+)
+from hummingbot.core.py_time_iterator import PyTimeIterator
+
+NaN = float("nan")
+
+
+class RecordedMarketData(PyTimeIterator):
+    """
+    Applies the order book messages of a capture, written by OrderBookMessageCapture, to the order books of a backtest
+    as the clock reaches the time they were captured at.
+
+    It wakes the clock up at the capture time of its next message, so a fast forwarding backtest clock only runs the
+    ticks with market data, and the ticks the strategies and connectors ask for. The tick before each message is run
+    too, so the other iterators have been ticked a tick ago when the message comes in, as when every tick is run, and
+    the orders and fills it leads to get the same timestamps.
+    """
+    def __init__(self, capture_path: str, trading_pairs: List[str], tick_size: float = 1.0):
+        super().__init__()
+        self._capture_path: str = capture_path
+        self._tick_size: float = tick_size
+        self._order_books: Dict[str, OrderBook] = {trading_pair: CompositeOrderBook()
+                                                   for trading_pair in trading_pairs}
+        self._messages: Iterator[CapturedOrderBookMessage] = iter(OrderBookMessageCaptureReader(capture_path))
+        self._next_message: Optional[CapturedOrderBookMessage] = None
+        self._snapshots_pending: set = set(trading_pairs)
+        self.messages_applied: int = 0
+        # Set by the connectors wrapping a RecordedOrderBookTracker around the market data, not used by the backtest.
+        self.order_book_create_function = None
+        self._advance()
+
+    @property
+    def order_books(self) -> Dict[str, OrderBook]:
+        return self._order_books
+
+    @property
+    def ready(self) -> bool:
+        """
+        True once every order book has been initialized from a recorded snapshot.
+        """
+        return len(self._snapshots_pending) == 0
+
+    @property
+    def finished(self) -> bool:
+        return self._next_message is None
+
+    @property
+    def first_timestamp(self) -> float:
+        """
+        Capture time of the next message to be applied, the first one of the capture before the backtest starts.
+        """
+        return self._next_message.capture_time if self._next_message is not None else NaN
+
+    def _advance(self):
+        self._next_message = None
+        for captured in self._messages:
+            if captured.message.trading_pair in self._order_books:
+                self._next_message = captured
+                return
+
+    def tick(self, timestamp: float):
+        while self._next_message is not None and self._next_message.capture_time <= timestamp:
+            self._apply(self._next_message)
+            self._advance()
+
+    def next_wakeup_time(self, timestamp: float) -> float:
+        if self._next_message is None:
+            return NaN
+        return self._next_message.capture_time - self._tick_size
+
+    def _apply(self, captured: CapturedOrderBookMessage):
+        message = captured.message
+        trading_pair: str = message.trading_pair
+        order_book: OrderBook = self._order_books[trading_pair]
+        if message.type is OrderBookMessageType.SNAPSHOT:
+            order_book.apply_snapshot_message(message)
+            self._snapshots_pending.discard(trading_pair)
+        elif trading_pair in self._snapshots_pending:
+            # Diffs and trades before the first snapshot have nothing to apply to.
+            return
+        elif message.type is OrderBookMessageType.DIFF:
+            if order_book.snapshot_uid > message.update_id:
+                return
+            order_book.apply_diff_message(message)
+        elif message.type is OrderBookMessageType.TRADE:
+            content = message.content
+            order_book.apply_trade(OrderBookTradeEvent(
+                trading_pair=trading_pair,
+                timestamp=captured.capture_time,
+                price=float(content["price"]),
+                amount=float(content["amount"]),
+                type=TradeType.SELL if content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
+            ))
+        self.messages_applied += 1
+
+
+class RecordedOrderBookTracker:
+    """
+    Stands in for an exchange's order book tracker in the paper trade connectors of a backtest. The order books are
+    kept up to date by the clock ticking the recorded market data, so there is nothing to start or stop.
+    """
+
+    def __init__(self, exchange_name: str, market_data: RecordedMarketData):
+        self._exchange_name: str = exchange_name
+        self._data_source: RecordedMarketData = market_data
+
+    @property
+    def exchange_name(self) -> str:
+        return self._exchange_name
+
+    @property
+    def data_source(self) -> RecordedMarketData:
+        return self._data_source
+
+    @property
+    def order_books(self) -> Dict[str, OrderBook]:
+        return self._data_source.order_books
+
+    @property
+    def ready(self) -> bool:
+        return self._data_source.ready
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+class RecordedTargetMarket:
+    """
+    Trading pairs are captured in Hummingbot's BASE-QUOTE format, so the paper trade connectors of a backtest don't
+    need the exchange's connector class to convert them.
+    """
+
+    @staticmethod
+    def convert_from_exchange_trading_pair(trading_pair: str) -> str:
+        return trading_pair
+
+    @staticmethod
+    def convert_to_exchange_trading_pair(trading_pair: str) -> str:
+        return trading_pair
+
+    @staticmethod
+    def split_trading_pair(trading_pair: str) -> Tuple[str, str]:
+        base_asset, quote_asset = trading_pair.split("-")
+        return base_asset, quote_asset
@@ -21,12 +21,6 @@ from hummingbot.client.config.security import Security
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.model.inventory_cost import InventoryCost
-from hummingbot.strategy.pure_market_making import (
-    PureMarketMakingStrategy
-)
-from hummingbot.strategy.perpetual_market_making import (
-    PerpetualMarketMakingStrategy
-)
 from hummingbot.user.user_balances import UserBalances
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -117,6 +111,13 @@ class ConfigCommand:
             return True
         return False
 
+    @staticmethod
+    def _is_market_making_strategy(strategy) -> bool:
+        # The strategy modules are imported here rather than at startup, as they're slow to import.
+        from hummingbot.strategy.pure_market_making import PureMarketMakingStrategy
+        from hummingbot.strategy.perpetual_market_making import PerpetualMarketMakingStrategy
+        return isinstance(strategy, (PureMarketMakingStrategy, PerpetualMarketMakingStrategy))
+
     async def _config_single_key(self,  # type: HummingbotApplication
                                  key: str,
                                  input_value):
@@ -158,8 +159,7 @@ class ConfigCommand:
             self._notify(f"{key}: {str(config_var.value)}")
             for config in missings:
                 self._notify(f"{config.key}: {str(config.value)}")
-            if isinstance(self.strategy, PureMarketMakingStrategy) or \
-               isinstance(self.strategy, PerpetualMarketMakingStrategy):
+            if self.strategy is not None and self._is_market_making_strategy(self.strategy):
                 updated = ConfigCommand.update_running_mm(self.strategy, key, config_var.value)
                 if updated:
                     self._notify(f"\nThe current {self.strategy_name} strategy has been updated "
@@ -27,6 +27,10 @@ class ExitCommand:
             # Freeze screen 1 second for better UI
             await asyncio.sleep(1)
 
+        # Commit the order events still queued by the markets recorder before the event loop stops.
+        if self.markets_recorder is not None:
+            self.markets_recorder.stop()
+
         self._notify("Winding down notifiers...")
         for notifier in self.notifiers:
             notifier.stop()
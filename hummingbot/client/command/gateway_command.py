@@ -5,7 +5,6 @@ import ssl
 import json
 import pandas as pd
 from hummingbot.core.utils.async_utils import safe_ensure_future
-from hummingbot.core.utils.ssl_cert import certs_files_exist, create_self_sign_certs
 from hummingbot import cert_path
 from hummingbot.client.settings import GATEAWAY_CA_CERT_PATH, GATEAWAY_CLIENT_CERT_PATH, GATEAWAY_CLIENT_KEY_PATH
 from hummingbot.client.config.global_config_map import global_config_map
@@ -29,6 +28,8 @@ class GatewayCommand:
 
     async def _generate_certs(self,  # type: HummingbotApplication
                               ):
+        # ssl_cert imports cryptography, which is slow to import, so it's imported here rather than at startup.
+        from hummingbot.core.utils.ssl_cert import certs_files_exist, create_self_sign_certs
         if certs_files_exist():
             self._notify(f"Gateway SSL certification files exist in {cert_path()}.")
             self._notify("To create new certification files, please first manually delete those files.")
@@ -11,7 +11,8 @@ from typing import (
 from os.path import dirname, join
 from hummingbot.core.clock import (
     Clock,
-    ClockMode
+    ClockMode,
+    ClockOverrunPolicy,
 )
 from hummingbot import init_logging
 from hummingbot.client.config.config_helpers import (
@@ -118,7 +119,9 @@ class StartCommand:
         try:
             config_path: str = self.strategy_file_name
             self.start_time = time.time() * 1e3  # Time in milliseconds
-            self.clock = Clock(ClockMode.REALTIME)
+            self.clock = Clock(ClockMode.REALTIME,
+                               tick_size=float(global_config_map["clock_tick_size"].value),
+                               overrun_policy=ClockOverrunPolicy[global_config_map["clock_overrun_policy"].value])
             if self.wallet is not None:
                 self.clock.add_iterator(self.wallet)
             for market in self.markets.values():
@@ -77,11 +77,33 @@ class StatusCommand:
             st_status = await self.strategy.format_status()
         else:
             st_status = self.strategy.format_status()
-        status = paper_trade + "\n" + st_status + "\n" + app_warning
+        clock_status = self.clock_status()
+        status = paper_trade + "\n" + st_status + "\n" + clock_status + app_warning
         if self._script_iterator is not None and live is False:
             self._script_iterator.request_status()
         return status
 
+    def clock_status(self,  # type: HummingbotApplication
+                     ) -> str:
+        if self.clock is None or self.clock.tick_profiler is None:
+            return ""
+        profiler = self.clock.tick_profiler
+        lines = ["", f"  Clock: tick size {self.clock.tick_size}s, overrun policy {self.clock.overrun_policy.name}",
+                 f"    Overruns: {profiler.overruns}, skipped ticks: {profiler.skipped_ticks}, "
+                 f"late ticks: {profiler.late_ticks}"]
+        iterator_stats = profiler.iterator_stats
+        if len(iterator_stats) > 0:
+            stats_df = pd.DataFrame(data=[stats.to_dict() for stats in iterator_stats])
+            lines.extend(["    " + line for line in stats_df.to_string(index=False).split("\n")])
+        worst_offender = profiler.worst_offender
+        if worst_offender is not None and worst_offender.elapsed >= self.clock.tick_size:
+            lines.append(f"    Slowest tick: {worst_offender.name} took {worst_offender.elapsed * 1e3:.1f}ms "
+                         f"at {pd.Timestamp(worst_offender.timestamp, unit='s').round('ms')}")
+            if worst_offender.stack is not None:
+                lines.extend(["      " + line for frame in worst_offender.stack[-self.CLOCK_STACK_STATUS_LIMIT:]
+                              for line in frame.rstrip().split("\n")])
+        return "\n".join(lines) + "\n"
+
     def application_warning(self):
         # Application warnings.
         self._expire_old_application_warnings()
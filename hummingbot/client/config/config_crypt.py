@@ -1,21 +1,6 @@
-from eth_account import Account
 from hummingbot.core.utils.wallet_setup import get_key_file_path
 import json
 import os
-from eth_keyfile.keyfile import (
-    Random,
-    get_default_work_factor_for_kdf,
-    _pbkdf2_hash,
-    DKLEN,
-    encode_hex_no_prefix,
-    _scrypt_hash,
-    SCRYPT_R,
-    SCRYPT_P,
-    big_endian_to_int,
-    encrypt_aes_ctr,
-    keccak,
-    int_to_big_endian
-)
 from hummingbot.client.settings import ENCYPTED_CONF_PREFIX, ENCYPTED_CONF_POSTFIX
 
 
@@ -64,6 +49,8 @@ def decrypt_config_value(config_key, password):
 def decrypt_file(file_path, password):
     with open(file_path, 'r') as f:
         encrypted = f.read()
+    # eth_account and eth_keyfile are slow to import, and aren't needed until a password is entered.
+    from eth_account import Account
     secured_value = Account.decrypt(encrypted, password)
     return secured_value.decode()
 
@@ -73,6 +60,21 @@ def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_fac
     Encrypt message by a given password.
     Most of this code is copied from eth_key_file.key_file, removed address and is from json result.
     """
+    from eth_keyfile.keyfile import (
+        Random,
+        get_default_work_factor_for_kdf,
+        _pbkdf2_hash,
+        DKLEN,
+        encode_hex_no_prefix,
+        _scrypt_hash,
+        SCRYPT_R,
+        SCRYPT_P,
+        big_endian_to_int,
+        encrypt_aes_ctr,
+        keccak,
+        int_to_big_endian
+    )
+
     salt = Random.get_random_bytes(16)
 
     if work_factor is None:
@@ -35,7 +35,6 @@ from hummingbot.client.settings import (
 from hummingbot.client.config.security import Security
 from hummingbot.core.utils.market_price import get_last_price
 from hummingbot import get_strategy_list
-from eth_account import Account
 
 # Use ruamel.yaml to preserve order and comments in .yml file
 yaml_parser = ruamel.yaml.YAML()
@@ -158,6 +157,7 @@ def get_eth_wallet_private_key() -> Optional[str]:
     if ethereum_wallet is None or ethereum_wallet == "":
         return None
     private_key = Security._private_keys[ethereum_wallet]
+    from eth_account import Account
     account = Account.privateKeyToAccount(private_key)
     return account.privateKey.hex()
 
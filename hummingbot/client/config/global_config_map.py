@@ -9,6 +9,7 @@ from hummingbot.client.config.config_validators import (
     validate_bool,
     validate_decimal
 )
+from hummingbot.core.clock_mode import ClockOverrunPolicy
 from hummingbot.core.rate_oracle.rate_oracle import RateOracleSource, RateOracle
 
 
@@ -50,10 +51,21 @@ def validate_rate_oracle_source(value: str) -> Optional[str]:
         return f"Invalid source, please choose value from {','.join(r.name for r in RateOracleSource)}"
 
 
+def validate_clock_overrun_policy(value: str) -> Optional[str]:
+    if value not in (p.name for p in ClockOverrunPolicy):
+        return f"Invalid policy, please choose value from {','.join(p.name for p in ClockOverrunPolicy)}"
+
+
 def rate_oracle_source_on_validated(value: str):
     RateOracle.source = RateOracleSource[value]
 
 
+def order_book_capture_dir_on_validated(value: str):
+    # Imported on use, so that loading the config map doesn't load the order book tracker and the modules it imports.
+    from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+    OrderBookTracker.MESSAGE_CAPTURE_DIR = value
+
+
 def global_token_on_validated(value: str):
     RateOracle.global_token = value.upper()
 
@@ -89,6 +101,27 @@ main_config_map = {
                   type_str="float",
                   required_if=lambda: False,
                   default=900),
+    "clock_tick_size":
+        ConfigVar(key="clock_tick_size",
+                  prompt=None,
+                  type_str="float",
+                  required_if=lambda: False,
+                  validator=lambda v: validate_decimal(v, Decimal(0), inclusive=False),
+                  default=1.0),
+    "clock_overrun_policy":
+        ConfigVar(key="clock_overrun_policy",
+                  prompt=None,
+                  type_str="str",
+                  required_if=lambda: False,
+                  validator=validate_clock_overrun_policy,
+                  default=ClockOverrunPolicy.SKIP.name),
+    "order_book_capture_dir":
+        ConfigVar(key="order_book_capture_dir",
+                  prompt=None,
+                  type_str="str",
+                  required_if=lambda: False,
+                  on_validated=order_book_capture_dir_on_validated,
+                  default=None),
     "logger_override_whitelist":
         ConfigVar(key="logger_override_whitelist",
                   prompt=None,
@@ -126,6 +159,13 @@ main_config_map = {
                   required_if=lambda: False,
                   type_str="json",
                   ),
+    "paper_trade_queue_position_fill":
+        ConfigVar(key="paper_trade_queue_position_fill",
+                  prompt=None,
+                  type_str="bool",
+                  required_if=lambda: False,
+                  validator=validate_bool,
+                  default=False),
     "celo_address":
         ConfigVar(key="celo_address",
                   prompt="Enter your Celo account address >>> ",
@@ -4,7 +4,7 @@ import asyncio
 from collections import deque
 import logging
 import time
-from typing import List, Dict, Optional, Tuple, Set, Deque
+from typing import List, Dict, Optional, Tuple, Set, Deque, TYPE_CHECKING
 
 from hummingbot.client.command import __all__ as commands
 from hummingbot.core.clock import Clock
@@ -12,9 +12,6 @@ from hummingbot.exceptions import ArgumentParserError
 from hummingbot.logger import HummingbotLogger
 from hummingbot.logger.application_warning import ApplicationWarning
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
-from hummingbot.connector.exchange.paper_trade import create_paper_trade_market
-from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
-from hummingbot.wallet.ethereum.web3_wallet import Web3Wallet
 from hummingbot.client.ui.keybindings import load_key_bindings
 from hummingbot.client.ui.parser import load_parser, ThrowingArgumentParser
 from hummingbot.client.ui.hummingbot_cli import HummingbotCLI
@@ -26,17 +23,20 @@ from hummingbot.client.config.config_helpers import (
     get_eth_wallet_private_key,
 )
 from hummingbot.strategy.strategy_base import StrategyBase
-from hummingbot.strategy.cross_exchange_market_making import CrossExchangeMarketPair
 from hummingbot.core.utils.kill_switch import KillSwitch
 from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 from hummingbot.data_feed.data_feed_base import DataFeedBase
 from hummingbot.notifier.notifier_base import NotifierBase
-from hummingbot.notifier.telegram_notifier import TelegramNotifier
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.client.config.security import Security
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.client.settings import CONNECTOR_SETTINGS, ConnectorType
+# The wallet, paper trade, Telegram and strategy modules are slow to import, and only needed once a strategy is
+# started, so they're imported where they are used.
+if TYPE_CHECKING:
+    from hummingbot.strategy.cross_exchange_market_making import CrossExchangeMarketPair
+    from hummingbot.wallet.ethereum.web3_wallet import Web3Wallet
 s_logger = None
 
 
@@ -44,6 +44,7 @@ class HummingbotApplication(*commands):
     KILL_TIMEOUT = 10.0
     APP_WARNING_EXPIRY_DURATION = 3600.0
     APP_WARNING_STATUS_LIMIT = 6
+    CLOCK_STACK_STATUS_LIMIT = 8
 
     _main_app: Optional["HummingbotApplication"] = None
 
@@ -70,13 +71,13 @@ class HummingbotApplication(*commands):
         )
 
         self.markets: Dict[str, ExchangeBase] = {}
-        self.wallet: Optional[Web3Wallet] = None
+        self.wallet: Optional["Web3Wallet"] = None
         # strategy file name and name get assigned value after import or create command
         self._strategy_file_name: str = None
         self.strategy_name: str = None
         self.strategy_task: Optional[asyncio.Task] = None
         self.strategy: Optional[StrategyBase] = None
-        self.market_pair: Optional[CrossExchangeMarketPair] = None
+        self.market_pair: Optional["CrossExchangeMarketPair"] = None
         self.market_trading_pair_tuples: List[MarketTradingPairTuple] = []
         self.clock: Optional[Clock] = None
         self.market_trading_pairs_map = {}
@@ -237,6 +238,9 @@ class HummingbotApplication(*commands):
         ethereum_rpc_url = global_config_map.get("ethereum_rpc_url").value
         erc20_token_addresses = {t: l[0] for t, l in self.token_list.items() if t in token_trading_pairs}
 
+        from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
+        from hummingbot.wallet.ethereum.web3_wallet import Web3Wallet
+
         chain_name: str = global_config_map.get("ethereum_chain_name").value
         self.wallet: Web3Wallet = Web3Wallet(
             private_key=private_key,
@@ -246,6 +250,8 @@ class HummingbotApplication(*commands):
         )
 
     def _initialize_markets(self, market_names: List[Tuple[str, List[str]]]):
+        from hummingbot.connector.exchange.paper_trade import create_paper_trade_market
+
         # aggregate trading_pairs if there are duplicate markets
 
         for market_name, trading_pairs in market_names:
@@ -257,7 +263,10 @@ class HummingbotApplication(*commands):
         for connector_name, trading_pairs in self.market_trading_pairs_map.items():
             conn_setting = CONNECTOR_SETTINGS[connector_name]
             if global_config_map.get("paper_trade_enabled").value and conn_setting.type == ConnectorType.Exchange:
-                connector = create_paper_trade_market(connector_name, trading_pairs)
+                connector = create_paper_trade_market(
+                    connector_name,
+                    trading_pairs,
+                    queue_position_fill=global_config_map.get("paper_trade_queue_position_fill").value)
                 paper_trade_account_balance = global_config_map.get("paper_trade_account_balance").value
                 for asset, balance in paper_trade_account_balance.items():
                     connector.set_balance(asset, balance)
@@ -290,6 +299,8 @@ class HummingbotApplication(*commands):
 
     def _initialize_notifiers(self):
         if global_config_map.get("telegram_enabled").value:
+            from hummingbot.notifier.telegram_notifier import TelegramNotifier
+
             # TODO: refactor to use single instance
             if not any([isinstance(n, TelegramNotifier) for n in self.notifiers]):
                 self.notifiers.append(
@@ -4,6 +4,7 @@ generate a dictionary of exchange names to ConnectorSettings.
 """
 
 import importlib
+import json
 from os import scandir
 from os.path import (
     realpath,
@@ -11,7 +12,16 @@ from os.path import (
 )
 from enum import Enum
 from decimal import Decimal
-from typing import List, NamedTuple, Dict, Any
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 from hummingbot import get_strategy_list
 from pathlib import Path
 from hummingbot.client.config.config_var import ConfigVar
@@ -40,6 +50,7 @@ CONF_PREFIX = "conf_"
 CONF_POSTFIX = "_strategy"
 SCRIPTS_PATH = realpath(join(__file__, "../../../scripts/"))
 CERTS_PATH = "certs/"
+CONNECTOR_SETTINGS_MANIFEST_PATH = realpath(join(__file__, "../connector_settings.json"))
 
 # Certificates for securely communicating with the gateway api
 GATEAWAY_CA_CERT_PATH = realpath(join(__file__, join(f"../../../{CERTS_PATH}/ca_cert.pem")))
@@ -56,6 +67,36 @@ class ConnectorType(Enum):
     Derivative = 3
 
 
+class ConnectorConfigKeys(Mapping):
+    """
+    The config keys of a connector, imported from its utils module when they are first used, so that the connector
+    settings can be loaded from the manifest without importing every connector.
+    """
+
+    def __init__(self, utils_module_path: str, domain: Optional[str] = None):
+        self._utils_module_path: str = utils_module_path
+        self._domain: Optional[str] = domain
+        self._config_keys: Optional[Dict[str, ConfigVar]] = None
+
+    def _keys(self) -> Dict[str, ConfigVar]:
+        if self._config_keys is None:
+            util_module = importlib.import_module(self._utils_module_path)
+            if self._domain is None:
+                self._config_keys = getattr(util_module, "KEYS", {})
+            else:
+                self._config_keys = getattr(util_module, "OTHER_DOMAINS_KEYS")[self._domain]
+        return self._config_keys
+
+    def __getitem__(self, key: str) -> ConfigVar:
+        return self._keys()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+
 class ConnectorSetting(NamedTuple):
     name: str
     type: ConnectorType
@@ -65,7 +106,7 @@ class ConnectorSetting(NamedTuple):
     fee_type: TradeFeeType
     fee_token: str
     default_fees: List[Decimal]
-    config_keys: Dict[str, ConfigVar]
+    config_keys: Mapping[str, ConfigVar]
     is_sub_domain: bool
     parent_name: str
     domain_parameter: str
@@ -83,6 +124,10 @@ class ConnectorSetting(NamedTuple):
         # return connector full path name, e.g. hummingbot.connector.exchange.binance.binance_exchange
         return f'hummingbot.connector.{self.type.name.lower()}.{self.base_name()}.{self.module_name()}'
 
+    def utils_module_path(self) -> str:
+        # return connector utils module full path name, e.g. hummingbot.connector.exchange.binance.binance_utils
+        return f'hummingbot.connector.{self.type.name.lower()}.{self.base_name()}.{self.base_name()}_utils'
+
     def class_name(self) -> str:
         # return connector class name, e.g. BinanceExchange
         return "".join([o.capitalize() for o in self.module_name().split("_")])
@@ -109,67 +154,145 @@ class ConnectorSetting(NamedTuple):
             return self.name
 
 
-def _create_connector_settings() -> Dict[str, ConnectorSetting]:
+def _connector_dirs() -> List[Tuple[str, str]]:
     """
-    Iterate over files in specific Python directories to create a dictionary of exchange names to ConnectorSetting.
+    The (connector type, connector) directories of the connector package, e.g. ("exchange", "binance").
     """
     connector_exceptions = ["paper_trade", "eterbase"]
-    connector_settings = {}
     package_dir = Path(__file__).resolve().parent.parent.parent
     type_dirs = [f for f in scandir(f'{str(package_dir)}/hummingbot/connector') if f.is_dir()]
-    for type_dir in type_dirs:
-        connector_dirs = [f for f in scandir(type_dir.path) if f.is_dir()]
-        for connector_dir in connector_dirs:
-            if connector_dir.name.startswith("_") or \
-                    connector_dir.name in connector_exceptions:
-                continue
-            if connector_dir.name in connector_settings:
-                raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
-            path = f"hummingbot.connector.{type_dir.name}.{connector_dir.name}.{connector_dir.name}_utils"
-            try:
-                util_module = importlib.import_module(path)
-            except ModuleNotFoundError:
-                continue
-            fee_type = TradeFeeType.Percent
-            fee_type_setting = getattr(util_module, "FEE_TYPE", None)
-            if fee_type_setting is not None:
-                fee_type = TradeFeeType[fee_type_setting]
-            connector_settings[connector_dir.name] = ConnectorSetting(
-                name=connector_dir.name,
-                type=ConnectorType[type_dir.name.capitalize()],
-                centralised=getattr(util_module, "CENTRALIZED", True),
-                example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
-                use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
-                fee_type=fee_type,
-                fee_token=getattr(util_module, "FEE_TOKEN", ""),
-                default_fees=getattr(util_module, "DEFAULT_FEES", []),
-                config_keys=getattr(util_module, "KEYS", {}),
-                is_sub_domain=False,
-                parent_name=None,
-                domain_parameter=None,
-                use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False)
+    return sorted((type_dir.name, connector_dir.name)
+                  for type_dir in type_dirs
+                  for connector_dir in scandir(type_dir.path)
+                  if connector_dir.is_dir() and not connector_dir.name.startswith("_")
+                  and connector_dir.name not in connector_exceptions)
+
+
+def _create_connector_settings() -> Dict[str, ConnectorSetting]:
+    """
+    Iterate over files in specific Python directories to create a dictionary of exchange names to ConnectorSetting.
+    """
+    connector_settings = {}
+    for type_dir_name, connector_dir_name in _connector_dirs():
+        if connector_dir_name in connector_settings:
+            raise Exception(f"Multiple connectors with the same {connector_dir_name} name.")
+        path = f"hummingbot.connector.{type_dir_name}.{connector_dir_name}.{connector_dir_name}_utils"
+        try:
+            util_module = importlib.import_module(path)
+        except ModuleNotFoundError:
+            continue
+        fee_type = TradeFeeType.Percent
+        fee_type_setting = getattr(util_module, "FEE_TYPE", None)
+        if fee_type_setting is not None:
+            fee_type = TradeFeeType[fee_type_setting]
+        connector_settings[connector_dir_name] = ConnectorSetting(
+            name=connector_dir_name,
+            type=ConnectorType[type_dir_name.capitalize()],
+            centralised=getattr(util_module, "CENTRALIZED", True),
+            example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
+            use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
+            fee_type=fee_type,
+            fee_token=getattr(util_module, "FEE_TOKEN", ""),
+            default_fees=getattr(util_module, "DEFAULT_FEES", []),
+            config_keys=getattr(util_module, "KEYS", {}),
+            is_sub_domain=False,
+            parent_name=None,
+            domain_parameter=None,
+            use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False)
+        )
+        other_domains = getattr(util_module, "OTHER_DOMAINS", [])
+        for domain in other_domains:
+            parent = connector_settings[connector_dir_name]
+            connector_settings[domain] = ConnectorSetting(
+                name=domain,
+                type=parent.type,
+                centralised=parent.centralised,
+                example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
+                use_ethereum_wallet=parent.use_ethereum_wallet,
+                fee_type=parent.fee_type,
+                fee_token=parent.fee_token,
+                default_fees=getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain],
+                config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
+                is_sub_domain=True,
+                parent_name=parent.name,
+                domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
+                use_eth_gas_lookup=parent.use_eth_gas_lookup
             )
-            other_domains = getattr(util_module, "OTHER_DOMAINS", [])
-            for domain in other_domains:
-                parent = connector_settings[connector_dir.name]
-                connector_settings[domain] = ConnectorSetting(
-                    name=domain,
-                    type=parent.type,
-                    centralised=parent.centralised,
-                    example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
-                    use_ethereum_wallet=parent.use_ethereum_wallet,
-                    fee_type=parent.fee_type,
-                    fee_token=parent.fee_token,
-                    default_fees=getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain],
-                    config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
-                    is_sub_domain=True,
-                    parent_name=parent.name,
-                    domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
-                    use_eth_gas_lookup=parent.use_eth_gas_lookup
-                )
     return connector_settings
 
 
+def _connector_setting_to_json(connector_setting: ConnectorSetting) -> Dict[str, Any]:
+    return {
+        "name": connector_setting.name,
+        "type": connector_setting.type.name,
+        "example_pair": connector_setting.example_pair,
+        "centralised": connector_setting.centralised,
+        "use_ethereum_wallet": connector_setting.use_ethereum_wallet,
+        "fee_type": connector_setting.fee_type.name,
+        "fee_token": connector_setting.fee_token,
+        "default_fees": connector_setting.default_fees,
+        "is_sub_domain": connector_setting.is_sub_domain,
+        "parent_name": connector_setting.parent_name,
+        "domain_parameter": connector_setting.domain_parameter,
+        "use_eth_gas_lookup": connector_setting.use_eth_gas_lookup,
+    }
+
+
+def _connector_setting_from_json(data: Dict[str, Any]) -> ConnectorSetting:
+    connector_setting = ConnectorSetting(
+        name=data["name"],
+        type=ConnectorType[data["type"]],
+        example_pair=data["example_pair"],
+        centralised=data["centralised"],
+        use_ethereum_wallet=data["use_ethereum_wallet"],
+        fee_type=TradeFeeType[data["fee_type"]],
+        fee_token=data["fee_token"],
+        default_fees=data["default_fees"],
+        config_keys={},
+        is_sub_domain=data["is_sub_domain"],
+        parent_name=data["parent_name"],
+        domain_parameter=data["domain_parameter"],
+        use_eth_gas_lookup=data["use_eth_gas_lookup"],
+    )
+    domain = connector_setting.name if connector_setting.is_sub_domain else None
+    return connector_setting._replace(config_keys=ConnectorConfigKeys(connector_setting.utils_module_path(), domain))
+
+
+def save_connector_settings_manifest(file_path: str = CONNECTOR_SETTINGS_MANIFEST_PATH):
+    """
+    Writes the connector settings manifest, from which the connector settings are loaded at startup. It needs to be
+    updated whenever a connector is added or the settings in a connector's utils module change.
+    """
+    manifest = {
+        "connector_dirs": [f"{type_dir_name}/{connector_dir_name}" for type_dir_name, connector_dir_name
+                           in _connector_dirs()],
+        "connectors": [_connector_setting_to_json(connector_setting)
+                       for connector_setting in _create_connector_settings().values()],
+    }
+    with open(file_path, "w") as fd:
+        json.dump(manifest, fd, indent=2)
+        fd.write("\n")
+
+
+def _load_connector_settings() -> Dict[str, ConnectorSetting]:
+    """
+    Loads the connector settings from the manifest, without importing the connectors' utils modules. They are
+    created from the utils modules instead if there's no manifest, or it doesn't list the connector directories on
+    disk, e.g. when a connector has been added and the manifest hasn't been updated.
+    """
+    try:
+        with open(CONNECTOR_SETTINGS_MANIFEST_PATH) as fd:
+            manifest: Dict[str, Any] = json.load(fd)
+    except (OSError, ValueError):
+        return _create_connector_settings()
+    connector_dirs: List[str] = [f"{type_dir_name}/{connector_dir_name}" for type_dir_name, connector_dir_name
+                                 in _connector_dirs()]
+    if manifest.get("connector_dirs") != connector_dirs:
+        return _create_connector_settings()
+    connector_settings = [_connector_setting_from_json(data) for data in manifest["connectors"]]
+    return {connector_setting.name: connector_setting for connector_setting in connector_settings}
+
+
 def ethereum_wallet_required() -> bool:
     """
     Check if an Ethereum wallet is required for any of the exchanges the user's config uses.
@@ -201,7 +324,7 @@ MAXIMUM_LOG_PANE_LINE_COUNT = 1000
 MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT = 100
 
 
-CONNECTOR_SETTINGS = _create_connector_settings()
+CONNECTOR_SETTINGS = _load_connector_settings()
 DERIVATIVES = {cs.name for cs in CONNECTOR_SETTINGS.values() if cs.type is ConnectorType.Derivative}
 EXCHANGES = {cs.name for cs in CONNECTOR_SETTINGS.values() if cs.type is ConnectorType.Exchange}
 OTHER_CONNECTORS = {cs.name for cs in CONNECTOR_SETTINGS.values() if cs.type is ConnectorType.Connector}
@@ -40,14 +40,31 @@ s_decimal_NaN = Decimal("nan")
 logging.basicConfig(level=METRICS_LOG_LEVEL)
 
 
+class GatewayError(IOError):
+    """
+    An error response from the Gateway API.
+    """
+
+    def __init__(self, message: str, status: int):
+        super().__init__(message)
+        self.status: int = status
+
+
 class UniswapConnector(ConnectorBase):
     """
     UniswapConnector connects with uniswap gateway APIs and provides pricing, user account tracking and trading
     functionality.
     """
     API_CALL_TIMEOUT = 10.0
+    # The poll interval is POLL_INTERVAL while transactions are pending. Otherwise polls only refresh balances, and
+    # the interval is doubled after each of them, up to MAX_POLL_INTERVAL, until a transaction is sent.
     POLL_INTERVAL = 1.0
+    MAX_POLL_INTERVAL = 8.0
     UPDATE_BALANCE_INTERVAL = 30.0
+    # Transactions per eth/poll-batch request
+    POLL_BATCH_SIZE = 100
+    # Concurrent requests when the gateway has no batch end points
+    MAX_CONCURRENT_POLL_REQUESTS = 5
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -89,6 +106,9 @@ class UniswapConnector(ConnectorBase):
         self._initiate_pool_status = None
         self._real_time_balance_update = False
         self._poll_notifier = None
+        self._poll_interval = self.POLL_INTERVAL
+        # Batch end points the gateway doesn't have
+        self._unsupported_batch_paths = set()
 
     @property
     def name(self):
@@ -348,6 +368,7 @@ class UniswapConnector(ConnectorBase):
         """
         Starts tracking an order by simply adding it into _in_flight_orders dictionary.
         """
+        self._poll_interval = self.POLL_INTERVAL
         self._in_flight_orders[order_id] = UniswapInFlightOrder(
             client_order_id=order_id,
             exchange_order_id=exchange_order_id,
@@ -366,26 +387,84 @@ class UniswapConnector(ConnectorBase):
         if order_id in self._in_flight_orders:
             del self._in_flight_orders[order_id]
 
+    async def poll_transactions(self, tx_hashes: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Polls the gateway for the status of transactions, POLL_BATCH_SIZE transactions per eth/poll-batch request.
+        Gateways without the batch end point are sent an eth/poll request per transaction instead,
+        MAX_CONCURRENT_POLL_REQUESTS at a time.
+        :param tx_hashes: The transaction hashes
+        :return: A dictionary of transaction hash and its eth/poll result
+        """
+        if len(tx_hashes) == 0:
+            return {}
+        results = await self._batch_api_request("eth/poll-batch", "txHashes", tx_hashes, self.POLL_BATCH_SIZE)
+        if results is not None:
+            return {result["txHash"]: result for result in results["txs"]}
+        poll_results = await self._bounded_api_requests("eth/poll", [{"txHash": tx_hash} for tx_hash in tx_hashes])
+        return {result["txHash"]: result for result in poll_results if "txHash" in result}
+
+    async def _batch_api_request(self,
+                                 path_url: str,
+                                 param_name: str,
+                                 values: List[Any],
+                                 batch_size: int) -> Optional[Dict[str, Any]]:
+        """
+        Sends values to a batch end point, batch_size values per request, with the values as a JSON list param.
+        :return: The results of the requests merged together, or None if the gateway doesn't have the end point
+        """
+        if path_url in self._unsupported_batch_paths:
+            return None
+        merged_result = {}
+        try:
+            for i in range(0, len(values), batch_size):
+                result = await self._api_request("post", path_url, {param_name: json.dumps(values[i:i + batch_size])})
+                for key, value in result.items():
+                    if isinstance(value, list):
+                        merged_result.setdefault(key, []).extend(value)
+                    elif isinstance(value, dict):
+                        merged_result.setdefault(key, {}).update(value)
+                    else:
+                        merged_result[key] = value
+        except GatewayError as e:
+            if e.status != 404:
+                raise
+            self.logger().info(f"Gateway has no {path_url} end point, sending a request per item instead.")
+            self._unsupported_batch_paths.add(path_url)
+            return None
+        return merged_result
+
+    async def _bounded_api_requests(self,
+                                    path_url: str,
+                                    params_list: List[Dict[str, Any]],
+                                    return_exceptions: bool = False) -> List[Any]:
+        """
+        Sends a post request per params, with at most MAX_CONCURRENT_POLL_REQUESTS in flight at once.
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_POLL_REQUESTS)
+
+        async def bounded_request(params: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._api_request("post", path_url, params)
+
+        return await safe_gather(*[bounded_request(params) for params in params_list],
+                                 return_exceptions=return_exceptions)
+
     async def _update_order_status(self):
         """
-        Calls REST API to get status update for each in-flight order.
+        Polls the gateway for the transaction status of each in-flight order, in as few requests as possible.
         """
         if len(self._in_flight_orders) > 0:
-            tracked_orders = list(self._in_flight_orders.values())
-
-            tasks = []
+            # Orders that don't have a transaction hash yet are polled for once they do.
+            tracked_orders = [tracked_order for tracked_order in self._in_flight_orders.values()
+                              if tracked_order.exchange_order_id is not None]
+            self.logger().debug(f"Polling for order status updates of {len(tracked_orders)} orders.")
+            update_results = await self.poll_transactions([tracked_order.exchange_order_id
+                                                           for tracked_order in tracked_orders])
             for tracked_order in tracked_orders:
-                order_id = await tracked_order.get_exchange_order_id()
-                tasks.append(self._api_request("post",
-                                               "eth/poll",
-                                               {"txHash": order_id}))
-            update_results = await safe_gather(*tasks, return_exceptions=True)
-            for update_result in update_results:
-                self.logger().info(f"Polling for order status updates of {len(tasks)} orders.")
-                if isinstance(update_result, Exception):
-                    raise update_result
-                if "txHash" not in update_result:
-                    self.logger().info(f"_update_order_status txHash not in resp: {update_result}")
+                order_id = tracked_order.exchange_order_id
+                update_result = update_results.get(order_id)
+                if update_result is None:
+                    self.logger().info(f"_update_order_status txHash {order_id} not in resp.")
                     continue
                 if update_result["confirmed"] is True:
                     if update_result["receipt"]["status"] == 1:
@@ -496,10 +575,19 @@ class UniswapConnector(ConnectorBase):
         Is called automatically by the clock for each clock's tick (1 second by default).
         It checks if status polling task is due for execution.
         """
-        if time.time() - self._last_poll_timestamp > self.POLL_INTERVAL:
+        if time.time() - self._last_poll_timestamp > self._poll_interval:
             if self._poll_notifier is not None and not self._poll_notifier.is_set():
                 self._poll_notifier.set()
 
+    def _has_pending_transactions(self) -> bool:
+        return len(self._in_flight_orders) > 0
+
+    def _update_poll_interval(self):
+        if self._has_pending_transactions():
+            self._poll_interval = self.POLL_INTERVAL
+        else:
+            self._poll_interval = min(self._poll_interval * 2, self.MAX_POLL_INTERVAL)
+
     async def _status_polling_loop(self):
         while True:
             try:
@@ -510,6 +598,7 @@ class UniswapConnector(ConnectorBase):
                     self._update_order_status(),
                 )
                 self._last_poll_timestamp = self.current_timestamp
+                self._update_poll_interval()
             except asyncio.CancelledError:
                 raise
             except Exception as e:
@@ -583,12 +672,18 @@ class UniswapConnector(ConnectorBase):
                 params["privateKey"] = "0x" + params["privateKey"]
             response = await client.post(url, data=params)
 
-        parsed_response = json.loads(await response.text())
+        try:
+            parsed_response = json.loads(await response.text())
+        except ValueError:
+            if response.status == 200:
+                raise
+            parsed_response = {}
         if response.status != 200:
             err_msg = ""
             if "error" in parsed_response:
                 err_msg = f" Message: {parsed_response['error']}"
-            raise IOError(f"Error fetching data from {url}. HTTP status is {response.status}.{err_msg}")
+            raise GatewayError(f"Error fetching data from {url}. HTTP status is {response.status}.{err_msg}",
+                               response.status)
         if "error" in parsed_response:
             raise Exception(f"Error: {parsed_response['error']} {parsed_response['message']}")
 
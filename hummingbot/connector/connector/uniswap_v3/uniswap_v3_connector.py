@@ -1,7 +1,7 @@
 import asyncio
 import json
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.connector.connector.uniswap.uniswap_connector import UniswapConnector
@@ -24,7 +24,7 @@ from hummingbot.core.event.events import (
     TradeType,
     TradeFee
 )
-from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.utils.ethereum import check_transaction_exceptions
 from hummingbot.client.config.fee_overrides_config_map import fee_overrides_config_map
@@ -257,32 +257,25 @@ class UniswapV3Connector(UniswapConnector):
 
     async def _update_order_status(self):
         """
-        Calls REST API to get status update for each in-flight order.
-        """
-        tasks, tracked_orders, tracked_positions, open_positions = [], [], [], []
-        if len(self._in_flight_orders) > 0:
-            tracked_orders = list(self._in_flight_orders.values())
-            for tracked_order in tracked_orders:
-                order_id = await tracked_order.get_exchange_order_id()
-                tasks.append(self._api_request("post",
-                                               "eth/poll",
-                                               {"txHash": order_id}))
-        if len(self._in_flight_positions) > 0:
-            tracked_positions = [pos for pos in self._in_flight_positions.values() if pos.last_status.is_pending()]  # We only want to poll update for pending positions
-            open_positions = [pos for pos in self._in_flight_positions.values() if pos.last_status.is_active()]
-            for tracked_pos in tracked_positions:
-                last_hash = await tracked_pos.get_last_tx_hash()
-                tasks.append(self._api_request("post",
-                                               "eth/poll",
-                                               {"txHash": last_hash}))
-        if tasks:
-            update_results = await safe_gather(*tasks, return_exceptions=True)
-            for update_result, tracked_item in zip(update_results, tracked_orders + tracked_positions):
-                self.logger().debug(f"Polling for order status updates of {len(tasks)} orders.")
-                if isinstance(update_result, Exception):
-                    raise update_result
-                if "txHash" not in update_result:
-                    self.logger().info(f"Update_order_status txHash not in resp: {update_result}")
+        Polls the gateway for the transaction status of each in-flight order and pending position, and for the
+        info of each open position, in as few requests as possible.
+        """
+        # Orders and positions that don't have a transaction hash yet are polled for once they do.
+        tracked_orders = [tracked_order for tracked_order in self._in_flight_orders.values()
+                          if tracked_order.exchange_order_id is not None]
+        # We only want to poll update for pending positions
+        tracked_positions = [pos for pos in self._in_flight_positions.values()
+                             if pos.last_status.is_pending() and pos.last_tx_hash is not None]
+        open_positions = [pos for pos in self._in_flight_positions.values() if pos.last_status.is_active()]
+        tracked_items = [(tracked_order.exchange_order_id, tracked_order) for tracked_order in tracked_orders] + \
+                        [(tracked_pos.last_tx_hash, tracked_pos) for tracked_pos in tracked_positions]
+        if len(tracked_items) > 0:
+            self.logger().debug(f"Polling for order status updates of {len(tracked_items)} orders.")
+            update_results = await self.poll_transactions([tx_hash for tx_hash, _ in tracked_items])
+            for tx_hash, tracked_item in tracked_items:
+                update_result = update_results.get(tx_hash)
+                if update_result is None:
+                    self.logger().info(f"Update_order_status txHash {tx_hash} not in resp.")
                     continue
                 if isinstance(tracked_item, UniswapInFlightOrder):
                     await self.update_swap_order(update_result, tracked_item)
@@ -290,26 +283,23 @@ class UniswapV3Connector(UniswapConnector):
                     await self.update_lp_order(update_result, tracked_item)
 
         # update info for each positions as well
-        tasks = []
         if len(open_positions) > 0:
-            for tracked_pos in open_positions:
-                tasks.append(self.get_position(tracked_pos.token_id))
-        if tasks:
-            position_results = await safe_gather(*tasks, return_exceptions=True)
-            for update_result, tracked_item in zip(position_results, open_positions):
-                if not isinstance(update_result, Exception) and len(update_result.get("position", {})) > 0:
-                    tracked_item.lower_price = Decimal(update_result["position"].get("lowerPrice", "0"))
-                    tracked_item.upper_price = Decimal(update_result["position"].get("upperPrice", "0"))
-                    if tracked_item.trading_pair.split("-")[0] == update_result["position"]["token0"]:
-                        tracked_item.current_base_amount = Decimal(update_result["position"].get("amount0", "0"))
-                        tracked_item.current_quote_amount = Decimal(update_result["position"].get("amount1", "0"))
-                        tracked_item.unclaimed_base_amount = Decimal(update_result["position"].get("unclaimedToken0", "0"))
-                        tracked_item.unclaimed_quote_amount = Decimal(update_result["position"].get("unclaimedToken1", "0"))
+            positions = await self.get_positions([tracked_pos.token_id for tracked_pos in open_positions])
+            for tracked_item in open_positions:
+                position = positions.get(str(tracked_item.token_id), {})
+                if len(position) > 0:
+                    tracked_item.lower_price = Decimal(position.get("lowerPrice", "0"))
+                    tracked_item.upper_price = Decimal(position.get("upperPrice", "0"))
+                    if tracked_item.trading_pair.split("-")[0] == position["token0"]:
+                        tracked_item.current_base_amount = Decimal(position.get("amount0", "0"))
+                        tracked_item.current_quote_amount = Decimal(position.get("amount1", "0"))
+                        tracked_item.unclaimed_base_amount = Decimal(position.get("unclaimedToken0", "0"))
+                        tracked_item.unclaimed_quote_amount = Decimal(position.get("unclaimedToken1", "0"))
                     else:
-                        tracked_item.current_base_amount = Decimal(update_result["position"].get("amount1", "0"))
-                        tracked_item.current_quote_amount = Decimal(update_result["position"].get("amount0", "0"))
-                        tracked_item.unclaimed_base_amount = Decimal(update_result["position"].get("unclaimedToken1", "0"))
-                        tracked_item.unclaimed_quote_amount = Decimal(update_result["position"].get("unclaimedToken0", "0"))
+                        tracked_item.current_base_amount = Decimal(position.get("amount1", "0"))
+                        tracked_item.current_quote_amount = Decimal(position.get("amount0", "0"))
+                        tracked_item.unclaimed_base_amount = Decimal(position.get("unclaimedToken1", "0"))
+                        tracked_item.unclaimed_quote_amount = Decimal(position.get("unclaimedToken0", "0"))
 
     def add_position(self,
                      trading_pair: str,
@@ -346,6 +336,10 @@ class UniswapV3Connector(UniswapConnector):
             upper_price=upper_price,
         )
 
+    def _has_pending_transactions(self) -> bool:
+        return super()._has_pending_transactions() or \
+            any(pos.last_status.is_pending() for pos in self._in_flight_positions.values())
+
     def stop_tracking_position(self, hb_id: str):
         """
         Stops tracking a position by simply removing it from _in_flight_positions dictionary.
@@ -393,6 +387,7 @@ class UniswapV3Connector(UniswapConnector):
             tracked_pos = self._in_flight_positions[hb_id]
             tx_hash = order_result["hash"]
             tracked_pos.update_last_tx_hash(tx_hash)
+            self._poll_interval = self.POLL_INTERVAL
             tracked_pos.gas_price = order_result.get("gasPrice")
             tracked_pos.last_status = UniswapV3PositionStatus.PENDING_CREATE
             self.logger().info(f"Adding liquidity for {trading_pair}, hb_id: {hb_id}, tx_hash: {tx_hash} "
@@ -455,6 +450,7 @@ class UniswapV3Connector(UniswapConnector):
                          f"{reducePercent}% reduction of liquidity for"
                 self.logger().info(f"Initiated {action} of position with ID - {token_id}.")
                 tracked_pos.update_last_tx_hash(hash)
+                self._poll_interval = self.POLL_INTERVAL
                 self.trigger_event(MarketEvent.RangePositionUpdated,
                                    RangePositionUpdatedEvent(self.current_timestamp, tracked_pos.hb_id,
                                                              tracked_pos.last_tx_hash, tracked_pos.token_id,
@@ -475,6 +471,27 @@ class UniswapV3Connector(UniswapConnector):
         result = await self._api_request("post", "eth/uniswap/v3/position", {"tokenId": token_id})
         return result
 
+    async def get_positions(self, token_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetches the info of positions, POLL_BATCH_SIZE positions per eth/uniswap/v3/positions request. Gateways
+        without the batch end point are sent an eth/uniswap/v3/position request per position instead.
+        :param token_ids: The token ids of the positions
+        :return: A dictionary of token id (as a string) and its position info, positions that couldn't be fetched
+        are left out.
+        """
+        if len(token_ids) == 0:
+            return {}
+        results = await self._batch_api_request(
+            "eth/uniswap/v3/positions", "tokenIds", token_ids, self.POLL_BATCH_SIZE)
+        if results is not None:
+            return {str(token_id): position for token_id, position in results["positions"].items()}
+        position_results = await self._bounded_api_requests("eth/uniswap/v3/position",
+                                                            [{"tokenId": token_id} for token_id in token_ids],
+                                                            return_exceptions=True)
+        return {str(token_id): result["position"]
+                for token_id, result in zip(token_ids, position_results)
+                if not isinstance(result, Exception) and "position" in result}
+
     async def collect_fees(self, token_id: str):  # not used yet, but should be refactored to return an order_id and also track transaction
         result = await self._api_request("post", "eth/uniswap/v3/collect-fees", {"tokenId": token_id})
         return result
@@ -5,7 +5,6 @@ from typing import Dict, List, Optional, Any, AsyncIterable
 
 import aiohttp
 import pandas as pd
-import ujson
 import websockets
 from websockets.exceptions import ConnectionClosed
 
@@ -13,6 +12,7 @@ from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.json_utils import json_loads, response_json
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_order_book import BinancePerpetualOrderBook
 from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_utils import convert_to_exchange_trading_pair
@@ -60,7 +60,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
         async with aiohttp.ClientSession() as client:
             url = TESTNET_BASE_URL if domain == "binance_perpetual_testnet" else PERPETUAL_BASE_URL
             resp = await client.get(f"{TICKER_PRICE_CHANGE_URL.format(url)}?symbol={convert_to_exchange_trading_pair(trading_pair)}")
-            resp_json = await resp.json()
+            resp_json = await response_json(resp)
             return float(resp_json["lastPrice"])
 
     """
@@ -88,7 +88,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
             async with aiohttp.ClientSession() as client:
                 async with client.get(EXCHANGE_INFO_URL.format(BASE_URL), timeout=10) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await response_json(response)
                         raw_trading_pairs = [d["symbol"] for d in data["symbols"] if d["status"] == "TRADING"]
                         trading_pair_list: List[str] = []
                         for raw_trading_pair in raw_trading_pairs:
@@ -114,7 +114,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
             if response.status != 200:
                 raise IOError(f"Error fetching Binance market snapshot for {trading_pair}. "
                               f"HTTP status is {response.status}.")
-            data: Dict[str, Any] = await response.json()
+            data: Dict[str, Any] = await response_json(response)
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
@@ -178,7 +178,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 async with websockets.connect(stream_url) as ws:
                     ws: websockets.WebSocketClientProtocol = ws
                     async for raw_msg in self.ws_messages(ws):
-                        msg_json = ujson.loads(raw_msg)
+                        msg_json = json_loads(raw_msg)
                         timestamp: float = time.time()
                         order_book_message: OrderBookMessage = BinancePerpetualOrderBook.diff_message_from_exchange(
                             msg_json,
@@ -202,7 +202,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 async with websockets.connect(stream_url) as ws:
                     ws: websockets.WebSocketClientProtocol = ws
                     async for raw_msg in self.ws_messages(ws):
-                        msg_json = ujson.loads(raw_msg)
+                        msg_json = json_loads(raw_msg)
                         trade_msg: OrderBookMessage = BinancePerpetualOrderBook.trade_message_from_exchange(msg_json)
                         output.put_nowait(trade_msg)
             except asyncio.CancelledError:
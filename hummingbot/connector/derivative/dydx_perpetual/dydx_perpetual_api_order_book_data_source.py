@@ -24,6 +24,7 @@ from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_row import ClientOrderBookRow
+from hummingbot.core.utils.json_utils import json_loads, response_json
 
 
 MARKETS_URL = "/markets"
@@ -60,7 +61,7 @@ class DydxPerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
             retval = {}
             for pair in trading_pairs:
                 resp = await client.get(f"{DYDX_V3_API_URL}{TICKER_URL}/{pair}")
-                resp_json = await resp.json()
+                resp_json = await response_json(resp)
                 retval[pair] = float(resp_json["markets"][pair]["close"])
             return retval
 
@@ -79,7 +80,7 @@ class DydxPerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 raise IOError(
                     f"Error fetching dydx market snapshot for {trading_pair}. " f"HTTP status is {response.status}."
                 )
-            data: Dict[str, Any] = await response.json()
+            data: Dict[str, Any] = await response_json(response)
             data["trading_pair"] = trading_pair
             return data
 
@@ -132,7 +133,7 @@ class DydxPerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
             async with aiohttp.ClientSession() as client:
                 async with client.get(f"{DYDX_V3_API_URL}{MARKETS_URL}", timeout=5) as response:
                     if response.status == 200:
-                        all_trading_pairs: Dict[str, Any] = await response.json()
+                        all_trading_pairs: Dict[str, Any] = await response_json(response)
                         valid_trading_pairs: list = []
                         for key, val in all_trading_pairs["markets"].items():
                             if val['status'] == "ONLINE":
@@ -157,7 +158,7 @@ class DydxPerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         }
                         await ws.send(ujson.dumps(subscribe_request))
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_loads(raw_msg)
                         if "contents" in msg:
                             if "trades" in msg["contents"]:
                                 if msg["type"] == "channel_data":
@@ -185,7 +186,7 @@ class DydxPerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         }
                         await ws.send(ujson.dumps(subscribe_request))
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_loads(raw_msg)
                         if "contents" in msg:
                             msg["trading_pair"] = msg["id"]
                             if msg["type"] == "channel_data":
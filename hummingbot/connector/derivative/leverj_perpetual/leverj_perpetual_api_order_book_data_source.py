@@ -14,28 +14,29 @@ import cachetools.func
 from typing import AsyncIterable, Dict, List, Optional, Any
 
 import time
-import ujson
 import websockets
 from websockets.exceptions import ConnectionClosed
 
 from hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_order_book import LeverjPerpetualOrderBook
 from hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_token_configuration import LeverjPerpetualAPITokenConfigurationDataSource
-from hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_socketio_client import LeverjPerpetualSocketIOClient
+from hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_socketio_manager import LeverjPerpetualSocketIOManager
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.tick_order_book import TickOrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
-from hummingbot.core.data_type.order_book_row import ClientOrderBookRow
 
 from hummingbot.connector.derivative.leverj_perpetual.constants import (
     PERPETUAL_BASE_URL,
     TESTNET_BASE_URL
 )
+from hummingbot.core.utils.json_utils import response_json
 
 MARKETS_URL = "/all/config"
 TICKER_URL = "/all/info"
 SNAPSHOT_URL = "/instrument/:marketid/orderbook/"
 TRADES_URL = "/instrument/:marketid/trade"
+ORDER_BOOK_STREAM = "order_book"
 
 
 class LeverjPerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
@@ -51,20 +52,23 @@ class LeverjPerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
             cls.__daobds__logger = logging.getLogger(__name__)
         return cls.__daobds__logger
 
-    def __init__(self, trading_pairs: List[str] = None, domain: str = "kovan", token_configuration = None):
+    def __init__(self, trading_pairs: List[str] = None, domain: str = "kovan", token_configuration = None,
+                 use_tick_order_book: bool = False):
         super().__init__(trading_pairs)
-        self._order_book_create_function = lambda: OrderBook()
         self._base_url = TESTNET_BASE_URL if domain == "kovan" else PERPETUAL_BASE_URL
         self._domain = domain
         self._get_tracking_pair_done_event: asyncio.Event = asyncio.Event()
-        self.order_book_create_function = lambda: OrderBook()
+        if use_tick_order_book:
+            self.order_book_create_function = lambda: TickOrderBook()
+        else:
+            self.order_book_create_function = lambda: OrderBook()
         self.token_config: LeverjPerpetualAPITokenConfigurationDataSource = token_configuration
 
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         async with aiohttp.ClientSession() as client:
             resp = await client.get(f"{PERPETUAL_BASE_URL}{TICKER_URL}")
-            resp_json = await resp.json()
+            resp_json = await response_json(resp)
             retval = {}
             #for key, value in resp_json.items():
             #    symbol = cls.token_config.get_symbol(key)
@@ -88,7 +92,7 @@ class LeverjPerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 raise IOError(
                     f"Error fetching leverj market snapshot for {trading_pair}. " f"HTTP status is {response.status}."
                 )
-            data: Dict[str, Any] = await response.json()
+            data: Dict[str, Any] = await response_json(response)
             data["trading_pair"] = trading_pair
             return data
 
@@ -102,9 +106,7 @@ class LeverjPerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 metadata={"id": trading_pair, "rest": True}
             )
             order_book: OrderBook = self.order_book_create_function()
-            bids = [ClientOrderBookRow(Decimal(bid["price"]), Decimal(bid["amount"]), snapshot_msg.update_id) for bid in snapshot_msg.bids]
-            asks = [ClientOrderBookRow(Decimal(ask["price"]), Decimal(ask["amount"]), snapshot_msg.update_id) for ask in snapshot_msg.asks]
-            order_book.apply_snapshot(bids, asks, snapshot_msg.update_id)
+            order_book.apply_snapshot_message(snapshot_msg)
             return order_book
 
     '''
@@ -147,7 +149,7 @@ class LeverjPerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
             async with aiohttp.ClientSession() as client:
                 async with client.get(f"{LEVERJ_API_URL}{MARKETS_URL}", timeout=5) as response:
                     if response.status == 200:
-                        res_json: Dict[str, Any] = await response.json()
+                        res_json: Dict[str, Any] = await response_json(response)
                         all_trading_pairs = res_json["instruments"]
                         valid_trading_pairs: list = []
                         for key, val in all_trading_pairs.items():
@@ -190,38 +192,25 @@ class LeverjPerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 await asyncio.sleep(30.0)
         '''
     async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
-        while True:
-            try:
-                diff_message_queue: asyncio.Queue = asyncio.Queue()
-                client = LeverjPerpetualSocketIOClient(diff_message_queue, self._base_url)
-                await client.run_client()
-                while True:
-                    msg = await diff_message_queue.get()
-                    if msg[0] in ['difforderbook']: #'orderbook']:
-                        if msg[0] == "difforderbook":
-                            trading_pair = self.token_config.get_symbol(msg[1]["instrument"])
-                            if trading_pair in self._trading_pairs:
-                                msg[1]["trading_pair"] = trading_pair
-                                market_id = self.token_config.get_marketid(trading_pair)
-                                ts = time.time()
-                                order_msg: OrderBookMessage = LeverjPerpetualOrderBook.diff_message_from_exchange(msg[1], ts, msg[1])
-                                output.put_nowait(order_msg)
-                        else:
-                            for trading_pair in self._trading_pairs:
-                                put_msg = {}
-                                market_id = self.token_config.get_marketid(trading_pair)
-                                put_msg["trading_pair"] = trading_pair
-
-                                put_msg["rest"] = False
-                                ts = time.time()
-                                order_msg: OrderBookMessage = LeverjPerpetualOrderBook.snapshot_message_from_exchange(msg[1][market_id], ts, put_msg)
-                                output.put_nowait(order_msg)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error with WebSocket connection. Retrying after 30 seconds...",
-                                    exc_info=True)
-                await asyncio.sleep(30.0)
+        diff_message_queue: asyncio.Queue = asyncio.Queue()
+        socketio_manager = LeverjPerpetualSocketIOManager.get_instance(self._base_url)
+        socketio_manager.subscribe(ORDER_BOOK_STREAM, ["difforderbook"], diff_message_queue)
+        try:
+            while True:
+                event, msg = await diff_message_queue.get()
+                try:
+                    trading_pair = self.token_config.get_symbol(msg["instrument"])
+                    if trading_pair in self._trading_pairs:
+                        msg["trading_pair"] = trading_pair
+                        order_msg: OrderBookMessage = LeverjPerpetualOrderBook.diff_message_from_exchange(
+                            msg, time.time(), msg)
+                        output.put_nowait(order_msg)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self.logger().error("Unexpected error processing leverj order book diff.", exc_info=True)
+        finally:
+            socketio_manager.unsubscribe(ORDER_BOOK_STREAM)
 
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         pass
\ No newline at end of file
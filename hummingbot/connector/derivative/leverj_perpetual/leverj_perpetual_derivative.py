@@ -10,7 +10,9 @@ from typing import (
     Any,
     Dict,
     List,
+    NamedTuple,
     Optional,
+    Tuple,
     AsyncIterable
 )
 from dateutil.parser import parse as dataparse
@@ -33,10 +35,12 @@ from hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_position
 from hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_user_stream_tracker import LeverjPerpetualUserStreamTracker
 from hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_token_configuration import LeverjPerpetualAPITokenConfigurationDataSource
 from hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_socketio_client import LeverjPerpetualSocketIOClient
-from hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_order_signer import sign_order
+from hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_order_signer import LeverjPerpetualOrderSigner
+from hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_socketio_manager import LeverjPerpetualSocketIOManager
 
 from hummingbot.core.utils.async_utils import (
     safe_ensure_future,
+    safe_gather,
 )
 from hummingbot.core.event.events import (
     MarketEvent,
@@ -90,6 +94,8 @@ API_CALL_TIMEOUT = 10.0
 
 MARKETS_INFO_ROUTE = '/all/info'
 UNRECOGNIZED_ORDER_DEBOUCE = 10
+# Maximum number of order status requests in flight at once during an order status polling pass
+ORDER_STATUS_REQUEST_LIMIT = 5
 
 
 class LatchingEventResponder(EventListener):
@@ -119,6 +125,42 @@ class LatchingEventResponder(EventListener):
         self._reduce()
 
 
+class LeverjPerpetualOrderRequest(NamedTuple):
+    trading_pair: str
+    trade_type: TradeType
+    amount: Decimal
+    price: Decimal
+    order_type: OrderType = OrderType.LIMIT
+    position_action: PositionAction = PositionAction.OPEN
+
+
+class LeverjPerpetualOrderStatusPollStats:
+    """
+    Request counts and latency of the order status polling passes of LeverjPerpetualDerivative.
+    """
+
+    def __init__(self):
+        self.passes: int = 0
+        self.total_requests: int = 0
+        self.last_pass_requests: int = 0
+        self.last_pass_orders: int = 0
+        self.last_pass_duration: float = 0.0
+        self.max_pass_duration: float = 0.0
+
+    def record_pass(self, num_orders: int, num_requests: int, duration: float):
+        self.passes += 1
+        self.total_requests += num_requests
+        self.last_pass_requests = num_requests
+        self.last_pass_orders = num_orders
+        self.last_pass_duration = duration
+        self.max_pass_duration = max(self.max_pass_duration, duration)
+
+    def __repr__(self) -> str:
+        return (f"LeverjPerpetualOrderStatusPollStats(passes={self.passes}, total_requests={self.total_requests}, "
+                f"last_pass_orders={self.last_pass_orders}, last_pass_requests={self.last_pass_requests}, "
+                f"last_pass_duration={self.last_pass_duration:.3f}, max_pass_duration={self.max_pass_duration:.3f})")
+
+
 class LeverjPerpetualDerivativeTransactionTracker(TransactionTracker):
 
     def __init__(self, owner):
@@ -145,7 +187,8 @@ class LeverjPerpetualDerivative(ExchangeBase, PerpetualTrading):
                  poll_interval: float = 10.0,
                  trading_pairs: Optional[List[str]] = None,
                  trading_required: bool = True,
-                 domain: str = "leverj_perpetual"):
+                 domain: str = "leverj_perpetual",
+                 use_tick_order_book: bool = False):
 
         super().__init__()
 
@@ -156,6 +199,7 @@ class LeverjPerpetualDerivative(ExchangeBase, PerpetualTrading):
             trading_pairs=trading_pairs,
             token_configuration=self._token_configuration,
             domain=domain,
+            use_tick_order_book=use_tick_order_book,
         )
         self._tx_tracker = LeverjPerpetualDerivativeTransactionTracker(self)
         self._trading_required = trading_required
@@ -170,11 +214,13 @@ class LeverjPerpetualDerivative(ExchangeBase, PerpetualTrading):
         self._leverj_auth = LeverjPerpetualAuth(leverj_perpetual_api_key,
                                                 leverj_perpetual_account_number,
                                                 leverj_perpetual_api_secret)
+        self._order_signer = LeverjPerpetualOrderSigner(leverj_perpetual_api_secret)
         self._user_stream_tracker = LeverjPerpetualUserStreamTracker(
             orderbook_tracker_data_source=self._order_book_tracker.data_source,
             leverj_auth=self._leverj_auth,
             domain=domain
         )
+        self._socketio_manager = LeverjPerpetualSocketIOManager.get_instance(self.API_REST_ENDPOINT)
 
         self._user_stream_event_listener_task = None
         self._user_stream_tracker_task = None
@@ -193,6 +239,7 @@ class LeverjPerpetualDerivative(ExchangeBase, PerpetualTrading):
         self._margin_fractions = {}
         self._funding_info = {}
         self._leverage = {}
+        self._order_status_poll_stats = LeverjPerpetualOrderStatusPollStats()
 
     @property
     def name(self) -> str:
@@ -202,6 +249,10 @@ class LeverjPerpetualDerivative(ExchangeBase, PerpetualTrading):
     def ready(self) -> bool:
         return all(self.status_dict.values())
 
+    @property
+    def order_status_poll_stats(self) -> LeverjPerpetualOrderStatusPollStats:
+        return self._order_status_poll_stats
+
     @property
     def status_dict(self) -> Dict[str, bool]:
         return {
@@ -209,8 +260,16 @@ class LeverjPerpetualDerivative(ExchangeBase, PerpetualTrading):
             "account_balances": len(self._account_balances) > 0 if self._trading_required else True,
             "trading_rule_initialized": len(self._trading_rules) > 0 if self._trading_required else True,
             "funding_info_available": len(self._funding_info) > 0 if self._trading_required else True,
+            "socketio_connected": self._socketio_manager.connected,
         }
 
+    @property
+    def stream_status(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Message rate and reconnect metrics of the order book and user streams sharing the Socket.IO session.
+        """
+        return {stream: stats.to_dict() for stream, stats in self._socketio_manager.stream_stats.items()}
+
     # ----------------------------------------
     # Markets & Order Books
 
@@ -296,14 +355,18 @@ class LeverjPerpetualDerivative(ExchangeBase, PerpetualTrading):
         return int((price * multiplier) / self._leverage[trading_pair])
 
 
-    async def place_order(self,
-                          client_order_id: str,
-                          trading_pair: str,
-                          amount: Decimal,
-                          is_buy: bool,
-                          order_type: OrderType,
-                          price: Decimal) -> Dict[str, Any]:
-
+    def _order_request_data(self,
+                            client_order_id: str,
+                            trading_pair: str,
+                            amount: Decimal,
+                            is_buy: bool,
+                            order_type: OrderType,
+                            price: Decimal,
+                            timestamp: Optional[int] = None,
+                            signed: bool = True) -> Dict[str, Any]:
+        """
+        Builds the /order request entry of an order, signed unless `signed` is False (see _sign_order_requests).
+        """
         order_side = 'buy' if is_buy else 'sell'
         post_only = False
         if order_type is OrderType.LIMIT_MAKER:
@@ -322,24 +385,52 @@ class LeverjPerpetualDerivative(ExchangeBase, PerpetualTrading):
             'marginPerFraction': str(self.get_margin_per_fraction(trading_pair, price)),
             'side': order_side,
             'orderType': leverj_order_type,
-            'timestamp': str(int(time.time()*1000000)),
+            'timestamp': str(timestamp if timestamp is not None else int(time.time()*1000000)),
             'quote': self._token_configuration.get_address(quote),
             'isPostOnly': False,
             'reduceOnly': False,
             'clientOrderId': client_order_id,
         }
-        order_signature = sign_order(data,
-                                     instrument_id,
-                                     self._token_configuration.get_decimals(instrument_id),
-                                     self._leverj_auth.secret_key)
-        data['signature'] = order_signature
+        if signed:
+            data['signature'] = self._order_signer.sign_order(data,
+                                                              instrument_id,
+                                                              self._token_configuration.get_decimals(instrument_id),
+                                                              price,
+                                                              amount)
+        return data
+
+    def _sign_order_requests(self, orders_data: List[Dict[str, Any]], orders: List[Tuple[str, Decimal, Decimal]]):
+        """
+        Signs a batch of unsigned /order request entries at once, `orders` holds the trading pair, amount and price
+        each entry was built from.
+        """
+        requests = []
+        for data, (trading_pair, amount, price) in zip(orders_data, orders):
+            instrument_id = self._token_configuration.get_marketid(trading_pair)
+            requests.append((data, instrument_id, self._token_configuration.get_decimals(instrument_id), price, amount))
+        for data, signature in zip(orders_data, self._order_signer.sign_orders(requests)):
+            data['signature'] = signature
 
-        return await self.api_request('POST', '/order', data=json.dumps([data], separators=(',', ':')))
+    async def place_order(self,
+                          client_order_id: str,
+                          trading_pair: str,
+                          amount: Decimal,
+                          is_buy: bool,
+                          order_type: OrderType,
+                          price: Decimal) -> Dict[str, Any]:
+        data = self._order_request_data(client_order_id, trading_pair, amount, is_buy, order_type, price)
+        return await self.place_orders([data])
 
-    async def execute_order(self, order_side, client_order_id, trading_pair, amount, order_type, position_action, price):
+    async def place_orders(self, orders_data: List[Dict[str, Any]]) -> Any:
         """
-        Completes the common tasks from execute_buy and execute_sell.  Quantizes the order's amount and price, and
-        validates the order against the trading rules before placing this order.
+        Posts signed orders (see _order_request_data) to the exchange in a single request.
+        """
+        return await self.api_request('POST', '/order', data=json.dumps(orders_data, separators=(',', ':')))
+
+    def _quantize_and_validate_order(self, trading_pair, amount, order_type, position_action, price):
+        """
+        Quantizes the order's amount and price, and validates the order against the trading rules. Raises ValueError
+        for orders that can not be placed.
         """
         if position_action not in [PositionAction.OPEN, PositionAction.CLOSE]:
             raise ValueError("Specify either OPEN_POSITION or CLOSE_POSITION position_action.")
@@ -367,6 +458,15 @@ class LeverjPerpetualDerivative(ExchangeBase, PerpetualTrading):
         if amount * price < trading_rule.min_notional_size:
             raise ValueError(f"Order notional value({str(amount*price)}) is less than the minimum allowable notional value for an order ({str(trading_rule.min_notional_size)})")
 
+        return amount, price
+
+    async def execute_order(self, order_side, client_order_id, trading_pair, amount, order_type, position_action, price):
+        """
+        Completes the common tasks from execute_buy and execute_sell.  Quantizes the order's amount and price, and
+        validates the order against the trading rules before placing this order.
+        """
+        amount, price = self._quantize_and_validate_order(trading_pair, amount, order_type, position_action, price)
+
         try:
             created_at: int = int(time.time())
             self.start_tracking_order(order_side, client_order_id, order_type, created_at, None, trading_pair, price, amount, 1, position_action.name)
@@ -464,6 +564,103 @@ class LeverjPerpetualDerivative(ExchangeBase, PerpetualTrading):
             self.trigger_event(ORDER_FAILURE_EVENT, MarketOrderFailureEvent(now(), order_id, order_type))
             self.logger().warning(f"Failed to place {order_id} on leverj. {str(e)}")
 
+    # ----------------------------------------
+    # Batch order placement
+
+    def batch_create_orders(self, orders: List[LeverjPerpetualOrderRequest]) -> List[str]:
+        """
+        Places several orders with a single /order request. Returns the client order ids, in the same order as
+        `orders`. Order created and failure events are issued per order, as for buy() and sell().
+        """
+        client_order_ids: List[str] = []
+        for order in orders:
+            side = 'buy' if order.trade_type is TradeType.BUY else 'sell'
+            client_order_ids.append(str(f"{side}-{order.trading_pair}-{get_tracking_nonce()}"))
+        safe_ensure_future(self.execute_batch_orders(list(zip(client_order_ids, orders))))
+        return client_order_ids
+
+    async def execute_batch_orders(self, orders: List[Tuple[str, LeverjPerpetualOrderRequest]]):
+        orders_data: List[Dict[str, Any]] = []
+        placed_orders: List[Tuple[str, LeverjPerpetualOrderRequest, Decimal, Decimal]] = []
+        # The orders are signed with distinct timestamps, so that otherwise identical orders get distinct signatures.
+        timestamp = int(time.time() * 1000000)
+        for client_order_id, order in orders:
+            try:
+                amount, price = self._quantize_and_validate_order(order.trading_pair, order.amount, order.order_type,
+                                                                  order.position_action, order.price)
+                self.start_tracking_order(order.trade_type, client_order_id, order.order_type, int(time.time()), None,
+                                          order.trading_pair, price, amount, 1, order.position_action.name)
+                orders_data.append(self._order_request_data(client_order_id, order.trading_pair, amount,
+                                                            order.trade_type is TradeType.BUY, order.order_type,
+                                                            price, timestamp + len(orders_data), signed=False))
+                placed_orders.append((client_order_id, order, amount, price))
+            except Exception as e:
+                self.stop_tracking_order(client_order_id)
+                self.trigger_event(ORDER_FAILURE_EVENT, MarketOrderFailureEvent(now(), client_order_id, order.order_type))
+                self.logger().warning(f"Failed to place {client_order_id} on leverj. {str(e)}")
+
+        if len(orders_data) == 0:
+            return
+
+        try:
+            self._sign_order_requests(orders_data, [(order.trading_pair, amount, price)
+                                                    for _, order, amount, price in placed_orders])
+            creation_response = await self.place_orders(orders_data)
+            if "error" in creation_response:
+                raise Exception(creation_response['error'])
+        except asyncio.TimeoutError:
+            # As for single orders, the orders may have been placed, so they are kept tracked.
+            for client_order_id, order, amount, price in placed_orders:
+                self._trigger_order_created_event(client_order_id, order, amount, price)
+            return
+        except Exception as e:
+            self.logger().warning(f"Error submitting a batch of {len(placed_orders)} orders to leverj.")
+            self.logger().info(e, exc_info=True)
+            for client_order_id, order, amount, price in placed_orders:
+                self.stop_tracking_order(client_order_id)
+                self.trigger_event(ORDER_FAILURE_EVENT, MarketOrderFailureEvent(now(), client_order_id, order.order_type))
+            return
+
+        # Map the response entries back to the orders by client order id, or by position if it is not echoed back.
+        responses_by_client_order_id: Dict[str, Dict[str, Any]] = {
+            entry['clientOrderId']: entry
+            for entry in creation_response if isinstance(entry, dict) and 'clientOrderId' in entry
+        }
+        for index, (client_order_id, order, amount, price) in enumerate(placed_orders):
+            response = responses_by_client_order_id.get(client_order_id)
+            if response is None and len(responses_by_client_order_id) == 0 and index < len(creation_response):
+                response = creation_response[index]
+            status = response.get("status") if isinstance(response, dict) else None
+            in_flight_order = self._in_flight_orders.get(client_order_id)
+            if status not in ['pending', 'open']:
+                self.logger().warning(f"Error submitting {order.trade_type.name} {order.order_type.name} order to "
+                                      f"leverj for {amount} {order.trading_pair} at {price}: {response}")
+                self.stop_tracking_order(client_order_id)
+                self.trigger_event(ORDER_FAILURE_EVENT, MarketOrderFailureEvent(now(), client_order_id, order.order_type))
+                continue
+            if in_flight_order is not None:
+                self._set_exchange_id(in_flight_order, response["uuid"])
+                self.logger().info(
+                    f"Created {in_flight_order.description} order {client_order_id} for {amount} {order.trading_pair}.")
+            self._trigger_order_created_event(client_order_id, order, amount, price)
+            # Issue any other events (fills) for this order that arrived while waiting for the exchange id
+            if in_flight_order is not None:
+                self._issue_order_events(in_flight_order)
+
+    def _trigger_order_created_event(self,
+                                     client_order_id: str,
+                                     order: LeverjPerpetualOrderRequest,
+                                     amount: Decimal,
+                                     price: Decimal):
+        if order.trade_type is TradeType.BUY:
+            self.trigger_event(BUY_ORDER_CREATED_EVENT,
+                               BuyOrderCreatedEvent(now(), order.order_type, order.trading_pair, amount, price,
+                                                    client_order_id))
+        else:
+            self.trigger_event(SELL_ORDER_CREATED_EVENT,
+                               SellOrderCreatedEvent(now(), order.order_type, order.trading_pair, amount, price,
+                                                     client_order_id))
+
     # ----------------------------------------
     # Cancellation
 
@@ -508,6 +705,49 @@ class LeverjPerpetualDerivative(ExchangeBase, PerpetualTrading):
             self.logger().info(e)
             return False
 
+    async def batch_cancel(self, client_order_ids: List[str]) -> Dict[str, bool]:
+        """
+        Cancels several orders with a single DELETE request, the exchange order ids are passed comma separated. If
+        that request fails, the orders are cancelled one by one with cancel_order().
+        Returns for each client order id whether a cancel request was sent, as cancel_order() does. The cancellations
+        themselves are confirmed by OrderCancelled events.
+        """
+        results: Dict[str, bool] = {}
+        exchange_order_ids: Dict[str, str] = {}
+        for client_order_id in client_order_ids:
+            in_flight_order = self._in_flight_orders.get(client_order_id)
+            if in_flight_order is None:
+                self.logger().warning(f"Cancelled an untracked order {client_order_id}")
+                self.trigger_event(ORDER_CANCELLED_EVENT, OrderCancelledEvent(now(), client_order_id))
+                results[client_order_id] = False
+            elif in_flight_order.exchange_order_id is None:
+                # Orders pending acknowledgement can't be cancelled on the exchange, see cancel_order()
+                try:
+                    results[client_order_id] = await self.cancel_order(client_order_id)
+                except Exception as e:
+                    self.logger().warning(f"Failed to cancel order {client_order_id}: {str(e)}")
+                    results[client_order_id] = False
+            else:
+                exchange_order_ids[client_order_id] = in_flight_order.exchange_order_id
+
+        if len(exchange_order_ids) > 0:
+            try:
+                await self.api_request('DELETE', f"/order/{','.join(exchange_order_ids.values())}")
+                for client_order_id in exchange_order_ids:
+                    results[client_order_id] = True
+            except Exception as e:
+                self.logger().warning(f"Unable to cancel orders {list(exchange_order_ids.values())} with a single "
+                                      f"request, cancelling them one by one: {str(e)}")
+                cancel_results = await safe_gather(*[self.cancel_order(client_order_id)
+                                                     for client_order_id in exchange_order_ids],
+                                                   return_exceptions=True)
+                for client_order_id, cancel_result in zip(exchange_order_ids, cancel_results):
+                    if isinstance(cancel_result, Exception):
+                        self.logger().warning(f"Failed to cancel order {client_order_id}: {str(cancel_result)}")
+                        cancel_result = False
+                    results[client_order_id] = cancel_result
+        return results
+
     async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
         cancellation_queue = self._in_flight_orders.copy()
         if len(cancellation_queue) == 0:
@@ -524,15 +764,21 @@ class LeverjPerpetualDerivative(ExchangeBase, PerpetualTrading):
         cancel_verifier = LatchingEventResponder(set_cancellation_status, len(cancellation_queue))
         self.add_listener(ORDER_CANCELLED_EVENT, cancel_verifier)
 
-        for order_id, in_flight in cancellation_queue.items():
-            try:
-                if order_status[order_id]:
-                    cancel_verifier.cancel_one()
-                elif not await self.cancel_order(order_id):
-                    # this order did not exist on the exchange
-                    cancel_verifier.cancel_one()
-                    order_status[order_id] = True
-            except Exception:
+        open_order_ids = []
+        for order_id in cancellation_queue:
+            if order_status[order_id]:
+                cancel_verifier.cancel_one()
+            else:
+                open_order_ids.append(order_id)
+
+        # All open orders are cancelled with a single request.
+        try:
+            cancel_results = await self.batch_cancel(open_order_ids)
+        except Exception:
+            cancel_results = {}
+        for order_id in open_order_ids:
+            if not cancel_results.get(order_id, False):
+                # this order did not exist on the exchange
                 cancel_verifier.cancel_one()
                 order_status[order_id] = True
 
@@ -584,6 +830,7 @@ class LeverjPerpetualDerivative(ExchangeBase, PerpetualTrading):
 
     async def stop_network(self):
         self._stop_network()
+        self._order_signer.close()
 
     async def check_network(self) -> NetworkStatus:
         try:
@@ -940,12 +1187,22 @@ class LeverjPerpetualDerivative(ExchangeBase, PerpetualTrading):
             except Exception as e:
                 self.logger().warning("Error updating trading rules")
                 self.logger().warning(str(e))
+        self._order_book_tracker.set_price_increments({
+            trading_pair: trading_rule.min_price_increment
+            for trading_pair, trading_rule in self._trading_rules.items()
+        })
 
     async def _update_order_status(self):
+        """
+        Reconciles all tracked orders with the exchange. The order statuses are fetched concurrently (at most
+        ORDER_STATUS_REQUEST_LIMIT requests at a time), and the account executions are fetched once for the whole pass
+        and only if some order is missing fills.
+        """
+        start_time = time.perf_counter()
         tracked_orders = self._in_flight_orders.copy()
+        pollable_orders: List[LeverjPerpetualInFlightOrder] = []
         for client_order_id, tracked_order in tracked_orders.items():
-            leverj_order_id = tracked_order.exchange_order_id
-            if leverj_order_id is None:
+            if tracked_order.exchange_order_id is None:
                 # This order is still pending acknowledgement from the exchange
                 if tracked_order.created_at < (int(time.time()) - UNRECOGNIZED_ORDER_DEBOUCE):
                     # this order should have a leverj_order_id at this point. If it doesn't, we should cancel it
@@ -955,42 +1212,89 @@ class LeverjPerpetualDerivative(ExchangeBase, PerpetualTrading):
                     except Exception:
                         pass
                 continue
+            pollable_orders.append(tracked_order)
 
-            leverj_order_request = None
-            try:
-                leverj_order_request = await self.api_request('GET', f"/order/{leverj_order_id}")
-                if leverj_order_request == 'Not Found':
-                    # we need to check for fills on this order that may not have been caught on the
-                    # websocket
-                    if tracked_order.created_at < (int(time.time()) - UNRECOGNIZED_ORDER_DEBOUCE):
-                        try:
-                            await self._update_fills(tracked_order)
-                            if not tracked_order.is_done:
-                                tracked_order.order_deleted()
-                            self._issue_order_events(tracked_order)
-                        except Exception:
-                            continue
-                data = leverj_order_request[0]
-            except Exception:
-                self.logger().warning(f"Failed to fetch tracked leverj order "
-                                      f"{client_order_id }({tracked_order.exchange_order_id}) from api "
-                                      f"(code: {leverj_order_request['resultInfo']['code'] if leverj_order_request is not None else 'None'})")
+        if len(pollable_orders) == 0:
+            return
 
-                # check if this error is because the api cliams to be unaware of this order. If so, and this order
-                # is reasonably old, mark the order as cancelled
-                continue
+        semaphore = asyncio.Semaphore(ORDER_STATUS_REQUEST_LIMIT)
+        order_requests = await safe_gather(*[self._fetch_order_status(tracked_order, semaphore)
+                                             for tracked_order in pollable_orders])
+        num_requests = len(pollable_orders)
 
+        # Apply the order statuses, and collect the orders whose fills need to be polled for.
+        orders_missing_fills: List[LeverjPerpetualInFlightOrder] = []
+        deleted_orders: List[LeverjPerpetualInFlightOrder] = []
+        for tracked_order, leverj_order_request in zip(pollable_orders, order_requests):
+            if leverj_order_request is None:
+                continue
+            if leverj_order_request == 'Not Found':
+                # we need to check for fills on this order that may not have been caught on the
+                # websocket
+                if tracked_order.created_at < (int(time.time()) - UNRECOGNIZED_ORDER_DEBOUCE):
+                    deleted_orders.append(tracked_order)
+                continue
             try:
+                data = leverj_order_request[0]
                 if isinstance(data, dict):
                     tracked_order.update(data)
                     if not tracked_order.fills_covered():
                         # We're missing fill reports for this order, so poll for them as well
-                        await self._update_fills(tracked_order)
-                    self._issue_order_events(tracked_order)
+                        orders_missing_fills.append(tracked_order)
+                    else:
+                        self._issue_order_events(tracked_order)
             except Exception as e:
                 self.logger().warning(f"Failed to update leverj order {tracked_order.exchange_order_id}")
                 self.logger().warning(e)
 
+        if len(orders_missing_fills) > 0 or len(deleted_orders) > 0:
+            executions_by_order_id = await self._fetch_executions_by_order_id()
+            num_requests += 1
+            for tracked_order in orders_missing_fills + deleted_orders:
+                try:
+                    if executions_by_order_id is not None:
+                        self._set_fills(executions_by_order_id.get(tracked_order.exchange_order_id, []),
+                                        tracked_order)
+                    if tracked_order in deleted_orders and not tracked_order.is_done:
+                        tracked_order.order_deleted()
+                    self._issue_order_events(tracked_order)
+                except Exception as e:
+                    self.logger().warning(f"Failed to update leverj order {tracked_order.exchange_order_id}")
+                    self.logger().warning(e)
+
+        self._order_status_poll_stats.record_pass(len(pollable_orders), num_requests,
+                                                  time.perf_counter() - start_time)
+
+    async def _fetch_order_status(self, tracked_order: LeverjPerpetualInFlightOrder, semaphore: asyncio.Semaphore):
+        leverj_order_request = None
+        try:
+            async with semaphore:
+                leverj_order_request = await self.api_request('GET', f"/order/{tracked_order.exchange_order_id}")
+            return leverj_order_request
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().warning(f"Failed to fetch tracked leverj order "
+                                  f"{tracked_order.client_order_id}({tracked_order.exchange_order_id}) from api")
+            return None
+
+    async def _fetch_executions_by_order_id(self) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        try:
+            data = await self.api_request('GET', '/account/execution')
+            return self._index_executions(data)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger().warning(f"Unable to poll for fills: {e}")
+            return None
+
+    @staticmethod
+    def _index_executions(data: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        executions_by_order_id: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for fill in data:
+            executions_by_order_id[fill['orderId']].append(fill)
+        return executions_by_order_id
+
     async def _update_fills(self, tracked_order: LeverjPerpetualInFlightOrder):
         try:
             data = await self.api_request('GET', '/account/execution')
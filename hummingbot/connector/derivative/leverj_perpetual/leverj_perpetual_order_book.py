@@ -1,13 +1,26 @@
 import logging
-from typing import Optional, Dict
+from typing import Any, Dict, Iterable, Optional
 from decimal import Decimal
 
+import numpy as np
+
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_order_book_message import LeverjPerpetualOrderBookMessage
 
 
+def levels_to_numpy(levels: Iterable[Dict[str, Any]], amount_key: str) -> np.ndarray:
+    """
+    Parses Leverj price levels straight into a float64 array of [price, amount] rows.
+    """
+    rows = [(level['price'], level[amount_key]) for level in levels]
+    if len(rows) == 0:
+        return np.empty((0, 2), dtype=np.float64)
+    return np.array(rows, dtype=np.float64)
+
+
 class LeverjPerpetualOrderBook(OrderBook):
     _bpob_logger = None
 
@@ -23,14 +36,14 @@ class LeverjPerpetualOrderBook(OrderBook):
         if metadata:
             msg.update(metadata)
         if msg["rest"]:
-            bids = [{"price": Decimal(str(bid["price"])), "amount": Decimal(str(bid["totalQuantity"]))} for bid in msg["buy"]]
-            asks = [{"price": Decimal(str(ask["price"])), "amount": Decimal(str(ask["totalQuantity"]))} for ask in msg["sell"]]
+            bids = levels_to_numpy(msg["buy"], "totalQuantity")
+            asks = levels_to_numpy(msg["sell"], "totalQuantity")
         else:
-            bids = [{"price": Decimal(bid['price']), "amount": Decimal(bid['size'])} for bid in msg["bids"]]
-            asks = [{"price": Decimal(ask['price']), "amount": Decimal(ask['size'])} for ask in msg["asks"]]
+            bids = levels_to_numpy(msg["bids"], "size")
+            asks = levels_to_numpy(msg["asks"], "size")
         return LeverjPerpetualOrderBookMessage(OrderBookMessageType.SNAPSHOT, {
             "trading_pair": msg["trading_pair"],
-            "update_id": timestamp,
+            "update_id": get_tracking_nonce(),
             "bids": bids,
             "asks": asks
         }, timestamp=timestamp)
@@ -38,16 +51,18 @@ class LeverjPerpetualOrderBook(OrderBook):
     @classmethod
     def diff_message_from_exchange(cls, msg: Dict[str, any], timestamp: Optional[float] = None,
                                    metadata: Optional[Dict] = None) -> OrderBookMessage:
+        """
+        Diff levels are parsed into float64 arrays without going through Decimal, and numbered with strictly
+        increasing microsecond update ids, shared with the snapshots, so diffs older than a snapshot are discarded.
+        """
         if metadata:
             msg.update(metadata)
 
-        bids = [{"price": Decimal(bid['price']), "amount": Decimal(bid['totalQuantity'])} for bid in msg["buy"].values()]
-        asks = [{"price": Decimal(ask['price']), "amount": Decimal(ask['totalQuantity'])} for ask in msg["sell"].values()]
         return LeverjPerpetualOrderBookMessage(OrderBookMessageType.DIFF, {
             "trading_pair": msg["trading_pair"],
-            "update_id": timestamp,
-            "bids": bids,
-            "asks": asks
+            "update_id": get_tracking_nonce(),
+            "bids": levels_to_numpy(msg["buy"].values(), "totalQuantity"),
+            "asks": levels_to_numpy(msg["sell"].values(), "totalQuantity")
         }, timestamp=timestamp)
 
     @classmethod
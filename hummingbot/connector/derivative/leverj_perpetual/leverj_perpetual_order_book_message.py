@@ -3,18 +3,16 @@
 import time
 from typing import (
     Dict,
-    List,
     Optional,
 )
 
-from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_message import (
-    OrderBookMessage,
+    NumpyOrderBookMessage,
     OrderBookMessageType,
 )
 
 
-class LeverjPerpetualOrderBookMessage(OrderBookMessage):
+class LeverjPerpetualOrderBookMessage(NumpyOrderBookMessage):
     def __new__(cls, message_type: OrderBookMessageType, content: Dict[str, any], timestamp: Optional[float] = None,
                 *args, **kwargs):
         if timestamp is None:
@@ -26,7 +24,7 @@ class LeverjPerpetualOrderBookMessage(OrderBookMessage):
 
     @property
     def update_id(self) -> int:
-        return int(self.timestamp)
+        return self.content["update_id"]
 
     @property
     def trade_id(self) -> int:
@@ -36,14 +34,6 @@ class LeverjPerpetualOrderBookMessage(OrderBookMessage):
     def trading_pair(self) -> str:
         return self.content["trading_pair"]
 
-    @property
-    def asks(self) -> List[OrderBookRow]:
-        return self.content["asks"]
-
-    @property
-    def bids(self) -> List[OrderBookRow]:
-        return self.content["bids"]
-
     @property
     def has_update_id(self) -> bool:
         return True
@@ -9,14 +9,12 @@ from typing import (
     Dict,
     # Set
 )
-from decimal import Decimal
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_order_book import LeverjPerpetualOrderBook
 from hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_order_book_message import LeverjPerpetualOrderBookMessage
 from hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_api_order_book_data_source import LeverjPerpetualAPIOrderBookDataSource
 from hummingbot.core.data_type.order_book_message import OrderBookMessageType
-from hummingbot.core.data_type.order_book_row import ClientOrderBookRow
 
 
 class LeverjPerpetualOrderBookTracker(OrderBookTracker):
@@ -33,13 +31,15 @@ class LeverjPerpetualOrderBookTracker(OrderBookTracker):
         trading_pairs: Optional[List[str]] = None,
         domain: str = None,
         leverj_auth: str = "",
-        token_configuration = None
+        token_configuration = None,
+        use_tick_order_book: bool = False
     ):
         super().__init__(
            LeverjPerpetualAPIOrderBookDataSource(
                 trading_pairs=trading_pairs,
                 token_configuration=token_configuration,
                 domain=domain,
+                use_tick_order_book=use_tick_order_book,
             ),
             trading_pairs)
 
@@ -67,14 +67,10 @@ class LeverjPerpetualOrderBookTracker(OrderBookTracker):
                 else:
                     message = await message_queue.get()
                 if message.type is OrderBookMessageType.DIFF:
-                    bids = [ClientOrderBookRow(Decimal(bid["price"]), Decimal(bid["amount"]), message.update_id) for bid in message.bids]
-                    asks = [ClientOrderBookRow(Decimal(ask["price"]), Decimal(ask["amount"]), message.update_id) for ask in message.asks]
-                    order_book.apply_diffs(bids, asks, int(message.timestamp))
+                    order_book.apply_diff_message(message)
 
                 elif message.type is OrderBookMessageType.SNAPSHOT:
-                    bids = [ClientOrderBookRow(Decimal(bid["price"]), Decimal(bid["amount"]), message.update_id) for bid in message.bids]
-                    asks = [ClientOrderBookRow(Decimal(ask["price"]), Decimal(ask["amount"]), message.update_id) for ask in message.asks]
-                    order_book.apply_snapshot(bids, asks, int(message.timestamp))
+                    order_book.apply_snapshot_message(message)
                     self.logger().debug("Processed order book snapshot for %s.", trading_pair)
 
             except asyncio.CancelledError:
@@ -0,0 +1,210 @@
+import asyncio
+import logging
+import time
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Optional,
+    Set,
+)
+
+import socketio
+
+from hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_auth import LeverjPerpetualAuth
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+SOCKETIO_PATH = "/futures/socket.io"
+
+
+class LeverjPerpetualStreamStats:
+    """
+    Message rate and reconnect counters of one consumer of a LeverjPerpetualSocketIOManager session.
+    """
+    RATE_WINDOW = 10.0
+
+    def __init__(self):
+        self.messages_received: int = 0
+        self.last_message_time: float = 0
+        self.message_rate: float = 0
+        self.reconnects: int = 0
+        self._window_start: float = 0
+        self._window_messages: int = 0
+
+    def record_message(self, timestamp: float):
+        self.messages_received += 1
+        self.last_message_time = timestamp
+        self._window_messages += 1
+        if self._window_start == 0:
+            self._window_start = timestamp
+        elif timestamp - self._window_start >= self.RATE_WINDOW:
+            self.message_rate = self._window_messages / (timestamp - self._window_start)
+            self._window_start = timestamp
+            self._window_messages = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "messages_received": self.messages_received,
+            "message_rate": round(self.message_rate, 2),
+            "last_message_time": self.last_message_time,
+            "reconnects": self.reconnects,
+        }
+
+    def __repr__(self) -> str:
+        return (f"LeverjPerpetualStreamStats(messages_received={self.messages_received}, "
+                f"message_rate={self.message_rate:.2f}/s, reconnects={self.reconnects})")
+
+
+class LeverjPerpetualSocketIOManager:
+    """
+    Runs a single Socket.IO session per domain, shared by the order book and user stream data sources. Consumers
+    subscribe with the event types they need and a queue; each event is put on the queues of the consumers subscribed
+    to its type as an (event type, message) tuple, without any intermediate queue.
+
+    The session is opened when the first consumer subscribes and closed when the last one unsubscribes. Lost
+    connections are reopened with exponential backoff, and the public and private subscriptions are requested again
+    as soon as the session is connected.
+    """
+    INITIAL_RECONNECT_DELAY = 0.5
+    MAX_RECONNECT_DELAY = 30.0
+
+    _lpsm_logger: Optional[HummingbotLogger] = None
+    _instances: Dict[str, "LeverjPerpetualSocketIOManager"] = {}
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._lpsm_logger is None:
+            cls._lpsm_logger = logging.getLogger(__name__)
+        return cls._lpsm_logger
+
+    @classmethod
+    def get_instance(cls, base_url: str) -> "LeverjPerpetualSocketIOManager":
+        if base_url not in cls._instances:
+            cls._instances[base_url] = cls(base_url)
+        return cls._instances[base_url]
+
+    def __init__(self, base_url: str):
+        self._base_url = base_url
+        self._leverj_auth: Optional[LeverjPerpetualAuth] = None
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._routes: Dict[str, Set[str]] = {}
+        self._stats: Dict[str, LeverjPerpetualStreamStats] = {}
+        self._sio: Optional[socketio.AsyncClient] = None
+        self._session_task: Optional[asyncio.Task] = None
+        self._disconnected: Optional[asyncio.Event] = None
+        self._connected: bool = False
+        self._reconnect_delay: float = self.INITIAL_RECONNECT_DELAY
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    @property
+    def stream_stats(self) -> Dict[str, LeverjPerpetualStreamStats]:
+        return self._stats
+
+    def subscribe(self,
+                  consumer: str,
+                  event_types: Iterable[str],
+                  queue: asyncio.Queue,
+                  leverj_auth: Optional[LeverjPerpetualAuth] = None):
+        """
+        Routes the given event types to `queue`. Passing `leverj_auth` registers the session for the account's
+        private events.
+        """
+        self.unsubscribe(consumer, close_session=False)
+        self._queues[consumer] = queue
+        self._stats[consumer] = LeverjPerpetualStreamStats()
+        for event_type in event_types:
+            if event_type not in self._routes:
+                self._routes[event_type] = set()
+                if self._sio is not None:
+                    self._sio.on(event_type, self._event_handler(event_type))
+            self._routes[event_type].add(consumer)
+        if leverj_auth is not None and self._leverj_auth is None:
+            self._leverj_auth = leverj_auth
+            if self._connected:
+                safe_ensure_future(self._register())
+        if self._session_task is None:
+            self._session_task = safe_ensure_future(self._run_session())
+
+    def unsubscribe(self, consumer: str, close_session: bool = True):
+        if consumer not in self._queues:
+            return
+        del self._queues[consumer]
+        for consumers in self._routes.values():
+            consumers.discard(consumer)
+        if close_session and len(self._queues) == 0 and self._session_task is not None:
+            self._session_task.cancel()
+            self._session_task = None
+
+    def _event_handler(self, event_type: str):
+        async def handler(msg):
+            timestamp = time.time()
+            for consumer in self._routes.get(event_type, ()):
+                self._stats[consumer].record_message(timestamp)
+                self._queues[consumer].put_nowait((event_type, msg))
+        return handler
+
+    def _create_client(self) -> socketio.AsyncClient:
+        # Reconnection is handled by _run_session, so the subscriptions are requested again on every new session.
+        sio = socketio.AsyncClient(logger=False, reconnection=False)
+        sio.on("connect", self._on_connect)
+        sio.on("disconnect", self._on_disconnect)
+        for event_type in self._routes:
+            sio.on(event_type, self._event_handler(event_type))
+        return sio
+
+    async def _on_connect(self):
+        self._connected = True
+        self._reconnect_delay = self.INITIAL_RECONNECT_DELAY
+        try:
+            await self._sio.emit('GET /instrument', {})
+            if self._leverj_auth is not None:
+                await self._register()
+        except Exception:
+            self.logger().error("Error subscribing to leverj Socket.IO events.", exc_info=True)
+
+    async def _on_disconnect(self, *args):
+        self._connected = False
+        if self._disconnected is not None:
+            self._disconnected.set()
+
+    async def _register(self):
+        headers = self._leverj_auth.generate_request_headers('GET', '/register', {})
+        await self._sio.emit('GET /register', {
+            "headers": headers,
+            "method": 'GET',
+            "uri": "/register",
+            "params": {},
+            "body": {},
+            "retry": False
+        })
+
+    async def _run_session(self):
+        first_session = True
+        try:
+            while True:
+                self._sio = self._create_client()
+                self._disconnected = asyncio.Event()
+                try:
+                    await self._sio.connect(self._base_url, socketio_path=SOCKETIO_PATH, transports=['websocket'])
+                    if not first_session:
+                        for consumer in self._queues:
+                            self._stats[consumer].reconnects += 1
+                    first_session = False
+                    await self._disconnected.wait()
+                    self.logger().warning("Leverj Socket.IO session disconnected. Reconnecting...")
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self.logger().network("Error connecting to the leverj Socket.IO endpoint.", exc_info=True,
+                                          app_warning_msg="Could not connect to leverj. Check network connection.")
+                finally:
+                    self._connected = False
+                    await self._sio.disconnect()
+                await asyncio.sleep(self._reconnect_delay)
+                self._reconnect_delay = min(self._reconnect_delay * 2, self.MAX_RECONNECT_DELAY)
+        finally:
+            self._sio = None
@@ -4,7 +4,6 @@ import asyncio
 import aiohttp
 import json
 import logging
-import time
 from typing import (
     AsyncIterable,
     Optional
@@ -16,13 +15,23 @@ from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_auth import LeverjPerpetualAuth
 from hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_api_order_book_data_source import LeverjPerpetualAPIOrderBookDataSource
 from hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_order_book import LeverjPerpetualOrderBook
-from hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_socketio_client import LeverjPerpetualSocketIOClient
+from hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_socketio_manager import LeverjPerpetualSocketIOManager
 
 from hummingbot.connector.derivative.leverj_perpetual.constants import (
     PERPETUAL_BASE_URL,
     TESTNET_BASE_URL
 )
 
+USER_STREAM = "user_stream"
+USER_STREAM_EVENTS = ['order_add',
+                      'order_update',
+                      'order_del',
+                      'account_balance',
+                      'order_execution',
+                      'position',
+                      'order_cancelled']
+
+
 class LeverjPerpetualUserStreamDataSource(UserStreamTrackerDataSource):
 
     _krausds_logger: Optional[HummingbotLogger] = None
@@ -37,9 +46,7 @@ class LeverjPerpetualUserStreamDataSource(UserStreamTrackerDataSource):
         self._leverj_auth: LeverjPerpetualAuth = leverj_auth
         self._orderbook_tracker_data_source: LeverjPerpetualAPIOrderBookDataSource = orderbook_tracker_data_source
         self._shared_client: Optional[aiohttp.ClientSession] = None
-        self._last_recv_time: float = 0
         self._request_message_queue: asyncio.Queue = asyncio.Queue()
-        self._account_message_queue: asyncio.Queue = asyncio.Queue()
         self._base_url = TESTNET_BASE_URL if domain == 'kovan' else PERPETUAL_BASE_URL
         super().__init__()
 
@@ -49,39 +56,14 @@ class LeverjPerpetualUserStreamDataSource(UserStreamTrackerDataSource):
 
     @property
     def last_recv_time(self):
-        return self._last_recv_time
+        stats = LeverjPerpetualSocketIOManager.get_instance(self._base_url).stream_stats.get(USER_STREAM)
+        return stats.last_message_time if stats is not None else 0
 
     async def listen_for_user_stream(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
-        while True:
-            try:
-                headers = self._leverj_auth.generate_request_headers('GET', '/register', {})
-                req_data = {
-                    "headers": headers,
-                    "method": 'GET',
-                    "uri": "/register",
-                    "params": {},
-                    "body": {},
-                    "retry": False
-                }
-                client = LeverjPerpetualSocketIOClient(self._account_message_queue,
-                                                       self._base_url,
-                                                       self._leverj_auth)
-                await client.run_client()
-                while True:
-                    msg = await self._account_message_queue.get()
-                    self._last_recv_time = time.time()
-
-                    if msg[0] in ['order_add',
-                                  'order_update',
-                                  'order_del',
-                                  'account_balance',
-                                  'order_execution', 
-                                  'position',
-                                  'order_cancelled']:
-                        output.put_nowait(msg)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error with leverj WebSocket connection. "
-                                    "Retrying after 30 seconds...", exc_info=True)
-                await asyncio.sleep(30.0)
+        # Account events are put straight on the user stream tracker's queue by the shared Socket.IO session.
+        socketio_manager = LeverjPerpetualSocketIOManager.get_instance(self._base_url)
+        socketio_manager.subscribe(USER_STREAM, USER_STREAM_EVENTS, output, leverj_auth=self._leverj_auth)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            socketio_manager.unsubscribe(USER_STREAM)
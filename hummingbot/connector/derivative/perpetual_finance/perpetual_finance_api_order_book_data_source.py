@@ -1,9 +1,9 @@
 import aiohttp
 from typing import List
-import json
 from typing import Dict
 
 from hummingbot.connector.derivative.perpetual_finance.perpetual_finance_utils import convert_from_exchange_trading_pair
+from hummingbot.core.utils.json_utils import response_json
 
 
 class PerpetualFinanceAPIOrderBookDataSource:
@@ -13,7 +13,7 @@ class PerpetualFinanceAPIOrderBookDataSource:
         async with aiohttp.ClientSession() as client:
             response = await client.get(url)
             trading_pairs = []
-            parsed_response = json.loads(await response.text())
+            parsed_response = await response_json(response)
             contracts = parsed_response["layers"]["layer2"]["contracts"]
             trading_pairs = [convert_from_exchange_trading_pair(contract) for contract in contracts.keys() if contracts[contract]["name"] == "Amm"]
             return trading_pairs
@@ -12,6 +12,7 @@ from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.json_utils import json_loads, response_json
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.ascend_ex.ascend_ex_active_order_tracker import AscendExActiveOrderTracker
 from hummingbot.connector.exchange.ascend_ex.ascend_ex_order_book import AscendExOrderBook
@@ -51,7 +52,7 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         f"HTTP status is {resp.status}."
                     )
 
-                resp_json = await resp.json()
+                resp_json = await response_json(resp)
                 if resp_json.get("code") != 0:
                     raise IOError(
                         f"Error fetching last traded prices at {EXCHANGE_NAME}. "
@@ -76,7 +77,7 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 # Do nothing if the request fails -- there will be no autocomplete for kucoin trading pairs
                 return []
 
-            data: Dict[str, Dict[str, Any]] = await resp.json()
+            data: Dict[str, Dict[str, Any]] = await response_json(resp)
             return [convert_from_exchange_trading_pair(item["symbol"]) for item in data["data"]]
 
     @staticmethod
@@ -92,7 +93,7 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     f"HTTP status is {resp.status}."
                 )
 
-            data: List[Dict[str, Any]] = await safe_gather(resp.json())
+            data: List[Dict[str, Any]] = await safe_gather(response_json(resp))
             item = data[0]
             if item.get("code") != 0:
                 raise IOError(
@@ -132,7 +133,7 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     await ws.send(ujson.dumps(payload))
 
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_loads(raw_msg)
                         if (msg is None or msg.get("m") != "trades"):
                             continue
 
@@ -171,7 +172,7 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     await ws.send(ujson.dumps(payload))
 
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_loads(raw_msg)
                         if msg is None:
                             continue
                         if msg.get("m", '') == "ping":
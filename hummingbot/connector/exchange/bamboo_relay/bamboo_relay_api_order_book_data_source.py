@@ -18,6 +18,7 @@ from websockets.exceptions import ConnectionClosed
 
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.utils.ssl_client_request import SSLClientRequest
+from hummingbot.core.utils.json_utils import json_loads, response_json
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.bamboo_relay.bamboo_relay_order_book import BambooRelayOrderBook
@@ -97,7 +98,7 @@ class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
             response: aiohttp.ClientResponse = response
             if response.status != 200:
                 raise IOError(f"Error fetching token info. HTTP status is {response.status}.")
-            data = await response.json()
+            data = await response_json(response)
             return {d["address"]: d for d in data}
 
     @staticmethod
@@ -111,7 +112,7 @@ class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
                                           timeout=5) as response:
                         if response.status == 200:
 
-                            markets = await response.json()
+                            markets = await response_json(response)
                             new_trading_pairs = set(map(lambda details: details.get("id"), markets))
                             if len(new_trading_pairs) == 0:
                                 break
@@ -142,7 +143,7 @@ class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
             if response.status != 200:
                 raise IOError(f"Error fetching Bamboo Relay market snapshot for {trading_pair}. "
                               f"HTTP status is {response.status}.")
-            return await response.json()
+            return await response_json(response)
 
     async def get_trading_pairs(self) -> List[str]:
         return await self.fetch_trading_pairs()
@@ -196,7 +197,7 @@ class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     if not self._motd_done:
                         try:
                             raw_msg = await asyncio.wait_for(ws.recv(), timeout=self.MESSAGE_TIMEOUT)
-                            msg = ujson.loads(raw_msg)
+                            msg = json_loads(raw_msg)
                             # Print MOTD and announcements if present
                             if "motd" in msg:
                                 self._motd_done = True
@@ -217,7 +218,7 @@ class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     async for raw_msg in self._inner_messages(ws):
                         # Try here, else any errors cause the websocket to disconnect
                         try:
-                            msg = ujson.loads(raw_msg)
+                            msg = json_loads(raw_msg)
                             # Valid Diff messages from BambooRelay have actions array
                             if "actions" in msg:
                                 diff_msg: BambooRelayOrderBookMessage = BambooRelayOrderBook.diff_message_from_exchange(
@@ -3,8 +3,6 @@
 import logging
 import aiohttp
 import asyncio
-import json
-import ujson
 from typing import Any, AsyncIterable, Optional, List, Dict
 import pandas as pd
 import websockets
@@ -13,6 +11,7 @@ import websockets
 from websockets.exceptions import ConnectionClosed
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils.json_utils import json_loads, response_json
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
@@ -59,8 +58,8 @@ class BeaxyAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 raise IOError(f'Error fetching Beaxy exchange information. '
                               f'HTTP status is {symbols_response.status}.')
 
-            symbols_data = await symbols_response.json()
-            rates_data = await rates_response.json()
+            symbols_data = await response_json(symbols_response)
+            rates_data = await response_json(rates_response)
 
             market_data: List[Dict[str, Any]] = [{'pair': pair, **rates_data[pair], **item}
                                                  for pair in rates_data
@@ -101,7 +100,7 @@ class BeaxyAPIOrderBookDataSource(OrderBookTrackerDataSource):
             async with aiohttp.ClientSession() as client:
                 async with client.get(BeaxyConstants.PublicApi.SYMBOLS_URL, timeout=5) as response:
                     if response.status == 200:
-                        all_trading_pairs: List[Dict[str, Any]] = await response.json()
+                        all_trading_pairs: List[Dict[str, Any]] = await response_json(response)
                         return ['{}-{}'.format(*p) for p in
                                 split_market_pairs([i['symbol'] for i in all_trading_pairs])]
         except Exception:  # nopep8
@@ -120,7 +119,7 @@ class BeaxyAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     if response.status != 200:
                         raise IOError(f'Error fetching Beaxy market trade for {trading_pair}. '
                                       f'HTTP status is {response.status}.')
-                    data: Dict[str, Any] = await response.json()
+                    data: Dict[str, Any] = await response_json(response)
                     return trading_pair, float(data['price'])
 
         fetches = [last_price_for_pair(p) for p in trading_pairs]
@@ -149,7 +148,7 @@ class BeaxyAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     'sequenceNumber': 1,
                 }
 
-            data: Dict[str, Any] = await response.json()
+            data: Dict[str, Any] = await response_json(response)
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
@@ -238,7 +237,7 @@ class BeaxyAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 async with websockets.connect(stream_url) as ws:
                     ws: websockets.WebSocketClientProtocol = ws
                     async for raw_msg in self._inner_messages(ws):
-                        msg = json.loads(raw_msg)  # ujson may round floats uncorrectly
+                        msg = json_loads(raw_msg)
                         msg_type = msg['type']
                         if msg_type == ORDERBOOK_MESSAGE_DIFF:
                             order_book_message: OrderBookMessage = BeaxyOrderBook.diff_message_from_exchange(
@@ -267,7 +266,7 @@ class BeaxyAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 async with websockets.connect(stream_url) as ws:
                     ws: websockets.WebSocketClientProtocol = ws
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_loads(raw_msg)
                         trade_msg: OrderBookMessage = BeaxyOrderBook.trade_message_from_exchange(msg)
                         output.put_nowait(trade_msg)
             except asyncio.CancelledError:
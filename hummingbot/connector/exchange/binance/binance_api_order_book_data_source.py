@@ -14,11 +14,11 @@ from typing import (
 from decimal import Decimal
 import re
 import time
-import ujson
 import websockets
 from websockets.exceptions import ConnectionClosed
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.json_utils import json_loads, response_json
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book import OrderBook
@@ -63,7 +63,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
         async with aiohttp.ClientSession() as client:
             url = TICKER_PRICE_CHANGE_URL.format(domain)
             resp = await client.get(f"{url}?symbol={convert_to_exchange_trading_pair(trading_pair)}")
-            resp_json = await resp.json()
+            resp_json = await response_json(resp)
             return float(resp_json["lastPrice"])
 
     @staticmethod
@@ -73,7 +73,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
         async with aiohttp.ClientSession() as client:
             url = "https://api.binance.{}/api/v3/ticker/bookTicker".format(domain)
             resp = await client.get(url)
-            resp_json = await resp.json()
+            resp_json = await response_json(resp)
             ret_val = {}
             for record in resp_json:
                 pair = convert_from_exchange_trading_pair(record["symbol"])
@@ -88,7 +88,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 url = EXCHANGE_INFO_URL.format(domain)
                 async with client.get(url, timeout=10) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await response_json(response)
                         raw_trading_pairs = [d["symbol"] for d in data["symbols"] if d["status"] == "TRADING"]
                         trading_pair_list: List[str] = []
                         for raw_trading_pair in raw_trading_pairs:
@@ -115,7 +115,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
             if response.status != 200:
                 raise IOError(f"Error fetching market snapshot for {trading_pair}. "
                               f"HTTP status is {response.status}.")
-            data: Dict[str, Any] = await response.json()
+            data: Dict[str, Any] = await response_json(response)
 
             # Need to add the symbol into the snapshot message for the Kafka message queue.
             # Because otherwise, there'd be no way for the receiver to know which market the
@@ -133,7 +133,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 metadata={"trading_pair": trading_pair}
             )
             order_book = self.order_book_create_function()
-            order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
+            order_book.apply_snapshot_message(snapshot_msg)
             return order_book
 
     async def _inner_messages(self,
@@ -166,7 +166,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 async with websockets.connect(stream_url) as ws:
                     ws: websockets.WebSocketClientProtocol = ws
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_loads(raw_msg)
                         trade_msg: OrderBookMessage = BinanceOrderBook.trade_message_from_exchange(msg)
                         output.put_nowait(trade_msg)
             except asyncio.CancelledError:
@@ -187,7 +187,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 async with websockets.connect(stream_url) as ws:
                     ws: websockets.WebSocketClientProtocol = ws
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_loads(raw_msg)
                         order_book_message: OrderBookMessage = BinanceOrderBook.diff_message_from_exchange(
                             msg, time.time())
                         output.put_nowait(order_book_message)
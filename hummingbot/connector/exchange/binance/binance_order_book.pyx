@@ -13,6 +13,7 @@ from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import TradeType
 from hummingbot.core.data_type.order_book cimport OrderBook
 from hummingbot.core.data_type.order_book_message import (
+    NumpyOrderBookMessage,
     OrderBookMessage,
     OrderBookMessageType
 )
@@ -36,7 +37,7 @@ cdef class BinanceOrderBook(OrderBook):
                                        metadata: Optional[Dict] = None) -> OrderBookMessage:
         if metadata:
             msg.update(metadata)
-        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+        return NumpyOrderBookMessage(OrderBookMessageType.SNAPSHOT, {
             "trading_pair": msg["trading_pair"],
             "update_id": msg["lastUpdateId"],
             "bids": msg["bids"],
@@ -50,7 +51,7 @@ cdef class BinanceOrderBook(OrderBook):
                                    metadata: Optional[Dict] = None) -> OrderBookMessage:
         if metadata:
             msg.update(metadata)
-        return OrderBookMessage(OrderBookMessageType.DIFF, {
+        return NumpyOrderBookMessage(OrderBookMessageType.DIFF, {
             "trading_pair": binance_utils.convert_from_exchange_trading_pair(msg["s"]),
             "first_update_id": msg["U"],
             "update_id": msg["u"],
@@ -140,5 +141,5 @@ cdef class BinanceOrderBook(OrderBook):
     @classmethod
     def from_snapshot(cls, msg: OrderBookMessage) -> "OrderBook":
         retval = BinanceOrderBook()
-        retval.apply_snapshot(msg.bids, msg.asks, msg.update_id)
+        retval.apply_snapshot_message(msg)
         return retval
@@ -11,6 +11,7 @@ from async_timeout import timeout
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.bitfinex import BITFINEX_WS_URI
 from hummingbot.connector.exchange.bitfinex.bitfinex_auth import BitfinexAuth
+from hummingbot.core.utils.json_utils import json_loads
 
 
 # reusable websocket class
@@ -58,7 +59,7 @@ class BitfinexWebsocket():
             while True:
                 try:
                     msg_str: str = await asyncio.wait_for(self._client.recv(), timeout=self.MESSAGE_TIMEOUT)
-                    msg = ujson.loads(msg_str)
+                    msg = json_loads(msg_str)
                     # print("received", msg)
 
                     for queue in self._consumers.values():
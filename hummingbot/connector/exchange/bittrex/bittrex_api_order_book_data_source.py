@@ -9,7 +9,6 @@ from zlib import decompress, MAX_WBITS
 
 import pandas as pd
 import signalr_aio
-import ujson
 from signalr_aio import Connection
 from signalr_aio.hubs import Hub
 from async_timeout import timeout
@@ -20,6 +19,7 @@ from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTr
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.bittrex.bittrex_active_order_tracker import BittrexActiveOrderTracker
 from hummingbot.connector.exchange.bittrex.bittrex_order_book import BittrexOrderBook
+from hummingbot.core.utils.json_utils import json_loads, response_json
 
 
 EXCHANGE_NAME = "Bittrex"
@@ -58,7 +58,7 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         results = dict()
         async with aiohttp.ClientSession() as client:
             resp = await client.get(f"{BITTREX_REST_URL}{BITTREX_TICKER_PATH}")
-            resp_json = await resp.json()
+            resp_json = await response_json(resp)
             for trading_pair in trading_pairs:
                 resp_record = [o for o in resp_json if o["symbol"] == trading_pair][0]
                 results[trading_pair] = float(resp_record["lastTradeRate"])
@@ -103,7 +103,7 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
             async with aiohttp.ClientSession() as client:
                 async with client.get(f"{BITTREX_REST_URL}{BITTREX_EXCHANGE_INFO_PATH}", timeout=5) as response:
                     if response.status == 200:
-                        all_trading_pairs: List[Dict[str, Any]] = await response.json()
+                        all_trading_pairs: List[Dict[str, Any]] = await response_json(response)
                         return [item["symbol"]
                                 for item in all_trading_pairs
                                 if item["status"] == "ONLINE"]
@@ -121,7 +121,7 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
             if response.status != 200:
                 raise IOError(f"Error fetching Bittrex market snapshot for {trading_pair}. "
                               f"HTTP status is {response.status}.")
-            data: Dict[str, Any] = await response.json()
+            data: Dict[str, Any] = await response_json(response)
             data["sequence"] = response.headers["sequence"]
             return data
 
@@ -193,7 +193,7 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
             except Exception:
                 return {}
 
-            return ujson.loads(decoded_msg.decode())
+            return json_loads(decoded_msg)
 
         def _is_market_delta(msg) -> bool:
             return len(msg.get("M", [])) > 0 and type(msg["M"][0]) == dict and msg["M"][0].get("M", None) == "orderBook"
@@ -202,7 +202,7 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return len(msg.get("M", [])) > 0 and type(msg["M"][0]) == dict and msg["M"][0].get("M", None) == "trade"
 
         output: Dict[str, Any] = {"nonce": None, "type": None, "results": {}}
-        msg: Dict[str, Any] = ujson.loads(msg)
+        msg: Dict[str, Any] = json_loads(msg)
         if len(msg.get("M", [])) > 0:
             output["results"] = _decode_message(msg["M"][0]["A"][0])
             output["nonce"] = time.time() * 1000
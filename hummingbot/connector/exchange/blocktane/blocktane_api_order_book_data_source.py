@@ -14,7 +14,6 @@ from typing import (
 )
 import re
 import time
-import ujson
 import websockets
 
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -23,6 +22,7 @@ from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.blocktane.blocktane_order_book import BlocktaneOrderBook
 from hummingbot.connector.exchange.blocktane.blocktane_utils import convert_to_exchange_trading_pair, convert_from_exchange_trading_pair
+from hummingbot.core.utils.json_utils import json_loads, response_json
 
 BLOCKTANE_REST_URL = "https://trade.blocktane.io/api/v2/xt/public"
 DIFF_STREAM_URL = "wss://trade.blocktane.io/api/v2/ws/public"
@@ -56,7 +56,7 @@ class BlocktaneAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         async with aiohttp.ClientSession() as client:
             resp = await client.get(TICKER_PRICE_CHANGE_URL)
-            resp_json = await resp.json()
+            resp_json = await response_json(resp)
 
             return {convert_from_exchange_trading_pair(market): float(data["ticker"]["last"]) for market, data in resp_json.items()
                     if convert_from_exchange_trading_pair(market) in trading_pairs}
@@ -71,7 +71,7 @@ class BlocktaneAPIOrderBookDataSource(OrderBookTrackerDataSource):
             async with aiohttp.ClientSession() as client:
                 async with client.get(EXCHANGE_INFO_URL, timeout=API_CALL_TIMEOUT) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await response_json(response)
                         raw_trading_pairs = [d["id"] for d in data if d["state"] == "enabled"]
                         trading_pair_list: List[str] = []
                         for raw_trading_pair in raw_trading_pairs:
@@ -96,7 +96,7 @@ class BlocktaneAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 raise IOError(f"Error fetching blocktane market snapshot for {trading_pair}. "
                               f"HTTP status is {response.status}.")
 
-            data: Dict[str, Any] = await response.json()
+            data: Dict[str, Any] = await response_json(response)
 
             # Need to add the symbol into the snapshot message for the Kafka message queue.
             # Because otherwise, there'd be no way for the receiver to know which market the
@@ -139,7 +139,7 @@ class BlocktaneAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
                 ws: websockets.WebSocketClientProtocol = await self.get_ws_connection(stream_url)
                 async for raw_msg in self._inner_messages(ws):
-                    msg = ujson.loads(raw_msg)
+                    msg = json_loads(raw_msg)
                     if (list(msg.keys())[0].endswith("trades")):
                         trade_msg: OrderBookMessage = BlocktaneOrderBook.trade_message_from_exchange(msg)
                         output.put_nowait(trade_msg)
@@ -162,7 +162,7 @@ class BlocktaneAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
                 ws: websockets.WebSocketClientProtocol = await self.get_ws_connection(stream_url)
                 async for raw_msg in self._inner_messages(ws):
-                    msg = ujson.loads(raw_msg)
+                    msg = json_loads(raw_msg)
                     key = list(msg.keys())[0]
                     if ('ob-inc' in key):
                         pair = re.sub(r'\.ob-inc', '', key)
@@ -16,6 +16,7 @@ from typing import (
 from websockets.exceptions import ConnectionClosed
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.coinzoom.coinzoom_auth import CoinzoomAuth
+from hummingbot.core.utils.json_utils import json_loads
 
 # reusable websocket class
 # ToDo: We should eventually remove this class, and instantiate web socket connection normally (see Binance for example)
@@ -65,7 +66,7 @@ class CoinzoomWebsocket():
                 try:
                     raw_msg_str: str = await asyncio.wait_for(self._client.recv(), timeout=Constants.MESSAGE_TIMEOUT)
                     try:
-                        msg = json.loads(raw_msg_str)
+                        msg = json_loads(raw_msg_str)
 
                         # CoinZoom doesn't support ping or heartbeat messages.
                         # Can handle them here if that changes - use `safe_ensure_future`.
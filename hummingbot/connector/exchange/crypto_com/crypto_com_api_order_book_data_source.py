@@ -11,6 +11,7 @@ from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.json_utils import response_json
 from hummingbot.logger import HummingbotLogger
 from . import crypto_com_utils
 from .crypto_com_active_order_tracker import CryptoComActiveOrderTracker
@@ -42,7 +43,7 @@ class CryptoComAPIOrderBookDataSource(OrderBookTrackerDataSource):
         result = {}
         async with aiohttp.ClientSession() as client:
             resp = await client.get(f"{constants.REST_URL}/public/get-ticker")
-            resp_json = await resp.json()
+            resp_json = await response_json(resp)
             for t_pair in trading_pairs:
                 last_trade = [o["a"] for o in resp_json["result"]["data"] if o["i"] ==
                               crypto_com_utils.convert_to_exchange_trading_pair(t_pair)]
@@ -58,7 +59,7 @@ class CryptoComAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     from hummingbot.connector.exchange.crypto_com.crypto_com_utils import \
                         convert_from_exchange_trading_pair
                     try:
-                        data: Dict[str, Any] = await response.json()
+                        data: Dict[str, Any] = await response_json(response)
                         return [convert_from_exchange_trading_pair(item["i"]) for item in data["result"]["data"]]
                     except Exception:
                         pass
@@ -82,7 +83,7 @@ class CryptoComAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     f"HTTP status is {orderbook_response.status}."
                 )
 
-            orderbook_data: List[Dict[str, Any]] = await safe_gather(orderbook_response.json())
+            orderbook_data: List[Dict[str, Any]] = await safe_gather(response_json(orderbook_response))
             orderbook_data = orderbook_data[0]["result"]["data"][0]
 
         return orderbook_data
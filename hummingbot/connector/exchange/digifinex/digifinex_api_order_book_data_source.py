@@ -12,6 +12,7 @@ from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.json_utils import response_json
 from hummingbot.logger import HummingbotLogger
 from . import digifinex_utils
 from .digifinex_active_order_tracker import DigifinexActiveOrderTracker
@@ -43,7 +44,7 @@ class DigifinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         result = {}
         async with aiohttp.ClientSession() as client:
             resp = await client.get(f"{constants.REST_URL}/ticker")
-            resp_json = await resp.json()
+            resp_json = await response_json(resp)
             for t_pair in trading_pairs:
                 last_trade = [o["last"] for o in resp_json["ticker"] if o["symbol"] ==
                               digifinex_utils.convert_to_exchange_trading_pair(t_pair)]
@@ -59,7 +60,7 @@ class DigifinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     from hummingbot.connector.exchange.digifinex.digifinex_utils import \
                         convert_from_exchange_trading_pair
                     try:
-                        data: Dict[str, Any] = await response.json()
+                        data: Dict[str, Any] = await response_json(response)
                         return [convert_from_exchange_trading_pair(item["symbol"]) for item in data["ticker"]]
                     except Exception:
                         pass
@@ -83,7 +84,7 @@ class DigifinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     f"HTTP status is {orderbook_response.status}."
                 )
 
-            orderbook_data: List[Dict[str, Any]] = await safe_gather(orderbook_response.json())
+            orderbook_data: List[Dict[str, Any]] = await safe_gather(response_json(orderbook_response))
             orderbook_data = orderbook_data[0]
         return orderbook_data
 
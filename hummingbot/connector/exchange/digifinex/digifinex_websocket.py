@@ -15,6 +15,7 @@ from websockets.exceptions import ConnectionClosed
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.digifinex.digifinex_auth import DigifinexAuth
 from hummingbot.connector.exchange.digifinex.digifinex_utils import RequestId
+from hummingbot.core.utils.json_utils import json_loads
 
 # reusable websocket class
 # ToDo: We should eventually remove this class, and instantiate web socket connection normally (see Binance for example)
@@ -96,7 +97,7 @@ class DigifinexWebsocket(RequestId):
                 try:
                     raw_msg_bytes: bytes = await asyncio.wait_for(self._client.recv(), timeout=self.MESSAGE_TIMEOUT)
                     inflated_msg: bytes = zlib.decompress(raw_msg_bytes)
-                    raw_msg = ujson.loads(inflated_msg)
+                    raw_msg = json_loads(inflated_msg)
                     # if "method" in raw_msg and raw_msg["method"] == "server.ping":
                     #     payload = {"id": raw_msg["id"], "method": "public/respond-heartbeat"}
                     #     safe_ensure_future(self._client.send(ujson.dumps(payload)))
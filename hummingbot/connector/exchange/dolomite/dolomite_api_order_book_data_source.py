@@ -16,6 +16,7 @@ import websockets
 from websockets.exceptions import ConnectionClosed
 
 from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils.json_utils import json_loads, response_json
 from hummingbot.connector.exchange.dolomite.dolomite_active_order_tracker import DolomiteActiveOrderTracker
 from hummingbot.connector.exchange.dolomite.dolomite_order_book import DolomiteOrderBook
 from hummingbot.connector.exchange.dolomite.dolomite_order_book_tracker_entry import DolomiteOrderBookTrackerEntry
@@ -68,7 +69,7 @@ class DolomiteAPIOrderBookDataSource(OrderBookTrackerDataSource):
             if markets_response.status != 200:
                 raise IOError(f"Error fetching active Dolomite markets. HTTP status is {markets_response.status}.")
 
-            markets_data = await markets_response.json()
+            markets_data = await response_json(markets_response)
             markets_data = markets_data["data"]
 
             field_mapping = {
@@ -105,7 +106,7 @@ class DolomiteAPIOrderBookDataSource(OrderBookTrackerDataSource):
             async with aiohttp.ClientSession() as client:
                 async with client.get("https://exchange-api.dolomite.io/v1/markets", timeout=10) as response:
                     if response.status == 200:
-                        all_trading_pairs: Dict[str, Any] = await response.json()
+                        all_trading_pairs: Dict[str, Any] = await response_json(response)
                         valid_trading_pairs: list = []
                         for item in all_trading_pairs["data"]:
                             valid_trading_pairs.append(item["market"])
@@ -138,7 +139,7 @@ class DolomiteAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 raise IOError(
                     f"Error fetching Dolomite market snapshot for {trading_pair}. " f"HTTP status is {response.status}."
                 )
-            data: Dict[str, Any] = await response.json()
+            data: Dict[str, Any] = await response_json(response)
             return data
 
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
@@ -226,7 +227,7 @@ class DolomiteAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     await ws.send(ujson.dumps(orderbook_subscription_request))
 
                     async for raw_msg in self._inner_messages(ws):
-                        message = ujson.loads(raw_msg)
+                        message = json_loads(raw_msg)
 
                         if message["route"] == SNAPSHOT_WS_ROUTE and message["action"] == SNAPSHOT_WS_UPDATE_ACTION:
                             snapshot_timestamp: float = time.time()
@@ -18,6 +18,7 @@ from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTr
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.utils.json_utils import json_loads, response_json
 
 
 MARKETS_URL = "/markets"
@@ -70,7 +71,7 @@ class DydxAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         async with aiohttp.ClientSession() as client:
             resp = await client.get(f"{DYDX_V1_API_URL}{TICKER_URL}")
-            resp_json = await resp.json()
+            resp_json = await response_json(resp)
             retval = {}
             for pair in trading_pairs:
                 retval[pair] = float(resp_json["markets"][convert_v2_pair_to_v1(pair)]["last"])
@@ -91,7 +92,7 @@ class DydxAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 raise IOError(
                     f"Error fetching dydx market snapshot for {trading_pair}. " f"HTTP status is {response.status}."
                 )
-            data: Dict[str, Any] = await response.json()
+            data: Dict[str, Any] = await response_json(response)
             data["market"] = trading_pair
             return data
 
@@ -133,7 +134,7 @@ class DydxAPIOrderBookDataSource(OrderBookTrackerDataSource):
             async with aiohttp.ClientSession() as client:
                 async with client.get(DYDX_MARKET_INFO_URL.format(""), timeout=5) as response:
                     if response.status == 200:
-                        all_trading_pairs: Dict[str, Any] = await response.json()
+                        all_trading_pairs: Dict[str, Any] = await response_json(response)
                         valid_trading_pairs: list = []
                         for item in all_trading_pairs["markets"].keys():
                             if "baseCurrency" in all_trading_pairs["markets"][item]:
@@ -163,7 +164,7 @@ class DydxAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         }
                         await ws.send(ujson.dumps(subscribe_request))
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_loads(raw_msg)
                         if "contents" in msg:
                             if "trades" in msg["contents"]:
                                 for datum in msg["contents"]["trades"]:
@@ -189,7 +190,7 @@ class DydxAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         }
                         await ws.send(ujson.dumps(subscribe_request))
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_loads(raw_msg)
                         if "contents" in msg:
                             if "updates" in msg["contents"]:
                                 ts = datetime.timestamp(datetime.now())
@@ -21,6 +21,7 @@ from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.logger import HummingbotLogger
+from hummingbot.core.utils.json_utils import response_json
 
 EXCHANGE_NAME = "ftx"
 
@@ -55,8 +56,8 @@ class FtxAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         async with aiohttp.ClientSession() as client:
             async with await client.get(f"{FTX_REST_URL}{FTX_EXCHANGE_INFO_PATH}", timeout=API_CALL_TIMEOUT) as response:
-                response_json = await response.json()
-                results = response_json['result']
+                resp_json = await response_json(response)
+                results = resp_json['result']
                 return {convert_from_exchange_trading_pair(result['name']): float(result['last'])
                         for result in results if convert_from_exchange_trading_pair(result['name']) in trading_pairs}
 
@@ -77,7 +78,7 @@ class FtxAPIOrderBookDataSource(OrderBookTrackerDataSource):
             async with aiohttp.ClientSession() as client:
                 async with client.get(f"{FTX_REST_URL}{FTX_EXCHANGE_INFO_PATH}", timeout=API_CALL_TIMEOUT) as response:
                     if response.status == 200:
-                        all_trading_pairs: Dict[str, Any] = await response.json()
+                        all_trading_pairs: Dict[str, Any] = await response_json(response)
                         valid_trading_pairs: list = []
                         for item in all_trading_pairs["result"]:
                             if item["type"] == "spot":
@@ -20,6 +20,7 @@ from hummingbot.connector.exchange.gate_io.gate_io_auth import GateIoAuth
 from hummingbot.connector.exchange.gate_io.gate_io_utils import (
     GateIoAPIError,
 )
+from hummingbot.core.utils.json_utils import json_loads
 
 # reusable websocket class
 # ToDo: We should eventually remove this class, and instantiate web socket connection normally (see Binance for example)
@@ -66,7 +67,7 @@ class GateIoWebsocket():
                 try:
                     raw_msg_str: str = await asyncio.wait_for(self._client.recv(), timeout=Constants.MESSAGE_TIMEOUT)
                     try:
-                        msg = json.loads(raw_msg_str)
+                        msg = json_loads(raw_msg_str)
 
                         # Raise API error for login failures.
                         if msg.get('error', None) is not None:
@@ -23,6 +23,7 @@ from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTr
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.huobi.huobi_order_book import HuobiOrderBook
 from hummingbot.connector.exchange.huobi.huobi_utils import convert_to_exchange_trading_pair
+from hummingbot.core.utils.json_utils import json_loads, response_json
 
 HUOBI_SYMBOLS_URL = "https://api.huobi.pro/v1/common/symbols"
 HUOBI_TICKER_URL = "https://api.huobi.pro/market/tickers"
@@ -51,7 +52,7 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
         results = dict()
         async with aiohttp.ClientSession() as client:
             resp = await client.get(HUOBI_TICKER_URL)
-            resp_json = await resp.json()
+            resp_json = await response_json(resp)
             for trading_pair in trading_pairs:
                 resp_record = [o for o in resp_json["data"] if o["symbol"] == convert_to_exchange_trading_pair(trading_pair)][0]
                 results[trading_pair] = float(resp_record["close"])
@@ -65,7 +66,7 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
             async with aiohttp.ClientSession() as client:
                 async with client.get(HUOBI_SYMBOLS_URL, timeout=10) as response:
                     if response.status == 200:
-                        all_trading_pairs: Dict[str, Any] = await response.json()
+                        all_trading_pairs: Dict[str, Any] = await response_json(response)
                         valid_trading_pairs: list = []
                         for item in all_trading_pairs["data"]:
                             if item["state"] == "online":
@@ -93,8 +94,7 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
             if response.status != 200:
                 raise IOError(f"Error fetching Huobi market snapshot for {trading_pair}. "
                               f"HTTP status is {response.status}.")
-            api_data = await response.read()
-            data: Dict[str, Any] = json.loads(api_data)
+            data: Dict[str, Any] = await response_json(response)
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
@@ -143,8 +143,8 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     async for raw_msg in self._inner_messages(ws):
                         # Huobi compresses their ws data
                         encoded_msg: bytes = gzip.decompress(raw_msg)
-                        # Huobi's data value for id is a large int too big for ujson to parse
-                        msg: Dict[str, Any] = json.loads(encoded_msg.decode('utf-8'))
+                        # Huobi's data value for id can be an int too large for orjson, json_loads falls back to json for those
+                        msg: Dict[str, Any] = json_loads(encoded_msg)
                         if "ping" in msg:
                             await ws.send(f'{{"op":"pong","ts": {str(msg["ping"])}}}')
                         elif "subbed" in msg:
@@ -181,8 +181,8 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     async for raw_msg in self._inner_messages(ws):
                         # Huobi compresses their ws data
                         encoded_msg: bytes = gzip.decompress(raw_msg)
-                        # Huobi's data value for id is a large int too big for ujson to parse
-                        msg: Dict[str, Any] = json.loads(encoded_msg.decode('utf-8'))
+                        # Huobi's data value for id can be an int too large for orjson, json_loads falls back to json for those
+                        msg: Dict[str, Any] = json_loads(encoded_msg)
                         if "ping" in msg:
                             await ws.send(f'{{"op":"pong","ts": {str(msg["ping"])}}}')
                         elif "subbed" in msg:
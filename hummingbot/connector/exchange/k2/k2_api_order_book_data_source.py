@@ -15,6 +15,7 @@ from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTr
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.k2.k2_order_book import K2OrderBook
 from hummingbot.connector.exchange.k2 import k2_utils
+from hummingbot.core.utils.json_utils import json_loads, response_json
 
 
 class K2APIOrderBookDataSource(OrderBookTrackerDataSource):
@@ -42,7 +43,7 @@ class K2APIOrderBookDataSource(OrderBookTrackerDataSource):
         result = {}
         async with aiohttp.ClientSession() as client:
             async with client.get(f"{constants.REST_URL}{constants.GET_TRADING_PAIRS_STATS}") as resp:
-                resp_json = await resp.json()
+                resp_json = await response_json(resp)
                 if resp_json["success"] is False:
                     raise IOError(
                         f"Error fetching last traded prices at {constants.EXCHANGE_NAME}. "
@@ -62,7 +63,7 @@ class K2APIOrderBookDataSource(OrderBookTrackerDataSource):
             async with client.get(f"{constants.REST_URL}{constants.GET_TRADING_PAIRS}", timeout=10) as response:
                 if response.status == 200:
                     try:
-                        data: Dict[str, Any] = await response.json()
+                        data: Dict[str, Any] = await response_json(response)
                         return [k2_utils.convert_from_exchange_trading_pair(item["symbol"]) for item in data["data"]]
                     except Exception:
                         pass
@@ -84,7 +85,7 @@ class K2APIOrderBookDataSource(OrderBookTrackerDataSource):
                         f"HTTP status is {resp.status}."
                     )
 
-                orderbook_data: Dict[str, Any] = await resp.json()
+                orderbook_data: Dict[str, Any] = await response_json(resp)
 
         return orderbook_data
 
@@ -131,7 +132,7 @@ class K2APIOrderBookDataSource(OrderBookTrackerDataSource):
                         }
                         await ws.send(ujson.dumps(params))
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_loads(raw_msg)
                         if msg["method"] != "marketchanged":
                             continue
                         for trade_entry in msg["data"]["trades"]:
@@ -160,7 +161,7 @@ class K2APIOrderBookDataSource(OrderBookTrackerDataSource):
                         }
                         await ws.send(ujson.dumps(params))
                     async for raw_msg in self._inner_messages(ws):
-                        response = ujson.loads(raw_msg)
+                        response = json_loads(raw_msg)
                         timestamp = int(time.time() * 1e3)
                         if response["method"] == "SubscribeOrderBook":
                             trading_pair = k2_utils.convert_from_exchange_trading_pair(response["pair"])
@@ -169,7 +170,7 @@ class K2APIOrderBookDataSource(OrderBookTrackerDataSource):
                                 timestamp=timestamp,
                                 metadata={"trading_pair": trading_pair})
                         elif response["method"] == "orderbookchanged":
-                            data = ujson.loads(response["data"])
+                            data = json_loads(response["data"])
                             trading_pair = k2_utils.convert_from_exchange_trading_pair(data["pair"])
                             message: OrderBookMessage = K2OrderBook.diff_message_from_exchange(
                                 msg=data,
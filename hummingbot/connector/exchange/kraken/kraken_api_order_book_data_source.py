@@ -17,6 +17,7 @@ import websockets
 from websockets.exceptions import ConnectionClosed
 
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.json_utils import json_loads, response_json
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book import OrderBook
@@ -60,7 +61,7 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def get_last_traded_price(cls, trading_pair: str) -> float:
         async with aiohttp.ClientSession() as client:
             resp = await client.get(f"{TICKER_URL}?pair={convert_to_exchange_trading_pair(trading_pair)}")
-            resp_json = await resp.json()
+            resp_json = await response_json(resp)
             record = list(resp_json["result"].values())[0]
             return float(record["c"][0])
 
@@ -74,11 +75,11 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
             if response.status != 200:
                 raise IOError(f"Error fetching Kraken market snapshot for {original_trading_pair}. "
                               f"HTTP status is {response.status}.")
-            response_json = await response.json()
-            if len(response_json["error"]) > 0:
+            resp_json = await response_json(response)
+            if len(resp_json["error"]) > 0:
                 raise IOError(f"Error fetching Kraken market snapshot for {original_trading_pair}. "
-                              f"Error is {response_json['error']}.")
-            data: Dict[str, Any] = next(iter(response_json["result"].values()))
+                              f"Error is {resp_json['error']}.")
+            data: Dict[str, Any] = next(iter(resp_json["result"].values()))
             data = {"trading_pair": trading_pair, **data}
             data["latest_update"] = max([*map(lambda x: x[2], data["bids"] + data["asks"])], default=0.)
 
@@ -130,7 +131,7 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 async with client.get(ASSET_PAIRS_URL, timeout=5) as response:
                     if response.status == 200:
                         from hummingbot.connector.exchange.kraken.kraken_utils import convert_from_exchange_trading_pair
-                        data: Dict[str, Any] = await response.json()
+                        data: Dict[str, Any] = await response_json(response)
                         raw_pairs = data.get("result", [])
                         converted_pairs: List[str] = []
                         for pair, details in raw_pairs.items():
@@ -155,7 +156,7 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     ws: websockets.WebSocketClientProtocol = ws
                     await ws.send(ws_message)
                     async for raw_msg in self._inner_messages(ws):
-                        msg: List[Any] = ujson.loads(raw_msg)
+                        msg: List[Any] = json_loads(raw_msg)
                         trades: List[Dict[str, Any]] = [{"pair": convert_from_exchange_trading_pair(msg[-1]), "trade": trade} for trade in msg[1]]
                         for trade in trades:
                             trade_msg: OrderBookMessage = KrakenOrderBook.trade_message_from_exchange(trade)
@@ -175,7 +176,7 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     ws: websockets.WebSocketClientProtocol = ws
                     await ws.send(ws_message)
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_loads(raw_msg)
                         msg_dict = {"trading_pair": convert_from_exchange_trading_pair(msg[-1]),
                                     "asks": msg[1].get("a", []) or msg[1].get("as", []) or [],
                                     "bids": msg[1].get("b", []) or msg[1].get("bs", []) or []}
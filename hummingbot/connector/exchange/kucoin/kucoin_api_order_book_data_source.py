@@ -33,6 +33,7 @@ from hummingbot.connector.exchange.kucoin.kucoin_auth import KucoinAuth
 from hummingbot.connector.exchange.kucoin.kucoin_order_book import KucoinOrderBook
 from hummingbot.connector.exchange.kucoin.kucoin_active_order_tracker import KucoinActiveOrderTracker
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.json_utils import json_loads, response_json
 from hummingbot.connector.exchange.kucoin.kucoin_utils import (
     convert_from_exchange_trading_pair,
     convert_to_exchange_trading_pair,
@@ -106,7 +107,7 @@ class KucoinWSConnectionIterator:
                 if response.status != 200:
                     raise IOError(f"Error fetching Kucoin websocket connection data."
                                   f"HTTP status is {response.status}.")
-                data: Dict[str, Any] = await response.json()
+                data: Dict[str, Any] = await response_json(response)
 
         endpoint: str = data["data"]["instanceServers"][0]["endpoint"]
         token: str = data["data"]["token"]
@@ -240,7 +241,7 @@ class KucoinWSConnectionIterator:
 
                 # Get messages
                 async for raw_msg in self._inner_messages(ws):
-                    msg: Dict[str, any] = json.loads(raw_msg)
+                    msg: Dict[str, any] = json_loads(raw_msg)
                     yield msg
         finally:
             # Clean up.
@@ -303,7 +304,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
         results = dict()
         async with aiohttp.ClientSession() as client:
             resp = await client.get(TICKER_PRICE_CHANGE_URL)
-            resp_json = await resp.json()
+            resp_json = await response_json(resp)
             for trading_pair in trading_pairs:
                 resp_record = [o for o in resp_json["data"]["ticker"] if convert_from_exchange_trading_pair(o["symbol"]) == trading_pair][0]
                 results[trading_pair] = float(resp_record["last"])
@@ -315,7 +316,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
             async with client.get(EXCHANGE_INFO_URL, timeout=5) as response:
                 if response.status == 200:
                     try:
-                        data: Dict[str, Any] = await response.json()
+                        data: Dict[str, Any] = await response_json(response)
                         all_trading_pairs = data.get("data", [])
                         return [convert_from_exchange_trading_pair(item["symbol"]) for item in all_trading_pairs if item["enableTrading"] is True]
                     except Exception:
@@ -336,7 +337,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
             if response.status != 200:
                 raise IOError(f"Error fetching Kucoin market snapshot for {trading_pair}. "
                               f"HTTP status is {response.status}.")
-            data: Dict[str, Any] = await response.json()
+            data: Dict[str, Any] = await response_json(response)
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
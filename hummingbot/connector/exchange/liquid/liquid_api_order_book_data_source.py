@@ -9,6 +9,7 @@ import websockets
 from websockets.exceptions import ConnectionClosed
 
 from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils.json_utils import json_loads, response_json
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -39,7 +40,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
         results = dict()
         async with aiohttp.ClientSession() as client:
             resp = await client.get(Constants.GET_EXCHANGE_MARKETS_URL)
-            resp_json = await resp.json()
+            resp_json = await response_json(resp)
             for record in resp_json:
                 trading_pair = f"{record['base_currency']}-{record['quoted_currency']}"
                 if trading_pair in trading_pairs:
@@ -144,7 +145,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 raise IOError(f"Error fetching Liquid markets information. "
                               f"HTTP status is {exchange_markets_response.status}.")
 
-            exchange_markets_data = await exchange_markets_response.json()
+            exchange_markets_data = await response_json(exchange_markets_response)
             return exchange_markets_data
 
     @classmethod
@@ -166,7 +167,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
             async with aiohttp.ClientSession() as client:
                 async with client.get(f"{Constants.BASE_URL}{Constants.PRODUCTS_URI}", timeout=10) as response:
                     if response.status == 200:
-                        products: List[Dict[str, Any]] = await response.json()
+                        products: List[Dict[str, Any]] = await response_json(response)
                         for data in products:
                             data['trading_pair'] = '-'.join([data['base_currency'], data['quoted_currency']])
                         return [
@@ -229,7 +230,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
             if response.status != 200:
                 raise IOError(f"Error fetching Liquid market snapshot for {id}. "
                               f"HTTP status is {response.status}.")
-            snapshot: Dict[str, Any] = await response.json()
+            snapshot: Dict[str, Any] = await response_json(response)
             return {
                 **snapshot,
                 'trading_pair': trading_pair
@@ -348,7 +349,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
                             await ws.send(ujson.dumps(subscribe_request))
 
                     async for raw_msg in self._inner_messages(ws):
-                        diff_msg: Dict[str, Any] = ujson.loads(raw_msg)
+                        diff_msg: Dict[str, Any] = json_loads(raw_msg)
 
                         event_type = diff_msg.get('event', None)
                         if event_type == 'updated':
@@ -360,7 +361,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
                             buy_or_sell = diff_msg.get('channel').split('_')[-1].lower()
                             side = 'asks' if buy_or_sell == Constants.SIDE_ASK else 'bids'
                             diff_msg = {
-                                '{0}'.format(side): ujson.loads(diff_msg.get('data', [])),
+                                '{0}'.format(side): json_loads(diff_msg.get('data', [])),
                                 'trading_pair': trading_pair
                             }
                             diff_timestamp: float = time.time()
@@ -22,6 +22,7 @@ from hummingbot.logger import HummingbotLogger
 # from hummingbot.connector.exchange.loopring.loopring_order_book_message import LoopringOrderBookMessage
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.utils.json_utils import json_loads, response_json
 
 
 MARKETS_URL = "/api/v3/exchange/markets"
@@ -57,7 +58,7 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         async with aiohttp.ClientSession() as client:
             resp = await client.get(f"https://api3.loopring.io{TICKER_URL}".replace(":markets", ",".join(trading_pairs)))
-            resp_json = await resp.json()
+            resp_json = await response_json(resp)
             return {x[0]: float(x[7]) for x in resp_json.get("tickers", [])}
 
     @property
@@ -75,7 +76,7 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 raise IOError(
                     f"Error fetching loopring market snapshot for {trading_pair}. " f"HTTP status is {response.status}."
                 )
-            data: Dict[str, Any] = await response.json()
+            data: Dict[str, Any] = await response_json(response)
             data["market"] = trading_pair
             return data
 
@@ -117,7 +118,7 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
             async with aiohttp.ClientSession() as client:
                 async with client.get(f"https://api3.loopring.io{MARKETS_URL}", timeout=5) as response:
                     if response.status == 200:
-                        all_trading_pairs: Dict[str, Any] = await response.json()
+                        all_trading_pairs: Dict[str, Any] = await response_json(response)
                         valid_trading_pairs: list = []
                         for item in all_trading_pairs["markets"]:
                             valid_trading_pairs.append(item["market"])
@@ -148,7 +149,7 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     await ws.send(ujson.dumps(subscribe_request))
                     async for raw_msg in self._inner_messages(ws):
                         if len(raw_msg) > 4:
-                            msg = ujson.loads(raw_msg)
+                            msg = json_loads(raw_msg)
                             if "topic" in msg:
                                 for datum in msg["data"]:
                                     trade_msg: OrderBookMessage = LoopringOrderBook.trade_message_from_exchange(datum, msg)
@@ -175,7 +176,7 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         await ws.send(ujson.dumps(subscribe_request))
                     async for raw_msg in self._inner_messages(ws):
                         if len(raw_msg) > 4:
-                            msg = ujson.loads(raw_msg)
+                            msg = json_loads(raw_msg)
                             if "topic" in msg:
                                 order_msg: OrderBookMessage = LoopringOrderBook.diff_message_from_exchange(msg)
                                 output.put_nowait(order_msg)
@@ -203,7 +204,7 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
                     async for raw_msg in self._inner_messages(ws):
                         if len(raw_msg) > 4:
-                            msg = ujson.loads(raw_msg)
+                            msg = json_loads(raw_msg)
                             if ("topic" in msg.keys()):
                                 order_msg: OrderBookMessage = LoopringOrderBook.snapshot_message_from_exchange(msg, msg["ts"])
                                 output.put_nowait(order_msg)
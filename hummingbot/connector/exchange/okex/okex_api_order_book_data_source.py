@@ -21,6 +21,7 @@ from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils.json_utils import json_loads, response_json
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.okex.okex_order_book import OkexOrderBook
 from hummingbot.connector.exchange.okex.constants import (
@@ -70,7 +71,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 if products_response.status != 200:
                     raise IOError(f"Error fetching active OKEx markets. HTTP status is {products_response.status}.")
 
-                data = await products_response.json()
+                data = await response_json(products_response)
                 data = data['data']
                 all_markets: pd.DataFrame = pd.DataFrame.from_records(data=data)
 
@@ -88,7 +89,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 if products_response.status != 200:
                     raise IOError(f"Error fetching active OKEx markets. HTTP status is {products_response.status}.")
 
-                data = await products_response.json()
+                data = await response_json(products_response)
                 data = data['data']
 
                 trading_pairs = []
@@ -122,7 +123,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 if products_response.status != 200:
                     raise IOError(f"Error fetching active OKEx markets. HTTP status is {products_response.status}.")
 
-                data = await products_response.json()
+                data = await response_json(products_response)
                 data = data['data']
                 all_markets: pd.DataFrame = pd.DataFrame.from_records(data=data)
                 all_markets.set_index('instId', inplace=True)
@@ -158,7 +159,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 raise IOError(f"Error fetching OKEX market snapshot for {trading_pair}. "
                               f"HTTP status is {response.status}.")
             api_data = await response.read()
-            data: Dict[str, Any] = json.loads(api_data)['data'][0]
+            data: Dict[str, Any] = json_loads(api_data)['data'][0]
             data['ts'] = int(data['ts'])
 
             return data
@@ -199,7 +200,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         elif '"channel": "orders"' in decoded_msg:
                             self.logger().debug(f"Received new trade: {decoded_msg}")
 
-                            for data in json.loads(decoded_msg)['data']:
+                            for data in json_loads(decoded_msg)['data']:
                                 trading_pair = data['instId']
                                 trade_message: OrderBookMessage = OkexOrderBook.trade_message_from_exchange(
                                     data, data['uTime'], metadata={"trading_pair": trading_pair}
@@ -260,7 +261,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         if '"event":"subscribe"' in decoded_msg:
                             self.logger().debug(f"Subscribed to channel, full message: {decoded_msg}")
                         elif '"action":"update"' in decoded_msg:
-                            msg = json.loads(decoded_msg)
+                            msg = json_loads(decoded_msg)
                             for data in msg['data']:
                                 order_book_message: OrderBookMessage = OkexOrderBook.diff_message_from_exchange(data, int(data['ts']), msg['arg'])
                                 output.put_nowait(order_book_message)
@@ -19,10 +19,11 @@ def get_order_book_tracker_class(connector_name: str) -> Callable:
     raise Exception(f"Connector {connector_name} OrderBookTracker class not found")
 
 
-def create_paper_trade_market(exchange_name: str, trading_pairs: List[str]):
+def create_paper_trade_market(exchange_name: str, trading_pairs: List[str], queue_position_fill: bool = False):
     obt_class = get_order_book_tracker_class(exchange_name)
     conn_setting = CONNECTOR_SETTINGS[exchange_name]
     obt_params = {"trading_pairs": trading_pairs}
     return PaperTradeExchange(obt_class(**conn_setting.add_domain_parameter(obt_params)),
                               MarketConfig.default_config(),
-                              get_connector_class(exchange_name))
+                              get_connector_class(exchange_name),
+                              queue_position_fill=queue_position_fill)
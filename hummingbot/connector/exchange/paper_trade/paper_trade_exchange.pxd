@@ -2,6 +2,7 @@ from libcpp.set cimport set as cpp_set
 from libcpp.string cimport string
 from libcpp.unordered_map cimport unordered_map
 from libcpp.utility cimport pair
+from libcpp.vector cimport vector
 
 from hummingbot.core.data_type.LimitOrder cimport LimitOrder as CPPLimitOrder
 from hummingbot.core.data_type.OrderExpirationEntry cimport OrderExpirationEntry as CPPOrderExpirationEntry
@@ -37,6 +38,14 @@ cdef class PaperTradeExchange(ExchangeBase):
         object _market_order_filled_listener
         LimitOrderExpirationSet _limit_order_expiration_set
         object _target_market
+        dict _on_hold_balances
+        dict _limit_order_prices
+        bint _queue_position_fill
+        dict _limit_order_filled_amounts
+        dict _queue_ahead
+        dict _queue_levels
+        dict _order_book_diff_listeners
+        bint _new_limit_orders
 
     cdef c_execute_buy(self, str order_id, str trading_pair, object amount)
     cdef c_execute_sell(self, str order_id, str trading_pair, object amount)
@@ -49,6 +58,12 @@ cdef class PaperTradeExchange(ExchangeBase):
                           object order_side,
                           object amount,
                           object price)
+    cdef c_hold_limit_order_balance(self, const CPPLimitOrder *cpp_limit_order_ptr, bint release)
+    cdef c_track_queue_position(self, const CPPLimitOrder *cpp_limit_order_ptr)
+    cdef c_untrack_queue_position(self, const CPPLimitOrder *cpp_limit_order_ptr)
+    cdef double c_consume_queue_ahead(self, str order_id, double volume)
+    cdef c_update_queue_positions(self, str trading_pair, object order_book_diff_event)
+    cdef c_reconcile_queue_positions(self, str trading_pair, bint is_buy)
     cdef c_delete_limit_order(self,
                               LimitOrders *limit_orders_map_ptr,
                               LimitOrdersIterator *map_it_ptr,
@@ -57,21 +72,32 @@ cdef class PaperTradeExchange(ExchangeBase):
                                bint is_buy,
                                LimitOrders *limit_orders_map_ptr,
                                LimitOrdersIterator *map_it_ptr,
-                               SingleTradingPairLimitOrdersIterator orders_it)
+                               SingleTradingPairLimitOrdersIterator orders_it,
+                               object amount=*)
     cdef c_process_limit_bid_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it)
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object amount)
     cdef c_process_limit_ask_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it)
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object amount)
     cdef c_process_crossed_limit_orders_for_trading_pair(self,
                                                          bint is_buy,
                                                          LimitOrders *limit_orders_map_ptr,
                                                          LimitOrdersIterator *map_it_ptr)
     cdef c_process_crossed_limit_orders(self)
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event)
+    cdef list c_queue_fill_amounts(self,
+                                   str trading_pair,
+                                   bint is_buy,
+                                   object trade_price,
+                                   object volume,
+                                   vector[SingleTradingPairLimitOrdersIterator] &process_order_its,
+                                   const vector[SingleTradingPairLimitOrdersIterator] &at_price_order_its)
+    cdef object c_get_unfilled_amount(self, const CPPLimitOrder *cpp_limit_order_ptr)
     cdef object c_cancel_order_from_orders_map(self,
                                                LimitOrders *orders_map,
                                                str trading_pair_str,
@@ -1,4 +1,4 @@
-# distutils: sources=['hummingbot/core/cpp/Utils.cpp', 'hummingbot/core/cpp/LimitOrder.cpp', 'hummingbot/core/cpp/OrderExpirationEntry.cpp']
+# distutils: sources=['hummingbot/core/cpp/Utils.cpp', 'hummingbot/core/cpp/LimitOrder.cpp', 'hummingbot/core/cpp/OrderExpirationEntry.cpp', 'hummingbot/core/cpp/OrderBookEntry.cpp']
 
 import asyncio
 from collections import (
@@ -7,6 +7,7 @@ from collections import (
 from cpython cimport PyObject
 from decimal import Decimal
 from libcpp cimport bool as cppbool
+from libcpp.set cimport set as cpp_set
 from libcpp.vector cimport vector
 import math
 import pandas as pd
@@ -37,6 +38,7 @@ from hummingbot.core.data_type.composite_order_book cimport CompositeOrderBook
 from hummingbot.core.data_type.limit_order cimport c_create_limit_order_from_cpp_limit_order
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.event.events import (
     MarketEvent,
@@ -64,6 +66,19 @@ from .market_config import (
 )
 ptm_logger = None
 s_decimal_0 = Decimal(0)
+NaN = float("nan")
+
+
+cdef double c_get_order_book_level_amount(OrderBook order_book, bint is_bid, double price):
+    """
+    Amount resting on one price level of the order book, or 0 if there's no such level.
+    """
+    cdef:
+        cpp_set[OrderBookEntry] *book_ptr = address(order_book._bid_book) if is_bid else address(order_book._ask_book)
+        cpp_set[OrderBookEntry].iterator level_it = book_ptr.find(OrderBookEntry(price, 0, 0))
+    if level_it == book_ptr.end():
+        return 0
+    return deref(level_it).getAmount()
 
 
 cdef class QuantizationParams:
@@ -145,6 +160,23 @@ cdef class OrderBookTradeListener(EventListener):
         except Exception as e:
             self.logger().error("Error call trade listener.", exc_info=True)
 
+cdef class OrderBookDiffListener(EventListener):
+    cdef:
+        PaperTradeExchange _market
+        str _trading_pair
+
+    def __init__(self, market: PaperTradeExchange, trading_pair: str):
+        super().__init__()
+        self._market = market
+        self._trading_pair = trading_pair
+
+    cdef c_call(self, object event_object):
+        try:
+            self._market.c_update_queue_positions(self._trading_pair, event_object)
+        except Exception:
+            self.logger().error("Error call order book diff listener.", exc_info=True)
+
+
 cdef class OrderBookMarketOrderFillListener(EventListener):
     cdef:
         ExchangeBase _market
@@ -171,8 +203,19 @@ cdef class PaperTradeExchange(ExchangeBase):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
     MARKET_SELL_ORDER_CREATED_EVENT_TAG = MarketEvent.SellOrderCreated.value
     MARKET_BUY_ORDER_CREATED_EVENT_TAG = MarketEvent.BuyOrderCreated.value
+    ORDER_BOOK_DIFF_EVENT_TAG = OrderBookEvent.DiffEvent.value
 
-    def __init__(self, order_book_tracker: OrderBookTracker, config: MarketConfig, target_market: type):
+    def __init__(self,
+                 order_book_tracker: OrderBookTracker,
+                 config: MarketConfig,
+                 target_market: type,
+                 queue_position_fill: bool = False):
+        """
+        :param queue_position_fill: if True, a resting limit order only fills once the order book volume that was
+        ahead of it at its price level has traded or been cancelled, or when the market trades through its price.
+        A trade then fills the limit orders it reaches up to its volume, so they can be partially filled.
+        Otherwise, it fills as soon as the market touches its price.
+        """
         order_book_tracker.data_source.order_book_create_function = lambda: CompositeOrderBook()
         self._order_book_tracker = order_book_tracker
         super(ExchangeBase, self).__init__()
@@ -187,6 +230,21 @@ cdef class PaperTradeExchange(ExchangeBase):
         self._target_market = target_market
         self._market_order_filled_listener = OrderBookMarketOrderFillListener(self)
         self.c_add_listener(self.ORDER_FILLED_EVENT_TAG, self._market_order_filled_listener)
+        # Kept up to date as limit orders are added and removed, instead of being summed over every resting order.
+        self._on_hold_balances = {}
+        # Client order id -> price of the resting limit orders, to look up an order in its price sorted collection.
+        self._limit_order_prices = {}
+        # Client order id -> amount filled so far of the partially filled limit orders.
+        self._limit_order_filled_amounts = {}
+        self._queue_position_fill = queue_position_fill
+        # Client order id -> order book volume still ahead of the resting limit order at its price level.
+        self._queue_ahead = {}
+        # (trading pair, is buy) -> price level -> client order ids of the resting limit orders at that level, in the
+        # order they were placed.
+        self._queue_levels = {}
+        self._order_book_diff_listeners = {}
+        # Set when limit orders are placed, until the next tick matches them against the order books.
+        self._new_limit_orders = False
 
     @classmethod
     def random_order_id(cls, order_side: str, trading_pair: str) -> str:
@@ -202,6 +260,11 @@ cdef class PaperTradeExchange(ExchangeBase):
                 self.ORDER_BOOK_TRADE_EVENT_TAG,
                 self._order_book_trade_listener
             )
+            if self._queue_position_fill:
+                diff_listener = OrderBookDiffListener(
+                    self, self._target_market.convert_from_exchange_trading_pair(trading_pair_str))
+                self._order_book_diff_listeners[trading_pair_str] = diff_listener
+                (<CompositeOrderBook>order_book).c_add_listener(self.ORDER_BOOK_DIFF_EVENT_TAG, diff_listener)
 
     def split_trading_pair(self, trading_pair: str) -> Tuple[str, str]:
         return self._target_market.split_trading_pair(trading_pair)
@@ -279,20 +342,23 @@ cdef class PaperTradeExchange(ExchangeBase):
 
     @property
     def on_hold_balances(self) -> Dict[str, Decimal]:
-        _on_hold_balances = defaultdict(Decimal)
-        for limit_order in self.limit_orders:
-            if limit_order.is_buy:
-                _on_hold_balances[limit_order.quote_currency] += limit_order.quantity * limit_order.price
-            else:
-                _on_hold_balances[limit_order.base_currency] += limit_order.quantity
-        return _on_hold_balances
+        return defaultdict(Decimal, self._on_hold_balances)
+
+    @property
+    def queue_position_fill(self) -> bool:
+        return self._queue_position_fill
+
+    @property
+    def queue_ahead(self) -> Dict[str, float]:
+        """
+        Order book volume ahead of each resting limit order, when fills are simulated from queue positions.
+        """
+        return self._queue_ahead.copy()
 
     @property
     def available_balances(self) -> Dict[str, Decimal]:
-        _available_balances = self._account_balances.copy()
-        for trading_pair_str, balance in _available_balances.items():
-            _available_balances[trading_pair_str] -= self.on_hold_balances[trading_pair_str]
-        return _available_balances
+        return {currency: balance - self._on_hold_balances.get(currency, s_decimal_0)
+                for currency, balance in self._account_balances.items()}
 
     # </editor-fold>
 
@@ -322,6 +388,20 @@ cdef class PaperTradeExchange(ExchangeBase):
         ExchangeBase.c_tick(self, timestamp)
         self.c_process_market_orders()
         self.c_process_crossed_limit_orders()
+        self._new_limit_orders = False
+
+    cdef double c_next_wakeup_time(self, double timestamp):
+        # Resting limit orders only need matching again once the order books change, which happens on the ticks the
+        # market data wakes the clock up for. New limit orders may cross the book right away, and queued market orders
+        # are executed once their execution delay has passed.
+        cdef:
+            QueuedOrder front_order
+        if self._new_limit_orders:
+            return timestamp
+        if len(self._queued_orders) > 0:
+            front_order = self._queued_orders[0]
+            return front_order.create_timestamp + self.TRADE_EXECUTION_DELAY
+        return NaN
 
     cdef str c_buy(self,
                    str trading_pair_str,
@@ -342,6 +422,7 @@ cdef class PaperTradeExchange(ExchangeBase):
             LimitOrdersIterator map_it
             SingleTradingPairLimitOrders *limit_orders_collection_ptr = NULL
             pair[LimitOrders.iterator, cppbool] insert_result
+            pair[SingleTradingPairLimitOrders.iterator, cppbool] limit_order_insert_result
 
         quantized_price = (self.c_quantize_order_price(trading_pair_str, price)
                            if order_type is OrderType.LIMIT
@@ -359,7 +440,7 @@ cdef class PaperTradeExchange(ExchangeBase):
                                                                               SingleTradingPairLimitOrders()))
                 map_it = insert_result.first
             limit_orders_collection_ptr = address(deref(map_it).second)
-            limit_orders_collection_ptr.insert(CPPLimitOrder(
+            limit_order_insert_result = limit_orders_collection_ptr.insert(CPPLimitOrder(
                 cpp_order_id,
                 cpp_trading_pair_str,
                 True,
@@ -368,6 +449,11 @@ cdef class PaperTradeExchange(ExchangeBase):
                 <PyObject *> quantized_price,
                 <PyObject *> quantized_amount
             ))
+            self.c_hold_limit_order_balance(address(deref(limit_order_insert_result.first)), False)
+            self._new_limit_orders = True
+            self._limit_order_prices[order_id] = quantized_price
+            if self._queue_position_fill:
+                self.c_track_queue_position(address(deref(limit_order_insert_result.first)))
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_BUY_ORDER_CREATED_EVENT_TAG,
             BuyOrderCreatedEvent(self._current_timestamp,
@@ -397,6 +483,7 @@ cdef class PaperTradeExchange(ExchangeBase):
             LimitOrdersIterator map_it
             SingleTradingPairLimitOrders *limit_orders_collection_ptr = NULL
             pair[LimitOrders.iterator, cppbool] insert_result
+            pair[SingleTradingPairLimitOrders.iterator, cppbool] limit_order_insert_result
 
         quantized_price = (self.c_quantize_order_price(trading_pair_str, price)
                            if order_type is OrderType.LIMIT
@@ -413,7 +500,7 @@ cdef class PaperTradeExchange(ExchangeBase):
                                                                               SingleTradingPairLimitOrders()))
                 map_it = insert_result.first
             limit_orders_collection_ptr = address(deref(map_it).second)
-            limit_orders_collection_ptr.insert(CPPLimitOrder(
+            limit_order_insert_result = limit_orders_collection_ptr.insert(CPPLimitOrder(
                 cpp_order_id,
                 cpp_trading_pair_str,
                 False,
@@ -422,6 +509,11 @@ cdef class PaperTradeExchange(ExchangeBase):
                 <PyObject *> quantized_price,
                 <PyObject *> quantized_amount
             ))
+            self.c_hold_limit_order_balance(address(deref(limit_order_insert_result.first)), False)
+            self._new_limit_orders = True
+            self._limit_order_prices[order_id] = quantized_price
+            if self._queue_position_fill:
+                self.c_track_queue_position(address(deref(limit_order_insert_result.first)))
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_SELL_ORDER_CREATED_EVENT_TAG,
             SellOrderCreatedEvent(self._current_timestamp,
@@ -561,6 +653,110 @@ cdef class PaperTradeExchange(ExchangeBase):
             else:
                 return
 
+    cdef c_hold_limit_order_balance(self, const CPPLimitOrder *cpp_limit_order_ptr, bint release):
+        """
+        Puts the balance needed by a resting limit order on hold, or releases it once the order is filled or removed.
+        """
+        cdef:
+            str currency
+            object amount = self.c_get_unfilled_amount(cpp_limit_order_ptr)
+        if cpp_limit_order_ptr.getIsBuy():
+            currency = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
+            amount *= <object> cpp_limit_order_ptr.getPrice()
+        else:
+            currency = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
+        on_hold_balance = self._on_hold_balances.get(currency, s_decimal_0) + (-amount if release else amount)
+        if on_hold_balance == s_decimal_0:
+            self._on_hold_balances.pop(currency, None)
+        else:
+            self._on_hold_balances[currency] = on_hold_balance
+
+    cdef c_track_queue_position(self, const CPPLimitOrder *cpp_limit_order_ptr):
+        """
+        Puts a new limit order at the back of the queue of its price level, behind the volume resting on the order book
+        at that level.
+        """
+        cdef:
+            str trading_pair = cpp_limit_order_ptr.getTradingPair().decode("utf8")
+            str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
+            bint is_buy = cpp_limit_order_ptr.getIsBuy()
+            double price = float(<object> cpp_limit_order_ptr.getPrice())
+            dict levels = self._queue_levels.get((trading_pair, is_buy))
+        if levels is None:
+            levels = self._queue_levels[(trading_pair, is_buy)] = {}
+        if price not in levels:
+            levels[price] = {}
+        levels[price][order_id] = None
+        self._queue_ahead[order_id] = c_get_order_book_level_amount(self.c_get_order_book(trading_pair), is_buy, price)
+
+    cdef c_untrack_queue_position(self, const CPPLimitOrder *cpp_limit_order_ptr):
+        cdef:
+            str trading_pair = cpp_limit_order_ptr.getTradingPair().decode("utf8")
+            str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
+            bint is_buy = cpp_limit_order_ptr.getIsBuy()
+            double price = float(<object> cpp_limit_order_ptr.getPrice())
+            dict levels = self._queue_levels.get((trading_pair, is_buy))
+        self._queue_ahead.pop(order_id, None)
+        if levels is None or price not in levels:
+            return
+        levels[price].pop(order_id, None)
+        if len(levels[price]) == 0:
+            del levels[price]
+            if len(levels) == 0:
+                del self._queue_levels[(trading_pair, is_buy)]
+
+    cdef double c_consume_queue_ahead(self, str order_id, double volume):
+        """
+        Takes the volume traded at a limit order's price off the volume ahead of it.
+
+        :return: the traded volume left once past the volume ahead, i.e. the volume that can fill the limit order
+        """
+        cdef:
+            double queue_ahead = self._queue_ahead.get(order_id, 0.0)
+        if volume <= queue_ahead:
+            self._queue_ahead[order_id] = queue_ahead - volume
+            return 0.0
+        self._queue_ahead[order_id] = 0.0
+        return volume - queue_ahead
+
+    cdef c_update_queue_positions(self, str trading_pair, object order_book_diff_event):
+        """
+        When the volume of a price level drops, the volume ahead of the limit orders at that level can be no more than
+        what is left on the level, i.e. cancellations are assumed to come from ahead of the limit orders.
+        """
+        cdef:
+            dict levels
+            object order_ids
+        for is_buy, rows in ((True, order_book_diff_event.bids), (False, order_book_diff_event.asks)):
+            levels = self._queue_levels.get((trading_pair, is_buy))
+            if levels is None:
+                continue
+            for price, amount in rows:
+                order_ids = levels.get(price)
+                if order_ids is None:
+                    continue
+                for order_id in order_ids:
+                    if amount < self._queue_ahead[order_id]:
+                        self._queue_ahead[order_id] = amount
+
+    cdef c_reconcile_queue_positions(self, str trading_pair, bint is_buy):
+        """
+        Caps the volume ahead of the limit orders with the current order book levels, which catches the levels changed
+        by order book snapshots rather than diffs.
+        """
+        cdef:
+            dict levels = self._queue_levels.get((trading_pair, is_buy))
+            OrderBook order_book
+            double level_amount
+        if levels is None:
+            return
+        order_book = self.c_get_order_book(trading_pair)
+        for price, order_ids in levels.items():
+            level_amount = c_get_order_book_level_amount(order_book, is_buy, price)
+            for order_id in order_ids:
+                if level_amount < self._queue_ahead[order_id]:
+                    self._queue_ahead[order_id] = level_amount
+
     cdef c_delete_limit_order(self,
                               LimitOrders *limit_orders_map_ptr,
                               LimitOrdersIterator *map_it_ptr,
@@ -568,6 +764,11 @@ cdef class PaperTradeExchange(ExchangeBase):
         cdef:
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
         try:
+            self.c_hold_limit_order_balance(address(deref(orders_it)), True)
+            self._limit_order_prices.pop(deref(orders_it).getClientOrderID().decode("utf8"), None)
+            self._limit_order_filled_amounts.pop(deref(orders_it).getClientOrderID().decode("utf8"), None)
+            if self._queue_position_fill:
+                self.c_untrack_queue_position(address(deref(orders_it)))
             orders_collection_ptr.erase(orders_it)
             if orders_collection_ptr.empty():
                 map_it_ptr[0] = limit_orders_map_ptr.erase(deref(map_it_ptr))
@@ -579,7 +780,12 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef c_process_limit_bid_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it):
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object amount):
+        """
+        Fills `amount` of the limit order, or what is left of it if `amount` is None or more than that. The order
+        completes once it is filled in full.
+        """
         cdef:
             const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
             str trading_pair = cpp_limit_order_ptr.getTradingPair().decode("utf8")
@@ -587,9 +793,14 @@ cdef class PaperTradeExchange(ExchangeBase):
             str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
             str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
             object quote_asset_balance = self.c_get_balance(quote_asset)
-            object quote_asset_traded = <object> cpp_limit_order_ptr.getPrice() * \
-                                        <object> cpp_limit_order_ptr.getQuantity()
-            object base_asset_traded = <object> cpp_limit_order_ptr.getQuantity()
+            object quantity = <object> cpp_limit_order_ptr.getQuantity()
+            object filled_amount = self._limit_order_filled_amounts.get(order_id, s_decimal_0)
+            object base_asset_traded = quantity - filled_amount
+            object quote_asset_traded
+
+        if amount is not None and amount < base_asset_traded:
+            base_asset_traded = amount
+        quote_asset_traded = <object> cpp_limit_order_ptr.getPrice() * base_asset_traded
 
         # Check if there's enough balance to satisfy the order. If not, remove the limit order without doing anything.
         if quote_asset_balance < quote_asset_traded:
@@ -622,9 +833,15 @@ cdef class PaperTradeExchange(ExchangeBase):
                 TradeType.BUY,
                 OrderType.LIMIT,
                 <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
+                base_asset_traded,
                 fees
             ))
+        if filled_amount + base_asset_traded < quantity:
+            # Partially filled, the order keeps resting with what is left of it on hold.
+            self.c_hold_limit_order_balance(cpp_limit_order_ptr, True)
+            self._limit_order_filled_amounts[order_id] = filled_amount + base_asset_traded
+            self.c_hold_limit_order_balance(cpp_limit_order_ptr, False)
+            return
 
         self.c_trigger_event(
             self.BUY_ORDER_COMPLETED_EVENT_TAG,
@@ -634,8 +851,8 @@ cdef class PaperTradeExchange(ExchangeBase):
                 base_asset,
                 quote_asset,
                 base_asset if config.buy_fees_asset is AssetType.BASE_CURRENCY else quote_asset,
-                base_asset_traded,
-                quote_asset_traded,
+                quantity,
+                <object> cpp_limit_order_ptr.getPrice() * quantity,
                 s_decimal_0,
                 OrderType.LIMIT
             ))
@@ -644,7 +861,12 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef c_process_limit_ask_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it):
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object amount):
+        """
+        Fills `amount` of the limit order, or what is left of it if `amount` is None or more than that. The order
+        completes once it is filled in full.
+        """
         cdef:
             const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
             str trading_pair_str = cpp_limit_order_ptr.getTradingPair().decode("utf8")
@@ -652,9 +874,14 @@ cdef class PaperTradeExchange(ExchangeBase):
             str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
             str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
             object base_asset_balance = self.c_get_balance(base_asset)
-            object quote_asset_traded = <object> cpp_limit_order_ptr.getPrice() * \
-                                        <object> cpp_limit_order_ptr.getQuantity()
-            object base_asset_traded = <object> cpp_limit_order_ptr.getQuantity()
+            object quantity = <object> cpp_limit_order_ptr.getQuantity()
+            object filled_amount = self._limit_order_filled_amounts.get(order_id, s_decimal_0)
+            object base_asset_traded = quantity - filled_amount
+            object quote_asset_traded
+
+        if amount is not None and amount < base_asset_traded:
+            base_asset_traded = amount
+        quote_asset_traded = <object> cpp_limit_order_ptr.getPrice() * base_asset_traded
 
         # Check if there's enough balance to satisfy the order. If not, remove the limit order without doing anything.
         if base_asset_balance < base_asset_traded:
@@ -686,9 +913,15 @@ cdef class PaperTradeExchange(ExchangeBase):
                 TradeType.SELL,
                 OrderType.LIMIT,
                 <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
+                base_asset_traded,
                 fees
             ))
+        if filled_amount + base_asset_traded < quantity:
+            # Partially filled, the order keeps resting with what is left of it on hold.
+            self.c_hold_limit_order_balance(cpp_limit_order_ptr, True)
+            self._limit_order_filled_amounts[order_id] = filled_amount + base_asset_traded
+            self.c_hold_limit_order_balance(cpp_limit_order_ptr, False)
+            return
 
         self.c_trigger_event(
             self.SELL_ORDER_COMPLETED_EVENT_TAG,
@@ -698,8 +931,8 @@ cdef class PaperTradeExchange(ExchangeBase):
                 base_asset,
                 quote_asset,
                 base_asset if config.sell_fees_asset is AssetType.BASE_CURRENCY else quote_asset,
-                base_asset_traded,
-                quote_asset_traded,
+                quantity,
+                <object> cpp_limit_order_ptr.getPrice() * quantity,
                 s_decimal_0,
                 OrderType.LIMIT
             ))
@@ -709,12 +942,13 @@ cdef class PaperTradeExchange(ExchangeBase):
                                bint is_buy,
                                LimitOrders *limit_orders_map_ptr,
                                LimitOrdersIterator *map_it_ptr,
-                               SingleTradingPairLimitOrdersIterator orders_it):
+                               SingleTradingPairLimitOrdersIterator orders_it,
+                               object amount=None):
         try:
             if is_buy:
-                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it, amount)
             else:
-                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it, amount)
         except Exception as e:
             self.logger().error(f"Error processing limit order.", exc_info=True)
 
@@ -726,6 +960,9 @@ cdef class PaperTradeExchange(ExchangeBase):
         Trigger limit orders when the opposite side of the order book has crossed the limit order's price.
         This implies someone was ready to fill the limit order, if that limit order was on the market.
 
+        With queue position fills, an opposite side only touching the limit order's price fills it once the volume
+        ahead of it is gone.
+
         :param is_buy: are the limit orders on the bid side?
         :param limit_orders_map_ptr: pointer to the limit orders map
         :param map_it_ptr: limit orders map iterator, which implies the trading pair being processed
@@ -739,20 +976,29 @@ cdef class PaperTradeExchange(ExchangeBase):
             vector[SingleTradingPairLimitOrdersIterator] process_order_its
             const CPPLimitOrder *cpp_limit_order_ptr = NULL
 
+        if self._queue_position_fill:
+            self.c_reconcile_queue_positions(trading_pair, is_buy)
+
         if is_buy:
             while orders_rit != orders_collection_ptr.rend():
                 cpp_limit_order_ptr = address(deref(orders_rit))
                 if opposite_order_book_price > <object>cpp_limit_order_ptr.getPrice():
                     break
-                process_order_its.push_back(getIteratorFromReverseIterator(
-                    <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
+                if (not self._queue_position_fill or
+                        opposite_order_book_price < <object>cpp_limit_order_ptr.getPrice() or
+                        self._queue_ahead.get(cpp_limit_order_ptr.getClientOrderID().decode("utf8"), 0.0) <= 0):
+                    process_order_its.push_back(getIteratorFromReverseIterator(
+                        <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
                 inc(orders_rit)
         else:
             while orders_it != orders_collection_ptr.end():
                 cpp_limit_order_ptr = address(deref(orders_it))
                 if opposite_order_book_price < <object>cpp_limit_order_ptr.getPrice():
                     break
-                process_order_its.push_back(orders_it)
+                if (not self._queue_position_fill or
+                        opposite_order_book_price > <object>cpp_limit_order_ptr.getPrice() or
+                        self._queue_ahead.get(cpp_limit_order_ptr.getClientOrderID().decode("utf8"), 0.0) <= 0):
+                    process_order_its.push_back(orders_it)
                 inc(orders_it)
 
         for orders_it in process_order_its:
@@ -781,6 +1027,9 @@ cdef class PaperTradeExchange(ExchangeBase):
         """
         Trigger limit orders when incoming market orders have crossed the limit order's price.
 
+        With queue position fills, the trade fills the limit orders it reaches in price-time priority, up to its volume.
+        At the limit order's price, the trade is taken off the volume ahead of the order first.
+
         :param order_book_trade_event: trade event from order book
         """
         cdef:
@@ -796,6 +1045,7 @@ cdef class PaperTradeExchange(ExchangeBase):
             SingleTradingPairLimitOrdersIterator orders_it
             SingleTradingPairLimitOrdersRIterator orders_rit
             vector[SingleTradingPairLimitOrdersIterator] process_order_its
+            vector[SingleTradingPairLimitOrdersIterator] at_price_order_its
             const CPPLimitOrder *cpp_limit_order_ptr = NULL
 
         if map_it == limit_orders_map_ptr.end():
@@ -806,27 +1056,94 @@ cdef class PaperTradeExchange(ExchangeBase):
             orders_rit = orders_collection_ptr.rbegin()
             while orders_rit != orders_collection_ptr.rend():
                 cpp_limit_order_ptr = address(deref(orders_rit))
-                if <object>cpp_limit_order_ptr.getPrice() <= trade_price:
+                if <object>cpp_limit_order_ptr.getPrice() < trade_price:
                     break
-                process_order_its.push_back(getIteratorFromReverseIterator(
-                    <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
+                orders_it = getIteratorFromReverseIterator(
+                    <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit)
+                if <object>cpp_limit_order_ptr.getPrice() == trade_price:
+                    at_price_order_its.push_back(orders_it)
+                else:
+                    process_order_its.push_back(orders_it)
                 inc(orders_rit)
         else:
             orders_it = orders_collection_ptr.begin()
             while orders_it != orders_collection_ptr.end():
                 cpp_limit_order_ptr = address(deref(orders_it))
-                if <object>cpp_limit_order_ptr.getPrice() >= trade_price:
+                if <object>cpp_limit_order_ptr.getPrice() > trade_price:
                     break
-                process_order_its.push_back(orders_it)
+                if <object>cpp_limit_order_ptr.getPrice() == trade_price:
+                    at_price_order_its.push_back(orders_it)
+                else:
+                    process_order_its.push_back(orders_it)
                 inc(orders_it)
 
-        for orders_it in process_order_its:
-            self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it)
+        if not self._queue_position_fill:
+            # Orders are only filled when the trade crosses their price, in full.
+            for orders_it in process_order_its:
+                self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it)
+            return
+
+        fill_amounts = self.c_queue_fill_amounts(order_book_trade_event.trading_pair, is_maker_buy, trade_price,
+                                                 Decimal(str(trade_quantity)), process_order_its, at_price_order_its)
+        for i, amount in enumerate(fill_amounts):
+            if amount > s_decimal_0:
+                self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it),
+                                           process_order_its[i], amount)
+
+    cdef list c_queue_fill_amounts(self,
+                                   str trading_pair,
+                                   bint is_buy,
+                                   object trade_price,
+                                   object volume,
+                                   vector[SingleTradingPairLimitOrdersIterator] &process_order_its,
+                                   const vector[SingleTradingPairLimitOrdersIterator] &at_price_order_its):
+        """
+        Shares out the volume of a trade between the limit orders it reaches: first the orders at a better price than
+        the trade, best first, then the orders at the trade price in the order they were placed, each once the volume
+        ahead of it is gone. Each fill is taken off the volume left for the next orders.
+
+        :param process_order_its: the orders at a better price than the trade, best first; the orders at the trade
+        price are appended to it
+        :return: the amount to fill of each order in process_order_its
+        """
+        cdef:
+            list fill_amounts = []
+            dict at_price_indices = {}
+            const CPPLimitOrder *cpp_limit_order_ptr = NULL
+            double past_queue_ahead
+            size_t i
+
+        for i in range(process_order_its.size()):
+            cpp_limit_order_ptr = address(deref(process_order_its[i]))
+            amount = min(volume, self.c_get_unfilled_amount(cpp_limit_order_ptr))
+            fill_amounts.append(amount)
+            volume -= amount
+        for i in range(at_price_order_its.size()):
+            at_price_indices[deref(at_price_order_its[i]).getClientOrderID().decode("utf8")] = i
+        level = self._queue_levels.get((trading_pair, is_buy), {}).get(float(trade_price), {})
+        for order_id in level:
+            if order_id not in at_price_indices:
+                continue
+            i = at_price_indices[order_id]
+            process_order_its.push_back(at_price_order_its[i])
+            past_queue_ahead = self.c_consume_queue_ahead(order_id, float(volume))
+            amount = min(Decimal("%.8g" % past_queue_ahead),
+                         self.c_get_unfilled_amount(address(deref(at_price_order_its[i]))))
+            fill_amounts.append(amount)
+            volume -= amount
+        return fill_amounts
+
+    cdef object c_get_unfilled_amount(self, const CPPLimitOrder *cpp_limit_order_ptr):
+        return <object> cpp_limit_order_ptr.getQuantity() - \
+            self._limit_order_filled_amounts.get(cpp_limit_order_ptr.getClientOrderID().decode("utf8"), s_decimal_0)
 
     # </editor-fold>
 
     cdef object c_get_available_balance(self, str currency):
-        return self.available_balances.get(currency.upper(), s_decimal_0)
+        currency = currency.upper()
+        if currency not in self._account_balances:
+            return s_decimal_0
+        return self._account_balances[currency] - self._on_hold_balances.get(currency, s_decimal_0)
 
     async def get_active_exchange_markets(self) -> pd.DataFrame:
         return await self._order_book_tracker.data_source.get_active_exchange_markets()
@@ -865,13 +1182,25 @@ cdef class PaperTradeExchange(ExchangeBase):
                 return []
 
             limit_orders_collection_ptr = address(deref(map_it).second)
-            orders_it = limit_orders_collection_ptr.begin()
-            while orders_it != limit_orders_collection_ptr.end():
-                limit_order_ptr = address(deref(orders_it))
-                limit_order_cid = limit_order_ptr.getClientOrderID().decode("utf8")
-                if (not cancel_all and limit_order_cid == client_order_id) or cancel_all:
+            if cancel_all:
+                orders_it = limit_orders_collection_ptr.begin()
+                while orders_it != limit_orders_collection_ptr.end():
+                    process_order_its.push_back(orders_it)
+                    inc(orders_it)
+            else:
+                # Orders are sorted by price and then client order id, so the order is found without a scan.
+                price = self._limit_order_prices.get(client_order_id)
+                if price is None:
+                    return []
+                orders_it = limit_orders_collection_ptr.find(CPPLimitOrder(client_order_id.encode("utf8"),
+                                                                           cpp_trading_pair,
+                                                                           False,
+                                                                           b"",
+                                                                           b"",
+                                                                           <PyObject *> price,
+                                                                           <PyObject *> price))
+                if orders_it != limit_orders_collection_ptr.end():
                     process_order_its.push_back(orders_it)
-                inc(orders_it)
 
             for orders_it in process_order_its:
                 limit_order_ptr = address(deref(orders_it))
@@ -22,6 +22,7 @@ from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTr
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.probit import probit_utils
 from hummingbot.connector.exchange.probit.probit_order_book import ProbitOrderBook
+from hummingbot.core.utils.json_utils import json_loads, response_json
 
 
 class ProbitAPIOrderBookDataSource(OrderBookTrackerDataSource):
@@ -50,7 +51,7 @@ class ProbitAPIOrderBookDataSource(OrderBookTrackerDataSource):
         async with aiohttp.ClientSession() as client:
             async with client.get(f"{CONSTANTS.TICKER_URL.format(domain)}") as response:
                 if response.status == 200:
-                    resp_json = await response.json()
+                    resp_json = await response_json(response)
                     if "data" in resp_json:
                         for market in resp_json["data"]:
                             if market["market_id"] in trading_pairs:
@@ -63,7 +64,7 @@ class ProbitAPIOrderBookDataSource(OrderBookTrackerDataSource):
         async with aiohttp.ClientSession() as client:
             async with client.get(f"{CONSTANTS.MARKETS_URL.format(domain)}") as response:
                 if response.status == 200:
-                    resp_json: Dict[str, Any] = await response.json()
+                    resp_json: Dict[str, Any] = await response_json(response)
                     return [market["id"] for market in resp_json["data"] if market["closed"] is False]
                 return []
 
@@ -78,9 +79,9 @@ class ProbitAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 if response.status != 200:
                     raise IOError(
                         f"Error fetching OrderBook for {trading_pair} at {CONSTANTS.ORDER_BOOK_URL.format(domain)}. "
-                        f"HTTP {response.status}. Response: {await response.json()}"
+                        f"HTTP {response.status}. Response: {await response_json(response)}"
                     )
-                return await response.json()
+                return await response_json(response)
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
         snapshot: Dict[str, Any] = await self.get_order_book_data(trading_pair, domain=self._domain)
@@ -138,7 +139,7 @@ class ProbitAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         await ws.send(ujson.dumps(params))
                     async for raw_msg in self._inner_messages(ws):
                         msg_timestamp: int = int(time.time() * 1e3)
-                        msg = ujson.loads(raw_msg)
+                        msg = json_loads(raw_msg)
                         if "recent_trades" not in msg:
                             # Unrecognized response from "recent_trades" channel
                             continue
@@ -179,7 +180,7 @@ class ProbitAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         await ws.send(ujson.dumps(params))
                     async for raw_msg in self._inner_messages(ws):
                         msg_timestamp: int = int(time.time() * 1e3)
-                        msg: Dict[str, Any] = ujson.loads(raw_msg)
+                        msg: Dict[str, Any] = json_loads(raw_msg)
                         if "order_books" not in msg:
                             # Unrecognized response from "order_books" channel
                             continue
@@ -21,6 +21,7 @@ from hummingbot.connector.exchange.radar_relay.radar_relay_order_book import Rad
 from hummingbot.connector.exchange.radar_relay.radar_relay_active_order_tracker import RadarRelayActiveOrderTracker
 from hummingbot.connector.exchange.radar_relay.radar_relay_order_book_message import RadarRelayOrderBookMessage
 from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils.json_utils import json_loads, response_json
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
@@ -69,7 +70,7 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
             response: aiohttp.ClientResponse = response
             if response.status != 200:
                 raise IOError(f"Error fetching token info. HTTP status is {response.status}.")
-            data = await response.json()
+            data = await response_json(response)
             return {d["address"]: d for d in data}
 
     @classmethod
@@ -83,7 +84,7 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
             response: aiohttp.ClientResponse = response
             if response.status != 200:
                 raise IOError(f"Error fetching active Radar Relay markets. HTTP status is {response.status}.")
-            data = await response.json()
+            data = await response_json(response)
             data: List[Dict[str, any]] = [
                 {**item, **{"baseAsset": item["id"].split("-")[0], "quoteAsset": item["id"].split("-")[1]}}
                 for item in data
@@ -108,7 +109,7 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     async with client.get(f"{MARKETS_URL}?perPage=100&page={page_count}", timeout=10) \
                             as response:
                         if response.status == 200:
-                            markets = await response.json()
+                            markets = await response_json(response)
                             new_trading_pairs = set(map(lambda details: details.get('id'), markets))
                             if len(new_trading_pairs) == 0:
                                 break
@@ -134,7 +135,7 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
             if response.status != 200:
                 raise IOError(f"Error fetching Radar Relay market snapshot for {trading_pair}. "
                               f"HTTP status is {response.status}.")
-            return await response.json()
+            return await response_json(response)
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
         async with aiohttp.ClientSession() as client:
@@ -190,7 +191,7 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         }
                         await ws.send(ujson.dumps(request))
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_loads(raw_msg)
                         # Valid Diff messages from RadarRelay have action key
                         if "action" in msg:
                             diff_msg: RadarRelayOrderBookMessage = RadarRelayOrderBook.diff_message_from_exchange(
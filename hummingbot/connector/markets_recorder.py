@@ -1,8 +1,11 @@
 #!/usr/bin/env python
+import csv
 import os.path
 import pandas as pd
 from shutil import move
 import asyncio
+import logging
+import queue
 from sqlalchemy.orm import (
     Session,
     Query
@@ -10,8 +13,11 @@ from sqlalchemy.orm import (
 import time
 import threading
 from typing import (
+    Any,
+    Callable,
     Dict,
     List,
+    NamedTuple,
     Optional,
     Tuple,
     Union,
@@ -44,9 +50,133 @@ from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.model.funding_payment import FundingPayment
+from hummingbot.logger import HummingbotLogger
+
+# A queued database write. It runs on the writer thread with the batch's session, and may return a callback to be run
+# once the batch has been committed.
+WriteFunction = Callable[[Session], Optional[Callable[[], None]]]
+
+
+class MarketsRecorderWriteBatch(NamedTuple):
+    writes: List[WriteFunction]
+    market_states: List[Tuple[str, Dict[str, Any]]]
+    timestamp: int
+    queued_at: float
+
+
+class MarketsRecorderQueueStats:
+    """
+    Lag metrics of the MarketsRecorder write-behind queue. The lag of a batch is the time from its first event being
+    queued to the batch being committed.
+    """
+
+    def __init__(self):
+        self.events_queued: int = 0
+        self.events_written: int = 0
+        self.events_failed: int = 0
+        self.batches_written: int = 0
+        self.batches_failed: int = 0
+        self.market_state_writes: int = 0
+        self.last_commit_duration: float = 0.0
+        self.last_lag: float = 0.0
+        self.max_lag: float = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        return self.events_queued - self.events_written - self.events_failed
+
+    def record_batch(self, num_events: int, num_market_states: int, commit_duration: float, lag: float):
+        self.events_written += num_events
+        self.batches_written += 1
+        self.market_state_writes += num_market_states
+        self.last_commit_duration = commit_duration
+        self.last_lag = lag
+        self.max_lag = max(self.max_lag, lag)
+
+    def record_failed_batch(self, num_events: int):
+        self.events_failed += num_events
+        self.batches_failed += 1
+
+    def __repr__(self) -> str:
+        return (f"MarketsRecorderQueueStats(queue_depth={self.queue_depth}, events_written={self.events_written}, "
+                f"batches_written={self.batches_written}, batches_failed={self.batches_failed}, "
+                f"last_lag={self.last_lag:.4f}, max_lag={self.max_lag:.4f})")
+
+
+class TradeFillCsvWriter:
+    """
+    Buffered, append-only writer of the trades CSV export of a config file. The file is kept open between fills and
+    rows are written in FIELD_NAMES order, which is computed once from the TradeFill columns. An existing file is
+    only checked when it is opened: if its header differs it is moved aside and a new file is started.
+    """
+    # id field should be first, "age" is an extra field that is not stored in the database.
+    FIELD_NAMES: Tuple[str, ...] = (("id",) +
+                                    tuple(sorted(name for name in TradeFill.__table__.columns.keys() if name != "id")) +
+                                    ("age",))
+
+    def __init__(self, csv_path: str):
+        self._csv_path: str = csv_path
+        self._file = None
+        self._writer = None
+
+    @property
+    def csv_path(self) -> str:
+        return self._csv_path
+
+    @staticmethod
+    def trade_age(trade: TradeFill) -> str:
+        # // indicates order is a paper order so 'n/a'. For real orders, calculate age.
+        if "//" in trade.order_id:
+            return "n/a"
+        return time.strftime("%H:%M:%S",
+                             time.gmtime(int(trade.timestamp / 1e3 - int(trade.order_id[-16:]) / 1e6)))
+
+    def _matches_header(self) -> bool:
+        with open(self._csv_path, newline="") as fd:
+            header: Optional[List[str]] = next(csv.reader(fd), None)
+        return header is not None and tuple(header) == self.FIELD_NAMES
+
+    def _open(self):
+        if os.path.exists(self._csv_path) and os.path.getsize(self._csv_path) > 0 and not self._matches_header():
+            move(self._csv_path,
+                 self._csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
+        write_header: bool = not os.path.exists(self._csv_path) or os.path.getsize(self._csv_path) == 0
+        self._file = open(self._csv_path, "a", newline="")
+        self._writer = csv.writer(self._file)
+        if write_header:
+            self._writer.writerow(self.FIELD_NAMES)
+
+    def write_trade(self, trade: TradeFill):
+        if self._file is None:
+            self._open()
+        self._writer.writerow([getattr(trade, name) for name in self.FIELD_NAMES[:-1]] + [self.trade_age(trade)])
+
+    def flush(self):
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
 
 
 class MarketsRecorder:
+    """
+    Records order events and market tracking states to the trade fills database.
+
+    Database writes are write-behind: event handlers only build the records on the main thread and queue them, and
+    the queued writes are committed in one transaction per `write_behind_interval` seconds on a dedicated writer
+    thread. Each flush saves the tracking states of a market at most once. Trade fills are also appended to the
+    trades CSV export from the writer thread. `stop()` flushes and waits for all pending writes, and the read methods
+    flush before querying. A `write_behind_interval` of 0 commits every event before
+    the handler returns.
+    """
+    _mr_logger: Optional[HummingbotLogger] = None
+
+    WRITE_BEHIND_INTERVAL: float = 1.0
+
     market_event_tag_map: Dict[int, MarketEvent] = {
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
@@ -56,7 +186,8 @@ class MarketsRecorder:
                  sql: SQLConnectionManager,
                  markets: List[ConnectorBase],
                  config_file_path: str,
-                 strategy_name: str):
+                 strategy_name: str,
+                 write_behind_interval: float = WRITE_BEHIND_INTERVAL):
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -65,6 +196,15 @@ class MarketsRecorder:
         self._markets: List[ConnectorBase] = markets
         self._config_file_path: str = config_file_path
         self._strategy_name: str = strategy_name
+        self._write_behind_interval: float = write_behind_interval
+        self._pending_writes: List[WriteFunction] = []
+        self._pending_markets: Dict[str, ConnectorBase] = {}
+        self._pending_since: Optional[float] = None
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._write_queue: queue.Queue = queue.Queue()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._queue_stats: MarketsRecorderQueueStats = MarketsRecorderQueueStats()
+        self._csv_writers: Dict[str, TradeFillCsvWriter] = {}
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -102,6 +242,12 @@ class MarketsRecorder:
             (MarketEvent.RangePositionUpdated, self._update_range_position_forwarder),
         ]
 
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mr_logger is None:
+            cls._mr_logger = logging.getLogger(__name__)
+        return cls._mr_logger
+
     @property
     def sql(self) -> SQLConnectionManager:
         return self._sql
@@ -122,6 +268,10 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def queue_stats(self) -> MarketsRecorderQueueStats:
+        return self._queue_stats
+
     def start(self):
         for market in self._markets:
             for event_pair in self._event_pairs:
@@ -131,10 +281,119 @@ class MarketsRecorder:
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
+        self.flush(wait=True)
+        self._stop_writer()
+        self._close_csv_writers()
+
+    def flush(self, wait: bool = False):
+        """
+        Hands the pending writes to the writer thread as a single transaction, together with the current tracking
+        states of every market that had events since the last flush. Must be called from the main thread.
+
+        :param wait: block until everything queued so far has been committed
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if len(self._pending_writes) > 0:
+            batch: MarketsRecorderWriteBatch = MarketsRecorderWriteBatch(
+                writes=self._pending_writes,
+                market_states=[(market_name, market.tracking_states)
+                               for market_name, market in self._pending_markets.items()],
+                timestamp=self.db_timestamp,
+                queued_at=self._pending_since
+            )
+            self._pending_writes = []
+            self._pending_markets = {}
+            self._pending_since = None
+            self._start_writer()
+            self._write_queue.put(batch)
+
+        if wait:
+            self._write_queue.join()
+
+    def _enqueue_write(self, market: ConnectorBase, write: WriteFunction):
+        self._pending_writes.append(write)
+        self._pending_markets[market.display_name] = market
+        if self._pending_since is None:
+            self._pending_since = time.perf_counter()
+        self._queue_stats.events_queued += 1
+
+        if self._write_behind_interval <= 0:
+            self.flush(wait=True)
+        elif self._flush_handle is None:
+            self._flush_handle = self._ev_loop.call_later(self._write_behind_interval, self.flush)
+
+    def _start_writer(self):
+        if self._writer_thread is None or not self._writer_thread.is_alive():
+            self._writer_thread = threading.Thread(target=self._writer_loop, name="MarketsRecorderWriter", daemon=True)
+            self._writer_thread.start()
+
+    def _stop_writer(self):
+        if self._writer_thread is not None and self._writer_thread.is_alive():
+            self._write_queue.put(None)
+            self._writer_thread.join()
+        self._writer_thread = None
+
+    def _writer_loop(self):
+        while True:
+            batch: Optional[MarketsRecorderWriteBatch] = self._write_queue.get()
+            try:
+                if batch is None:
+                    return
+                self._write_batch(batch)
+            except Exception:
+                self._queue_stats.record_failed_batch(len(batch.writes))
+                self.logger().error(f"Error writing {len(batch.writes)} order events to the database.", exc_info=True)
+            finally:
+                self._write_queue.task_done()
+
+    def _write_batch(self, batch: MarketsRecorderWriteBatch):
+        start: float = time.perf_counter()
+        callbacks: List[Callable[[], None]] = []
+        with self._sql.begin() as session:
+            for write in batch.writes:
+                callback: Optional[Callable[[], None]] = write(session)
+                if callback is not None:
+                    callbacks.append(callback)
+            for market_name, saved_state in batch.market_states:
+                self._write_market_state(session, market_name, saved_state, batch.timestamp)
+        end: float = time.perf_counter()
+        self._queue_stats.record_batch(len(batch.writes), len(batch.market_states), end - start, end - batch.queued_at)
+
+        for callback in callbacks:
+            callback()
+        # The trades CSV files are flushed once per batch.
+        if len(callbacks) > 0:
+            for csv_writer in self._csv_writers.values():
+                csv_writer.flush()
+
+    def _write_market_state(self, session: Session, market_name: str, saved_state: Dict[str, Any], timestamp: int):
+        market_states: Optional[MarketState] = (session
+                                                .query(MarketState)
+                                                .filter(MarketState.config_file_path == self._config_file_path,
+                                                        MarketState.market == market_name)
+                                                .one_or_none())
+        if market_states is not None:
+            market_states.saved_state = saved_state
+            market_states.timestamp = timestamp
+        else:
+            session.add(MarketState(config_file_path=self._config_file_path,
+                                    market=market_name,
+                                    timestamp=timestamp,
+                                    saved_state=saved_state))
+
+    def _flush_for_read(self):
+        # Reads go through the shared session, make sure they see the rows committed by the writer thread.
+        if self._queue_stats.events_queued > 0:
+            self.flush(wait=True)
+            self.session.expire_all()
 
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
                                          number_of_rows: Optional[int] = None) -> List[Order]:
+        self._flush_for_read()
         session: Session = self.session
         filters = [Order.config_file_path == config_file_path,
                    Order.market == market.display_name]
@@ -150,6 +409,7 @@ class MarketsRecorder:
             return query.limit(number_of_rows).all()
 
     def get_trades_for_config(self, config_file_path: str, number_of_rows: Optional[int] = None) -> List[TradeFill]:
+        self._flush_for_read()
         session: Session = self.session
         query: Query = (session
                         .query(TradeFill)
@@ -185,6 +445,7 @@ class MarketsRecorder:
             market.restore_tracking_states(market_states.saved_state)
 
     def get_market_states(self, config_file_path: str, market: ConnectorBase) -> Optional[MarketState]:
+        self._flush_for_read()
         session: Session = self.session
         query: Query = (session
                         .query(MarketState)
@@ -201,7 +462,6 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_create_order, event_tag, market, evt)
             return
 
-        session: Session = self.session
         base_asset, quote_asset = evt.trading_pair.split("-")
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
@@ -224,11 +484,13 @@ class MarketsRecorder:
         order_status: OrderStatus = OrderStatus(order=order_record,
                                                 timestamp=timestamp,
                                                 status=event_type.name)
-        session.add(order_record)
-        session.add(order_status)
         market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-        self.save_market_states(self._config_file_path, market, no_commit=True)
-        session.commit()
+
+        def write(session: Session):
+            session.add(order_record)
+            session.add(order_status)
+
+        self._enqueue_write(market, write)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -238,18 +500,11 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_fill_order, event_tag, market, evt)
             return
 
-        session: Session = self.session
         base_asset, quote_asset = evt.trading_pair.split("-")
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        # Try to find the order record, and update it if necessary.
-        order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-        if order_record is not None:
-            order_record.last_status = event_type.name
-            order_record.last_update_timestamp = timestamp
-
         # Order status and trade fill record should be added even if the order record is not found, because it's
         # possible for fill event to come in before the order created event for market orders.
         order_status: OrderStatus = OrderStatus(order_id=order_id,
@@ -271,14 +526,21 @@ class MarketsRecorder:
                                                  trade_fee=TradeFee.to_json(evt.trade_fee),
                                                  exchange_trade_id=evt.exchange_trade_id,
                                                  position=evt.position if evt.position else "NILL", )
-        session.add(order_status)
-        session.add(trade_fill_record)
-        self.save_market_states(self._config_file_path, market, no_commit=True)
-        session.commit()
         market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
                                                                            trade_fill_record.exchange_trade_id,
                                                                            trade_fill_record.symbol)})
-        self.append_to_csv(trade_fill_record)
+
+        def write(session: Session):
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+            session.add(order_status)
+            session.add(trade_fill_record)
+            return lambda: self.append_to_csv(trade_fill_record)
+
+        self._enqueue_write(market, write)
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -288,61 +550,36 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_complete_funding_payment, event_tag, market, evt)
             return
 
-        session: Session = self.session
         timestamp: float = evt.timestamp
-
-        # Try to find the funding payment has been recorded already.
-        payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-            FundingPayment.timestamp == timestamp).one_or_none()
-        if payment_record is None:
-            funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                    config_file_path=self.config_file_path,
-                                                                    market=market.display_name,
-                                                                    rate=evt.funding_rate,
-                                                                    symbol=evt.trading_pair,
-                                                                    amount=float(evt.amount))
-            session.add(funding_payment_record)
-            session.commit()
-            # self.append_to_csv(funding_payment_record)
-
-    @staticmethod
-    def _is_primitive_type(obj: object) -> bool:
-        return not hasattr(obj, '__dict__')
-
-    @staticmethod
-    def _is_protected_method(method_name: str) -> bool:
-        return method_name.startswith('_')
-
-    @staticmethod
-    def _csv_matches_header(file_path: str, header: tuple) -> bool:
-        df = pd.read_csv(file_path, header=None)
-        return tuple(df.iloc[0].values) == header
+        funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                config_file_path=self.config_file_path,
+                                                                market=market.display_name,
+                                                                rate=evt.funding_rate,
+                                                                symbol=evt.trading_pair,
+                                                                amount=float(evt.amount))
+
+        def write(session: Session):
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+                FundingPayment.timestamp == timestamp).one_or_none()
+            if payment_record is None:
+                session.add(funding_payment_record)
+                # self.append_to_csv(funding_payment_record)
+
+        self._enqueue_write(market, write)
 
     def append_to_csv(self, trade: TradeFill):
         csv_filename = "trades_" + trade.config_file_path[:-4] + ".csv"
         csv_path = os.path.join(data_path(), csv_filename)
+        csv_writer: Optional[TradeFillCsvWriter] = self._csv_writers.get(csv_path)
+        if csv_writer is None:
+            csv_writer = self._csv_writers[csv_path] = TradeFillCsvWriter(csv_path)
+        csv_writer.write_trade(trade)
 
-        field_names = ("id",)  # id field should be first
-        field_names += tuple(attr for attr in dir(trade) if (not self._is_protected_method(attr) and
-                                                             self._is_primitive_type(getattr(trade, attr)) and
-                                                             (attr not in field_names)))
-        field_data = tuple(getattr(trade, attr) for attr in field_names)
-
-        # adding extra field "age"
-        # // indicates order is a paper order so 'n/a'. For real orders, calculate age.
-        age = pd.Timestamp(int(trade.timestamp / 1e3 - int(trade.order_id[-16:]) / 1e6), unit='s').strftime(
-            '%H:%M:%S') if "//" not in trade.order_id else "n/a"
-        field_names += ("age",)
-        field_data += (age,)
-
-        if (os.path.exists(csv_path) and (not self._csv_matches_header(csv_path, field_names))):
-            move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
-
-        if not os.path.exists(csv_path):
-            df_header = pd.DataFrame([field_names])
-            df_header.to_csv(csv_path, mode='a', header=False, index=False)
-        df = pd.DataFrame([field_data])
-        df.to_csv(csv_path, mode='a', header=False, index=False)
+    def _close_csv_writers(self):
+        for csv_writer in self._csv_writers.values():
+            csv_writer.close()
+        self._csv_writers.clear()
 
     def _update_order_status(self,
                              event_tag: int,
@@ -356,23 +593,23 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._update_order_status, event_tag, market, evt)
             return
 
-        session: Session = self.session
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
-        order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
 
-        if order_record is not None:
+        def write(session: Session):
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is None:
+                self.logger().warning(f"Order {order_id} is not recorded, its {event_type.name} status is not saved.")
+                return
             order_record.last_status = event_type.name
             order_record.last_update_timestamp = timestamp
             order_status: OrderStatus = OrderStatus(order_id=order_id,
                                                     timestamp=timestamp,
                                                     status=event_type.name)
             session.add(order_status)
-            self.save_market_states(self._config_file_path, market, no_commit=True)
-            session.commit()
-        else:
-            session.rollback()
+
+        self._enqueue_write(market, write)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -406,7 +643,6 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_initiate_range_position, event_tag, connector, evt)
             return
 
-        session: Session = self.session
         timestamp: int = self.db_timestamp
         r_pos: RangePosition = RangePosition(hb_id=evt.hb_id,
                                              config_file_path=self._config_file_path,
@@ -422,9 +658,11 @@ class MarketsRecorder:
                                              status=evt.status,
                                              creation_timestamp=timestamp,
                                              last_update_timestamp=timestamp)
-        session.add(r_pos)
-        self.save_market_states(self._config_file_path, connector, no_commit=True)
-        session.commit()
+
+        def write(session: Session):
+            session.add(r_pos)
+
+        self._enqueue_write(connector, write)
 
     def _did_update_range_position(self,
                                    event_tag: int,
@@ -434,20 +672,20 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_update_range_position, event_tag, connector, evt)
             return
 
-        session: Session = self.session
         timestamp: int = self.db_timestamp
-
-        rp_record: Optional[RangePosition] = session.query(RangePosition).filter(
-            RangePosition.hb_id == evt.hb_id).one_or_none()
-        if rp_record is not None:
-            rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.hb_id,
-                                                                 timestamp=timestamp,
-                                                                 tx_hash=evt.tx_hash,
-                                                                 token_id=evt.token_id,
-                                                                 base_amount=float(evt.base_amount),
-                                                                 quote_amount=float(evt.quote_amount),
-                                                                 status=evt.status,
-                                                                 )
-            session.add(rp_update)
-            self.save_market_states(self._config_file_path, connector, no_commit=True)
-            session.commit()
+        rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.hb_id,
+                                                             timestamp=timestamp,
+                                                             tx_hash=evt.tx_hash,
+                                                             token_id=evt.token_id,
+                                                             base_amount=float(evt.base_amount),
+                                                             quote_amount=float(evt.quote_amount),
+                                                             status=evt.status,
+                                                             )
+
+        def write(session: Session):
+            rp_record: Optional[RangePosition] = session.query(RangePosition).filter(
+                RangePosition.hb_id == evt.hb_id).one_or_none()
+            if rp_record is not None:
+                session.add(rp_update)
+
+        self._enqueue_write(connector, write)
@@ -4,15 +4,17 @@ import base64
 from collections import namedtuple
 from typing import (
     Dict,
-    Optional
+    Optional,
+    TYPE_CHECKING,
 )
-from zero_ex.order_utils import Order as ZeroExOrder
+if TYPE_CHECKING:
+    from zero_ex.order_utils import Order as ZeroExOrder
 
 
 TradeFillOrderDetails = namedtuple("TradeFillOrderDetails", "market exchange_trade_id symbol")
 
 
-def zrx_order_to_json(order: Optional[ZeroExOrder]) -> Optional[Dict[str, any]]:
+def zrx_order_to_json(order: Optional["ZeroExOrder"]) -> Optional[Dict[str, any]]:
     if order is None:
         return None
 
@@ -25,10 +27,13 @@ def zrx_order_to_json(order: Optional[ZeroExOrder]) -> Optional[Dict[str, any]]:
     return retval
 
 
-def json_to_zrx_order(data: Optional[Dict[str, any]]) -> Optional[ZeroExOrder]:
+def json_to_zrx_order(data: Optional[Dict[str, any]]) -> Optional["ZeroExOrder"]:
     if data is None:
         return None
 
+    # zero_ex imports web3, which is slow to import and isn't needed by most of the connectors that import this module.
+    from zero_ex.order_utils import Order as ZeroExOrder
+
     intermediate: Dict[str, any] = {}
     for key, value in data.items():
         if key.startswith("__binary__"):
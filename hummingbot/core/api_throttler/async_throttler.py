@@ -0,0 +1,204 @@
+import asyncio
+import itertools
+import time
+from collections import deque
+from typing import (
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from hummingbot.core.api_throttler.api_throttler_base import APIThrottlerBase
+from hummingbot.core.api_throttler.data_types import (
+    RateLimit,
+    RequestPath,
+    RequestPriority,
+    RequestWeight,
+    Seconds,
+)
+
+
+class TokenBucket:
+    """
+    Tracks the weight a rate limit let through in its last time interval. Requests take their weight from the bucket,
+    and the tokens are returned once the time interval has passed, so a bucket enforces the same sliding window as
+    the task logs of the other throttlers, with O(1) work per request.
+    """
+
+    def __init__(self, rate_limit: RateLimit, period_safety_margin: Seconds = 0.1):
+        self.rate_limit: RateLimit = rate_limit
+        # Number of requests queued on the bucket
+        self.waiters: int = 0
+        # Tokens are returned a safety margin late, for the network latency.
+        self._period: float = rate_limit.time_interval + period_safety_margin
+        # (return time, weight) of the tokens taken
+        self._taken: Deque[Tuple[float, RequestWeight]] = deque()
+        self._taken_weight: int = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.rate_limit.limit - self._taken_weight
+
+    @property
+    def next_return_time(self) -> Optional[float]:
+        return self._taken[0][0] if len(self._taken) > 0 else None
+
+    def return_tokens(self, now: float):
+        taken: Deque[Tuple[float, RequestWeight]] = self._taken
+        while len(taken) > 0 and taken[0][0] <= now:
+            self._taken_weight -= taken.popleft()[1]
+
+    def take(self, now: float, weight: RequestWeight):
+        self._taken.append((now + self._period, weight))
+        self._taken_weight += weight
+
+
+class _Waiter:
+    __slots__ = ("bucket_weights", "future")
+
+    def __init__(self, bucket_weights: List[Tuple[TokenBucket, RequestWeight]], future: asyncio.Future):
+        self.bucket_weights: List[Tuple[TokenBucket, RequestWeight]] = bucket_weights
+        self.future: asyncio.Future = future
+
+
+class AsyncThrottler(APIThrottlerBase):
+    """
+    Throttles API requests with a token bucket per rate limit. A request takes its weight from the bucket of its path
+    url and from the buckets of the linked limits, e.g. a request weight pool shared by several endpoints.
+
+    Requests that don't fit wait in priority lanes, and are woken by a timer set for the moment the tokens they wait
+    on are returned, rather than by polling. Within a bucket, waiting requests are let through by priority and then in
+    arrival order, so e.g. order cancellations go ahead of status polls. A full bucket only holds up the requests that
+    need its tokens.
+    """
+
+    def __init__(self,
+                 rate_limit_list: List[RateLimit],
+                 period_safety_margin: Seconds = 0.1):
+        super().__init__(rate_limit_list, period_safety_margin=period_safety_margin)
+
+        self._buckets: Dict[RequestPath, TokenBucket] = {
+            limit.path_url: TokenBucket(limit, period_safety_margin)
+            for limit in self._rate_limit_list
+        }
+        # The buckets each path url takes tokens from, and how many.
+        self._path_bucket_weights: Dict[RequestPath, List[Tuple[TokenBucket, RequestWeight]]] = {}
+        for limit in self._rate_limit_list:
+            bucket_weights: List[Tuple[TokenBucket, RequestWeight]] = [(self._buckets[limit.path_url], limit.weight)]
+            for linked_limit in limit.linked_limits:
+                if linked_limit.path_url not in self._buckets:
+                    raise ValueError(f"Rate limit {limit.path_url} is linked to an unknown rate limit "
+                                     f"{linked_limit.path_url}.")
+                bucket_weights.append((self._buckets[linked_limit.path_url], linked_limit.weight))
+            for bucket, weight in bucket_weights:
+                if weight > bucket.rate_limit.limit:
+                    raise ValueError(f"Requests to {limit.path_url} weigh more than the {bucket.rate_limit.path_url} "
+                                     f"rate limit of {bucket.rate_limit.limit}.")
+            self._path_bucket_weights[limit.path_url] = bucket_weights
+
+        # Waiting requests by priority, in arrival order.
+        self._lanes: Dict[RequestPriority, Dict[int, _Waiter]] = {priority: {} for priority in sorted(RequestPriority)}
+        self._waiter_ids = itertools.count()
+        self._wakeup_handle: Optional[asyncio.TimerHandle] = None
+        self._wakeup_time: float = float("inf")
+
+    @property
+    def waiting_requests(self) -> int:
+        return sum(len(lane) for lane in self._lanes.values())
+
+    def execute_task(self, path_url: RequestPath, priority: RequestPriority = RequestPriority.NORMAL):
+        return AsyncRequestContext(self, path_url, priority)
+
+    async def acquire(self, path_url: RequestPath, priority: RequestPriority = RequestPriority.NORMAL):
+        bucket_weights: List[Tuple[TokenBucket, RequestWeight]] = self._path_bucket_weights[path_url]
+        if all(bucket.waiters == 0 for bucket, _ in bucket_weights) and self._take(bucket_weights, time.time()):
+            return
+
+        waiter: _Waiter = _Waiter(bucket_weights, asyncio.get_event_loop().create_future())
+        waiter_id: int = next(self._waiter_ids)
+        lane: Dict[int, _Waiter] = self._lanes[priority]
+        lane[waiter_id] = waiter
+        for bucket, _ in bucket_weights:
+            bucket.waiters += 1
+        # The request may go ahead of lower priority ones already waiting.
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if lane.pop(waiter_id, None) is not None:
+                for bucket, _ in bucket_weights:
+                    bucket.waiters -= 1
+                # Requests queued behind it may fit now.
+                self._dispatch()
+            raise
+
+    @staticmethod
+    def _take(bucket_weights: List[Tuple[TokenBucket, RequestWeight]], now: float) -> bool:
+        for bucket, weight in bucket_weights:
+            bucket.return_tokens(now)
+            if bucket.capacity < weight:
+                return False
+        for bucket, weight in bucket_weights:
+            bucket.take(now, weight)
+        return True
+
+    def _dispatch(self):
+        """
+        Lets through the waiting requests that fit, by priority and arrival order. Once a request doesn't fit, the
+        later requests on the buckets it doesn't fit in keep waiting behind it.
+        """
+        now: float = time.time()
+        full_buckets: Set[TokenBucket] = set()
+        for lane in self._lanes.values():
+            ready_ids: List[int] = []
+            for waiter_id, waiter in lane.items():
+                if len(full_buckets) == len(self._buckets):
+                    break
+                if waiter.future.done() or any(bucket in full_buckets for bucket, _ in waiter.bucket_weights):
+                    continue
+                if self._take(waiter.bucket_weights, now):
+                    ready_ids.append(waiter_id)
+                else:
+                    full_buckets.update(bucket for bucket, weight in waiter.bucket_weights if bucket.capacity < weight)
+            for waiter_id in ready_ids:
+                waiter = lane.pop(waiter_id)
+                for bucket, _ in waiter.bucket_weights:
+                    bucket.waiters -= 1
+                waiter.future.set_result(None)
+        self._schedule_wakeup(min((bucket.next_return_time for bucket in full_buckets), default=None), now)
+
+    def _schedule_wakeup(self, wakeup_time: Optional[float], now: float):
+        if wakeup_time == self._wakeup_time:
+            return
+        if self._wakeup_handle is not None:
+            self._wakeup_handle.cancel()
+            self._wakeup_handle = None
+            self._wakeup_time = float("inf")
+        if wakeup_time is not None:
+            self._wakeup_handle = asyncio.get_event_loop().call_later(max(wakeup_time - now, 0), self._wakeup)
+            self._wakeup_time = wakeup_time
+
+    def _wakeup(self):
+        self._wakeup_handle = None
+        self._wakeup_time = float("inf")
+        self._dispatch()
+
+
+class AsyncRequestContext:
+    """
+    Asynchronous context associated with each API request of an AsyncThrottler.
+    """
+
+    def __init__(self, throttler: AsyncThrottler, path_url: RequestPath, priority: RequestPriority):
+        self._throttler: AsyncThrottler = throttler
+        self._path_url: RequestPath = path_url
+        self._priority: RequestPriority = priority
+
+    async def __aenter__(self):
+        await self._throttler.acquire(self._path_url, self._priority)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
@@ -1,4 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import List
 
 DEFAULT_PATH = ""
 DEFAULT_WEIGHT = 1
@@ -10,12 +12,27 @@ RequestWeight = int     # Integer representing the request weight of the path ur
 Seconds = float
 
 
+class RequestPriority(IntEnum):
+    # Lower values are let through first when requests wait on the same rate limit.
+    HIGH = 0            # e.g. order cancellations
+    NORMAL = 1
+    LOW = 2             # e.g. order status polling
+
+
+@dataclass
+class LinkedLimitWeightPair():
+    path_url: RequestPath
+    weight: RequestWeight = DEFAULT_WEIGHT
+
+
 @dataclass
 class RateLimit():
     limit: Limit
     time_interval: Seconds
     path_url: RequestPath = DEFAULT_PATH
     weight: RequestWeight = DEFAULT_WEIGHT
+    # Other rate limits, e.g. a pool shared by several endpoints, that the requests count towards as well.
+    linked_limits: List[LinkedLimitWeightPair] = field(default_factory=list)
 
 
 @dataclass
@@ -1,12 +1,23 @@
 # distutils: language=c++
 
+from libc.stdint cimport int64_t
+
 cdef class Clock:
     cdef:
         object _clock_mode
         double _tick_size
+        int64_t _tick_size_ns
         double _start_time
         double _end_time
         list _child_iterators
         list _current_context
         double _current_tick
+        int64_t _current_tick_ns
+        int64_t _ticks
         bint _started
+        bint _fast_forward
+        object _overrun_policy
+        object _tick_profiler
+
+    cdef c_set_current_tick_ns(self, int64_t tick_ns)
+    cdef int64_t c_next_backtest_tick_ns(self, double timestamp)
@@ -3,14 +3,28 @@
 import asyncio
 import logging
 import time
-from typing import List
+from typing import (
+    List,
+    Optional,
+)
+
+from libc.stdint cimport int64_t
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
-from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.clock_mode import (
+    ClockMode,
+    ClockOverrunPolicy,
+)
+from hummingbot.core.clock_tick_profiler import ClockTickProfiler
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
+NaN = float("nan")
+
+
+cdef inline int64_t to_nanoseconds(double seconds):
+    return <int64_t>round(seconds * 1e9)
 
 
 cdef class Clock:
@@ -21,21 +35,43 @@ cdef class Clock:
             s_logger = logging.getLogger(__name__)
         return s_logger
 
-    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
+    def __init__(self,
+                 clock_mode: ClockMode,
+                 tick_size: float = 1.0,
+                 start_time: float = 0.0,
+                 end_time: float = 0.0,
+                 overrun_policy: ClockOverrunPolicy = ClockOverrunPolicy.SKIP,
+                 profile_ticks: bool = True,
+                 fast_forward: bool = False):
         """
         :param clock_mode: either real time mode or back testing mode
-        :param tick_size: time interval of each tick
+        :param tick_size: time interval of each tick, sub-second tick sizes are kept exact as integer nanoseconds
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
+        :param overrun_policy: (real time mode only) whether ticks missed while the iterators were running are
+        skipped or run late
+        :param profile_ticks: (real time mode only) records tick execution times and overruns
+        :param fast_forward: (back testing mode only) skips the ticks before the iterators' next wake-up time
         """
+        if tick_size <= 0:
+            raise ValueError(f"Clock tick size must be positive, got {tick_size}.")
         self._clock_mode = clock_mode
         self._tick_size = tick_size
+        self._tick_size_ns = to_nanoseconds(tick_size)
         self._start_time = start_time
         self._end_time = end_time
-        self._current_tick = start_time if clock_mode is ClockMode.BACKTEST else (time.time() // tick_size) * tick_size
+        if clock_mode is ClockMode.BACKTEST:
+            self.c_set_current_tick_ns(to_nanoseconds(start_time))
+        else:
+            self.c_set_current_tick_ns((time.time_ns() // self._tick_size_ns) * self._tick_size_ns)
         self._child_iterators = []
         self._current_context = None
+        self._ticks = 0
         self._started = False
+        self._fast_forward = fast_forward
+        self._overrun_policy = overrun_policy
+        self._tick_profiler = ClockTickProfiler(tick_size) \
+            if profile_ticks and clock_mode is ClockMode.REALTIME else None
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -49,6 +85,25 @@ cdef class Clock:
     def tick_size(self) -> float:
         return self._tick_size
 
+    @property
+    def fast_forward(self) -> bool:
+        return self._fast_forward
+
+    @property
+    def ticks(self) -> int:
+        """
+        Number of ticks run so far.
+        """
+        return self._ticks
+
+    @property
+    def overrun_policy(self) -> ClockOverrunPolicy:
+        return self._overrun_policy
+
+    @property
+    def tick_profiler(self) -> Optional[ClockTickProfiler]:
+        return self._tick_profiler
+
     @property
     def child_iterators(self) -> List[TimeIterator]:
         return self._child_iterators
@@ -57,6 +112,11 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    cdef c_set_current_tick_ns(self, int64_t tick_ns):
+        # Timestamps are derived from the integer tick instead of accumulated, so they never drift.
+        self._current_tick_ns = tick_ns
+        self._current_tick = tick_ns / 1e9
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -88,33 +148,58 @@ cdef class Clock:
     async def run_til(self, timestamp: float):
         cdef:
             TimeIterator child_iterator
-            double now = time.time()
-            double next_tick_time
+            int64_t now_ns
+            int64_t next_tick_ns
+            bint catch_up = self._overrun_policy is ClockOverrunPolicy.CATCH_UP
+            bint behind = False
+            object profiler = self._tick_profiler
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
 
-        self._current_tick = (now // self._tick_size) * self._tick_size
+        self.c_set_current_tick_ns((time.time_ns() // self._tick_size_ns) * self._tick_size_ns)
         if not self._started:
             for ci in self._current_context:
                 child_iterator = ci
                 child_iterator.c_start(self, self._current_tick)
             self._started = True
+        if profiler is not None:
+            profiler.start()
 
         try:
             while True:
-                now = time.time()
-                if now >= timestamp:
+                now_ns = time.time_ns()
+                if now_ns / 1e9 >= timestamp:
                     return
 
-                # Sleep until the next tick
-                next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
-                await asyncio.sleep(next_tick_time - now)
-                self._current_tick = next_tick_time
+                if now_ns < self._current_tick_ns + self._tick_size_ns:
+                    # On time, sleep until the next tick.
+                    behind = False
+                    next_tick_ns = self._current_tick_ns + self._tick_size_ns
+                    await asyncio.sleep((next_tick_ns - now_ns) / 1e9)
+                elif catch_up:
+                    # The previous tick ran past the next tick boundary, run the missed ticks without sleeping.
+                    next_tick_ns = self._current_tick_ns + self._tick_size_ns
+                    if profiler is not None:
+                        if not behind:
+                            profiler.record_overrun(0)
+                        profiler.record_late_tick()
+                    behind = True
+                    await asyncio.sleep(0)
+                else:
+                    # The previous tick ran past the next tick boundary, skip to the next boundary from now.
+                    next_tick_ns = ((now_ns // self._tick_size_ns) + 1) * self._tick_size_ns
+                    if profiler is not None:
+                        profiler.record_overrun((next_tick_ns - self._current_tick_ns) // self._tick_size_ns - 1)
+                    await asyncio.sleep((next_tick_ns - now_ns) / 1e9)
+                self.c_set_current_tick_ns(next_tick_ns)
+                self._ticks += 1
 
                 # Run through all the child iterators.
                 for ci in self._current_context:
                     child_iterator = ci
+                    if profiler is not None:
+                        profiler.tick_started()
                     try:
                         child_iterator.c_tick(self._current_tick)
                     except StopIteration:
@@ -122,13 +207,52 @@ cdef class Clock:
                         return
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                    if profiler is not None:
+                        profiler.tick_finished(child_iterator, self._current_tick)
         finally:
+            if profiler is not None:
+                profiler.stop()
             for ci in self._current_context:
                 child_iterator = ci
                 child_iterator._clock = None
 
+    cdef int64_t c_next_backtest_tick_ns(self, double timestamp):
+        """
+        The tick after the current one when fast forwarding: the first tick on or after the earliest wake-up time of
+        the iterators, and no later than the first tick on or after `timestamp`. Ticks stay on the tick size grid, so
+        iterators see the same timestamps as when every tick is run.
+
+        :return: the next tick in nanoseconds, -1 if no iterator will wake up again and `timestamp` is NaN
+        """
+        cdef:
+            TimeIterator child_iterator
+            int64_t next_tick_ns = self._current_tick_ns + self._tick_size_ns
+            int64_t wakeup_ns
+            double wakeup_time
+            double earliest = NaN
+
+        for ci in self._child_iterators:
+            child_iterator = ci
+            wakeup_time = child_iterator.c_next_wakeup_time(self._current_tick)
+            if wakeup_time <= self._current_tick:
+                return next_tick_ns
+            if wakeup_time == wakeup_time and not (wakeup_time >= earliest):
+                earliest = wakeup_time
+
+        if earliest != earliest or earliest > timestamp:
+            earliest = timestamp
+        if earliest != earliest:
+            return -1
+        wakeup_ns = to_nanoseconds(earliest)
+        if wakeup_ns <= next_tick_ns:
+            return next_tick_ns
+        return self._current_tick_ns + ((wakeup_ns - self._current_tick_ns - 1) // self._tick_size_ns + 1) * \
+            self._tick_size_ns
+
     def backtest_til(self, timestamp: float):
-        cdef TimeIterator child_iterator
+        cdef:
+            TimeIterator child_iterator
+            int64_t next_tick_ns
 
         if not self._started:
             for ci in self._child_iterators:
@@ -138,7 +262,14 @@ cdef class Clock:
 
         try:
             while not (self._current_tick >= timestamp):
-                self._current_tick += self._tick_size
+                if self._fast_forward:
+                    next_tick_ns = self.c_next_backtest_tick_ns(timestamp)
+                    if next_tick_ns < 0:
+                        return
+                else:
+                    next_tick_ns = self._current_tick_ns + self._tick_size_ns
+                self.c_set_current_tick_ns(next_tick_ns)
+                self._ticks += 1
                 for ci in self._child_iterators:
                     child_iterator = ci
                     try:
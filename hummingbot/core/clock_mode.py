@@ -6,3 +6,14 @@ from enum import Enum
 class ClockMode(Enum):
     REALTIME = 1
     BACKTEST = 2
+
+
+class ClockOverrunPolicy(Enum):
+    """
+    What a real time clock does when the iterators of one tick run past the next tick boundary.
+
+    SKIP: ticks whose time has already passed are dropped, and the clock resumes at the next boundary.
+    CATCH_UP: every missed tick is run back to back, with its own timestamp, until the clock is on time again.
+    """
+    SKIP = 1
+    CATCH_UP = 2
@@ -0,0 +1,153 @@
+import sys
+import threading
+import time
+import traceback
+from bisect import bisect_left
+from typing import (
+    Any,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+)
+
+
+class TickOffender(NamedTuple):
+    name: str
+    elapsed: float
+    timestamp: float
+    stack: Optional[List[str]]
+
+
+class IteratorTickStats:
+    """
+    Execution time histogram of the ticks of one TimeIterator.
+    """
+    BUCKET_BOUNDS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000)
+
+    def __init__(self, name: str):
+        self.name: str = name
+        self.ticks: int = 0
+        self.total_time: float = 0
+        self.max_time: float = 0
+        self.histogram: List[int] = [0] * (len(self.BUCKET_BOUNDS_MS) + 1)
+
+    def record(self, elapsed: float):
+        self.ticks += 1
+        self.total_time += elapsed
+        if elapsed > self.max_time:
+            self.max_time = elapsed
+        self.histogram[bisect_left(self.BUCKET_BOUNDS_MS, elapsed * 1e3)] += 1
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.ticks if self.ticks > 0 else 0
+
+    def percentile(self, q: float) -> float:
+        """
+        Upper bound, in seconds, of the histogram bucket holding the q-th percentile tick.
+        """
+        threshold = self.ticks * q / 100
+        count = 0
+        for bound, bucket_count in zip(self.BUCKET_BOUNDS_MS, self.histogram):
+            count += bucket_count
+            if count >= threshold:
+                return min(bound / 1e3, self.max_time)
+        return self.max_time
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "iterator": self.name,
+            "ticks": self.ticks,
+            "mean_ms": round(self.mean_time * 1e3, 3),
+            "p99_ms": round(self.percentile(99) * 1e3, 3),
+            "max_ms": round(self.max_time * 1e3, 3),
+        }
+
+    def __repr__(self) -> str:
+        return (f"IteratorTickStats(name={self.name}, ticks={self.ticks}, mean={self.mean_time * 1e3:.3f}ms, "
+                f"max={self.max_time * 1e3:.3f}ms)")
+
+
+class ClockTickProfiler:
+    """
+    Records how long every TimeIterator takes to tick, and how often the clock falls behind the wall clock because
+    the iterators of one tick took longer than the tick size.
+
+    While the clock is running, a watchdog thread looks at the tick in progress. When a single iterator tick runs
+    longer than the tick size, the watchdog samples the clock thread's stack once, so the slowest tick seen is
+    reported together with where it was spending its time.
+    """
+
+    def __init__(self, tick_size: float, capture_stacks: bool = True):
+        self._tick_size: float = tick_size
+        self._capture_stacks: bool = capture_stacks
+        self._stats: Dict[Any, IteratorTickStats] = {}
+        self.overruns: int = 0
+        self.skipped_ticks: int = 0
+        self.late_ticks: int = 0
+        self.worst_offender: Optional[TickOffender] = None
+
+        self._active_seq: int = 0
+        self._active_since: Optional[float] = None
+        self._sampled_seq: int = -1
+        self._sampled_stack: Optional[List[str]] = None
+        self._clock_thread_id: Optional[int] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._watchdog_stopped: threading.Event = threading.Event()
+
+    @property
+    def iterator_stats(self) -> List[IteratorTickStats]:
+        return list(self._stats.values())
+
+    def start(self):
+        self._clock_thread_id = threading.get_ident()
+        if self._capture_stacks and self._watchdog is None:
+            self._watchdog_stopped.clear()
+            self._watchdog = threading.Thread(target=self._watch, name="ClockTickWatchdog", daemon=True)
+            self._watchdog.start()
+
+    def stop(self):
+        self._active_since = None
+        if self._watchdog is not None:
+            self._watchdog_stopped.set()
+            self._watchdog.join()
+            self._watchdog = None
+
+    def tick_started(self):
+        self._active_seq += 1
+        self._active_since = time.perf_counter()
+
+    def tick_finished(self, iterator: Any, timestamp: float):
+        elapsed = time.perf_counter() - self._active_since
+        self._active_since = None
+        stats = self._stats.get(iterator)
+        if stats is None:
+            stats = self._stats[iterator] = IteratorTickStats(self.iterator_name(iterator))
+        stats.record(elapsed)
+        if self.worst_offender is None or elapsed > self.worst_offender.elapsed:
+            stack = self._sampled_stack if self._sampled_seq == self._active_seq else None
+            self.worst_offender = TickOffender(stats.name, elapsed, timestamp, stack)
+
+    def record_overrun(self, skipped_ticks: int):
+        self.overruns += 1
+        self.skipped_ticks += skipped_ticks
+
+    def record_late_tick(self):
+        self.late_ticks += 1
+
+    @staticmethod
+    def iterator_name(iterator: Any) -> str:
+        display_name = getattr(iterator, "display_name", None)
+        return display_name if isinstance(display_name, str) else type(iterator).__name__
+
+    def _watch(self):
+        interval = min(max(self._tick_size / 4, 0.01), 0.25)
+        while not self._watchdog_stopped.wait(interval):
+            seq, since = self._active_seq, self._active_since
+            if since is None or seq == self._sampled_seq or time.perf_counter() - since < self._tick_size:
+                continue
+            frame = sys._current_frames().get(self._clock_thread_id)
+            if frame is not None:
+                self._sampled_stack = traceback.format_stack(frame)
+                self._sampled_seq = seq
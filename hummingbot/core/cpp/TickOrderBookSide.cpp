@@ -0,0 +1,117 @@
+#include "TickOrderBookSide.h"
+#include <algorithm>
+
+TickOrderBookSide::TickOrderBookSide() {
+    this->isBid = false;
+}
+
+TickOrderBookSide::TickOrderBookSide(bool isBid) {
+    this->isBid = isBid;
+}
+
+TickOrderBookSide::TickOrderBookSide(const TickOrderBookSide &other) {
+    this->levels = other.levels;
+    this->isBid = other.isBid;
+}
+
+TickOrderBookSide &TickOrderBookSide::operator=(const TickOrderBookSide &other) {
+    this->levels = other.levels;
+    this->isBid = other.isBid;
+    return *this;
+}
+
+// Bids are sorted by ascending ticks and asks by descending ticks, so the best price is always at the back.
+size_t TickOrderBookSide::position(int64_t ticks) const {
+    size_t low = 0;
+    size_t high = this->levels.size();
+    while (low < high) {
+        size_t mid = (low + high) >> 1;
+        bool before = this->isBid ? this->levels[mid].ticks < ticks : this->levels[mid].ticks > ticks;
+        if (before) {
+            low = mid + 1;
+        } else {
+            high = mid;
+        }
+    }
+    return low;
+}
+
+void TickOrderBookSide::apply(int64_t ticks, double amount, int64_t updateId) {
+    size_t index = this->position(ticks);
+    bool found = index < this->levels.size() && this->levels[index].ticks == ticks;
+    if (amount > 0) {
+        TickLevel level = {ticks, amount, updateId};
+        if (found) {
+            this->levels[index] = level;
+        } else {
+            this->levels.insert(this->levels.begin() + index, level);
+        }
+    } else if (found) {
+        this->levels.erase(this->levels.begin() + index);
+    }
+}
+
+void TickOrderBookSide::assign(const std::vector<TickLevel> &newLevels) {
+    bool isBid = this->isBid;
+    this->levels = newLevels;
+    std::stable_sort(this->levels.begin(), this->levels.end(), [isBid](const TickLevel &a, const TickLevel &b) {
+        return isBid ? a.ticks < b.ticks : a.ticks > b.ticks;
+    });
+    std::vector<TickLevel>::iterator last = std::unique(
+        this->levels.begin(), this->levels.end(), [](const TickLevel &a, const TickLevel &b) {
+            return a.ticks == b.ticks;
+        });
+    this->levels.erase(last, this->levels.end());
+}
+
+void TickOrderBookSide::clear() {
+    this->levels.clear();
+}
+
+void TickOrderBookSide::reserve(size_t size) {
+    this->levels.reserve(size);
+}
+
+void TickOrderBookSide::popBest() {
+    this->levels.pop_back();
+}
+
+size_t TickOrderBookSide::size() const {
+    return this->levels.size();
+}
+
+bool TickOrderBookSide::empty() const {
+    return this->levels.empty();
+}
+
+const TickLevel &TickOrderBookSide::best() const {
+    return this->levels.back();
+}
+
+const TickLevel &TickOrderBookSide::levelFromTop(size_t i) const {
+    return this->levels[this->levels.size() - 1 - i];
+}
+
+// Same rules as truncateOverlapEntries() in OrderBookEntry.cpp - centralised: the newer entry wins, dex: the entry
+// with the larger quote volume wins.
+void truncateOverlapTickLevels(TickOrderBookSide &bidBook, TickOrderBookSide &askBook, const int &dex,
+                               const double &priceIncrement) {
+    while (!bidBook.empty() && !askBook.empty()) {
+        const TickLevel &topBid = bidBook.best();
+        const TickLevel &topAsk = askBook.best();
+        if (topBid.ticks < topAsk.ticks) {
+            break;
+        }
+        bool bidWins;
+        if (dex != 0) {
+            bidWins = topBid.amount * (topBid.ticks * priceIncrement) > topAsk.amount * (topAsk.ticks * priceIncrement);
+        } else {
+            bidWins = topBid.updateId > topAsk.updateId;
+        }
+        if (bidWins) {
+            askBook.popBest();
+        } else {
+            bidBook.popBest();
+        }
+    }
+}
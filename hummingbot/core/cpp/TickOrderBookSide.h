@@ -0,0 +1,47 @@
+#ifndef _TICK_ORDER_BOOK_SIDE_H
+#define _TICK_ORDER_BOOK_SIDE_H
+
+#include <stdint.h>
+#include <stddef.h>
+#include <vector>
+
+typedef struct TickLevel {
+    int64_t ticks;
+    double amount;
+    int64_t updateId;
+} TickLevel;
+
+// One side of a TickOrderBook. Price levels are keyed on integer ticks and kept in a flat vector, sorted so that the
+// best price is at the back. Most updates land near the top of the book, so inserts and erases only shift the few
+// levels behind them.
+class TickOrderBookSide {
+    std::vector<TickLevel> levels;
+    bool isBid;
+
+    size_t position(int64_t ticks) const;
+
+    public:
+        TickOrderBookSide();
+        TickOrderBookSide(bool isBid);
+        TickOrderBookSide(const TickOrderBookSide &other);
+        TickOrderBookSide &operator=(const TickOrderBookSide &other);
+
+        // Sets the amount of a level, an amount of 0 removes the level.
+        void apply(int64_t ticks, double amount, int64_t updateId);
+        // Replaces all levels. Where the same level is given more than once, the first one is kept.
+        void assign(const std::vector<TickLevel> &newLevels);
+        void clear();
+        void reserve(size_t size);
+        void popBest();
+
+        size_t size() const;
+        bool empty() const;
+        const TickLevel &best() const;
+        // The i-th level counting from the best price, i.e. levelFromTop(0) == best().
+        const TickLevel &levelFromTop(size_t i) const;
+};
+
+void truncateOverlapTickLevels(TickOrderBookSide &bidBook, TickOrderBookSide &askBook, const int &dex,
+                               const double &priceIncrement);
+
+#endif
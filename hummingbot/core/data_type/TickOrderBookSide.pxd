@@ -0,0 +1,29 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp cimport bool
+from libcpp.vector cimport vector
+
+cdef extern from "../cpp/TickOrderBookSide.h":
+    ctypedef struct TickLevel:
+        int64_t ticks
+        double amount
+        int64_t updateId
+
+    cdef cppclass TickOrderBookSide:
+        TickOrderBookSide()
+        TickOrderBookSide(bool isBid)
+        TickOrderBookSide(const TickOrderBookSide &other)
+        TickOrderBookSide &operator=(const TickOrderBookSide &other)
+        void apply(int64_t ticks, double amount, int64_t updateId)
+        void assign(const vector[TickLevel] &newLevels)
+        void clear()
+        void reserve(size_t size)
+        void popBest()
+        size_t size() const
+        bool empty() const
+        const TickLevel &best() const
+        const TickLevel &levelFromTop(size_t i) const
+
+    void truncateOverlapTickLevels(TickOrderBookSide &bid_book, TickOrderBookSide &ask_book, const bint &dex,
+                                   const double &price_increment)
@@ -20,6 +20,13 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef vector[double] _bid_depth_prices
+    cdef vector[double] _bid_depth_base
+    cdef vector[double] _bid_depth_quote
+    cdef vector[double] _ask_depth_prices
+    cdef vector[double] _ask_depth_base
+    cdef vector[double] _ask_depth_quote
+    cdef bint _depth_index_valid
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
@@ -30,6 +37,9 @@ cdef class OrderBook(PubSub):
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
                                 np.ndarray[np.float64_t, ndim=2] asks_array)
+    cdef c_invalidate_depth_index(self)
+    cdef c_rebuild_depth_index(self)
+    cdef c_append_depth_level(self, bint is_bid, double price, double amount)
     cdef double c_get_price(self, bint is_buy) except? -1
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
@@ -8,6 +8,7 @@ from cython.operator cimport(
 from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
+    OrderBookDiffEvent,
     OrderBookEvent,
     OrderBookTradeEvent
 )
@@ -16,13 +17,15 @@ from typing import (
     Iterator,
     Tuple,
     Optional,
-    Dict
+    Dict,
+    TYPE_CHECKING,
 )
-from aiokafka import ConsumerRecord
+if TYPE_CHECKING:
+    from aiokafka import ConsumerRecord
 import pandas as pd
 import numpy as np
 import time
-from .order_book_message import OrderBookMessage
+from .order_book_message import OrderBookMessage, NumpyOrderBookMessage
 from .order_book_row import OrderBookRow
 from .order_book_query_result import OrderBookQueryResult
 from sqlalchemy.engine import RowProxy
@@ -33,8 +36,47 @@ ob_logger = None
 NaN = float("nan")
 
 
+cdef size_t c_first_level_reaching(vector[double] *cumulative, double target):
+    """
+    Binary search over a non-decreasing cumulative volume array. Returns the index of the first level at which the
+    cumulative volume reaches the target, or the number of levels if the target is never reached.
+    """
+    cdef:
+        size_t low = 0
+        size_t high = deref(cumulative).size()
+        size_t mid
+    while low < high:
+        mid = (low + high) >> 1
+        if not (deref(cumulative)[mid] >= target):
+            low = mid + 1
+        else:
+            high = mid
+    return low
+
+
+cdef size_t c_num_levels_within_price(vector[double] *prices, double price, bint is_ask):
+    """
+    Binary search over the level prices in walking order. Returns the number of levels, starting from the top of the
+    book, that are priced at or better than the given price.
+    """
+    cdef:
+        size_t low = 0
+        size_t high = deref(prices).size()
+        size_t mid
+        bint within
+    while low < high:
+        mid = (low + high) >> 1
+        within = not (deref(prices)[mid] > price) if is_ask else not (deref(prices)[mid] < price)
+        if within:
+            low = mid + 1
+        else:
+            high = mid
+    return low
+
+
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_DIFF_EVENT_TAG = OrderBookEvent.DiffEvent.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -52,6 +94,7 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._depth_index_valid = False
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -93,6 +136,16 @@ cdef class OrderBook(PubSub):
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
 
+        self.c_invalidate_depth_index()
+
+        # The diff rows are only turned into Python objects when someone listens to them.
+        if len(self.c_get_snapshot(self.ORDER_BOOK_DIFF_EVENT_TAG)) > 0:
+            self.c_trigger_event(self.ORDER_BOOK_DIFF_EVENT_TAG, OrderBookDiffEvent(
+                update_id,
+                [(bid.getPrice(), bid.getAmount()) for bid in bids],
+                [(ask.getPrice(), ask.getAmount()) for ask in asks]
+            ))
+
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
             double best_bid_price = float("NaN")
@@ -133,6 +186,8 @@ cdef class OrderBook(PubSub):
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
 
+        self.c_invalidate_depth_index()
+
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
         self._last_applied_trade = time.perf_counter()
@@ -223,13 +278,18 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+            Py_ssize_t i
+
+        if bids_array.shape[0] + asks_array.shape[0] == 0:
+            last_update_id = self._last_diff_uid
+        cpp_bids.reserve(bids_array.shape[0])
+        cpp_asks.reserve(asks_array.shape[0])
+        for i in range(bids_array.shape[0]):
+            cpp_bids.push_back(OrderBookEntry(bids_array[i, 0], bids_array[i, 1], <int64_t>(bids_array[i, 2])))
+            last_update_id = max(last_update_id, <int64_t>bids_array[i, 2])
+        for i in range(asks_array.shape[0]):
+            cpp_asks.push_back(OrderBookEntry(asks_array[i, 0], asks_array[i, 1], <int64_t>(asks_array[i, 2])))
+            last_update_id = max(last_update_id, <int64_t>asks_array[i, 2])
         self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
 
     def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
@@ -250,15 +310,36 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+            Py_ssize_t i
+
+        cpp_bids.reserve(bids_array.shape[0])
+        cpp_asks.reserve(asks_array.shape[0])
+        for i in range(bids_array.shape[0]):
+            cpp_bids.push_back(OrderBookEntry(bids_array[i, 0], bids_array[i, 1], <int64_t>(bids_array[i, 2])))
+            last_update_id = max(last_update_id, <int64_t>bids_array[i, 2])
+        for i in range(asks_array.shape[0]):
+            cpp_asks.push_back(OrderBookEntry(asks_array[i, 0], asks_array[i, 1], <int64_t>(asks_array[i, 2])))
+            last_update_id = max(last_update_id, <int64_t>asks_array[i, 2])
         self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
 
+    def apply_diff_message(self, message: OrderBookMessage):
+        """
+        Applies a diff message, straight from its numpy arrays when it is a NumpyOrderBookMessage.
+        """
+        if isinstance(message, NumpyOrderBookMessage):
+            self.c_apply_numpy_diffs(message.bids_array, message.asks_array)
+        else:
+            self.apply_diffs(message.bids, message.asks, message.update_id)
+
+    def apply_snapshot_message(self, message: OrderBookMessage):
+        """
+        Applies a snapshot message, straight from its numpy arrays when it is a NumpyOrderBookMessage.
+        """
+        if isinstance(message, NumpyOrderBookMessage):
+            self.c_apply_numpy_snapshot(message.bids_array, message.asks_array)
+        else:
+            self.apply_snapshot(message.bids, message.asks, message.update_id)
+
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
             set[OrderBookEntry].reverse_iterator it = self._bid_book.rbegin()
@@ -315,142 +396,196 @@ cdef class OrderBook(PubSub):
     def get_price(self, is_buy: bool) -> float:
         return self.c_get_price(is_buy)
 
+    cdef c_invalidate_depth_index(self):
+        self._bid_depth_prices.clear()
+        self._bid_depth_base.clear()
+        self._bid_depth_quote.clear()
+        self._ask_depth_prices.clear()
+        self._ask_depth_base.clear()
+        self._ask_depth_quote.clear()
+        self._depth_index_valid = False
+
+    cdef c_rebuild_depth_index(self):
+        """
+        Rebuilds the cumulative depth index from the bid and ask books. Levels are stored in walking order, i.e. bids
+        from the best (highest) price down and asks from the best (lowest) price up, together with the running base
+        and quote volumes up to and including each level.
+        """
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            OrderBookEntry entry
+
+        self._bid_depth_prices.reserve(self._bid_book.size())
+        self._bid_depth_base.reserve(self._bid_book.size())
+        self._bid_depth_quote.reserve(self._bid_book.size())
+        self._ask_depth_prices.reserve(self._ask_book.size())
+        self._ask_depth_base.reserve(self._ask_book.size())
+        self._ask_depth_quote.reserve(self._ask_book.size())
+        while bid_it != self._bid_book.rend():
+            entry = deref(bid_it)
+            self.c_append_depth_level(True, entry.getPrice(), entry.getAmount())
+            inc(bid_it)
+        while ask_it != self._ask_book.end():
+            entry = deref(ask_it)
+            self.c_append_depth_level(False, entry.getPrice(), entry.getAmount())
+            inc(ask_it)
+        self._depth_index_valid = True
+
+    cdef c_append_depth_level(self, bint is_bid, double price, double amount):
+        cdef:
+            vector[double] *prices = ref(self._bid_depth_prices) if is_bid else ref(self._ask_depth_prices)
+            vector[double] *cum_base = ref(self._bid_depth_base) if is_bid else ref(self._ask_depth_base)
+            vector[double] *cum_quote = ref(self._bid_depth_quote) if is_bid else ref(self._ask_depth_quote)
+            double prev_base = 0
+            double prev_quote = 0
+
+        if deref(prices).size() > 0:
+            prev_base = deref(cum_base).back()
+            prev_quote = deref(cum_quote).back()
+        deref(prices).push_back(price)
+        deref(cum_base).push_back(prev_base + amount)
+        deref(cum_quote).push_back(prev_quote + amount * price)
+
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
         cdef:
+            vector[double] *prices
+            vector[double] *cum_base
+            size_t level
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+        if not self._depth_index_valid:
+            self.c_rebuild_depth_index()
+        prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+        cum_base = ref(self._ask_depth_base) if is_buy else ref(self._bid_depth_base)
+
+        level = c_first_level_reaching(cum_base, volume)
+        if level < deref(prices).size():
+            cumulative_volume = deref(cum_base)[level]
+            result_price = deref(prices)[level]
+        elif deref(prices).size() > 0:
+            cumulative_volume = deref(cum_base).back()
 
         return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
 
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
         cdef:
+            vector[double] *prices
+            vector[double] *cum_base
+            vector[double] *cum_quote
+            size_t level
             double total_cost = 0
             double total_volume = 0
+            double incremental_amount
             double result_vwap = NaN
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
+
+        if not self._depth_index_valid:
+            self.c_rebuild_depth_index()
+        prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+        cum_base = ref(self._ask_depth_base) if is_buy else ref(self._bid_depth_base)
+        cum_quote = ref(self._ask_depth_quote) if is_buy else ref(self._bid_depth_quote)
+
+        level = c_first_level_reaching(cum_base, volume)
+        if level < deref(prices).size():
+            # Take everything before the level that fills the volume, and the remainder from that level.
+            if level > 0:
+                total_cost = deref(cum_quote)[level - 1]
+                total_volume = deref(cum_base)[level - 1]
+            incremental_amount = volume - total_volume
+            total_cost += incremental_amount * deref(prices)[level]
+            total_volume += incremental_amount
+            result_vwap = total_cost / total_volume
+        elif deref(prices).size() > 0:
+            total_volume = deref(cum_base).back()
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
         cdef:
+            vector[double] *prices
+            vector[double] *cum_quote
+            size_t level
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
+        if not self._depth_index_valid:
+            self.c_rebuild_depth_index()
+        prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+        cum_quote = ref(self._ask_depth_quote) if is_buy else ref(self._bid_depth_quote)
+
+        level = c_first_level_reaching(cum_quote, quote_volume)
+        if level < deref(prices).size():
+            cumulative_volume = deref(cum_quote)[level]
+            result_price = deref(prices)[level]
+        elif deref(prices).size() > 0:
+            cumulative_volume = deref(cum_quote).back()
 
         return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
 
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
         cdef:
+            vector[double] *prices
+            vector[double] *cum_base
+            vector[double] *cum_quote
+            size_t level
             double cumulative_volume = 0
             double cumulative_base_amount = 0
-            double row_amount = 0
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
+
+        if not self._depth_index_valid:
+            self.c_rebuild_depth_index()
+        prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+        cum_base = ref(self._ask_depth_base) if is_buy else ref(self._bid_depth_base)
+        cum_quote = ref(self._ask_depth_quote) if is_buy else ref(self._bid_depth_quote)
+
+        level = c_first_level_reaching(cum_base, base_amount)
+        if level < deref(prices).size():
+            if level > 0:
+                cumulative_volume = deref(cum_quote)[level - 1]
+                cumulative_base_amount = deref(cum_base)[level - 1]
+            cumulative_volume += (base_amount - cumulative_base_amount) * deref(prices)[level]
+        elif deref(prices).size() > 0:
+            cumulative_volume = deref(cum_quote).back()
 
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
         cdef:
+            vector[double] *prices
+            vector[double] *cum_base
+            size_t num_levels
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+        if not self._depth_index_valid:
+            self.c_rebuild_depth_index()
+        prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+        cum_base = ref(self._ask_depth_base) if is_buy else ref(self._bid_depth_base)
+
+        num_levels = c_num_levels_within_price(prices, price, is_buy)
+        if num_levels > 0:
+            cumulative_volume = deref(cum_base)[num_levels - 1]
+            result_price = deref(prices)[num_levels - 1]
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
         cdef:
+            vector[double] *prices
+            vector[double] *cum_quote
+            size_t num_levels
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+        if not self._depth_index_valid:
+            self.c_rebuild_depth_index()
+        prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+        cum_quote = ref(self._ask_depth_quote) if is_buy else ref(self._bid_depth_quote)
+
+        num_levels = c_num_levels_within_price(prices, price, is_buy)
+        if num_levels > 0:
+            cumulative_volume = deref(cum_quote)[num_levels - 1]
+            result_price = deref(prices)[num_levels - 1]
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
@@ -481,11 +616,11 @@ cdef class OrderBook(PubSub):
         pass
 
     @classmethod
-    def snapshot_message_from_kafka(cls, record: ConsumerRecord, metadata: Optional[Dict] = None) -> OrderBookMessage:
+    def snapshot_message_from_kafka(cls, record: "ConsumerRecord", metadata: Optional[Dict] = None) -> OrderBookMessage:
         pass
 
     @classmethod
-    def diff_message_from_kafka(cls, record: ConsumerRecord, metadata: Optional[Dict] = None) -> OrderBookMessage:
+    def diff_message_from_kafka(cls, record: "ConsumerRecord", metadata: Optional[Dict] = None) -> OrderBookMessage:
         pass
 
     @classmethod
@@ -495,6 +630,6 @@ cdef class OrderBook(PubSub):
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.apply_snapshot_message(snapshot)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_diff_message(diff)
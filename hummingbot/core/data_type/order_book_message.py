@@ -9,6 +9,8 @@ from typing import (
     Optional,
 )
 
+import numpy as np
+
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
 
@@ -97,3 +99,56 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
             else:
                 # For messages of same timestamp, order book messages come before trade messages.
                 return self.has_update_id
+
+
+def order_book_entries_to_numpy(entries, update_id: int) -> np.ndarray:
+    """
+    Converts [price, amount, ...] order book entries, with string or numeric values, into a contiguous float64 array
+    of [price, amount, update_id] rows.
+    """
+    if isinstance(entries, np.ndarray):
+        rows: np.ndarray = np.empty((entries.shape[0], 3), dtype=np.float64)
+        rows[:, :2] = entries[:, :2]
+    else:
+        rows: np.ndarray = np.empty((len(entries), 3), dtype=np.float64)
+        if len(entries) > 0:
+            rows[:, :2] = [entry[:2] for entry in entries]
+    rows[:, 2] = update_id
+    return rows
+
+
+class NumpyOrderBookMessage(OrderBookMessage):
+    """
+    Diff and snapshot messages that parse their bids and asks only once, on creation, into float64 arrays of
+    [price, amount, update_id] rows. OrderBook.apply_diff_message() and OrderBook.apply_snapshot_message() apply the
+    arrays directly, without building an OrderBookRow per entry.
+    """
+    def __new__(
+        cls,
+        message_type: OrderBookMessageType,
+        content: Dict[str, any],
+        timestamp: Optional[float] = None,
+        *args,
+        **kwargs,
+    ):
+        if message_type in (OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT):
+            content = dict(content)
+            content["bids"] = order_book_entries_to_numpy(content["bids"], content["update_id"])
+            content["asks"] = order_book_entries_to_numpy(content["asks"], content["update_id"])
+        return super(NumpyOrderBookMessage, cls).__new__(cls, message_type, content, timestamp, *args, **kwargs)
+
+    @property
+    def bids_array(self) -> np.ndarray:
+        return self.content["bids"]
+
+    @property
+    def asks_array(self) -> np.ndarray:
+        return self.content["asks"]
+
+    @property
+    def asks(self) -> List[OrderBookRow]:
+        return [OrderBookRow(price, amount, self.update_id) for price, amount, _ in self.content["asks"].tolist()]
+
+    @property
+    def bids(self) -> List[OrderBookRow]:
+        return [OrderBookRow(price, amount, self.update_id) for price, amount, _ in self.content["bids"].tolist()]
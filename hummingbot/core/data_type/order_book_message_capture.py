@@ -0,0 +1,315 @@
+#!/usr/bin/env python
+
+import logging
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+from datetime import (
+    datetime,
+    timezone,
+)
+from typing import (
+    BinaryIO,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+)
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book_message import (
+    NumpyOrderBookMessage,
+    OrderBookMessage,
+    OrderBookMessageType,
+    order_book_entries_to_numpy,
+)
+from hummingbot.logger import HummingbotLogger
+
+# Capture files are made of a header, followed by length prefixed records:
+#
+#   header:  magic (6 bytes) | format version (uint8) | flags (uint8)
+#   record:  payload length (uint32) | payload, zlib compressed if the file has the FLAG_COMPRESSED flag
+#
+#   payload: message type (uint8, TRADE_ID_IS_INT bit for trades) | capture time (float64) | timestamp (float64) |
+#            update id (int64) | first update id (int64) | trading pair length (uint16) | trading pair (utf8)
+#            diffs and snapshots:  bids count (uint32) | asks count (uint32) | [price, amount] float64 pairs
+#            trades:               price (float64) | amount (float64) | trade type (uint8) |
+#                                  trade id length (uint16) | trade id (utf8)
+#
+# All numbers are little endian. Files are only ever appended to. A record cut short by a crash is ignored on reading,
+# and cut off before a later capture appends to the file.
+CAPTURE_FILE_MAGIC = b"HBOBMC"
+CAPTURE_FORMAT_VERSION = 1
+CAPTURE_FILE_SUFFIX = ".obcap"
+FLAG_COMPRESSED = 0x01
+TRADE_ID_IS_INT = 0x80
+
+FILE_HEADER = struct.Struct("<6sBB")
+RECORD_LENGTH = struct.Struct("<I")
+MESSAGE_HEADER = struct.Struct("<BddqqH")
+ENTRY_COUNTS = struct.Struct("<II")
+TRADE_FIELDS = struct.Struct("<ddBH")
+
+NaN = float("nan")
+
+
+class CapturedOrderBookMessage(NamedTuple):
+    capture_time: float
+    message: OrderBookMessage
+
+
+def encode_order_book_message(message: OrderBookMessage, capture_time: float) -> bytes:
+    content = message.content
+    trading_pair: bytes = message.trading_pair.encode("utf8")
+    timestamp: float = message.timestamp if message.timestamp is not None else NaN
+    if message.type is OrderBookMessageType.TRADE:
+        trade_id = content.get("trade_id", -1)
+        trade_id_bytes: bytes = str(trade_id).encode("utf8")
+        message_type: int = message.type.value | (TRADE_ID_IS_INT if isinstance(trade_id, int) else 0)
+        return b"".join([
+            MESSAGE_HEADER.pack(message_type, capture_time, timestamp, int(content.get("update_id", -1)), -1,
+                                len(trading_pair)),
+            trading_pair,
+            TRADE_FIELDS.pack(float(content["price"]), float(content["amount"]), int(float(content["trade_type"])),
+                              len(trade_id_bytes)),
+            trade_id_bytes,
+        ])
+    if isinstance(message, NumpyOrderBookMessage):
+        bids: np.ndarray = np.ascontiguousarray(message.bids_array[:, :2])
+        asks: np.ndarray = np.ascontiguousarray(message.asks_array[:, :2])
+    else:
+        bids: np.ndarray = order_book_entries_to_numpy(content["bids"], 0)[:, :2].copy()
+        asks: np.ndarray = order_book_entries_to_numpy(content["asks"], 0)[:, :2].copy()
+    return b"".join([
+        MESSAGE_HEADER.pack(message.type.value, capture_time, timestamp, message.update_id,
+                            message.first_update_id if message.type is OrderBookMessageType.DIFF else -1,
+                            len(trading_pair)),
+        trading_pair,
+        ENTRY_COUNTS.pack(len(bids), len(asks)),
+        bids.tobytes(),
+        asks.tobytes(),
+    ])
+
+
+def decode_order_book_message(payload) -> CapturedOrderBookMessage:
+    """
+    Decodes a record payload. Diffs and snapshots are decoded into NumpyOrderBookMessage, with their entries copied
+    out of the payload's buffer.
+    """
+    message_type, capture_time, timestamp, update_id, first_update_id, pair_length = \
+        MESSAGE_HEADER.unpack_from(payload, 0)
+    offset: int = MESSAGE_HEADER.size
+    trading_pair: str = bytes(payload[offset:offset + pair_length]).decode("utf8")
+    offset += pair_length
+    if (message_type & ~TRADE_ID_IS_INT) == OrderBookMessageType.TRADE.value:
+        price, amount, trade_type, trade_id_length = TRADE_FIELDS.unpack_from(payload, offset)
+        offset += TRADE_FIELDS.size
+        trade_id = bytes(payload[offset:offset + trade_id_length]).decode("utf8")
+        message = OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": trading_pair,
+            "trade_type": float(trade_type),
+            "trade_id": int(trade_id) if message_type & TRADE_ID_IS_INT else trade_id,
+            "update_id": update_id,
+            "price": price,
+            "amount": amount,
+        }, timestamp=timestamp)
+        return CapturedOrderBookMessage(capture_time, message)
+
+    bids_count, asks_count = ENTRY_COUNTS.unpack_from(payload, offset)
+    offset += ENTRY_COUNTS.size
+    bids: np.ndarray = np.frombuffer(payload, dtype=np.float64, count=bids_count * 2, offset=offset)
+    offset += bids_count * 16
+    asks: np.ndarray = np.frombuffer(payload, dtype=np.float64, count=asks_count * 2, offset=offset)
+    content = {
+        "trading_pair": trading_pair,
+        "update_id": update_id,
+        "bids": bids.reshape(bids_count, 2),
+        "asks": asks.reshape(asks_count, 2),
+    }
+    if first_update_id >= 0:
+        content["first_update_id"] = first_update_id
+    message = NumpyOrderBookMessage(OrderBookMessageType(message_type), content, timestamp=timestamp)
+    return CapturedOrderBookMessage(capture_time, message)
+
+
+def capture_segment_name(capture_time: float) -> str:
+    return datetime.fromtimestamp(capture_time, tz=timezone.utc).strftime("%Y%m%d-%H") + CAPTURE_FILE_SUFFIX
+
+
+class OrderBookMessageCapture:
+    """
+    Appends the order book messages given to record() to hourly capture files, named after the UTC hour the messages
+    were captured in, in the capture directory.
+
+    record() only timestamps the message and hands it over to a writer thread, which encodes, compresses and writes
+    it, so capturing doesn't block the event loop on disk writes.
+    """
+    _obmc_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._obmc_logger is None:
+            cls._obmc_logger = logging.getLogger(__name__)
+        return cls._obmc_logger
+
+    def __init__(self, capture_dir: str, compress: bool = True):
+        self._capture_dir: str = capture_dir
+        self._compress: bool = compress
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer: Optional[threading.Thread] = None
+        self._file: Optional[BinaryIO] = None
+        self._file_name: Optional[str] = None
+        self._file_compressed: bool = compress
+        self.messages_written: int = 0
+
+    @property
+    def capture_dir(self) -> str:
+        return self._capture_dir
+
+    def start(self):
+        if self._writer is None:
+            os.makedirs(self._capture_dir, exist_ok=True)
+            self._writer = threading.Thread(target=self._write_loop, name="OrderBookMessageCapture", daemon=True)
+            self._writer.start()
+
+    def stop(self):
+        """
+        Writes out the messages recorded so far, and closes the capture file.
+        """
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+
+    def record(self, message: OrderBookMessage, capture_time: Optional[float] = None):
+        if self._writer is None:
+            self.start()
+        self._queue.put(CapturedOrderBookMessage(capture_time if capture_time is not None else time.time(), message))
+
+    @staticmethod
+    def _truncate_partial_record(path: str) -> Optional[int]:
+        """
+        Cuts off the record a crash left incomplete at the end of a segment, so that the records appended to it are
+        read back. Returns the segment's flags, or None if it has no header.
+        """
+        with open(path, "r+b") as fd:
+            size: int = os.fstat(fd.fileno()).st_size
+            if size < FILE_HEADER.size:
+                fd.truncate(0)
+                return None
+            _, _, flags = FILE_HEADER.unpack(fd.read(FILE_HEADER.size))
+            offset: int = FILE_HEADER.size
+            while offset + RECORD_LENGTH.size <= size:
+                (payload_length,) = RECORD_LENGTH.unpack(fd.read(RECORD_LENGTH.size))
+                if offset + RECORD_LENGTH.size + payload_length > size:
+                    break
+                offset += RECORD_LENGTH.size + payload_length
+                fd.seek(offset)
+            if offset < size:
+                fd.truncate(offset)
+            return flags
+
+    def _open_segment(self, file_name: str):
+        if self._file is not None:
+            self._file.close()
+        path: str = os.path.join(self._capture_dir, file_name)
+        # Appending to the segment of a previous capture, keep on using its flags.
+        flags: Optional[int] = self._truncate_partial_record(path) if os.path.exists(path) else None
+        self._file = open(path, "ab")
+        self._file_name = file_name
+        if flags is None:
+            self._file_compressed = self._compress
+            self._file.write(FILE_HEADER.pack(CAPTURE_FILE_MAGIC, CAPTURE_FORMAT_VERSION,
+                                              FLAG_COMPRESSED if self._compress else 0))
+        else:
+            self._file_compressed = bool(flags & FLAG_COMPRESSED)
+
+    def _write(self, captured: CapturedOrderBookMessage):
+        file_name: str = capture_segment_name(captured.capture_time)
+        if file_name != self._file_name:
+            self._open_segment(file_name)
+        payload: bytes = encode_order_book_message(captured.message, captured.capture_time)
+        if self._file_compressed:
+            payload = zlib.compress(payload, 1)
+        self._file.write(RECORD_LENGTH.pack(len(payload)))
+        self._file.write(payload)
+        self.messages_written += 1
+
+    def _write_loop(self):
+        stopped: bool = False
+        while not stopped:
+            # Write everything queued so far before flushing.
+            captured: Optional[CapturedOrderBookMessage] = self._queue.get()
+            while captured is not None:
+                try:
+                    self._write(captured)
+                except Exception:
+                    self.logger().error(f"Error capturing order book message {captured.message}.", exc_info=True)
+                try:
+                    captured = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            stopped = captured is None
+            if self._file is not None:
+                self._file.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._file_name = None
+
+
+class OrderBookMessageCaptureReader:
+    """
+    Reads the messages of a capture directory, or of a single capture file, in the order they were captured. Files are
+    memory mapped, and records are decoded as they are iterated over.
+    """
+
+    def __init__(self, capture_path: str):
+        self._capture_path: str = capture_path
+
+    @property
+    def segment_paths(self) -> List[str]:
+        if os.path.isfile(self._capture_path):
+            return [self._capture_path]
+        return [os.path.join(self._capture_path, file_name)
+                for file_name in sorted(os.listdir(self._capture_path))
+                if file_name.endswith(CAPTURE_FILE_SUFFIX)]
+
+    @staticmethod
+    def read_segment(segment_path: str) -> Iterator[CapturedOrderBookMessage]:
+        with open(segment_path, "rb") as fd:
+            if os.fstat(fd.fileno()).st_size < FILE_HEADER.size:
+                return
+            with mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                magic, version, flags = FILE_HEADER.unpack_from(mapped, 0)
+                if magic != CAPTURE_FILE_MAGIC or version > CAPTURE_FORMAT_VERSION:
+                    raise ValueError(f"{segment_path} is not an order book message capture file.")
+                compressed: bool = bool(flags & FLAG_COMPRESSED)
+                size: int = len(mapped)
+                offset: int = FILE_HEADER.size
+                while offset + RECORD_LENGTH.size <= size:
+                    (payload_length,) = RECORD_LENGTH.unpack_from(mapped, offset)
+                    offset += RECORD_LENGTH.size
+                    if offset + payload_length > size:
+                        break
+                    if compressed:
+                        payload = zlib.decompress(mapped[offset:offset + payload_length])
+                    else:
+                        payload = mapped[offset:offset + payload_length]
+                    offset += payload_length
+                    yield decode_order_book_message(payload)
+
+    def __iter__(self) -> Iterator[CapturedOrderBookMessage]:
+        for segment_path in self.segment_paths:
+            yield from self.read_segment(segment_path)
+
+    def first_snapshot(self, trading_pair: str) -> Optional[CapturedOrderBookMessage]:
+        for captured in self:
+            if captured.message.type is OrderBookMessageType.SNAPSHOT and captured.message.trading_pair == trading_pair:
+                return captured
+        return None
@@ -2,8 +2,11 @@
 import asyncio
 from abc import ABC
 from collections import deque
+from decimal import Decimal
 from enum import Enum
 import logging
+import numpy as np
+import os
 import pandas as pd
 import re
 from typing import (
@@ -16,11 +19,15 @@ import time
 from hummingbot.core.event.events import OrderBookTradeEvent, TradeType
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.tick_order_book import TickOrderBook
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from .order_book_message import (
     OrderBookMessageType,
     OrderBookMessage,
+    NumpyOrderBookMessage,
 )
+from .order_book_message_capture import OrderBookMessageCapture
+from .order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 
 TRADING_PAIR_FILTER = re.compile(r"(BTC|ETH|USDT)$")
@@ -32,8 +39,42 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
+class OrderBookDiffQueueStats:
+    """
+    Per trading pair statistics of the diff messages consumed by OrderBookTracker._track_single_book.
+    The coalescing ratio is the average number of diff messages merged into a single apply_diffs() call.
+    """
+    def __init__(self):
+        self.messages_applied: int = 0
+        self.batches_applied: int = 0
+        self.max_batch_size: int = 0
+        self.queue_depth: int = 0
+        self.max_queue_depth: int = 0
+
+    @property
+    def coalescing_ratio(self) -> float:
+        return self.messages_applied / self.batches_applied if self.batches_applied > 0 else 1.0
+
+    def record_batch(self, batch_size: int, queue_depth: int):
+        self.messages_applied += batch_size
+        self.batches_applied += 1
+        self.max_batch_size = max(self.max_batch_size, batch_size)
+        self.queue_depth = queue_depth
+        self.max_queue_depth = max(self.max_queue_depth, queue_depth)
+
+    def __repr__(self) -> str:
+        return (f"OrderBookDiffQueueStats(messages_applied={self.messages_applied}, "
+                f"batches_applied={self.batches_applied}, coalescing_ratio={self.coalescing_ratio:.2f}, "
+                f"queue_depth={self.queue_depth}, max_queue_depth={self.max_queue_depth})")
+
+
 class OrderBookTracker(ABC):
     PAST_DIFF_WINDOW_SIZE: int = 32
+    # When enabled, every diff message waiting in a trading pair's queue is merged into a single apply_diffs() call.
+    COALESCE_DIFF_MESSAGES: bool = False
+    # When set, every tracker captures the order book messages it receives into a sub directory named after its
+    # exchange, to be replayed later with ReplayOrderBookTrackerDataSource.
+    MESSAGE_CAPTURE_DIR: Optional[str] = None
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -51,6 +92,8 @@ class OrderBookTracker(ABC):
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
         self._past_diffs_windows: Dict[str, Deque] = {}
+        self._diff_queue_stats: Dict[str, OrderBookDiffQueueStats] = {}
+        self._price_increments: Dict[str, Decimal] = {}
         self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
@@ -64,6 +107,7 @@ class OrderBookTracker(ABC):
         self._order_book_diff_router_task: Optional[asyncio.Task] = None
         self._order_book_snapshot_router_task: Optional[asyncio.Task] = None
         self._update_last_trade_prices_task: Optional[asyncio.Task] = None
+        self._message_capture: Optional[OrderBookMessageCapture] = None
 
     @property
     def data_source(self) -> OrderBookTrackerDataSource:
@@ -77,6 +121,18 @@ class OrderBookTracker(ABC):
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def diff_queue_stats(self) -> Dict[str, OrderBookDiffQueueStats]:
+        return self._diff_queue_stats
+
+    @property
+    def message_capture(self) -> Optional[OrderBookMessageCapture]:
+        return self._message_capture
+
+    @message_capture.setter
+    def message_capture(self, message_capture: Optional[OrderBookMessageCapture]):
+        self._message_capture = message_capture
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -84,8 +140,21 @@ class OrderBookTracker(ABC):
             for trading_pair, order_book in self._order_books.items()
         }
 
+    def set_price_increments(self, price_increments: Dict[str, Decimal]):
+        """
+        Passes the trading pairs' minimum price increments, usually from the connector's trading rules, to the order
+        books that key their price levels on ticks. Order books created later pick them up on initialization.
+        """
+        self._price_increments.update(price_increments)
+        for trading_pair, order_book in self._order_books.items():
+            if isinstance(order_book, TickOrderBook) and trading_pair in price_increments:
+                order_book.set_price_increment(float(price_increments[trading_pair]))
+
     def start(self):
         self.stop()
+        if self._message_capture is None and self.MESSAGE_CAPTURE_DIR is not None:
+            capture_name: str = getattr(self, "exchange_name", None) or self.__class__.__name__
+            self._message_capture = OrderBookMessageCapture(os.path.join(self.MESSAGE_CAPTURE_DIR, capture_name))
         self._init_order_books_task = safe_ensure_future(
             self._init_order_books()
         )
@@ -141,6 +210,8 @@ class OrderBookTracker(ABC):
             for _, task in self._tracking_tasks.items():
                 task.cancel()
             self._tracking_tasks.clear()
+        if self._message_capture is not None:
+            self._message_capture.stop()
         self._order_books_initialized.clear()
 
     async def _update_last_trade_prices_loop(self):
@@ -176,6 +247,10 @@ class OrderBookTracker(ABC):
         """
         for index, trading_pair in enumerate(self._trading_pairs):
             self._order_books[trading_pair] = await self._data_source.get_new_order_book(trading_pair)
+            if self._message_capture is not None:
+                self._capture_order_book_snapshot(trading_pair, self._order_books[trading_pair])
+            if isinstance(self._order_books[trading_pair], TickOrderBook) and trading_pair in self._price_increments:
+                self._order_books[trading_pair].set_price_increment(float(self._price_increments[trading_pair]))
             self._tracking_message_queues[trading_pair] = asyncio.Queue()
             self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
             self.logger().info(f"Initialized order book for {trading_pair}. "
@@ -183,6 +258,18 @@ class OrderBookTracker(ABC):
             await asyncio.sleep(1)
         self._order_books_initialized.set()
 
+    def _capture_order_book_snapshot(self, trading_pair: str, order_book: OrderBook):
+        """
+        Captures an order book that was initialized outside of the message streams, e.g. from a REST snapshot.
+        """
+        bids_df, asks_df = order_book.snapshot
+        self._message_capture.record(NumpyOrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": trading_pair,
+            "update_id": order_book.snapshot_uid,
+            "bids": bids_df[["price", "amount"]].values,
+            "asks": asks_df[["price", "amount"]].values,
+        }, timestamp=time.time()))
+
     async def _order_book_diff_router(self):
         """
         Route the real-time order book diff messages to the correct order book.
@@ -194,6 +281,8 @@ class OrderBookTracker(ABC):
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
+                if self._message_capture is not None:
+                    self._message_capture.record(ob_message)
                 trading_pair: str = ob_message.trading_pair
 
                 if trading_pair not in self._tracking_message_queues:
@@ -231,6 +320,8 @@ class OrderBookTracker(ABC):
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_snapshot_stream.get()
+                if self._message_capture is not None:
+                    self._message_capture.record(ob_message)
                 trading_pair: str = ob_message.trading_pair
                 if trading_pair not in self._tracking_message_queues:
                     continue
@@ -242,29 +333,86 @@ class OrderBookTracker(ABC):
                 self.logger().error("Unknown error. Retrying after 5 seconds.", exc_info=True)
                 await asyncio.sleep(5.0)
 
+    @staticmethod
+    def _drain_diff_messages(first_message: OrderBookMessage,
+                             message_queue: asyncio.Queue) -> Tuple[List[OrderBookMessage], Optional[OrderBookMessage]]:
+        """
+        Takes every diff message already waiting in the queue, stopping at the first message of another type so that
+        snapshots are still applied in order. Returns the diffs and the non-diff message, if one was taken.
+        """
+        diff_messages: List[OrderBookMessage] = [first_message]
+        while not message_queue.empty():
+            message: OrderBookMessage = message_queue.get_nowait()
+            if message.type is not OrderBookMessageType.DIFF:
+                return diff_messages, message
+            diff_messages.append(message)
+        return diff_messages, None
+
+    @staticmethod
+    def _merge_diff_messages(diff_messages: List[OrderBookMessage]) -> Tuple[List[OrderBookRow],
+                                                                             List[OrderBookRow],
+                                                                             int]:
+        """
+        Merges diff messages per price level, the newest message wins.
+        """
+        bids: Dict[float, OrderBookRow] = {}
+        asks: Dict[float, OrderBookRow] = {}
+        for diff_message in diff_messages:
+            for row in diff_message.bids:
+                bids[row.price] = row
+            for row in diff_message.asks:
+                asks[row.price] = row
+        return list(bids.values()), list(asks.values()), diff_messages[-1].update_id
+
+    @classmethod
+    def _apply_merged_diff_messages(cls, order_book: OrderBook, diff_messages: List[OrderBookMessage]):
+        if all(isinstance(diff_message, NumpyOrderBookMessage) for diff_message in diff_messages):
+            # Entries are applied in order, so later rows for the same price level win without explicit merging.
+            order_book.apply_numpy_diffs(np.concatenate([diff_message.bids_array for diff_message in diff_messages]),
+                                         np.concatenate([diff_message.asks_array for diff_message in diff_messages]))
+        else:
+            order_book.apply_diffs(*cls._merge_diff_messages(diff_messages))
+
     async def _track_single_book(self, trading_pair: str):
         past_diffs_window: Deque[OrderBookMessage] = deque()
         self._past_diffs_windows[trading_pair] = past_diffs_window
 
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: OrderBook = self._order_books[trading_pair]
+        diff_queue_stats: OrderBookDiffQueueStats = self._diff_queue_stats.setdefault(
+            trading_pair, OrderBookDiffQueueStats())
+        pending_message: Optional[OrderBookMessage] = None
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
 
         while True:
             try:
-                message: OrderBookMessage = await message_queue.get()
+                if pending_message is not None:
+                    message: OrderBookMessage = pending_message
+                    pending_message = None
+                else:
+                    message: OrderBookMessage = await message_queue.get()
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
+                    queue_depth: int = message_queue.qsize() + 1
+                    if self.COALESCE_DIFF_MESSAGES:
+                        diff_messages, pending_message = self._drain_diff_messages(message, message_queue)
+                    else:
+                        diff_messages = [message]
+                    if len(diff_messages) > 1:
+                        self._apply_merged_diff_messages(order_book, diff_messages)
+                    else:
+                        order_book.apply_diff_message(message)
+                    diff_queue_stats.record_batch(len(diff_messages), queue_depth)
+                    past_diffs_window.extend(diff_messages)
                     while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
                         past_diffs_window.popleft()
-                    diff_messages_accepted += 1
+                    diff_messages_accepted += len(diff_messages)
 
                     # Output some statistics periodically.
                     now: float = time.time()
                     if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                        self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}.")
+                        self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}. "
+                                            f"{diff_queue_stats}")
                         diff_messages_accepted = 0
                     last_message_timestamp = now
                 elif message.type is OrderBookMessageType.SNAPSHOT:
@@ -285,6 +433,8 @@ class OrderBookTracker(ABC):
         while True:
             try:
                 trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
+                if self._message_capture is not None:
+                    self._message_capture.record(trade_message)
                 trading_pair: str = trade_message.trading_pair
 
                 if trading_pair not in self._order_books:
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+
+import asyncio
+import logging
+import time
+from typing import (
+    Dict,
+    List,
+    Optional,
+)
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_message_capture import OrderBookMessageCaptureReader
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+
+class ReplayOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+    """
+    Feeds the order book messages of a capture, written by OrderBookMessageCapture, to an OrderBookTracker.
+
+    Messages are replayed in the order they were captured, through a single task for diffs, snapshots and trades, so
+    their interleaving is reproduced. With a speed, the replay keeps the capture's pace (sped up by the speed factor),
+    without one it replays as fast as the tracker takes the messages.
+    """
+    # At full speed, yield to the event loop every so many messages so the tracker can drain its queues.
+    MAX_SPEED_BATCH_SIZE: int = 256
+
+    _rpobds_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._rpobds_logger is None:
+            cls._rpobds_logger = logging.getLogger(__name__)
+        return cls._rpobds_logger
+
+    def __init__(self, capture_path: str, trading_pairs: List[str], speed: Optional[float] = 1.0):
+        super().__init__(trading_pairs)
+        if speed is not None and speed <= 0:
+            raise ValueError(f"Replay speed must be positive, or None for full speed. {speed} given.")
+        self._reader: OrderBookMessageCaptureReader = OrderBookMessageCaptureReader(capture_path)
+        self._speed: Optional[float] = speed
+        self._outputs: Dict[OrderBookMessageType, asyncio.Queue] = {}
+        self._replay_task: Optional[asyncio.Task] = None
+        self._replay_finished: asyncio.Event = asyncio.Event()
+        self._last_traded_prices: Dict[str, float] = {}
+        self.messages_replayed: int = 0
+
+    @staticmethod
+    async def fetch_trading_pairs() -> List[str]:
+        return []
+
+    @property
+    def replay_finished(self) -> asyncio.Event:
+        return self._replay_finished
+
+    async def get_last_traded_prices(self, trading_pairs: List[str]) -> Dict[str, float]:
+        return {trading_pair: self._last_traded_prices[trading_pair]
+                for trading_pair in trading_pairs
+                if trading_pair in self._last_traded_prices}
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        captured = self._reader.first_snapshot(trading_pair)
+        if captured is None:
+            raise ValueError(f"The capture has no order book snapshot for {trading_pair}.")
+        order_book: OrderBook = self.order_book_create_function()
+        order_book.apply_snapshot_message(captured.message)
+        return order_book
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        await self._listen(OrderBookMessageType.DIFF, output)
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        await self._listen(OrderBookMessageType.SNAPSHOT, output)
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        await self._listen(OrderBookMessageType.TRADE, output)
+
+    async def _listen(self, message_type: OrderBookMessageType, output: asyncio.Queue):
+        self._outputs[message_type] = output
+        if self._replay_task is None or self._replay_task.done():
+            self._replay_task = safe_ensure_future(self._replay())
+        await self._replay_task
+
+    async def _replay(self):
+        # Let the other listeners register their outputs first.
+        await asyncio.sleep(0)
+        self._replay_finished.clear()
+        trading_pairs = set(self._trading_pairs)
+        replay_start: float = time.time()
+        capture_start: Optional[float] = None
+        for capture_time, message in self._reader:
+            if message.trading_pair not in trading_pairs:
+                continue
+            if self._speed is not None:
+                if capture_start is None:
+                    capture_start = capture_time
+                delay: float = (capture_time - capture_start) / self._speed - (time.time() - replay_start)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            elif self.messages_replayed % self.MAX_SPEED_BATCH_SIZE == 0:
+                await asyncio.sleep(0)
+            self._emit(message)
+        self.logger().info(f"Replayed {self.messages_replayed} order book messages.")
+        self._replay_finished.set()
+
+    def _emit(self, message: OrderBookMessage):
+        output: Optional[asyncio.Queue] = self._outputs.get(message.type)
+        if output is None:
+            return
+        if message.type is OrderBookMessageType.TRADE:
+            self._last_traded_prices[message.trading_pair] = message.content["price"]
+        output.put_nowait(message)
+        self.messages_replayed += 1
@@ -0,0 +1,22 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp.vector cimport vector
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.TickOrderBookSide cimport TickLevel, TickOrderBookSide
+from hummingbot.core.data_type.order_book cimport OrderBook
+
+
+cdef class TickOrderBook(OrderBook):
+    cdef TickOrderBookSide _bid_levels
+    cdef TickOrderBookSide _ask_levels
+    cdef double _price_increment
+
+    cdef int64_t c_to_ticks(self, double price)
+    cdef double c_from_ticks(self, int64_t ticks)
+    cdef vector[TickLevel] c_to_tick_levels(self, vector[OrderBookEntry] entries)
+    cdef c_update_best_prices(self)
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_rebuild_depth_index(self)
+    cdef double c_get_price(self, bint is_buy) except? -1
@@ -0,0 +1,160 @@
+# distutils: language=c++
+# distutils: sources=['hummingbot/core/cpp/OrderBookEntry.cpp', 'hummingbot/core/cpp/TickOrderBookSide.cpp']
+from cython.operator cimport dereference as deref
+from libc.math cimport llround
+from typing import Iterator
+
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.events import OrderBookDiffEvent
+from hummingbot.core.data_type.TickOrderBookSide cimport truncateOverlapTickLevels
+
+DEFAULT_PRICE_INCREMENT = 1e-8
+NaN = float("nan")
+
+
+cdef class TickOrderBook(OrderBook):
+    """
+    Order book engine that keys price levels on int64 ticks of the trading pair's minimum price increment instead of on
+    double prices. Prices are converted to ticks once, when diffs and snapshots are applied, so a price level is
+    always matched exactly even when the exchange's price strings parse to slightly different doubles.
+
+    Each side is a flat vector sorted with the best price at the back (see TickOrderBookSide.cpp), which keeps
+    iteration cache friendly and makes top of book updates cheap.
+
+    Until the trading rules are known, prices are quantized to DEFAULT_PRICE_INCREMENT. Calling
+    set_price_increment() later re-keys the existing levels.
+    """
+
+    def __init__(self, price_increment: float = DEFAULT_PRICE_INCREMENT, dex=False):
+        super().__init__(dex=dex)
+        if not price_increment > 0:
+            raise ValueError(f"Price increment must be positive, got {price_increment}.")
+        self._price_increment = float(price_increment)
+        self._bid_levels = TickOrderBookSide(True)
+        self._ask_levels = TickOrderBookSide(False)
+
+    @property
+    def price_increment(self) -> float:
+        return self._price_increment
+
+    def set_price_increment(self, price_increment: float):
+        cdef:
+            vector[TickLevel] bids
+            vector[TickLevel] asks
+            TickLevel level
+            double old_price_increment = self._price_increment
+            size_t i
+
+        price_increment = float(price_increment)
+        if not price_increment > 0:
+            raise ValueError(f"Price increment must be positive, got {price_increment}.")
+        if price_increment == old_price_increment:
+            return
+
+        self._price_increment = price_increment
+        for i in range(self._bid_levels.size()):
+            level = self._bid_levels.levelFromTop(i)
+            level.ticks = self.c_to_ticks(level.ticks * old_price_increment)
+            bids.push_back(level)
+        for i in range(self._ask_levels.size()):
+            level = self._ask_levels.levelFromTop(i)
+            level.ticks = self.c_to_ticks(level.ticks * old_price_increment)
+            asks.push_back(level)
+        self._bid_levels.assign(bids)
+        self._ask_levels.assign(asks)
+        self.c_update_best_prices()
+        self.c_invalidate_depth_index()
+
+    cdef int64_t c_to_ticks(self, double price):
+        return llround(price / self._price_increment)
+
+    cdef double c_from_ticks(self, int64_t ticks):
+        return ticks * self._price_increment
+
+    cdef vector[TickLevel] c_to_tick_levels(self, vector[OrderBookEntry] entries):
+        cdef:
+            vector[TickLevel] levels
+            TickLevel level
+
+        levels.reserve(entries.size())
+        for entry in entries:
+            level.ticks = self.c_to_ticks(entry.getPrice())
+            level.amount = entry.getAmount()
+            level.updateId = entry.getUpdateId()
+            levels.push_back(level)
+        return levels
+
+    cdef c_update_best_prices(self):
+        if not self._bid_levels.empty():
+            self._best_bid = self.c_from_ticks(self._bid_levels.best().ticks)
+        if not self._ask_levels.empty():
+            self._best_ask = self.c_from_ticks(self._ask_levels.best().ticks)
+
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        # Diffs with 0 amounts mean deletion.
+        for bid in bids:
+            self._bid_levels.apply(self.c_to_ticks(bid.getPrice()), bid.getAmount(), bid.getUpdateId())
+        for ask in asks:
+            self._ask_levels.apply(self.c_to_ticks(ask.getPrice()), ask.getAmount(), ask.getUpdateId())
+
+        truncateOverlapTickLevels(self._bid_levels, self._ask_levels, self._dex, self._price_increment)
+
+        self.c_update_best_prices()
+        self._last_diff_uid = update_id
+        self.c_invalidate_depth_index()
+
+        if len(self.c_get_snapshot(self.ORDER_BOOK_DIFF_EVENT_TAG)) > 0:
+            self.c_trigger_event(self.ORDER_BOOK_DIFF_EVENT_TAG, OrderBookDiffEvent(
+                update_id,
+                [(bid.getPrice(), bid.getAmount()) for bid in bids],
+                [(ask.getPrice(), ask.getAmount()) for ask in asks]
+            ))
+
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        self._bid_levels.assign(self.c_to_tick_levels(bids))
+        self._ask_levels.assign(self.c_to_tick_levels(asks))
+        if self._dex:
+            truncateOverlapTickLevels(self._bid_levels, self._ask_levels, self._dex, self._price_increment)
+
+        self._best_bid = self._best_ask = NaN
+        self.c_update_best_prices()
+        self._snapshot_uid = update_id
+        self.c_invalidate_depth_index()
+
+    cdef c_rebuild_depth_index(self):
+        cdef:
+            TickLevel level
+            size_t i
+
+        for i in range(self._bid_levels.size()):
+            level = self._bid_levels.levelFromTop(i)
+            self.c_append_depth_level(True, self.c_from_ticks(level.ticks), level.amount)
+        for i in range(self._ask_levels.size()):
+            level = self._ask_levels.levelFromTop(i)
+            self.c_append_depth_level(False, self.c_from_ticks(level.ticks), level.amount)
+        self._depth_index_valid = True
+
+    def bid_entries(self) -> Iterator[OrderBookRow]:
+        cdef:
+            TickLevel level
+            size_t i = 0
+        while i < self._bid_levels.size():
+            level = self._bid_levels.levelFromTop(i)
+            yield OrderBookRow(self.c_from_ticks(level.ticks), level.amount, level.updateId)
+            i += 1
+
+    def ask_entries(self) -> Iterator[OrderBookRow]:
+        cdef:
+            TickLevel level
+            size_t i = 0
+        while i < self._ask_levels.size():
+            level = self._ask_levels.levelFromTop(i)
+            yield OrderBookRow(self.c_from_ticks(level.ticks), level.amount, level.updateId)
+            i += 1
+
+    cdef double c_get_price(self, bint is_buy) except? -1:
+        cdef:
+            TickOrderBookSide *book = &self._ask_levels if is_buy else &self._bid_levels
+        if deref(book).size() < 1:
+            raise EnvironmentError("Order book is empty - no price quote is possible.")
+        return self._best_ask if is_buy else self._best_bid
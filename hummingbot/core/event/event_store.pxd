@@ -0,0 +1,15 @@
+from .event_logger cimport EventLogger
+
+
+cdef class EventStore(EventLogger):
+    cdef:
+        int _max_events
+        dict _events_by_type
+        dict _filled_balances
+        dict _fill_timestamps
+        dict _cumulative_balances
+        dict _trimmed_balances
+        object _split_trading_pair
+    cdef c_call(self, object event_object)
+    cdef c_record_fill(self, object order_filled_event)
+    cdef c_record_asset_fill(self, str asset, double timestamp, object amount)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+
+from bisect import bisect_right
+from collections import deque
+from decimal import Decimal
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+)
+
+from hummingbot.core.event.events import (
+    OrderFilledEvent,
+    TradeType,
+)
+from hummingbot.core.event.event_logger cimport EventLogger
+
+s_decimal_0 = Decimal(0)
+DEFAULT_MAX_EVENTS = 10000
+
+
+def default_split_trading_pair(trading_pair: str):
+    return trading_pair.split("-")[0], trading_pair.split("-")[1]
+
+
+cdef class EventStore(EventLogger):
+    """
+    Event logger for long running connectors. It keeps only the last `max_events` events overall and per event type,
+    with an index per event type, and keeps running totals of the asset balance changes from OrderFilledEvents.
+
+    order_filled_balances() is answered from the cumulative balance of each asset after each of its fills, sorted by
+    timestamp: the cumulative balance up to the starting timestamp, found by bisection, is subtracted from the total.
+    Up to `max_events` fills are kept per asset, older ones are folded into a base balance, so a starting timestamp
+    before the oldest retained fill is answered as if it were just before that fill.
+    """
+    def __init__(self,
+                 event_source: Optional[str] = None,
+                 max_events: int = DEFAULT_MAX_EVENTS,
+                 split_trading_pair: Callable = default_split_trading_pair):
+        super().__init__(event_source=event_source)
+        self._max_events = max_events
+        self._logged_events = deque(maxlen=max_events)
+        self._events_by_type = {}
+        self._filled_balances = {}
+        self._fill_timestamps = {}
+        self._cumulative_balances = {}
+        self._trimmed_balances = {}
+        self._split_trading_pair = split_trading_pair
+
+    @property
+    def event_log(self) -> List[any]:
+        return list(self._logged_events)
+
+    @property
+    def max_events(self) -> int:
+        return self._max_events
+
+    def events_of_type(self, event_type) -> List[any]:
+        return list(self._events_by_type.get(event_type, ()))
+
+    def clear(self):
+        self._logged_events.clear()
+        self._events_by_type.clear()
+        self._filled_balances.clear()
+        self._fill_timestamps.clear()
+        self._cumulative_balances.clear()
+        self._trimmed_balances.clear()
+
+    def order_filled_balances(self, starting_timestamp: float = 0) -> Dict[str, Decimal]:
+        """
+        Asset balance changes from the OrderFilledEvents with a timestamp after `starting_timestamp`, see
+        ConnectorBase.order_filled_balances().
+        """
+        cdef:
+            list timestamps
+            list cumulative_balances
+            int index
+
+        if starting_timestamp <= 0:
+            return dict(self._filled_balances)
+        balances = {}
+        for asset, amount in self._filled_balances.items():
+            timestamps = self._fill_timestamps[asset]
+            cumulative_balances = self._cumulative_balances[asset]
+            index = bisect_right(timestamps, starting_timestamp)
+            if index > 0:
+                balances[asset] = amount - cumulative_balances[index - 1]
+            else:
+                balances[asset] = amount - self._trimmed_balances.get(asset, s_decimal_0)
+        return balances
+
+    def add_fill_to_balances(self, dict balances, object event):
+        base, quote = self._split_trading_pair(event.trading_pair)
+        if event.trade_type is TradeType.BUY:
+            quote_value = Decimal("-1") * event.price * event.amount
+            base_value = event.amount
+        else:
+            quote_value = event.price * event.amount
+            base_value = Decimal("-1") * event.amount
+        balances[base] = balances.get(base, s_decimal_0) + base_value
+        balances[quote] = balances.get(quote, s_decimal_0) + quote_value
+
+    cdef c_record_asset_fill(self, str asset, double timestamp, object amount):
+        cdef:
+            list timestamps = self._fill_timestamps.setdefault(asset, [])
+            list cumulative_balances = self._cumulative_balances.setdefault(asset, [])
+            int index = bisect_right(timestamps, timestamp)
+            int i
+            int trimmed
+
+        previous_balance = cumulative_balances[index - 1] if index > 0 \
+            else self._trimmed_balances.get(asset, s_decimal_0)
+        timestamps.insert(index, timestamp)
+        cumulative_balances.insert(index, previous_balance + amount)
+        # Only fills arriving out of timestamp order have later fills to update.
+        for i in range(index + 1, len(cumulative_balances)):
+            cumulative_balances[i] += amount
+        if len(timestamps) > 2 * self._max_events:
+            # Fold the oldest fills into the base balance to keep memory bounded, in batches to amortize the copy.
+            trimmed = len(timestamps) - self._max_events
+            self._trimmed_balances[asset] = cumulative_balances[trimmed - 1]
+            del timestamps[:trimmed]
+            del cumulative_balances[:trimmed]
+
+    cdef c_record_fill(self, object order_filled_event):
+        cdef:
+            dict balances = {}
+
+        self.add_fill_to_balances(balances, order_filled_event)
+        for asset, amount in balances.items():
+            self._filled_balances[asset] = self._filled_balances.get(asset, s_decimal_0) + amount
+            self.c_record_asset_fill(asset, order_filled_event.timestamp, amount)
+
+    cdef c_call(self, object event_object):
+        event_type = type(event_object)
+        events = self._events_by_type.get(event_type)
+        if events is None:
+            events = self._events_by_type[event_type] = deque(maxlen=self._max_events)
+        events.append(event_object)
+        if event_type is OrderFilledEvent:
+            self.c_record_fill(event_object)
+        EventLogger.c_call(self, event_object)
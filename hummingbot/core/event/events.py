@@ -57,6 +57,7 @@ class ERC20WatcherEvent(Enum):
 
 class OrderBookEvent(Enum):
     TradeEvent = 901
+    DiffEvent = 902
 
 
 class ZeroExEvent(Enum):
@@ -309,6 +310,13 @@ class OrderBookTradeEvent(NamedTuple):
     amount: Decimal
 
 
+class OrderBookDiffEvent(NamedTuple):
+    update_id: int
+    # (price, amount) of the changed levels, with a 0 amount for removed levels
+    bids: List[Tuple[float, float]]
+    asks: List[Tuple[float, float]]
+
+
 class OrderFilledEvent(NamedTuple):
     timestamp: float
     order_id: str
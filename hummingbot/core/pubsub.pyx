@@ -1,20 +1,12 @@
 # distutils: language=c++
-# distutils: sources=hummingbot/core/cpp/PyRef.cpp
 
-from cpython cimport(
+from cpython cimport (
     PyObject,
-    PyWeakref_NewRef,
     PyWeakref_GetObject
 )
-from cython.operator cimport(
-    postincrement as inc,
-    dereference as deref,
-    address
-)
-from libcpp.vector cimport vector
 from enum import Enum
 import logging
-import random
+import weakref
 from typing import List
 
 from hummingbot.logger import HummingbotLogger
@@ -24,26 +16,25 @@ from hummingbot.core.event.event_listener cimport EventListener
 class_logger = None
 
 
-cdef class PubSub:
-    """
-    PubSub with weak references. This avoids the lapsed listener problem by periodically performing GC on dead
-    event listener.
-
-    Dead listener is done by calling c_remove_dead_listeners(), which checks whether the listener weak references are
-    alive or not, and removes the dead ones. Each call to c_remove_dead_listeners() takes O(n).
+def _listener_died(pubsub_weakref, int64_t event_tag):
+    # Weak reference callback that prunes a dead listener, without keeping the PubSub alive.
+    def callback(listener_weakref):
+        pubsub = pubsub_weakref()
+        if pubsub is not None:
+            (<PubSub>pubsub).c_discard_listener_weakref(event_tag, listener_weakref)
+    return callback
 
-    Here's how the dead listener GC is performed:
 
-    1. c_add_listener():
-       Randomly with ADD_LISTENER_GC_PROBABILITY. This assumes c_add_listener() is called frequently and so it doesn't
-       make sense to do the GC every time.
-    2. c_remove_listener():
-       Every time. This assumes c_remove_listener() is called infrequently.
-    3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+cdef class PubSub:
     """
+    PubSub with weak references. This avoids the lapsed listener problem, listeners that are garbage collected are
+    removed by their weak reference callbacks.
 
-    ADD_LISTENER_GC_PROBABILITY = 0.005
+    Listeners are held in a dispatch table per event tag, and c_trigger_event() iterates over an immutable snapshot
+    (a tuple) of the listeners' weak references. The snapshot is only rebuilt after listeners are added or removed,
+    and since it is immutable, listeners are free to call c_add_listener() or c_remove_listener() while an event is
+    being dispatched.
+    """
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -52,8 +43,11 @@ cdef class PubSub:
             class_logger = logging.getLogger(__name__)
         return class_logger
 
-    def __init__(self):
-        self._events = Events()
+    def __cinit__(self, *args, **kwargs):
+        # Initialized in __cinit__, so subclasses that don't call PubSub.__init__() still get a working dispatch table.
+        self._listeners = {}
+        self._snapshots = {}
+        self._self_weakref = weakref.ref(self)
 
     def add_listener(self, event_tag: Enum, listener: EventListener):
         self.c_add_listener(event_tag.value, listener)
@@ -72,94 +66,77 @@ cdef class PubSub:
 
     cdef c_add_listener(self, int64_t event_tag, EventListener listener):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection new_listeners
-            EventListenersCollection *listeners_ptr
-            object listener_weakref = PyWeakref_NewRef(listener, None)
-            PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
-        if it != self._events.end():
-            listeners_ptr = address(deref(it).second)
-            deref(listeners_ptr).insert(listener_wrapper)
-        else:
-            new_listeners.insert(listener_wrapper)
-            self._events.insert(EventsPair(event_tag, new_listeners))
-
-        if random.random() < PubSub.ADD_LISTENER_GC_PROBABILITY:
-            self.c_remove_dead_listeners(event_tag)
+            dict listeners = self._listeners.get(event_tag)
+            object listener_weakref = weakref.ref(listener, _listener_died(self._self_weakref, event_tag))
+        if listeners is None:
+            listeners = self._listeners[event_tag] = {}
+        # Weak references to the same live listener compare equal, so adding a listener twice is a no-op.
+        if listener_weakref not in listeners:
+            listeners[listener_weakref] = None
+            self._snapshots.pop(event_tag, None)
 
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weakref = PyWeakref_NewRef(listener, None)
-            PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
-            EventListenersIterator lit
-        if it == self._events.end():
+            dict listeners = self._listeners.get(event_tag)
+        if listeners is None:
             return
-        listeners_ptr = address(deref(it).second)
-        lit = deref(listeners_ptr).find(listener_wrapper)
-        if lit != deref(listeners_ptr).end():
-            deref(listeners_ptr).erase(lit)
-        self.c_remove_dead_listeners(event_tag)
+        if listeners.pop(weakref.ref(listener), 0) is None:
+            self._snapshots.pop(event_tag, None)
+        if len(listeners) == 0:
+            del self._listeners[event_tag]
 
-    cdef c_remove_dead_listeners(self, int64_t event_tag):
+    cdef c_discard_listener_weakref(self, int64_t event_tag, object listener_weakref):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weakref
-            EventListenersIterator lit
-            vector[EventListenersIterator] lit_to_remove
-        if it == self._events.end():
+            dict listeners = self._listeners.get(event_tag)
+        if listeners is None:
             return
-        listeners_ptr = address(deref(it).second)
-        lit = deref(listeners_ptr).begin()
-        while lit != deref(listeners_ptr).end():
-            listener_weakref = <object>(deref(lit).get())
-            if <object>(PyWeakref_GetObject(listener_weakref)) is None:
-                lit_to_remove.push_back(lit)
-            inc(lit)
-        for lit in lit_to_remove:
-            deref(listeners_ptr).erase(lit)
-        if deref(listeners_ptr).size() < 1:
-            self._events.erase(it)
-
-    cdef c_get_listeners(self, int64_t event_tag):
-        self.c_remove_dead_listeners(event_tag)
+        # A dead weak reference only compares equal to itself.
+        for registered_weakref in list(listeners):
+            if registered_weakref is listener_weakref:
+                del listeners[registered_weakref]
+                self._snapshots.pop(event_tag, None)
+        if len(listeners) == 0:
+            del self._listeners[event_tag]
 
+    cdef c_remove_dead_listeners(self, int64_t event_tag):
+        # Dead listeners are pruned by their weak reference callbacks, this only catches references whose callback
+        # has not run yet.
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weafref
-            EventListener typed_listener
+            dict listeners = self._listeners.get(event_tag)
+        if listeners is None:
+            return
+        for listener_weakref in [ref for ref in listeners if ref() is None]:
+            self.c_discard_listener_weakref(event_tag, listener_weakref)
 
-        if it == self._events.end():
-            return []
+    cdef tuple c_get_snapshot(self, int64_t event_tag):
+        cdef:
+            tuple snapshot = self._snapshots.get(event_tag)
+            dict listeners
+        if snapshot is None:
+            listeners = self._listeners.get(event_tag)
+            snapshot = tuple(listeners) if listeners is not None else ()
+            self._snapshots[event_tag] = snapshot
+        return snapshot
 
+    cdef c_get_listeners(self, int64_t event_tag):
         retval = []
-        listeners_ptr = address(deref(it).second)
-        for pyref in deref(listeners_ptr):
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
-            retval.append(typed_listener)
+        for listener_weakref in self.c_get_snapshot(event_tag):
+            listener = listener_weakref()
+            if listener is not None:
+                retval.append(listener)
         return retval
 
     cdef c_trigger_event(self, int64_t event_tag, object arg):
-        self.c_remove_dead_listeners(event_tag)
-
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection listeners
-            object listener_weafref
+            tuple snapshot = self.c_get_snapshot(event_tag)
+            PyObject *listener_ptr
             EventListener typed_listener
-        if it == self._events.end():
-            return
 
-        # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
-        # c_remove_listener(), which breaks the iterator if we're using the underlying set.
-        listeners = deref(it).second
-        for pyref in listeners:
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
+        for listener_weakref in snapshot:
+            listener_ptr = PyWeakref_GetObject(listener_weakref)
+            if <object>listener_ptr is None:
+                continue
+            typed_listener = <EventListener><object>listener_ptr
             try:
                 typed_listener.c_set_event_info(event_tag, self)
                 typed_listener.c_call(arg)
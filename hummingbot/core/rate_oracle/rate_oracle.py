@@ -18,7 +18,7 @@ from hummingbot.connector.exchange.kucoin.kucoin_utils import convert_from_excha
     kucoin_convert_from_exchange_pair
 from hummingbot.connector.exchange.ascend_ex.ascend_ex_utils import convert_from_exchange_trading_pair as \
     ascend_ex_convert_from_exchange_pair
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import RateGraph
 from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.utils import async_ttl_cache
 
@@ -37,7 +37,7 @@ class RateOracle(NetworkBase):
     """
     RateOracle provides conversion rates for any given pair token symbols in both async and sync fashions.
     It achieves this by query URL on a given source for prices and store them, either in cache or as an object member.
-    The find_rate is then used on these prices to find a rate on a given pair.
+    A RateGraph of these prices, built once per price update, is then used to find a rate on a given pair.
     """
     # Set these below class members before query for rates
     source: RateOracleSource = RateOracleSource.binance
@@ -48,6 +48,7 @@ class RateOracle(NetworkBase):
     _shared_instance: "RateOracle" = None
     _shared_client: Optional[aiohttp.ClientSession] = None
     _cgecko_supported_vs_tokens: List[str] = []
+    _rate_graph: Optional[RateGraph] = None
 
     binance_price_url = "https://api.binance.com/api/v3/ticker/bookTicker"
     binance_us_price_url = "https://api.binance.us/api/v3/ticker/bookTicker"
@@ -117,7 +118,7 @@ class RateOracle(NetworkBase):
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        return find_rate(self._prices, pair)
+        return self.find_rate(self._prices, pair)
 
     @classmethod
     async def rate_async(cls, pair: str) -> Decimal:
@@ -128,7 +129,7 @@ class RateOracle(NetworkBase):
         :return A conversion rate
         """
         prices = await cls.get_prices()
-        return find_rate(prices, pair)
+        return cls.find_rate(prices, pair)
 
     @classmethod
     async def global_rate(cls, token: str) -> Decimal:
@@ -139,7 +140,22 @@ class RateOracle(NetworkBase):
         """
         prices = await cls.get_prices()
         pair = token + "-" + cls.global_token
-        return find_rate(prices, pair)
+        return cls.find_rate(prices, pair)
+
+    @classmethod
+    def find_rate(cls, prices: Dict[str, Decimal], pair: str) -> Decimal:
+        """
+        Finds a conversion rate in the rate graph of the prices. Prices are replaced rather than updated, and the
+        graph is only rebuilt when new prices are looked up in, so rates from the previous prices aren't mixed in.
+        :param prices: A dictionary of trading pairs and prices
+        :param pair: A trading pair, e.g. BTC-USDT
+        :return A conversion rate
+        """
+        rate_graph = cls._rate_graph
+        if rate_graph is None or rate_graph.prices is not prices:
+            rate_graph = RateGraph(prices)
+            cls._rate_graph = rate_graph
+        return rate_graph.find_rate(pair)
 
     @classmethod
     async def global_value(cls, token: str, amount: Decimal) -> Decimal:
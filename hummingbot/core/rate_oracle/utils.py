@@ -1,7 +1,62 @@
-from typing import Dict
+from collections import deque
+from typing import (
+    Deque,
+    Dict,
+    Optional,
+    Tuple,
+)
 from decimal import Decimal
 
 
+class RateGraph:
+    '''
+    A graph of the currencies in a dictionary of prices, linked by the trading pairs they are traded in. Rates are
+    found along the paths with the fewest hops, by a breadth first search from the base currency that stops once the
+    quote currency is reached, and is picked up from there by later lookups from the same currency. The prices must
+    not be modified afterwards, a new graph is built for new prices.
+    '''
+
+    def __init__(self, prices: Dict[str, Decimal]):
+        self.prices: Dict[str, Decimal] = prices
+        # Currency -> currency -> (price, whether the rate is the inverse of the price)
+        self._links: Dict[str, Dict[str, Tuple[Decimal, bool]]] = {}
+        # Symbols with dashes in them can't be told apart from the pairs' separator.
+        pairs = [(pair.split("-"), price) for pair, price in prices.items() if pair.count("-") == 1]
+        # Pairs as quoted are linked first, so that paths follow them where they can.
+        for (base, quote), price in pairs:
+            self._links.setdefault(base, {})[quote] = (price, False)
+        for (base, quote), price in pairs:
+            if base not in self._links.setdefault(quote, {}):
+                self._links[quote][base] = (price, True)
+        # Currency -> (rates to the currencies reached so far, currencies left to search from)
+        self._searches: Dict[str, Tuple[Dict[str, Decimal], Deque[str]]] = {}
+
+    def find_rate(self, pair: str) -> Optional[Decimal]:
+        '''
+        Finds exchange rate for a given trading pair, through any number of pairs
+        :param pair: The trading pair
+        '''
+        price: Optional[Decimal] = self.prices.get(pair)
+        if price is not None:
+            return price
+        base, quote = pair.split("-")
+        if base == quote:
+            return Decimal("1")
+        search: Optional[Tuple[Dict[str, Decimal], Deque[str]]] = self._searches.get(base)
+        if search is None:
+            search = ({base: Decimal("1")}, deque([base]))
+            self._searches[base] = search
+        rates, to_visit = search
+        while quote not in rates and len(to_visit) > 0:
+            link_currency: str = to_visit.popleft()
+            link_rate: Decimal = rates[link_currency]
+            for next_currency, (price, inverse) in self._links.get(link_currency, {}).items():
+                if next_currency not in rates:
+                    rates[next_currency] = link_rate / price if inverse else link_rate * price
+                    to_visit.append(next_currency)
+        return rates.get(quote)
+
+
 def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
     '''
     Finds exchange rate for a given trading pair from a dictionary of prices
@@ -10,6 +65,7 @@ def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
     A rate for HBOT-AAVE will be 100 / 50
     A rate for AAVE-HBOT will be 50 / 100
     A rate for HBOT-GBP will be 100 * 0.75
+    Only rates through up to two pairs are found, RateGraph finds them through any number of pairs and caches them.
     :param prices: The dictionary of trading pairs and their prices
     :param pair: The trading pair
     '''
@@ -24,9 +24,21 @@ cdef class TimeIterator(PubSub):
     cdef c_tick(self, double timestamp):
         self._current_timestamp = timestamp
 
+    cdef double c_next_wakeup_time(self, double timestamp):
+        """
+        Earliest time at which the iterator needs to be ticked again, after it was ticked at `timestamp`. A fast
+        forwarding backtest clock skips the ticks before the earliest wake-up of all its iterators.
+
+        :return: `timestamp` to be ticked on every clock tick (the default), NaN if nothing is scheduled
+        """
+        return timestamp
+
     def tick(self, timestamp: float):
         self.c_tick(timestamp)
 
+    def next_wakeup_time(self, timestamp: float) -> float:
+        return self.c_next_wakeup_time(timestamp)
+
     @property
     def current_timestamp(self) -> float:
         return self._current_timestamp
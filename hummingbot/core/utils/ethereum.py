@@ -8,13 +8,14 @@ from hummingbot.core.utils import async_ttl_cache
 import itertools as it
 import logging
 from typing import List
-from web3 import Web3
 
 
 def is_connected_to_web3(ethereum_rpc_url: str) -> bool:
     """
     This is abstracted out of check_web3 to make mock testing easier
     """
+    # web3 is slow to import, and this module is imported at startup by the status command.
+    from web3 import Web3
     w3: Web3 = Web3(Web3.HTTPProvider(ethereum_rpc_url, request_kwargs={"timeout": 2.0}))
     return w3.isConnected()
 
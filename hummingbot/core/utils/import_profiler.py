@@ -0,0 +1,124 @@
+"""
+Measures how long the client's modules take to import, with python's -X importtime option, to find what slows down
+startup.
+"""
+
+import os
+import re
+import subprocess
+import sys
+from os.path import (
+    join,
+    realpath,
+)
+from typing import (
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+STARTUP_MODULES = ["hummingbot.client.hummingbot_application"]
+
+_IMPORT_TIME_PATTERN = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+class ImportTime(NamedTuple):
+    module: str
+    self_time: float
+    cumulative_time: float
+    depth: int
+    # The module whose import imported this one, None for the modules imported by the profiled code.
+    importer: Optional[str]
+
+    def package(self) -> str:
+        return self.module.split(".")[0]
+
+
+def parse_import_times(output: str) -> List[ImportTime]:
+    """
+    Parses the -X importtime report, in which modules are listed after the modules they import.
+    :param output: The stderr of a python process run with -X importtime
+    :return: The modules' import times, in seconds, in the order they were reported
+    """
+    rows: List[Tuple[str, float, float, int]] = []
+    for line in output.splitlines():
+        match = _IMPORT_TIME_PATTERN.match(line)
+        if match is not None:
+            rows.append((match.group(4), int(match.group(1)) / 1e6, int(match.group(2)) / 1e6,
+                         len(match.group(3)) // 2))
+    import_times: List[ImportTime] = []
+    # Modules being imported, nearest last, with their depths.
+    importers: List[Tuple[str, int]] = []
+    for module, self_time, cumulative_time, depth in reversed(rows):
+        while len(importers) > 0 and importers[-1][1] >= depth:
+            importers.pop()
+        importer: Optional[str] = importers[-1][0] if len(importers) > 0 else None
+        import_times.append(ImportTime(module, self_time, cumulative_time, depth, importer))
+        importers.append((module, depth))
+    import_times.reverse()
+    return import_times
+
+
+def profile_imports(modules: List[str] = STARTUP_MODULES) -> List[ImportTime]:
+    """
+    Imports the modules in a new python process, so that none of them are imported already.
+    :param modules: The modules to import
+    :return: The import times of the modules and everything they import
+    """
+    package_dir: str = realpath(join(__file__, "../../../../"))
+    env: Dict[str, str] = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([package_dir] + [p for p in [env.get("PYTHONPATH")] if p])
+    code: str = "\n".join(f"import {module}" for module in modules)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, universal_newlines=True)
+    if result.returncode != 0:
+        raise ImportError(f"Failed to import {', '.join(modules)}.\n{result.stderr[-2000:]}")
+    return parse_import_times(result.stderr)
+
+
+def package_import_times(import_times: List[ImportTime]) -> Dict[str, Tuple[float, Optional[str]]]:
+    """
+    Totals the import time of each top level package, e.g. pandas, and finds which module first imported it, which
+    tells where the package can be imported later, or not at all.
+    :return: Package -> (total self time of its modules, the module outside of the package that first imported it)
+    """
+    packages: Dict[str, Tuple[float, Optional[str]]] = {}
+    # Modules are listed in the order their imports finished, a module's import started with the first of the
+    # modules it imported, which are listed right before it.
+    first_imports: Dict[str, int] = {}
+    # (index of the module whose import started first, depth) of the modules whose importer is still to come
+    started: List[Tuple[int, int]] = []
+    for index, import_time in enumerate(import_times):
+        start: int = index
+        while len(started) > 0 and started[-1][1] > import_time.depth:
+            start = min(start, started.pop()[0])
+        started.append((start, import_time.depth))
+        package: str = import_time.package()
+        total, importer = packages.get(package, (0., None))
+        if (import_time.importer is None or import_time.importer.split(".")[0] != package) and \
+                start < first_imports.get(package, len(import_times)):
+            first_imports[package] = start
+            importer = import_time.importer
+        packages[package] = (total + import_time.self_time, importer)
+    return packages
+
+
+def format_import_profile(import_times: List[ImportTime], limit: int = 25) -> str:
+    """
+    The import time of the slowest packages, and of the slowest hummingbot modules including what they import.
+    """
+    total: float = sum(import_time.self_time for import_time in import_times)
+    lines: List[str] = [f"Imported {len(import_times)} modules in {total:.2f} s.", "",
+                        f"{'Package':<40}{'Time (ms)':>10}  First imported by"]
+    packages = sorted(package_import_times(import_times).items(), key=lambda item: item[1][0], reverse=True)
+    for package, (package_time, importer) in packages[:limit]:
+        lines.append(f"{package:<40}{package_time * 1e3:>10.0f}  {importer or ''}")
+    lines += ["", f"{'Hummingbot module':<60}{'Self (ms)':>10}{'Total (ms)':>12}"]
+    modules = sorted((import_time for import_time in import_times if import_time.package() == "hummingbot"),
+                     key=lambda import_time: import_time.cumulative_time, reverse=True)
+    for import_time in modules[:limit]:
+        lines.append(f"{import_time.module:<60}{import_time.self_time * 1e3:>10.0f}"
+                     f"{import_time.cumulative_time * 1e3:>12.0f}")
+    return "\n".join(lines)
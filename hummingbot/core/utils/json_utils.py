@@ -0,0 +1,95 @@
+import asyncio
+import json
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Union,
+)
+
+import aiohttp
+
+JSONPayload = Union[str, bytes]
+JSONDecoder = Callable[[JSONPayload], Any]
+
+# Payloads of at least this many characters or bytes, e.g. full order book snapshots and ticker dumps, are decoded in
+# a worker thread by json_loads_async.
+LARGE_PAYLOAD_SIZE = 512 * 1024
+
+_decoders: Dict[str, JSONDecoder] = {"json": json.loads}
+try:
+    import ujson
+    _decoders["ujson"] = ujson.loads
+except ImportError:
+    pass
+try:
+    import orjson
+    _decoders["orjson"] = orjson.loads
+except ImportError:
+    pass
+
+# orjson if it's installed. ujson isn't picked by default, as older versions of it round some floats incorrectly.
+_decoder_name: str = "orjson" if "orjson" in _decoders else "json"
+_decoder: JSONDecoder = _decoders[_decoder_name]
+
+
+def available_decoders() -> List[str]:
+    return list(_decoders)
+
+
+def decoder_name() -> str:
+    return _decoder_name
+
+
+def register_decoder(name: str, decoder: JSONDecoder):
+    """
+    Adds a decoder that can be used by use_decoder, e.g. a simdjson based one.
+    :param name: The decoder name
+    :param decoder: A function that decodes a JSON document from a str or bytes, and raises ValueError on invalid
+    documents
+    """
+    _decoders[name] = decoder
+
+
+def use_decoder(name: str):
+    """
+    Sets the decoder json_loads uses.
+    :param name: The decoder name, one of available_decoders()
+    """
+    global _decoder, _decoder_name
+    if name not in _decoders:
+        raise ValueError(f"Unknown JSON decoder {name}. Available decoders are {', '.join(_decoders)}.")
+    _decoder = _decoders[name]
+    _decoder_name = name
+
+
+def json_loads(data: JSONPayload) -> Any:
+    """
+    Decodes a JSON message with the decoder in use, which is orjson if it's installed unless set by use_decoder.
+    Documents the decoder rejects, e.g. ones with NaN or integers beyond 64 bits, are decoded by the json module, so
+    the results are the same whatever the decoder, and invalid documents raise the json module's ValueError.
+    """
+    try:
+        return _decoder(data)
+    except ValueError:
+        if _decoder is json.loads:
+            raise
+        return json.loads(data)
+
+
+async def json_loads_async(data: JSONPayload) -> Any:
+    """
+    Decodes a JSON message like json_loads, in a worker thread if it is a large payload.
+    """
+    if len(data) >= LARGE_PAYLOAD_SIZE:
+        return await asyncio.get_event_loop().run_in_executor(None, json_loads, data)
+    return json_loads(data)
+
+
+async def response_json(response: aiohttp.ClientResponse) -> Any:
+    """
+    Decodes the JSON body of a response, a replacement of response.json() that uses the decoder in use, and doesn't
+    check the content type of the response.
+    """
+    return await json_loads_async(await response.read())
@@ -2,11 +2,11 @@ from typing import Optional, Dict
 from decimal import Decimal
 import importlib
 from hummingbot.client.settings import CONNECTOR_SETTINGS, ConnectorType
-from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
 
 
 async def get_binance_mid_price(trading_pair: str) -> Dict[str, Decimal]:
     # Binance is the place to go to for pricing atm
+    from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
     prices = await BinanceAPIOrderBookDataSource.get_all_mid_prices()
     return prices.get(trading_pair, None)
 
@@ -1,3 +1,4 @@
+import asyncio
 import importlib
 from typing import (
     Dict,
@@ -37,6 +38,9 @@ class TradingPairFetcher:
 
     async def fetch_all(self):
         for conn_setting in CONNECTOR_SETTINGS.values():
+            # Importing a connector takes a while, the event loop is let run in between so that the client's UI isn't
+            # held up at startup by importing all of them.
+            await asyncio.sleep(0)
             module_name = f"{conn_setting.base_name()}_connector" if conn_setting.type is ConnectorType.Connector \
                 else f"{conn_setting.base_name()}_api_order_book_data_source"
             module_path = f"hummingbot.connector.{conn_setting.type.name.lower()}." \
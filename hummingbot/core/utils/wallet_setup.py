@@ -4,7 +4,6 @@
 Functions for storing encrypted wallets and decrypting stored wallets.
 """
 
-from eth_account import Account
 from hummingbot.client.settings import (
     KEYFILE_PREFIX,
     KEYFILE_POSTFIX,
@@ -17,7 +16,10 @@ from os.path import (
     join,
     isfile
 )
-from typing import Dict, List
+from typing import Dict, List, TYPE_CHECKING
+# eth_account is slow to import, and isn't needed until a password is entered, so it's imported on use.
+if TYPE_CHECKING:
+    from eth_account import Account
 
 
 def get_key_file_path() -> str:
@@ -30,18 +32,20 @@ def get_key_file_path() -> str:
     return path if path is not None else DEFAULT_KEY_FILE_PATH
 
 
-def import_and_save_wallet(password: str, private_key: str) -> Account:
+def import_and_save_wallet(password: str, private_key: str) -> "Account":
     """
     Create an account for a private key, then encryt the private key and store it in the path from get_key_file_path()
     """
+    from eth_account import Account
     acct: Account = Account.privateKeyToAccount(private_key)
     return save_wallet(acct, password)
 
 
-def save_wallet(acct: Account, password: str) -> Account:
+def save_wallet(acct: "Account", password: str) -> "Account":
     """
     For a given account and password, encrypt the account address and store it in the path from get_key_file_path()
     """
+    from eth_account import Account
     encrypted: Dict = Account.encrypt(acct.privateKey, password)
     file_path: str = "%s%s%s%s" % (get_key_file_path(), KEYFILE_PREFIX, acct.address, KEYFILE_POSTFIX)
     with open(file_path, 'w+') as f:
@@ -57,6 +61,7 @@ def unlock_wallet(public_key: str, password: str) -> str:
     file_path: str = "%s%s%s%s" % (get_key_file_path(), KEYFILE_PREFIX, public_key, KEYFILE_POSTFIX)
     with open(file_path, 'r') as f:
         encrypted = f.read()
+    from eth_account import Account
     private_key: str = Account.decrypt(encrypted, password)
     return private_key
 
@@ -1,11 +1,18 @@
 import numpy as np
 import logging
+from libc.math cimport sqrt
 cimport numpy as np
 
 
 pmm_logger = None
 
 cdef class RingBuffer:
+    """
+    Fixed length buffer of the latest values. The mean and variance of the values in the buffer are kept up to date
+    as values are added (Welford's algorithm, with the oldest value removed once the buffer is full), so reading them
+    is O(1) regardless of the buffer length. To keep rounding errors from accumulating, the statistics are recalculated
+    from the buffer every time it wraps around.
+    """
     @classmethod
     def logger(cls):
         global pmm_logger
@@ -19,13 +26,48 @@ cdef class RingBuffer:
         self._start_index = 0
         self._stop_index = 0
         self._is_full = False
+        self._mean = 0
+        self._m2 = 0
 
     def __dealloc__(self):
         self._buffer = None
 
-    cdef void c_add_value(self, float val):
+    cdef void c_add_value(self, double val):
+        cdef:
+            double old_value
+            double old_mean
+            double delta
+
+        if self._is_full:
+            # The buffer is full, so the value at the stop index is the oldest one, about to be overwritten.
+            old_value = self._buffer[self._stop_index]
+            old_mean = self._mean
+            self._mean += (val - old_value) / self._length
+            self._m2 += (val - old_value) * (val - self._mean + old_value - old_mean)
+        else:
+            delta = val - self._mean
+            self._mean += delta / (self._stop_index + 1)
+            self._m2 += delta * (val - self._mean)
+
         self._buffer[self._stop_index] = val
         self.c_increment_index()
+        # A NaN stays in the running statistics after it has left the buffer, so recalculate until it is gone.
+        if self._is_full and (self._stop_index == 0 or self._mean != self._mean):
+            self.c_recalculate_stats()
+
+    cdef void c_recalculate_stats(self):
+        cdef:
+            int64_t i
+            int64_t size = self.c_size()
+            double total = 0
+            double m2 = 0
+
+        for i in range(size):
+            total += self._buffer[(self._start_index + i) % self._length]
+        self._mean = total / size if size > 0 else 0
+        for i in range(size):
+            m2 += (self._buffer[(self._start_index + i) % self._length] - self._mean) ** 2
+        self._m2 = m2
 
     cdef void c_increment_index(self):
         self._stop_index = (self._stop_index + 1) % self._length
@@ -41,36 +83,59 @@ cdef class RingBuffer:
             return np.nan
         return self._buffer[self._stop_index-1]
 
+    cdef double c_get_first_value(self):
+        if self.c_is_empty():
+            return np.nan
+        # Once the buffer is full, the oldest value is the one at the stop index, which is overwritten next.
+        if self._is_full:
+            return self._buffer[self._stop_index]
+        return self._buffer[self._start_index]
+
+    cdef int64_t c_size(self):
+        if self._is_full:
+            return self._length
+        return self._stop_index - self._start_index
+
     cdef bint c_is_full(self):
         return self._is_full
 
     cdef double c_mean_value(self):
         result = np.nan
         if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
+            result = self._mean
         return result
 
     cdef double c_variance(self):
         result = np.nan
         if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
+            result = self.c_running_variance()
         return result
 
     cdef double c_std_dev(self):
         result = np.nan
         if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
+            result = sqrt(self.c_running_variance())
         return result
 
+    cdef double c_running_mean(self):
+        # Mean of the values in the buffer, also when it is not full yet.
+        if self.c_is_empty():
+            return np.nan
+        return self._mean
+
+    cdef double c_running_variance(self):
+        # Population variance of the values in the buffer, also when it is not full yet.
+        if self.c_is_empty():
+            return np.nan
+        return max(self._m2 / self.c_size(), 0.0)
+
     cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
+        cdef np.ndarray[np.double_t, ndim=1] buffer = np.asarray(self._buffer)
 
         if not self._is_full:
-            indexes = np.arange(self._start_index, stop=self._stop_index, dtype=np.int16)
-        else:
-            indexes = np.arange(self._start_index, stop=self._start_index + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+            return buffer[self._start_index:self._stop_index].copy()
+        # Oldest to newest value.
+        return np.concatenate((buffer[self._stop_index:], buffer[:self._stop_index]))
 
     def __init__(self, length):
         self._length = length
@@ -78,6 +143,8 @@ cdef class RingBuffer:
         self._start_index = 0
         self._stop_index = 0
         self._is_full = False
+        self._mean = 0
+        self._m2 = 0
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -88,6 +155,13 @@ cdef class RingBuffer:
     def get_last_value(self):
         return self.c_get_last_value()
 
+    def get_first_value(self):
+        return self.c_get_first_value()
+
+    @property
+    def size(self) -> int:
+        return self.c_size()
+
     @property
     def is_full(self):
         return self.c_is_full()
@@ -103,3 +177,11 @@ cdef class RingBuffer:
     @property
     def variance(self):
         return self.c_variance()
+
+    @property
+    def running_mean(self):
+        return self.c_running_mean()
+
+    @property
+    def running_variance(self):
+        return self.c_running_variance()
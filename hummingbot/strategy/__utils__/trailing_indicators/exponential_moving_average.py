@@ -1,5 +1,4 @@
-from base_trailing_indicator import BaseTrailingIndicator
-import pandas as pd
+from .base_trailing_indicator import BaseTrailingIndicator
 
 
 class ExponentialMovingAverageIndicator(BaseTrailingIndicator):
@@ -7,11 +6,24 @@ class ExponentialMovingAverageIndicator(BaseTrailingIndicator):
         if processing_length != 1:
             raise Exception("Exponential moving average processing_length should be 1")
         super().__init__(sampling_length, processing_length)
+        # Adjusted EWM (as pandas' ewm(span=sampling_length, adjust=True)) over the samples in the sampling buffer,
+        # kept as a weighted sum and sum of weights that are updated as samples enter and leave the buffer.
+        self._decay = 1 - 2 / (sampling_length + 1)
+        self._oldest_weight = self._decay ** sampling_length
+        self._weighted_sum = 0.0
+        self._weights_sum = 0.0
+
+    def add_sample(self, value: float):
+        value = float(value)
+        self._weighted_sum = value + self._decay * self._weighted_sum
+        self._weights_sum = 1 + self._decay * self._weights_sum
+        if self._sampling_buffer.is_full:
+            self._weighted_sum -= self._oldest_weight * self._sampling_buffer.get_first_value()
+            self._weights_sum -= self._oldest_weight
+        super().add_sample(value)
 
     def _indicator_calculation(self) -> float:
-        ema = pd.Series(self._sampling_buffer.get_as_numpy_array())\
-            .ewm(span=self._sampling_length, adjust=True).mean()
-        return ema[-1]
+        return self._weighted_sum / self._weights_sum
 
     def _processing_calculation(self) -> float:
         return self._processing_buffer.get_last_value()
@@ -1,18 +1,26 @@
 from .base_trailing_indicator import BaseTrailingIndicator
+from ..ring_buffer import RingBuffer
 import numpy as np
 
 
 class HistoricalVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        # The log returns between the samples in the sampling buffer, one less than the number of samples.
+        self._returns_buffer = RingBuffer(max(sampling_length - 1, 1))
+
+    def add_sample(self, value: float):
+        value = float(value)
+        last_value = self._sampling_buffer.get_last_value()
+        if not np.isnan(last_value):
+            self._returns_buffer.add_value(np.log(value / last_value))
+        super().add_sample(value)
 
     def _indicator_calculation(self) -> float:
-        prices = self._sampling_buffer.get_as_numpy_array()
-        if prices.size > 0:
-            log_returns = np.diff(np.log(prices))
-            return np.var(log_returns)
+        # NaN variances (no returns yet) are counted as 0 by the processing calculation.
+        variance = self._returns_buffer.running_variance
+        return 0.0 if np.isnan(variance) else variance
 
     def _processing_calculation(self) -> float:
-        processing_array = self._processing_buffer.get_as_numpy_array()
-        if processing_array.size > 0:
-            return np.sqrt(np.mean(np.nan_to_num(processing_array)))
+        if self._processing_buffer.size > 0:
+            return np.sqrt(self._processing_buffer.running_mean)
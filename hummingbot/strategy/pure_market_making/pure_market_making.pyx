@@ -686,6 +686,17 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         finally:
             self._last_timestamp = timestamp
 
+    cdef double c_next_wakeup_time(self, double timestamp):
+        # Outside of its refresh timers the strategy only reacts to market data and order events, which wake up the
+        # markets. Order ages are measured in wall clock time, so they don't schedule wake-ups.
+        if not self._all_markets_ready:
+            return timestamp
+        # The cancel timer isn't moved on until orders are created again, e.g. while waiting out the filled order
+        # delay, and there is nothing for it to do once the orders are gone.
+        if self._cancel_timestamp <= timestamp and len(self.active_non_hanging_orders) == 0:
+            return self._create_timestamp
+        return min(self._create_timestamp, self._cancel_timestamp)
+
     cdef object c_create_base_proposal(self):
         cdef:
             ExchangeBase market = self._market_info.market
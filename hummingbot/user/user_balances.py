@@ -4,14 +4,10 @@ from hummingbot.client.config.security import Security
 from hummingbot.client.config.config_helpers import get_connector_class, get_eth_wallet_private_key
 from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.client.config.global_config_map import global_config_map
-from hummingbot.connector.connector.balancer.balancer_connector import BalancerConnector
-from hummingbot.connector.derivative.perpetual_finance.perpetual_finance_derivative import PerpetualFinanceDerivative
 from hummingbot.client.settings import ethereum_required_trading_pairs
 from typing import Optional, Dict, List
 from decimal import Decimal
 
-from web3 import Web3
-
 
 class UserBalances:
     __instance = None
@@ -107,6 +103,8 @@ class UserBalances:
     def ethereum_balance() -> Decimal:
         ethereum_wallet = global_config_map.get("ethereum_wallet").value
         ethereum_rpc_url = global_config_map.get("ethereum_rpc_url").value
+        # web3 and the gateway connectors below are imported on use, as they're slow to import.
+        from web3 import Web3
         web3 = Web3(Web3.HTTPProvider(ethereum_rpc_url))
         balance = web3.eth.getBalance(ethereum_wallet)
         balance = web3.fromWei(balance, "ether")
@@ -115,6 +113,7 @@ class UserBalances:
     @staticmethod
     async def eth_n_erc20_balances() -> Dict[str, Decimal]:
         ethereum_rpc_url = global_config_map.get("ethereum_rpc_url").value
+        from hummingbot.connector.connector.balancer.balancer_connector import BalancerConnector
         # Todo: Use generic ERC20 balance update
         connector = BalancerConnector(ethereum_required_trading_pairs(),
                                       get_eth_wallet_private_key(),
@@ -125,6 +124,8 @@ class UserBalances:
 
     @staticmethod
     async def xdai_balances() -> Dict[str, Decimal]:
+        from hummingbot.connector.derivative.perpetual_finance.perpetual_finance_derivative import \
+            PerpetualFinanceDerivative
         connector = PerpetualFinanceDerivative("",
                                                get_eth_wallet_private_key(),
                                                "",
@@ -36,6 +36,7 @@ def main():
     version = "20210715"
     packages = [
         "hummingbot",
+        "hummingbot.backtest",
         "hummingbot.client",
         "hummingbot.client.command",
         "hummingbot.client.config",
@@ -101,6 +102,7 @@ def main():
             "wallet/ethereum/token_abi/*.json",
             "wallet/ethereum/erc20_tokens.json",
             "wallet/ethereum/erc20_tokens_kovan.json",
+            "client/connector_settings.json",
             "VERSION",
             "templates/*TEMPLATE.yml"
         ],
@@ -191,7 +193,8 @@ def main():
           ],
           scripts=[
               "bin/hummingbot.py",
-              "bin/hummingbot_quickstart.py"
+              "bin/hummingbot_quickstart.py",
+              "bin/hummingbot_backtest.py"
           ],
           cmdclass={'build_ext': BuildExt},
           )
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+"""
+Sends 1000 concurrent requests through the WeightedAPIThrottler and the AsyncThrottler. A tenth of them go to an
+endpoint whose rate limit makes them wait, the others to endpoints with plenty of capacity left.
+
+Prints how long the requests waited on each kind of endpoint, the most requests the limited endpoint let through
+in any of its time intervals, and the CPU time spent.
+
+Usage: python test/debug/benchmark_api_throttler.py [num_requests]
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import asyncio
+import bisect
+import time
+from typing import (
+    Dict,
+    List,
+)
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.weighted_api_throttler import WeightedAPIThrottler
+
+NUM_ENDPOINTS = 10
+LIMITED_PATH_URL = "/endpoint_0"
+LIMIT = 20
+TIME_INTERVAL = 0.5
+RATE_LIMITS = [RateLimit(LIMIT, TIME_INTERVAL, LIMITED_PATH_URL)] + \
+    [RateLimit(100000, TIME_INTERVAL, f"/endpoint_{i}") for i in range(1, NUM_ENDPOINTS)]
+
+
+async def request(throttler, path_url: str, latencies: Dict[str, List[float]], start_times: List[float]):
+    start = time.perf_counter()
+    async with throttler.execute_task(path_url):
+        now = time.perf_counter()
+        latencies[path_url].append(now - start)
+        if path_url == LIMITED_PATH_URL:
+            start_times.append(now)
+
+
+def max_requests_per_interval(start_times: List[float]) -> int:
+    start_times.sort()
+    return max(bisect.bisect_left(start_times, t + TIME_INTERVAL) - i for i, t in enumerate(start_times))
+
+
+def percentiles(latencies: List[float]) -> str:
+    latencies.sort()
+    return f"median {latencies[len(latencies) // 2]:6.3f}s max {latencies[-1]:6.3f}s"
+
+
+async def run(throttler, num_requests: int):
+    latencies: Dict[str, List[float]] = {limit.path_url: [] for limit in RATE_LIMITS}
+    start_times: List[float] = []
+    await asyncio.gather(*[request(throttler, RATE_LIMITS[i % NUM_ENDPOINTS].path_url, latencies, start_times)
+                           for i in range(num_requests)])
+    return latencies, start_times
+
+
+def main():
+    num_requests = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    limited_requests = num_requests // NUM_ENDPOINTS
+    print(f"{num_requests} requests, {limited_requests} of them limited to {LIMIT} per {TIME_INTERVAL}s, which lets "
+          f"them through in {(limited_requests - 1) // LIMIT * TIME_INTERVAL:.2f}s")
+    ev_loop = asyncio.get_event_loop()
+    for name, throttler in (("WeightedAPIThrottler", WeightedAPIThrottler(RATE_LIMITS, period_safety_margin=0)),
+                            ("AsyncThrottler", AsyncThrottler(RATE_LIMITS, period_safety_margin=0))):
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        latencies, start_times = ev_loop.run_until_complete(run(throttler, num_requests))
+        wall_time, cpu_time = time.perf_counter() - wall_start, time.process_time() - cpu_start
+        other_latencies = [latency for path_url, path_latencies in latencies.items() if path_url != LIMITED_PATH_URL
+                           for latency in path_latencies]
+        print(f"{name}: {wall_time:.2f}s, cpu {cpu_time:.3f}s")
+        print(f"    limited endpoint waits {percentiles(latencies[LIMITED_PATH_URL])}, "
+              f"at most {max_requests_per_interval(start_times)} requests per interval")
+        print(f"    other endpoints wait   {percentiles(other_latencies)}")
+
+
+if __name__ == "__main__":
+    main()
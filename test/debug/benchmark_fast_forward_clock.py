@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""
+Backtests a month at 1 second resolution with a market data iterator that has a recorded message every few minutes,
+and a strategy that refreshes its orders every 15 minutes, once ticking every step and once fast forwarding between
+the iterators' wake-ups. Both runs must see the same ticks with market data or order refreshes.
+
+Usage: python test/debug/benchmark_fast_forward_clock.py [mean seconds between messages]
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import time
+from typing import List
+
+import numpy as np
+
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.py_time_iterator import PyTimeIterator
+
+NaN = float("nan")
+START = 1609459200.0
+END = START + 30 * 24 * 3600
+
+
+class RecordedMarket(PyTimeIterator):
+    def __init__(self, message_timestamps: List[float]):
+        super().__init__()
+        self._message_timestamps = message_timestamps
+        self._next_message = 0
+        self.messages_applied = 0
+
+    def tick(self, timestamp: float):
+        while (self._next_message < len(self._message_timestamps) and
+               self._message_timestamps[self._next_message] <= timestamp):
+            self._next_message += 1
+            self.messages_applied += 1
+
+    def next_wakeup_time(self, timestamp: float) -> float:
+        if self._next_message < len(self._message_timestamps):
+            return self._message_timestamps[self._next_message]
+        return NaN
+
+
+class RefreshingStrategy(PyTimeIterator):
+    def __init__(self, market: RecordedMarket, order_refresh_time: float):
+        super().__init__()
+        self._market = market
+        self._order_refresh_time = order_refresh_time
+        self._refresh_timestamp = 0
+        self._last_messages_applied = -1
+        self.actions = []
+
+    def tick(self, timestamp: float):
+        if self._market.messages_applied != self._last_messages_applied or self._refresh_timestamp <= timestamp:
+            self._last_messages_applied = self._market.messages_applied
+            self._refresh_timestamp = timestamp + self._order_refresh_time
+            self.actions.append(timestamp)
+
+    def next_wakeup_time(self, timestamp: float) -> float:
+        return self._refresh_timestamp
+
+
+def run(label: str, message_timestamps: List[float], fast_forward: bool) -> List[float]:
+    clock = Clock(ClockMode.BACKTEST, 1.0, START, END, fast_forward=fast_forward)
+    market = RecordedMarket(message_timestamps)
+    strategy = RefreshingStrategy(market, 900)
+    clock.add_iterator(market)
+    clock.add_iterator(strategy)
+
+    start = time.perf_counter()
+    clock.backtest()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<14} {elapsed:8.2f} s  ticks: {clock.ticks:8d}  strategy actions: {len(strategy.actions)}")
+    return strategy.actions
+
+
+def main():
+    mean_interval = float(sys.argv[1]) if len(sys.argv) > 1 else 300
+    rng = np.random.default_rng(7)
+    intervals = rng.exponential(mean_interval, size=int((END - START) / mean_interval * 2))
+    message_timestamps = [float(ts) for ts in START + np.cumsum(intervals) if ts < END]
+    print(f"Backtesting 30 days, {len(message_timestamps)} recorded messages")
+    every_tick = run("every tick", message_timestamps, False)
+    fast_forward = run("fast forward", message_timestamps, True)
+    assert every_tick == fast_forward, "Fast forward changed the strategy's actions"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+"""
+Compares the JSON decoders available to json_utils on the recorded REST and websocket payloads of the connector
+test fixtures, and on a large order book snapshot, for which it also measures how long the event loop is stalled
+when the snapshot is decoded inline and by json_loads_async.
+
+Usage: python test/debug/benchmark_json_decoding.py [rounds]
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import asyncio
+import glob
+import importlib
+import json
+import os
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+
+from hummingbot.core.utils import json_utils
+from hummingbot.core.utils.json_utils import (
+    available_decoders,
+    json_loads,
+    json_loads_async,
+    use_decoder,
+)
+
+FIXTURES_DIR = realpath(join(__file__, "../../connector/exchange"))
+
+
+def fixture_payloads() -> Dict[str, List[str]]:
+    """
+    The dictionaries and lists in the connector fixture modules, encoded as they would be sent by the exchange.
+    """
+    payloads: Dict[str, List[str]] = {}
+    for path in sorted(glob.glob(join(FIXTURES_DIR, "*", "fixture*.py"))):
+        connector: str = os.path.basename(os.path.dirname(path))
+        module = importlib.import_module(f"test.connector.exchange.{connector}.{os.path.basename(path)[:-3]}")
+        namespaces = [vars(module)] + [vars(value) for value in vars(module).values()
+                                       if isinstance(value, type) and value.__module__ == module.__name__]
+        for namespace in namespaces:
+            for name, value in namespace.items():
+                if name.startswith("_") or not isinstance(value, (dict, list)):
+                    continue
+                try:
+                    payloads.setdefault(connector, []).append(json.dumps(value))
+                except TypeError:
+                    continue
+    return payloads
+
+
+def snapshot_payload(levels: int) -> str:
+    return json.dumps({"lastUpdateId": 299745427,
+                       "bids": [[f"{100 - level * 0.0001:.8f}", f"{level % 97 + 0.5:.8f}"] for level in range(levels)],
+                       "asks": [[f"{100 + level * 0.0001:.8f}", f"{level % 89 + 0.5:.8f}"] for level in range(levels)]})
+
+
+def time_decoding(payloads: List[Any], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for payload in payloads:
+            json_loads(payload)
+    return (time.perf_counter() - start) / (rounds * len(payloads))
+
+
+async def max_loop_stall(decode, payload: str, count: int = 5) -> float:
+    stalls: List[float] = []
+
+    async def ticker():
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            stalls.append(time.perf_counter() - start - 0.001)
+
+    task = asyncio.ensure_future(ticker())
+    await asyncio.sleep(0.01)
+    stalls.clear()
+    for _ in range(count):
+        await decode(payload)
+    task.cancel()
+    return max(stalls, default=0.)
+
+
+async def decode_inline(payload: str):
+    json_loads(payload)
+    await asyncio.sleep(0)
+
+
+def main():
+    rounds: int = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    decoders: List[str] = available_decoders()
+    payloads: Dict[str, List[str]] = fixture_payloads()
+    snapshot: str = snapshot_payload(50000)
+
+    print(f"{'payloads':<24}" + "".join(f"{name:>12}" for name in decoders) + "   (us per payload)")
+    rows = [(f"{connector} x{len(connector_payloads)}", connector_payloads, rounds)
+            for connector, connector_payloads in payloads.items()]
+    rows.append((f"snapshot {len(snapshot) // 1024} KiB", [snapshot], max(rounds // 100, 1)))
+    for label, row_payloads, row_rounds in rows:
+        timings: List[float] = []
+        for name in decoders:
+            use_decoder(name)
+            timings.append(time_decoding(row_payloads, row_rounds))
+        print(f"{label:<24}" + "".join(f"{timing * 1e6:>12.1f}" for timing in timings))
+
+    ev_loop = asyncio.get_event_loop()
+    print(f"\nMax event loop stall decoding the snapshot (LARGE_PAYLOAD_SIZE is "
+          f"{json_utils.LARGE_PAYLOAD_SIZE // 1024} KiB):")
+    for name in decoders:
+        use_decoder(name)
+        inline: float = ev_loop.run_until_complete(max_loop_stall(decode_inline, snapshot))
+        threaded: float = ev_loop.run_until_complete(max_loop_stall(json_loads_async, snapshot))
+        print(f"  {name:<8} inline: {inline * 1e3:.1f} ms, json_loads_async: {threaded * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+"""
+Replays a Leverj difforderbook stream through the previous Decimal based ingest path (Decimal levels, then
+ClientOrderBookRow, then OrderBook.apply_diffs) and through the float64 path (diff_message_from_exchange, then
+OrderBook.apply_diff_message), and compares their throughput and resulting books.
+
+Usage: python test/debug/benchmark_leverj_order_book_ingest.py [difforderbook_stream.jsonl]
+
+Each line of the stream is a captured difforderbook payload, with "buy" and "sell" maps of price levels. Without a
+file, a synthetic stream is generated.
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import json
+import random
+import time
+from decimal import Decimal
+from typing import Any, Dict, List
+
+from hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_order_book import LeverjPerpetualOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import ClientOrderBookRow
+
+
+def synthetic_stream(num_diffs: int = 50000) -> List[Dict[str, Any]]:
+    rng = random.Random(7)
+    mid = 50000
+    stream = []
+    for _ in range(num_diffs):
+        # The mid price is kept fixed so the two sides never cross, crossed books are resolved by update id and the
+        # previous path only had second resolution ids.
+        diff = {"instrument": "1", "buy": {}, "sell": {}}
+        for side, sign in (("buy", -1), ("sell", 1)):
+            for _ in range(rng.randint(1, 6)):
+                price = f"{mid + sign * rng.randint(1, 200) / 2:.1f}"
+                amount = "0" if rng.random() < 0.3 else f"{rng.randint(1, 50000) / 1000:.3f}"
+                diff[side][price] = {"price": price, "totalQuantity": amount}
+        stream.append(diff)
+    return stream
+
+
+def decimal_ingest(order_book: OrderBook, msg: Dict[str, Any]):
+    # The ingest path as it was before the float64 messages.
+    bids = [{"price": Decimal(bid['price']), "amount": Decimal(bid['totalQuantity'])} for bid in msg["buy"].values()]
+    asks = [{"price": Decimal(ask['price']), "amount": Decimal(ask['totalQuantity'])} for ask in msg["sell"].values()]
+    update_id = int(time.time())
+    bids = [ClientOrderBookRow(Decimal(float(bid["price"])), Decimal(float(bid["amount"])), update_id) for bid in bids]
+    asks = [ClientOrderBookRow(Decimal(float(ask["price"])), Decimal(float(ask["amount"])), update_id) for ask in asks]
+    order_book.apply_diffs(bids, asks, update_id)
+
+
+def numpy_ingest(order_book: OrderBook, msg: Dict[str, Any]):
+    order_book.apply_diff_message(LeverjPerpetualOrderBook.diff_message_from_exchange(msg, time.time(), msg))
+
+
+def run(label: str, ingest, stream: List[Dict[str, Any]]) -> OrderBook:
+    order_book = OrderBook()
+    start = time.perf_counter()
+    for msg in stream:
+        msg["trading_pair"] = "BTC-DAI"
+        ingest(order_book, msg)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<8} {len(stream) / elapsed:10.0f} diffs/s  {elapsed * 1e6 / len(stream):7.2f} us/diff")
+    return order_book
+
+
+def main():
+    if len(sys.argv) > 1:
+        with open(sys.argv[1]) as fd:
+            stream = [json.loads(line) for line in fd]
+    else:
+        stream = synthetic_stream()
+    print(f"Replaying {len(stream)} difforderbook messages")
+    decimal_book = run("Decimal", decimal_ingest, stream)
+    numpy_book = run("float64", numpy_ingest, stream)
+    same = ([(row.price, row.amount) for row in decimal_book.bid_entries()] ==
+            [(row.price, row.amount) for row in numpy_book.bid_entries()] and
+            [(row.price, row.amount) for row in decimal_book.ask_entries()] ==
+            [(row.price, row.amount) for row in numpy_book.ask_entries()])
+    print(f"Resulting books identical: {same}")
+    if not same:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+"""
+Compares the Web3 based Leverj order signing (sign_order) with LeverjPerpetualOrderSigner, and checks that both
+produce byte-for-byte identical signatures.
+
+Usage: python test/debug/benchmark_leverj_order_signer.py [num_orders]
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import random
+import time
+from decimal import Decimal
+
+from hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_order_signer import (
+    LeverjPerpetualOrderSigner,
+    sign_order,
+)
+
+SECRET_KEY = "0x" + "4c" * 32
+DECIMALS = 6
+
+
+def random_orders(num_orders: int):
+    rng = random.Random(7)
+    orders = []
+    for i in range(num_orders):
+        price = Decimal(rng.randint(3000000, 6000000)) / Decimal(100)
+        quantity = Decimal(rng.randint(1, 100000)) / Decimal(1000)
+        orders.append(({
+            "accountId": "0x12C95E6F4fCe1C8a4C2a2C7F7bb5cA5b3C1E7B61",
+            "instrument": "1",
+            "price": float(price),
+            "quantity": float(quantity),
+            "marginPerFraction": str(rng.randint(10 ** 9, 10 ** 12)),
+            "side": rng.choice(["buy", "sell"]),
+            "orderType": "LMT",
+            "timestamp": str(1618432000000000 + i),
+            "quote": "0xdAC17F958D2ee523a2206206994597C13D831ec7",
+        }, 1, DECIMALS, price, quantity))
+    return orders
+
+
+def main():
+    num_orders = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    orders = random_orders(num_orders)
+    signer = LeverjPerpetualOrderSigner(SECRET_KEY)
+
+    start = time.perf_counter()
+    expected = [sign_order(order, instrument_id, decimals, SECRET_KEY)
+                for order, instrument_id, decimals, _, _ in orders]
+    web3_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    signatures = [signer.sign_order(*order) for order in orders]
+    signer_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch_signatures = signer.sign_orders(orders)
+    batch_elapsed = time.perf_counter() - start
+    signer.close()
+
+    mismatches = sum(1 for a, b, c in zip(expected, signatures, batch_signatures) if not a == b == c)
+    print(f"web3 sign_order:        {web3_elapsed * 1e6 / num_orders:9.1f} us/order")
+    print(f"LeverjPerpetualSigner:  {signer_elapsed * 1e6 / num_orders:9.1f} us/order")
+    print(f"  sign_orders (batch):  {batch_elapsed * 1e6 / num_orders:9.1f} us/order")
+    print(f"{num_orders - mismatches}/{num_orders} signatures identical")
+    if mismatches > 0:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""
+Captures a stream of 20 level order book diffs, and times how long record() holds up the event loop, how long the
+writer thread takes to write everything out, the capture's size, and how fast the capture is read back.
+
+Usage: python test/debug/benchmark_order_book_capture.py [messages]
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import os
+import random
+import tempfile
+import time
+
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_message_capture import (
+    OrderBookMessageCapture,
+    OrderBookMessageCaptureReader,
+)
+
+
+def make_diffs(count: int):
+    rng = random.Random(7)
+    return [OrderBookMessage(OrderBookMessageType.DIFF, {
+        "trading_pair": "ETH-USDT",
+        "update_id": update_id,
+        "bids": [[f"{1999.99 - rng.randrange(200) * 0.01:.2f}", f"{rng.uniform(0, 20):.4f}"] for _ in range(10)],
+        "asks": [[f"{2000.01 + rng.randrange(200) * 0.01:.2f}", f"{rng.uniform(0, 20):.4f}"] for _ in range(10)],
+    }, timestamp=update_id / 100) for update_id in range(count)]
+
+
+def run(label: str, diffs, compress: bool):
+    with tempfile.TemporaryDirectory() as capture_dir:
+        capture = OrderBookMessageCapture(capture_dir, compress=compress)
+        capture.start()
+        start = time.perf_counter()
+        for diff in diffs:
+            capture.record(diff)
+        record_time = time.perf_counter() - start
+        capture.stop()
+        write_time = time.perf_counter() - start
+        size = sum(os.path.getsize(join(capture_dir, file_name)) for file_name in os.listdir(capture_dir))
+
+        start = time.perf_counter()
+        read_count = sum(1 for _ in OrderBookMessageCaptureReader(capture_dir))
+        read_time = time.perf_counter() - start
+        assert read_count == len(diffs)
+    print(f"{label:<12} record: {record_time * 1e6 / len(diffs):6.2f} us/msg   "
+          f"written in: {write_time:6.2f} s   size: {size / len(diffs):6.1f} B/msg   "
+          f"read: {len(diffs) / read_time:9.0f} msg/s")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    diffs = make_diffs(count)
+    print(f"{count} diff messages of 20 levels")
+    run("raw", diffs, False)
+    run("compressed", diffs, True)
+
+
+if __name__ == "__main__":
+    main()
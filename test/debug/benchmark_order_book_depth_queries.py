@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""
+Compares the cumulative depth index used by the OrderBook depth queries against walking the book entries level by
+level, which is what the depth queries used to do.
+
+Usage: python test/debug/benchmark_order_book_depth_queries.py [num_levels] [num_queries]
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import math
+import time
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+
+
+def walk_price_for_volume(order_book: OrderBook, is_buy: bool, volume: float) -> float:
+    cumulative_volume = 0
+    for row in (order_book.ask_entries() if is_buy else order_book.bid_entries()):
+        cumulative_volume += row.amount
+        if cumulative_volume >= volume:
+            return row.price
+    return float("nan")
+
+
+def walk_volume_for_price(order_book: OrderBook, is_buy: bool, price: float) -> float:
+    cumulative_volume = 0
+    for row in (order_book.ask_entries() if is_buy else order_book.bid_entries()):
+        if (row.price > price) if is_buy else (row.price < price):
+            break
+        cumulative_volume += row.amount
+    return cumulative_volume
+
+
+def make_order_book(num_levels: int) -> OrderBook:
+    order_book = OrderBook()
+    mid_price = 100.0
+    tick = 0.01
+    amounts = np.random.uniform(0.1, 10, size=(2, num_levels))
+    bids = np.array([[mid_price - (i + 1) * tick, amounts[0][i], 1] for i in range(num_levels)], dtype=np.float64)
+    asks = np.array([[mid_price + (i + 1) * tick, amounts[1][i], 1] for i in range(num_levels)], dtype=np.float64)
+    order_book.apply_numpy_snapshot(bids, asks)
+    return order_book
+
+
+def timed(label: str, fn, queries) -> list:
+    start = time.perf_counter()
+    results = [fn(is_buy, value) for is_buy, value in queries]
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<40} {elapsed * 1e6 / len(queries):10.2f} us/query")
+    return results
+
+
+def main():
+    num_levels = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    num_queries = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    order_book = make_order_book(num_levels)
+    total_volume = sum(row.amount for row in order_book.ask_entries())
+    rng = np.random.default_rng(42)
+    volume_queries = [(bool(rng.integers(2)), float(rng.uniform(0, total_volume))) for _ in range(num_queries)]
+    price_queries = [(is_buy, 100.0 + (1 if is_buy else -1) * float(rng.uniform(0, num_levels * 0.01)))
+                     for is_buy, _ in volume_queries]
+
+    print(f"Order book with {num_levels} levels per side, {num_queries} queries")
+
+    print("get_price_for_volume")
+    walked = timed("entry walk", lambda b, v: walk_price_for_volume(order_book, b, v), volume_queries)
+    indexed = timed("depth index", lambda b, v: order_book.get_price_for_volume(b, v).result_price, volume_queries)
+    assert all(a == b or (math.isnan(a) and math.isnan(b)) for a, b in zip(walked, indexed))
+
+    print("get_volume_for_price")
+    walked = timed("entry walk", lambda b, p: walk_volume_for_price(order_book, b, p), price_queries)
+    indexed = timed("depth index", lambda b, p: order_book.get_volume_for_price(b, p).result_volume, price_queries)
+    assert walked == indexed
+
+    # Every query after a diff pays for one rebuild of the index.
+    diff = np.array([[100.0 + 0.01 * (num_levels // 2), 1.0, 2]], dtype=np.float64)
+    empty = np.empty((0, 3), dtype=np.float64)
+
+    def query_after_diff(is_buy, volume):
+        order_book.apply_numpy_diffs(empty, diff)
+        return order_book.get_price_for_volume(is_buy, volume).result_price
+
+    print("apply_numpy_diffs + get_price_for_volume")
+    timed("depth index, rebuilt on each query", query_after_diff, volume_queries)
+
+
+if __name__ == "__main__":
+    main()
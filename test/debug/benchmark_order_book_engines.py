@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+"""
+Replays an order book diff stream into the std::set based OrderBook and the int64 tick based TickOrderBook, and
+compares apply/query throughput and the number of levels each engine ends up with.
+
+Usage: python test/debug/benchmark_order_book_engines.py [diff_stream.jsonl] [price_increment]
+
+Each line of the diff stream is a JSON object with "bids" and "asks" lists of [price, amount] entries, the first line
+is applied as the snapshot. Without a file, a synthetic random walk stream is generated whose prices are computed in
+floating point, so the same level does not always parse to a bit-identical double.
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import json
+import time
+from typing import List, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.tick_order_book import TickOrderBook
+
+DiffArrays = Tuple[np.ndarray, np.ndarray]
+
+
+def to_rows(entries, update_id: int) -> np.ndarray:
+    rows = np.empty((len(entries), 3), dtype=np.float64)
+    if len(entries) > 0:
+        rows[:, :2] = [entry[:2] for entry in entries]
+    rows[:, 2] = update_id
+    return rows
+
+
+def load_stream(path: str) -> List[DiffArrays]:
+    stream = []
+    with open(path) as fd:
+        for update_id, line in enumerate(fd, start=1):
+            message = json.loads(line)
+            stream.append((to_rows(message["bids"], update_id), to_rows(message["asks"], update_id)))
+    return stream
+
+
+def synthetic_stream(num_diffs: int = 100000, depth: int = 500, price_increment: float = 0.01) -> List[DiffArrays]:
+    rng = np.random.default_rng(7)
+    mid_ticks = 10000
+    stream = [(
+        np.array([[(mid_ticks - i) * price_increment, 1.0, 1] for i in range(1, depth)], dtype=np.float64),
+        np.array([[(mid_ticks + i) * price_increment, 1.0, 1] for i in range(1, depth)], dtype=np.float64),
+    )]
+    for update_id in range(2, num_diffs + 2):
+        mid_ticks += int(rng.integers(-1, 2))
+        offsets = rng.integers(1, 50, size=4)
+        amounts = np.where(rng.random(4) < 0.3, 0.0, rng.uniform(0.1, 5, size=4))
+        # Dividing by 100 instead of multiplying by the increment gives doubles that differ in the last bits.
+        bids = [[(mid_ticks - offset) / 100.0, amount, update_id] for offset, amount in zip(offsets[:2], amounts[:2])]
+        asks = [[(mid_ticks + offset) / 100.0, amount, update_id] for offset, amount in zip(offsets[2:], amounts[2:])]
+        stream.append((np.array(bids, dtype=np.float64), np.array(asks, dtype=np.float64)))
+    return stream
+
+
+def run(label: str, order_book: OrderBook, stream: List[DiffArrays]):
+    snapshot, diffs = stream[0], stream[1:]
+    order_book.apply_numpy_snapshot(*snapshot)
+
+    start = time.perf_counter()
+    for bids, asks in diffs:
+        order_book.apply_numpy_diffs(bids, asks)
+    apply_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(10000):
+        order_book.get_price_for_volume(True, 10.0)
+        order_book.get_price_for_volume(False, 10.0)
+    query_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(100):
+        list(order_book.bid_entries())
+    iterate_elapsed = time.perf_counter() - start
+
+    num_bids = len(list(order_book.bid_entries()))
+    num_asks = len(list(order_book.ask_entries()))
+    print(f"{label:<14} apply: {apply_elapsed * 1e6 / len(diffs):7.2f} us/diff  "
+          f"query: {query_elapsed * 1e6 / 20000:7.2f} us  "
+          f"iterate bids: {iterate_elapsed * 1e3 / 100:7.2f} ms  "
+          f"levels: {num_bids} bids / {num_asks} asks")
+
+
+def main():
+    price_increment = float(sys.argv[2]) if len(sys.argv) > 2 else 0.01
+    stream = load_stream(sys.argv[1]) if len(sys.argv) > 1 else synthetic_stream(price_increment=price_increment)
+    print(f"Replaying {len(stream) - 1} diffs")
+    run("std::set", OrderBook(), stream)
+    run("int64 ticks", TickOrderBook(price_increment=price_increment), stream)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+"""
+Paper trades a 50 level grid on each side of 20 trading pairs, and times the operations a market making strategy runs
+on every tick: checking the available balances of every pair, the exchange's tick with the book moving around the
+grid, matching order book trades, and refreshing (cancelling and re-placing) the whole grid.
+
+Usage: python test/debug/benchmark_paper_trade_matching.py [levels] [trading pairs]
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import time
+from decimal import Decimal
+
+from hummingbot.connector.exchange.paper_trade.market_config import MarketConfig
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.events import (
+    OrderBookTradeEvent,
+    OrderType,
+    TradeType,
+)
+
+
+class MockDataSource:
+    order_book_create_function = None
+
+
+class MockOrderBookTracker:
+    exchange_name = "binance"
+
+    def __init__(self, trading_pairs):
+        self.data_source = MockDataSource()
+        self.order_books = {trading_pair: CompositeOrderBook() for trading_pair in trading_pairs}
+        self.ready = True
+
+
+class MockTargetMarket:
+    @staticmethod
+    def convert_from_exchange_trading_pair(trading_pair: str) -> str:
+        return trading_pair
+
+    @staticmethod
+    def convert_to_exchange_trading_pair(trading_pair: str) -> str:
+        return trading_pair
+
+    @staticmethod
+    def split_trading_pair(trading_pair: str):
+        return tuple(trading_pair.split("-"))
+
+
+def set_book(order_book: CompositeOrderBook, mid: float, update_id: int):
+    order_book.apply_snapshot([OrderBookRow(mid - 0.5 - i * 0.1, 10, update_id) for i in range(20)],
+                              [OrderBookRow(mid + 0.5 + i * 0.1, 10, update_id) for i in range(20)],
+                              update_id)
+
+
+def place_grid(exchange: PaperTradeExchange, trading_pair: str, levels: int):
+    for i in range(levels):
+        exchange.buy(trading_pair, Decimal(1), OrderType.LIMIT, Decimal(99) - Decimal(i) / 10)
+        exchange.sell(trading_pair, Decimal(1), OrderType.LIMIT, Decimal(101) + Decimal(i) / 10)
+
+
+def main():
+    levels = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    num_pairs = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    trading_pairs = [f"COIN{i}-HBOT" for i in range(num_pairs)]
+    tracker = MockOrderBookTracker(trading_pairs)
+    for trading_pair in trading_pairs:
+        set_book(tracker.order_books[trading_pair], 100, 1)
+    exchange = PaperTradeExchange(tracker, MarketConfig.default_config(), MockTargetMarket)
+    assert exchange.ready
+    clock = Clock(ClockMode.BACKTEST, 1.0, 0, 3600)
+    clock.add_iterator(exchange)
+    exchange.set_balance("HBOT", Decimal(1e9))
+    for trading_pair in trading_pairs:
+        exchange.set_balance(trading_pair.split("-")[0], Decimal(1e6))
+        place_grid(exchange, trading_pair, levels)
+    print(f"{len(exchange.limit_orders)} resting orders on {num_pairs} trading pairs")
+
+    rounds = 20
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for trading_pair in trading_pairs:
+            base, quote = trading_pair.split("-")
+            exchange.get_available_balance(base)
+            exchange.get_available_balance(quote)
+    print(f"available balances: {(time.perf_counter() - start) * 1e3 / rounds:9.3f} ms per tick")
+
+    start = time.perf_counter()
+    for i in range(rounds):
+        # The book wobbles inside the grid without crossing any order.
+        for trading_pair in trading_pairs:
+            set_book(tracker.order_books[trading_pair], 100 + (i % 3 - 1) * 0.2, i + 2)
+        clock.backtest_til(i + 1)
+    print(f"tick:               {(time.perf_counter() - start) * 1e3 / rounds:9.3f} ms per tick")
+
+    start = time.perf_counter()
+    for i in range(rounds):
+        for trading_pair in trading_pairs:
+            exchange.match_trade_to_limit_orders(
+                OrderBookTradeEvent(trading_pair, i, TradeType.BUY, Decimal("100.5"), Decimal(1)))
+    print(f"trade matching:     {(time.perf_counter() - start) * 1e6 / rounds / num_pairs:9.3f} us per trade")
+
+    start = time.perf_counter()
+    for order in exchange.limit_orders:
+        exchange.cancel(order.trading_pair, order.client_order_id)
+    for trading_pair in trading_pairs:
+        place_grid(exchange, trading_pair, levels)
+    print(f"grid refresh:       {(time.perf_counter() - start) * 1e3:9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
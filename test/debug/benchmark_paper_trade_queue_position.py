@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+"""
+Applies order book diffs to 40 trading pairs, each with a 10 level paper trade grid on both sides, and times the diffs
+with and without queue position fills. With queue position fills, every diff is also seen by the paper trade exchange
+to keep the volume ahead of its limit orders up to date.
+
+Usage: python test/debug/benchmark_paper_trade_queue_position.py [trading pairs] [levels]
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import random
+import time
+from decimal import Decimal
+
+from hummingbot.connector.exchange.paper_trade.market_config import MarketConfig
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.events import (
+    OrderBookTradeEvent,
+    OrderType,
+    TradeType,
+)
+
+
+class MockDataSource:
+    order_book_create_function = None
+
+
+class MockOrderBookTracker:
+    exchange_name = "binance"
+
+    def __init__(self, trading_pairs):
+        self.data_source = MockDataSource()
+        self.order_books = {trading_pair: CompositeOrderBook() for trading_pair in trading_pairs}
+        self.ready = True
+
+
+class MockTargetMarket:
+    @staticmethod
+    def convert_from_exchange_trading_pair(trading_pair: str) -> str:
+        return trading_pair
+
+    @staticmethod
+    def convert_to_exchange_trading_pair(trading_pair: str) -> str:
+        return trading_pair
+
+    @staticmethod
+    def split_trading_pair(trading_pair: str):
+        return tuple(trading_pair.split("-"))
+
+
+def run(label: str, queue_position_fill: bool, num_pairs: int, levels: int):
+    rng = random.Random(7)
+    trading_pairs = [f"COIN{i}-HBOT" for i in range(num_pairs)]
+    tracker = MockOrderBookTracker(trading_pairs)
+    for trading_pair in trading_pairs:
+        tracker.order_books[trading_pair].apply_snapshot(
+            [OrderBookRow(round(99.9 - i * 0.1, 1), 10, 1) for i in range(100)],
+            [OrderBookRow(round(100.1 + i * 0.1, 1), 10, 1) for i in range(100)],
+            1)
+    exchange = PaperTradeExchange(tracker, MarketConfig.default_config(), MockTargetMarket,
+                                  queue_position_fill=queue_position_fill)
+    assert exchange.ready
+    exchange.set_balance("HBOT", Decimal(1e9))
+    for trading_pair in trading_pairs:
+        exchange.set_balance(trading_pair.split("-")[0], Decimal(1e6))
+        for i in range(levels):
+            exchange.buy(trading_pair, Decimal(1), OrderType.LIMIT, Decimal("99.5") - Decimal(i) / 10)
+            exchange.sell(trading_pair, Decimal(1), OrderType.LIMIT, Decimal("100.5") + Decimal(i) / 10)
+
+    # Diffs of 20 rows around the top of the book, half of them on the grid's levels.
+    diffs = []
+    for update_id in range(2, 2002):
+        diffs.append((rng.choice(trading_pairs),
+                      [OrderBookRow(round(99.9 - rng.randrange(20) * 0.1, 1), rng.uniform(1, 20), update_id)
+                       for _ in range(10)],
+                      [OrderBookRow(round(100.1 + rng.randrange(20) * 0.1, 1), rng.uniform(1, 20), update_id)
+                       for _ in range(10)],
+                      update_id))
+    start = time.perf_counter()
+    for trading_pair, bids, asks, update_id in diffs:
+        tracker.order_books[trading_pair].apply_diffs(bids, asks, update_id)
+    diff_time = (time.perf_counter() - start) / len(diffs)
+
+    trades = [OrderBookTradeEvent(rng.choice(trading_pairs), 1, TradeType.SELL, Decimal("99.5"), Decimal("0.1"))
+              for _ in range(2000)]
+    start = time.perf_counter()
+    for trade in trades:
+        exchange.match_trade_to_limit_orders(trade)
+    trade_time = (time.perf_counter() - start) / len(trades)
+    print(f"{label:<22} diff: {diff_time * 1e6:8.2f} us   trade at the grid's price: {trade_time * 1e6:8.2f} us")
+
+
+def main():
+    num_pairs = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    levels = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    print(f"{num_pairs} trading pairs, {levels * 2} resting orders each")
+    run("touch fills", False, num_pairs, levels)
+    run("queue position fills", True, num_pairs, levels)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+"""
+Measures PubSub.trigger_event() throughput with 1, 10 and 100 listeners on the triggered event tag.
+
+Usage: python test/debug/benchmark_pubsub_trigger.py [num_events]
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import time
+from enum import Enum
+
+from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.pubsub import PubSub
+
+
+class BenchmarkEvent(Enum):
+    Triggered = 1
+    Other = 2
+
+
+class CountingListener(EventListener):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def __call__(self, arg):
+        self.count += 1
+
+
+def run(num_listeners: int, num_events: int):
+    pubsub = PubSub()
+    listeners = [CountingListener() for _ in range(num_listeners)]
+    for listener in listeners:
+        pubsub.add_listener(BenchmarkEvent.Triggered, listener)
+        pubsub.add_listener(BenchmarkEvent.Other, listener)
+
+    start = time.perf_counter()
+    for i in range(num_events):
+        pubsub.trigger_event(BenchmarkEvent.Triggered, i)
+    elapsed = time.perf_counter() - start
+
+    assert all(listener.count == num_events for listener in listeners)
+    print(f"{num_listeners:>4} listeners: {num_events / elapsed:12.0f} events/s  "
+          f"{num_events * num_listeners / elapsed:12.0f} listener calls/s")
+
+
+def main():
+    num_events = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    for num_listeners in (1, 10, 100):
+        run(num_listeners, num_events if num_listeners < 100 else num_events // 10)
+
+
+if __name__ == "__main__":
+    main()
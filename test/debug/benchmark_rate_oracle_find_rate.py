@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+"""
+Measures rate lookup latency on a price map the size of Binance's tickers, with find_rate() and with a RateGraph
+built once for the prices, as the RateOracle does.
+
+Usage: python test/debug/benchmark_rate_oracle_find_rate.py [num_tokens]
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import random
+import time
+from decimal import Decimal
+from typing import (
+    Dict,
+    List,
+)
+
+from hummingbot.core.rate_oracle.utils import (
+    find_rate,
+    RateGraph,
+)
+
+QUOTES = ["USDT", "BTC", "ETH", "BNB", "BUSD"]
+
+
+def make_prices(num_tokens: int) -> Dict[str, Decimal]:
+    random.seed(0)
+    prices: Dict[str, Decimal] = {}
+    for i in range(num_tokens):
+        for quote in random.sample(QUOTES, 3):
+            prices[f"TOKEN{i}-{quote}"] = Decimal(str(round(random.uniform(0.01, 100), 6)))
+    for quote in QUOTES[1:]:
+        prices[f"{quote}-USDT"] = Decimal(str(round(random.uniform(1, 50000), 2)))
+    return prices
+
+
+def lookup_pairs(num_tokens: int) -> List[str]:
+    # Direct, inverse, and through one or two other currencies
+    tokens = [f"TOKEN{i}" for i in range(0, num_tokens, 7)]
+    return [f"{token}-USDT" for token in tokens] + [f"USDT-{token}" for token in tokens] + \
+        [f"{token}-ETH" for token in tokens] + [f"{token}-TOKEN1" for token in tokens]
+
+
+def time_lookups(name: str, find, pairs: List[str], rounds: int = 5):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for pair in pairs:
+            find(pair)
+    elapsed = time.perf_counter() - start
+    print(f"{name:>28}: {elapsed / (rounds * len(pairs)) * 1e6:10.2f} us per lookup")
+
+
+def main():
+    num_tokens = int(sys.argv[1]) if len(sys.argv) > 1 else 700
+    prices = make_prices(num_tokens)
+    pairs = lookup_pairs(num_tokens)
+    print(f"{len(prices)} prices, {len(pairs)} pairs looked up")
+
+    time_lookups("find_rate", lambda pair: find_rate(prices, pair), pairs)
+
+    start = time.perf_counter()
+    graph = RateGraph(prices)
+    print(f"{'RateGraph build':>28}: {(time.perf_counter() - start) * 1e3:10.2f} ms")
+    time_lookups("RateGraph first lookups", graph.find_rate, pairs, rounds=1)
+    time_lookups("RateGraph cached lookups", graph.find_rate, pairs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+
+import numpy as np
+
+from hummingbot.backtest.backtest_application import BacktestApplication
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_message_capture import OrderBookMessageCapture
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    MarketEvent,
+    TradeType,
+)
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making import PureMarketMakingStrategy
+
+TRADING_PAIR = "COINALPHA-HBOT"
+CAPTURE_START = 1609459200.0
+
+
+def book_message(message_type: OrderBookMessageType, update_id: int, mid_price: float) -> OrderBookMessage:
+    return OrderBookMessage(message_type, {
+        "trading_pair": TRADING_PAIR,
+        "update_id": update_id,
+        "bids": [[mid_price - 0.05 - level * 0.1, 10] for level in range(10)],
+        "asks": [[mid_price + 0.05 + level * 0.1, 10] for level in range(10)],
+    }, timestamp=float(update_id))
+
+
+def trade_message(trade_type: TradeType, price: float, amount: float) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.TRADE, {
+        "trading_pair": TRADING_PAIR,
+        "trade_type": float(trade_type.value),
+        "trade_id": 1,
+        "update_id": 1,
+        "price": price,
+        "amount": amount,
+    }, timestamp=1.0)
+
+
+class BacktestApplicationUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        # Captures are looked up in a sub directory named after the connector.
+        capture = OrderBookMessageCapture(os.path.join(self.temp_dir.name, "binance"))
+        messages = [
+            (0.5, book_message(OrderBookMessageType.SNAPSHOT, 1, 100)),
+            # Fills the bid at 99
+            (10.5, trade_message(TradeType.SELL, 98.5, 2)),
+            # Crosses the ask at 101
+            (100.5, book_message(OrderBookMessageType.DIFF, 2, 102)),
+            # Fills the ask at 103.02, 1% above the new mid price
+            (200.5, trade_message(TradeType.BUY, 103.5, 5)),
+        ]
+        for offset, message in messages:
+            capture.record(message, capture_time=CAPTURE_START + offset)
+        capture.stop()
+
+        self.app = BacktestApplication("pure_market_making", "conf_pure_mm_1.yml", self.temp_dir.name,
+                                       {"COINALPHA": Decimal(10), "HBOT": Decimal(1000)})
+        # What the strategy's start file does.
+        self.app._initialize_markets([("binance", [TRADING_PAIR])])
+        self.market = self.app.markets["binance"]
+        market_info = MarketTradingPairTuple(self.market, TRADING_PAIR, "COINALPHA", "HBOT")
+        self.app.market_trading_pair_tuples = [market_info]
+        self.app.strategy = PureMarketMakingStrategy(market_info,
+                                                     bid_spread=Decimal("0.01"),
+                                                     ask_spread=Decimal("0.01"),
+                                                     order_amount=Decimal(1),
+                                                     order_refresh_time=30,
+                                                     filled_order_delay=60,
+                                                     minimum_spread=Decimal(-1))
+        self.fill_logger = EventLogger()
+        self.market.add_listener(MarketEvent.OrderFilled, self.fill_logger)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_paper_trade_markets(self):
+        self.assertEqual("binance", self.market.name)
+        self.assertEqual(Decimal(10), self.market.get_balance("COINALPHA"))
+        self.assertEqual(os.path.join(self.temp_dir.name, "binance"), self.app.capture_path("binance"))
+        self.assertEqual(self.temp_dir.name, self.app.capture_path("kucoin"))
+        self.assertEqual([["COINALPHA", "HBOT"]], self.app._initialize_market_assets("binance", [TRADING_PAIR]))
+
+    def test_run(self):
+        result = self.app.run(sample_interval=60)
+
+        self.assertEqual(CAPTURE_START + 0.5, result.start_time)
+        self.assertEqual(4, result.messages_applied)
+        fills = self.fill_logger.event_log
+        # The clock ticks from the first message, so the fills are a tick before the messages are applied.
+        self.assertEqual([(CAPTURE_START + 9.5, 1, 99, 1), (CAPTURE_START + 100.5, -1, 101, 1),
+                          (CAPTURE_START + 199.5, -1, 103.02, 1)],
+                         [(fill.timestamp, 1 if fill.trade_type is TradeType.BUY else -1, float(fill.price),
+                           float(fill.amount)) for fill in fills])
+        np.testing.assert_array_equal([fill.timestamp for fill in fills], result.trades["timestamp"])
+        np.testing.assert_array_equal([1, -1, -1], result.trades["side"])
+        np.testing.assert_array_equal([99, 101, 103.02], result.trades["price"])
+        np.testing.assert_array_equal([1, 1, 1], result.trades["amount"])
+        np.testing.assert_allclose([0.099, 0.101, 0.10302], result.trades["fee"])
+
+        inventory = result.inventory
+        # Sampled every minute of market time, until the end of the recorded data.
+        np.testing.assert_array_equal(CAPTURE_START + 0.5 + 60 * np.arange(1, 5), inventory["timestamp"])
+        np.testing.assert_array_equal([100, 102, 102, 102], inventory["mid_price"])
+        np.testing.assert_array_equal([11, 10, 10, 9], inventory["base_balance"])
+        self.assertEqual(float(self.market.get_balance("HBOT")), inventory["quote_balance"][-1])
+        np.testing.assert_allclose(inventory["base_balance"] * inventory["mid_price"] + inventory["quote_balance"],
+                                   inventory["value"])
+        np.testing.assert_allclose(inventory["value"] - (10 * inventory["mid_price"] + 1000), inventory["pnl"])
+
+        summary = result.summary
+        self.assertEqual(3, summary["trades"])
+        self.assertEqual(1, summary["buys"])
+        self.assertEqual(2, summary["sells"])
+        self.assertAlmostEqual(99 + 101 + 103.02, summary["volume"])
+        self.assertEqual(inventory["pnl"][-1], summary["pnl"])
+        # Fast forwarded through most of the 240 seconds.
+        self.assertLess(result.ticks, 60)
+
+    def test_run_without_data(self):
+        with self.assertRaises(ValueError):
+            self.app.run(start_time=CAPTURE_START + 300, end_time=CAPTURE_START + 300)
+
+
+if __name__ == "__main__":
+    unittest.main()
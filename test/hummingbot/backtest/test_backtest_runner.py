@@ -0,0 +1,94 @@
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+
+import numpy as np
+
+from hummingbot.backtest.backtest_recorder import (
+    BacktestResult,
+    INVENTORY_DTYPE,
+    TRADES_DTYPE,
+)
+from hummingbot.backtest.backtest_runner import (
+    load_strategy_config,
+    parameter_grid,
+    parse_balances,
+    write_backtest_result,
+)
+from hummingbot.strategy.pure_market_making.pure_market_making_config_map import pure_market_making_config_map
+
+PMM_CONFIG = """strategy: pure_market_making
+exchange: binance
+market: COINALPHA-HBOT
+bid_spread: 1
+ask_spread: 1
+order_amount: 2
+order_refresh_time: 60
+"""
+
+
+class BacktestRunnerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        for cvar in pure_market_making_config_map.values():
+            cvar.value = None
+
+    def write_config(self, content: str) -> str:
+        path = os.path.join(self.temp_dir.name, "conf_backtest.yml")
+        with open(path, "w") as stream:
+            stream.write(content)
+        return path
+
+    def test_parameter_grid(self):
+        self.assertEqual([{}], parameter_grid([]))
+        self.assertEqual([{"bid_spread": "0.1", "order_amount": "1"},
+                          {"bid_spread": "0.1", "order_amount": "2"},
+                          {"bid_spread": "0.2", "order_amount": "1"},
+                          {"bid_spread": "0.2", "order_amount": "2"}],
+                         parameter_grid(["bid_spread=0.1,0.2", "order_amount = 1, 2"]))
+
+    def test_parse_balances(self):
+        self.assertEqual({"BTC": Decimal("1.5"), "USDT": Decimal(1000)}, parse_balances(["btc=1.5", "USDT=1000"]))
+
+    def test_load_strategy_config(self):
+        path = self.write_config(PMM_CONFIG)
+        self.assertEqual("pure_market_making", load_strategy_config(path, {"bid_spread": "0.5"}))
+        self.assertEqual(Decimal("0.5"), pure_market_making_config_map["bid_spread"].value)
+        self.assertEqual(Decimal(1), pure_market_making_config_map["ask_spread"].value)
+        self.assertEqual(60., pure_market_making_config_map["order_refresh_time"].value)
+        # Defaults of the configs left out of the file.
+        self.assertEqual(1800., pure_market_making_config_map["max_order_age"].value)
+
+    def test_load_invalid_strategy_config(self):
+        path = self.write_config(PMM_CONFIG)
+        with self.assertRaisesRegex(ValueError, "Invalid pure_market_making config keys: spread"):
+            load_strategy_config(path, {"spread": "0.5"})
+        with self.assertRaisesRegex(ValueError, "current_market price source"):
+            load_strategy_config(path, {"price_source": "external_market"})
+        with self.assertRaisesRegex(ValueError, "inventory_cost"):
+            load_strategy_config(path, {"price_type": "inventory_cost"})
+        path = self.write_config(PMM_CONFIG.replace("order_amount: 2\n", ""))
+        with self.assertRaisesRegex(ValueError, "Missing pure_market_making configs: order_amount"):
+            load_strategy_config(path)
+        path = self.write_config("strategy: arbitrage\n")
+        with self.assertRaisesRegex(ValueError, "arbitrage config"):
+            load_strategy_config(path)
+
+    def test_write_backtest_result(self):
+        trades = np.array([(1., 1, 100., 2., 0.2)], dtype=TRADES_DTYPE)
+        inventory = np.array([(1., 100., 2., 800., 1000., 0.)], dtype=INVENTORY_DTYPE)
+        result = BacktestResult(trades, inventory, 0., 1., 1, 1, 0.)
+        output_dir = os.path.join(self.temp_dir.name, "run_0")
+        write_backtest_result(result, output_dir)
+        np.testing.assert_array_equal(trades, np.load(os.path.join(output_dir, "trades.npy")))
+        np.testing.assert_array_equal(inventory, np.load(os.path.join(output_dir, "inventory.npy")))
+        with self.assertRaises(ValueError):
+            write_backtest_result(result, output_dir, "csv")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import math
+import tempfile
+import unittest
+
+from hummingbot.backtest.recorded_market_data import (
+    RecordedMarketData,
+    RecordedOrderBookTracker,
+)
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_message_capture import OrderBookMessageCapture
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    OrderBookEvent,
+    TradeType,
+)
+
+TRADING_PAIR = "COINALPHA-HBOT"
+CAPTURE_START = 1609459200.0
+
+
+def book_message(message_type: OrderBookMessageType, update_id: int, bids, asks,
+                 trading_pair: str = TRADING_PAIR) -> OrderBookMessage:
+    return OrderBookMessage(message_type, {
+        "trading_pair": trading_pair,
+        "update_id": update_id,
+        "bids": bids,
+        "asks": asks,
+    }, timestamp=float(update_id))
+
+
+def trade_message(price: float, amount: float) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.TRADE, {
+        "trading_pair": TRADING_PAIR,
+        "trade_type": float(TradeType.SELL.value),
+        "trade_id": 1,
+        "update_id": 3,
+        "price": price,
+        "amount": amount,
+    }, timestamp=3.0)
+
+
+class RecordedMarketDataUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        capture = OrderBookMessageCapture(self.temp_dir.name)
+        messages = [
+            (0.5, book_message(OrderBookMessageType.DIFF, 1, [[10, 1]], [])),
+            (10.2, book_message(OrderBookMessageType.SNAPSHOT, 2, [[9, 1], [8, 1]], [[11, 1], [12, 1]])),
+            (10.7, book_message(OrderBookMessageType.DIFF, 1, [[9.5, 1]], [])),
+            (20, book_message(OrderBookMessageType.DIFF, 3, [[9, 0]], [], trading_pair="OTHER-HBOT")),
+            (30, trade_message(8.5, 2)),
+            (60.5, book_message(OrderBookMessageType.DIFF, 4, [[10, 3]], [[11, 0]])),
+        ]
+        for offset, message in messages:
+            capture.record(message, capture_time=CAPTURE_START + offset)
+        capture.stop()
+        self.market_data = RecordedMarketData(self.temp_dir.name, [TRADING_PAIR])
+        self.order_book = self.market_data.order_books[TRADING_PAIR]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_messages_applied_at_capture_time(self):
+        self.assertEqual(CAPTURE_START + 0.5, self.market_data.first_timestamp)
+        self.assertFalse(self.market_data.ready)
+
+        self.market_data.tick(CAPTURE_START + 10)
+        # The diff before the first snapshot is dropped.
+        self.assertFalse(self.market_data.ready)
+        self.assertEqual(0, self.market_data.messages_applied)
+
+        self.market_data.tick(CAPTURE_START + 11)
+        # Diffs older than the snapshot are dropped too.
+        self.assertTrue(self.market_data.ready)
+        self.assertEqual(1, self.market_data.messages_applied)
+        self.assertEqual(9, self.order_book.get_price(False))
+
+        trade_logger = EventLogger()
+        self.order_book.add_listener(OrderBookEvent.TradeEvent, trade_logger)
+        self.market_data.tick(CAPTURE_START + 60)
+        self.assertEqual([(CAPTURE_START + 30, TradeType.SELL, 8.5, 2)],
+                         [(trade.timestamp, trade.type, trade.price, trade.amount) for trade in trade_logger.event_log])
+        self.assertFalse(self.market_data.finished)
+
+        self.market_data.tick(CAPTURE_START + 61)
+        self.assertEqual(10, self.order_book.get_price(False))
+        self.assertEqual(12, self.order_book.get_price(True))
+        self.assertTrue(self.market_data.finished)
+        self.assertEqual(3, self.market_data.messages_applied)
+
+    def test_tracker(self):
+        tracker = RecordedOrderBookTracker("binance", self.market_data)
+        self.assertEqual("binance", tracker.exchange_name)
+        self.assertIs(self.market_data.order_books, tracker.order_books)
+        self.assertFalse(tracker.ready)
+        self.market_data.tick(CAPTURE_START + 11)
+        self.assertTrue(tracker.ready)
+
+    def test_fast_forward_clock(self):
+        clock = Clock(ClockMode.BACKTEST, 1.0, CAPTURE_START, CAPTURE_START + 3600, fast_forward=True)
+        clock.add_iterator(self.market_data)
+        # Wakes up the clock a tick before the next message.
+        self.assertEqual(CAPTURE_START - 0.5, self.market_data.next_wakeup_time(CAPTURE_START))
+        clock.backtest()
+        self.assertTrue(self.market_data.finished)
+        self.assertTrue(math.isnan(self.market_data.next_wakeup_time(CAPTURE_START + 61)))
+        # Ticks 1 / 10, 11 (two messages) / 29, 30 / 60, 61 and the end of the backtest.
+        self.assertEqual(8, clock.ticks)
+
+
+if __name__ == "__main__":
+    unittest.main()
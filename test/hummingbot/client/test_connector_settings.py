@@ -0,0 +1,48 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from hummingbot.client import settings
+from hummingbot.client.settings import (
+    CONNECTOR_SETTINGS,
+    ConnectorConfigKeys,
+)
+
+
+class ConnectorSettingsTest(unittest.TestCase):
+
+    def test_manifest_up_to_date(self):
+        created_settings = settings._create_connector_settings()
+        message = "The connector settings manifest is out of date, update it with " \
+                  "hummingbot.client.settings.save_connector_settings_manifest()."
+        self.assertEqual(list(created_settings), list(CONNECTOR_SETTINGS), message)
+        for name, created_setting in created_settings.items():
+            self.assertEqual(created_setting._replace(config_keys={}),
+                             CONNECTOR_SETTINGS[name]._replace(config_keys={}), message)
+            self.assertEqual(created_setting.config_keys, dict(CONNECTOR_SETTINGS[name].config_keys), name)
+
+    def test_config_keys_imported_on_use(self):
+        config_keys = ConnectorConfigKeys("hummingbot.connector.exchange.binance.binance_utils")
+        self.assertIsNone(config_keys._config_keys)
+        self.assertIn("binance_api_key", config_keys)
+        self.assertEqual("binance_api_key", config_keys["binance_api_key"].key)
+        domain_config_keys = ConnectorConfigKeys("hummingbot.connector.exchange.binance.binance_utils", "binance_us")
+        self.assertEqual(["binance_us_api_key", "binance_us_api_secret"], sorted(domain_config_keys))
+
+    def test_connector_settings_created_if_manifest_out_of_date(self):
+        with patch.object(settings, "_connector_dirs", return_value=[("exchange", "new_exchange")]), \
+                patch.object(settings, "_create_connector_settings", return_value={}) as create_connector_settings:
+            self.assertEqual({}, settings._load_connector_settings())
+        create_connector_settings.assert_called_once()
+
+    def test_save_connector_settings_manifest(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "connector_settings.json")
+            settings.save_connector_settings_manifest(file_path)
+            with patch.object(settings, "CONNECTOR_SETTINGS_MANIFEST_PATH", file_path), \
+                    patch.object(settings, "_create_connector_settings") as create_connector_settings:
+                loaded_settings = settings._load_connector_settings()
+        create_connector_settings.assert_not_called()
+        self.assertEqual(list(CONNECTOR_SETTINGS), list(loaded_settings))
+        self.assertIsInstance(loaded_settings["binance"].config_keys, ConnectorConfigKeys)
@@ -0,0 +1,69 @@
+import asyncio
+import json
+from collections import defaultdict
+from typing import (
+    Any,
+    Dict,
+    Set,
+)
+
+from aiohttp import web
+
+from hummingbot.core.mock_api.mock_web_server import MockWebServer
+
+GATEWAY_HOST = "gateway.hbottest.com"
+
+
+class GatewayMockServer(MockWebServer):
+    """
+    A stand-in gateway, which answers the transaction and position polling end points of the Uniswap connectors.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.confirmed_txs: Dict[str, int] = {}
+        self.positions: Dict[str, Dict[str, Any]] = {}
+        self.batch_routes: bool = True
+        self.request_counts: Dict[str, int] = defaultdict(int)
+        self.max_concurrent_requests: int = 0
+        self._concurrent_requests: int = 0
+
+    def reset(self):
+        self.confirmed_txs.clear()
+        self.positions.clear()
+        self.batch_routes = True
+        self.request_counts.clear()
+        self.max_concurrent_requests = 0
+
+    def tx_result(self, tx_hash: str) -> Dict[str, Any]:
+        if tx_hash in self.confirmed_txs:
+            return {"txHash": tx_hash, "confirmed": True,
+                    "receipt": {"status": self.confirmed_txs[tx_hash], "gasUsed": 100000, "logs": []}}
+        return {"txHash": tx_hash, "confirmed": False, "receipt": {}}
+
+    async def _handler(self, request: web.Request):
+        path = request.path[request.path.find("/", 1) + 1:]
+        self.request_counts[path] += 1
+        self._concurrent_requests += 1
+        self.max_concurrent_requests = max(self.max_concurrent_requests, self._concurrent_requests)
+        try:
+            params = dict(await request.post())
+            # Gives the requests sent together the chance to overlap.
+            await asyncio.sleep(0.01)
+            batch_paths: Set[str] = {"eth/poll-batch", "eth/uniswap/v3/positions"}
+            if path in batch_paths and not self.batch_routes:
+                return web.json_response({"error": "Not found"}, status=404)
+            if path == "eth/poll":
+                return web.json_response(self.tx_result(params["txHash"]))
+            if path == "eth/poll-batch":
+                return web.json_response({"txs": [self.tx_result(tx_hash)
+                                                  for tx_hash in json.loads(params["txHashes"])]})
+            if path == "eth/uniswap/v3/position":
+                return web.json_response({"position": self.positions.get(params["tokenId"], {})})
+            if path == "eth/uniswap/v3/positions":
+                return web.json_response({"positions": {token_id: self.positions[str(token_id)]
+                                                        for token_id in json.loads(params["tokenIds"])
+                                                        if str(token_id) in self.positions}})
+            return web.json_response({"error": f"No route for {path}"}, status=404)
+        finally:
+            self._concurrent_requests -= 1
@@ -0,0 +1,182 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from unittest.mock import patch
+
+import aiohttp
+
+from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.connector.connector.uniswap.uniswap_connector import UniswapConnector
+from hummingbot.connector.connector.uniswap_v3.uniswap_v3_connector import UniswapV3Connector
+from hummingbot.connector.connector.uniswap_v3.uniswap_v3_in_flight_position import (
+    UniswapV3InFlightPosition,
+    UniswapV3PositionStatus,
+)
+from hummingbot.core.event.events import TradeType
+
+from test.hummingbot.connector.connector.uniswap.gateway_mock_server import (
+    GATEWAY_HOST,
+    GatewayMockServer,
+)
+
+TRADING_PAIR = "ETH-USDC"
+PRIVATE_KEY = "0x" + "1" * 64
+
+
+class UniswapGatewayPollingUnitTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+        cls.gateway = GatewayMockServer.get_instance()
+        cls.gateway.add_host_to_mock(GATEWAY_HOST)
+        cls.gateway.start()
+        cls.ev_loop.run_until_complete(cls.gateway.wait_til_started())
+
+        cls._patcher = patch("aiohttp.client.URL")
+        cls._url_mock = cls._patcher.start()
+        cls._url_mock.side_effect = GatewayMockServer.reroute_local
+
+        cls._gateway_host = global_config_map["gateway_api_host"].value
+        cls._gateway_port = global_config_map["gateway_api_port"].value
+        global_config_map["gateway_api_host"].value = GATEWAY_HOST
+        global_config_map["gateway_api_port"].value = 5000
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        global_config_map["gateway_api_host"].value = cls._gateway_host
+        global_config_map["gateway_api_port"].value = cls._gateway_port
+        cls.gateway.stop()
+        cls._patcher.stop()
+        super().tearDownClass()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.gateway.reset()
+        self.connector = self.create_connector(UniswapConnector)
+
+    def tearDown(self) -> None:
+        self.ev_loop.run_until_complete(self.connector._shared_client.close())
+        super().tearDown()
+
+    def create_connector(self, connector_class):
+        connector = connector_class([TRADING_PAIR], PRIVATE_KEY, "rpc", trading_required=False)
+        # The stand-in gateway is served over plain http.
+        connector._shared_client = self.ev_loop.run_until_complete(self.create_client_session())
+        return connector
+
+    @staticmethod
+    async def create_client_session() -> aiohttp.ClientSession:
+        return aiohttp.ClientSession()
+
+    def track_orders(self, connector: UniswapConnector, count: int):
+        for i in range(count):
+            connector.start_tracking_order(f"order {i}", f"0x{i}", TRADING_PAIR, TradeType.BUY,
+                                           Decimal(1000), Decimal(1), 100)
+
+    def test_poll_transactions_in_batches(self):
+        tx_hashes = [f"0x{i}" for i in range(150)]
+        self.gateway.confirmed_txs["0x120"] = 1
+
+        results = self.ev_loop.run_until_complete(self.connector.poll_transactions(tx_hashes))
+
+        self.assertEqual(set(tx_hashes), set(results))
+        self.assertTrue(results["0x120"]["confirmed"])
+        self.assertFalse(results["0x0"]["confirmed"])
+        self.assertEqual({"eth/poll-batch": 2}, self.gateway.request_counts)
+
+    def test_confirmed_orders_stop_being_tracked(self):
+        self.track_orders(self.connector, 3)
+        self.connector.start_tracking_order("order 3", None, TRADING_PAIR, TradeType.BUY,
+                                            Decimal(1000), Decimal(1), 100)
+        self.gateway.confirmed_txs["0x1"] = 1
+        self.gateway.confirmed_txs["0x2"] = 0
+
+        self.ev_loop.run_until_complete(self.connector._update_order_status())
+
+        self.assertEqual(["order 0", "order 3"], sorted(self.connector.in_flight_orders))
+        self.assertEqual({"eth/poll-batch": 1}, self.gateway.request_counts)
+
+    def test_fallback_to_bounded_poll_requests(self):
+        self.gateway.batch_routes = False
+        self.track_orders(self.connector, 20)
+        self.gateway.confirmed_txs["0x5"] = 1
+
+        self.ev_loop.run_until_complete(self.connector._update_order_status())
+        self.ev_loop.run_until_complete(self.connector._update_order_status())
+
+        self.assertEqual(19, len(self.connector.in_flight_orders))
+        self.assertNotIn("order 5", self.connector.in_flight_orders)
+        # The missing batch route is only tried once.
+        self.assertEqual({"eth/poll-batch": 1, "eth/poll": 39}, self.gateway.request_counts)
+        self.assertLessEqual(self.gateway.max_concurrent_requests, self.connector.MAX_CONCURRENT_POLL_REQUESTS)
+
+    def test_poll_interval_reset_by_new_orders(self):
+        self.connector._poll_interval = self.connector.MAX_POLL_INTERVAL
+        self.track_orders(self.connector, 1)
+        self.assertEqual(self.connector.POLL_INTERVAL, self.connector._poll_interval)
+
+    def test_poll_interval_backs_off_without_pending_transactions(self):
+        self.track_orders(self.connector, 1)
+        for _ in range(3):
+            self.connector._update_poll_interval()
+        self.assertEqual(self.connector.POLL_INTERVAL, self.connector._poll_interval)
+
+        self.connector.stop_tracking_order("order 0")
+        intervals = []
+        for _ in range(5):
+            self.connector._update_poll_interval()
+            intervals.append(self.connector._poll_interval)
+        self.assertEqual([2.0, 4.0, 8.0, 8.0, 8.0], intervals)
+
+        connector = self.create_connector(UniswapV3Connector)
+        connector._poll_interval = connector.MAX_POLL_INTERVAL
+        connector.start_tracking_position("position", TRADING_PAIR, "MEDIUM", Decimal(1), Decimal(1000),
+                                          Decimal(1000), Decimal(2000))
+        connector._update_poll_interval()
+        self.assertEqual(connector.POLL_INTERVAL, connector._poll_interval)
+        self.ev_loop.run_until_complete(connector._shared_client.close())
+
+    def test_v3_positions_polled_in_batches(self):
+        for batch_routes in (True, False):
+            self.gateway.reset()
+            self.gateway.batch_routes = batch_routes
+            connector = self.create_connector(UniswapV3Connector)
+            self.track_orders(connector, 2)
+            pending_positions = [UniswapV3InFlightPosition(f"pending {i}", None, TRADING_PAIR, Decimal(2000),
+                                                           Decimal(1000), Decimal(1), Decimal(1000), "MEDIUM",
+                                                           last_tx_hash=f"0xp{i}")
+                                 for i in range(2)]
+            open_positions = [UniswapV3InFlightPosition(f"open {i}", i, TRADING_PAIR, Decimal(2000),
+                                                        Decimal(1000), Decimal(1), Decimal(1000), "MEDIUM",
+                                                        last_status=UniswapV3PositionStatus.OPEN)
+                              for i in range(3)]
+            for position in pending_positions + open_positions:
+                connector._in_flight_positions[position.hb_id] = position
+            for i in range(2):
+                self.gateway.positions[str(i)] = {"token0": "ETH", "token1": "USDC", "lowerPrice": "1500",
+                                                  "upperPrice": "2500", "amount0": f"{i + 1}", "amount1": "500",
+                                                  "unclaimedToken0": "0.1", "unclaimedToken1": "10"}
+            self.gateway.confirmed_txs["0x0"] = 1
+
+            self.ev_loop.run_until_complete(connector._update_order_status())
+
+            self.assertEqual(["order 1"], list(connector.in_flight_orders))
+            self.assertEqual(Decimal(1500), open_positions[0].lower_price)
+            self.assertEqual(Decimal(2), open_positions[1].current_base_amount)
+            self.assertEqual(Decimal(500), open_positions[1].current_quote_amount)
+            self.assertEqual(Decimal(10), open_positions[1].unclaimed_quote_amount)
+            # Positions the gateway doesn't know are left as they are.
+            self.assertEqual(Decimal(1000), open_positions[2].lower_price)
+            if batch_routes:
+                self.assertEqual({"eth/poll-batch": 1, "eth/uniswap/v3/positions": 1}, self.gateway.request_counts)
+            else:
+                self.assertEqual({"eth/poll-batch": 1, "eth/poll": 4, "eth/uniswap/v3/positions": 1,
+                                  "eth/uniswap/v3/position": 3}, self.gateway.request_counts)
+            self.ev_loop.run_until_complete(connector._shared_client.close())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,23 @@
+class Fixture:
+    # DELETE /order/EOID1,EOID2
+    BatchCancel = {
+        "status": 200,
+        "body": [
+            {"uuid": "EOID1", "instrument": "BTCDAI", "status": "cancelled"},
+            {"uuid": "EOID2", "instrument": "BTCDAI", "status": "cancelled"},
+        ],
+    }
+
+    # DELETE /order/EOID1,EOID2, with an order id the exchange doesn't know
+    BatchCancelUnknownOrder = {
+        "status": 400,
+        "body": {"message": "Order with specified id: EOID2 could not be found"},
+    }
+
+    # DELETE /order/EOID1
+    Cancel = {
+        "status": 200,
+        "body": [
+            {"uuid": "EOID1", "instrument": "BTCDAI", "status": "cancelled"},
+        ],
+    }
@@ -0,0 +1,224 @@
+import asyncio
+import json
+import time
+import unittest
+from decimal import Decimal
+from typing import Any, Dict, List, Tuple
+from unittest.mock import patch
+
+from hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_derivative import (
+    LeverjPerpetualDerivative,
+    LeverjPerpetualOrderRequest,
+)
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent, OrderType, TradeType
+
+from .fixture import Fixture
+
+MODULE = "hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_derivative.LeverjPerpetualDerivative"
+
+
+class MockResponse:
+    def __init__(self, fixture: Dict[str, Any]):
+        self.status = fixture["status"]
+        self._body = fixture["body"]
+
+    async def json(self):
+        return self._body
+
+    async def text(self):
+        return json.dumps(self._body)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+
+class MockClientSession:
+    def __init__(self, responses: Dict[str, Dict[str, Any]]):
+        self.responses = responses
+        self.requests: List[Tuple[str, str]] = []
+
+    def request(self, method: str, url: str, **kwargs) -> MockResponse:
+        self.requests.append((method, url))
+        return MockResponse(self.responses[url])
+
+
+class LeverjPerpetualDerivativeUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop = asyncio.get_event_loop()
+        self.exchange = LeverjPerpetualDerivative("api_key", "api_secret", 1,
+                                                  trading_pairs=["BTC-DAI"], trading_required=False)
+        self.requests: List[str] = []
+        self.orders: Dict[str, Any] = {}
+        self.executions: List[Dict[str, Any]] = []
+
+        self.request_data: List[Any] = []
+        self.creation_response: List[Dict[str, Any]] = []
+
+        async def api_request(http_method: str, url: str, *args, **kwargs):
+            self.requests.append(url)
+            if url == "/account/execution":
+                return self.executions
+            if http_method == "POST":
+                self.request_data.append(json.loads(kwargs["data"]))
+                return self.creation_response
+            if http_method == "DELETE":
+                return []
+            return self.orders.get(url[len("/order/"):], "Not Found")
+
+        self.exchange.api_request = api_request
+
+    def track_order(self, client_order_id: str, exchange_order_id: str, created_at: int = None):
+        self.exchange.start_tracking_order(TradeType.BUY, client_order_id, OrderType.LIMIT,
+                                           created_at or int(time.time()), None, "BTC-DAI", Decimal("100"),
+                                           Decimal("1"), 1, "OPEN")
+        self.exchange._set_exchange_id(self.exchange.in_flight_orders[client_order_id], exchange_order_id)
+
+    def test_update_order_status_fetches_executions_once(self):
+        for i in range(10):
+            self.track_order(f"OID{i}", f"EOID{i}")
+            self.orders[f"EOID{i}"] = [{"uuid": f"EOID{i}", "status": "open", "filled": 0, "averagePrice": 0}]
+        # Two of the orders have fills that are not known yet.
+        for i in range(2):
+            self.orders[f"EOID{i}"] = [{"uuid": f"EOID{i}", "status": "open", "filled": 0.5, "averagePrice": 100}]
+            self.executions.append({"orderId": f"EOID{i}", "executionId": f"X{i}", "quantity": 0.5, "price": 100})
+        self.exchange._leverage["BTC-DAI"] = 1
+
+        self.ev_loop.run_until_complete(self.exchange._update_order_status())
+
+        self.assertEqual(10, len([url for url in self.requests if url.startswith("/order/")]))
+        self.assertEqual(1, self.requests.count("/account/execution"))
+        self.assertEqual(Decimal("0.5"), self.exchange.in_flight_orders["OID0"].executed_amount_base)
+        self.assertEqual(Decimal("0.5"), self.exchange.in_flight_orders["OID1"].executed_amount_base)
+        self.assertEqual(Decimal("0"), self.exchange.in_flight_orders["OID2"].executed_amount_base)
+
+        stats = self.exchange.order_status_poll_stats
+        self.assertEqual(1, stats.passes)
+        self.assertEqual(10, stats.last_pass_orders)
+        self.assertEqual(11, stats.last_pass_requests)
+
+    def test_update_order_status_without_missing_fills(self):
+        self.track_order("OID1", "EOID1")
+        self.orders["EOID1"] = [{"uuid": "EOID1", "status": "open", "filled": 0, "averagePrice": 0}]
+
+        self.ev_loop.run_until_complete(self.exchange._update_order_status())
+
+        self.assertEqual(["/order/EOID1"], self.requests)
+        self.assertEqual(1, self.exchange.order_status_poll_stats.last_pass_requests)
+
+    def test_update_order_status_deleted_order(self):
+        self.track_order("OID1", "EOID1", created_at=int(time.time()) - 60)
+
+        self.ev_loop.run_until_complete(self.exchange._update_order_status())
+
+        self.assertEqual(["/order/EOID1", "/account/execution"], self.requests)
+        self.assertNotIn("OID1", self.exchange.in_flight_orders)
+
+    @staticmethod
+    def order_request_data(client_order_id, trading_pair, amount, is_buy, order_type, price, timestamp=None,
+                           signed=True):
+        return {"clientOrderId": client_order_id, "quantity": float(amount), "price": float(price),
+                "side": "buy" if is_buy else "sell", "timestamp": str(timestamp)}
+
+    @patch(f"{MODULE}._quantize_and_validate_order", lambda self, pair, amount, *args: (amount, args[-1]))
+    @patch(f"{MODULE}._order_request_data",
+           lambda self, *args, **kwargs: LeverjPerpetualDerivativeUnitTest.order_request_data(*args, **kwargs))
+    @patch(f"{MODULE}._sign_order_requests", lambda self, orders_data, orders: None)
+    def test_batch_create_orders(self):
+        created_logger, failure_logger = EventLogger(), EventLogger()
+        self.exchange.add_listener(MarketEvent.BuyOrderCreated, created_logger)
+        self.exchange.add_listener(MarketEvent.SellOrderCreated, created_logger)
+        self.exchange.add_listener(MarketEvent.OrderFailure, failure_logger)
+        orders = [LeverjPerpetualOrderRequest("BTC-DAI", TradeType.BUY, Decimal("1"), Decimal("99")),
+                  LeverjPerpetualOrderRequest("BTC-DAI", TradeType.BUY, Decimal("1"), Decimal("99")),
+                  LeverjPerpetualOrderRequest("BTC-DAI", TradeType.SELL, Decimal("2"), Decimal("101"))]
+
+        with patch("hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_derivative.safe_ensure_future") \
+                as safe_ensure_future_mock:
+            client_order_ids = self.exchange.batch_create_orders(orders)
+        # The exchange answers out of order, and rejects one of the orders.
+        self.creation_response = [
+            {"clientOrderId": client_order_ids[2], "uuid": "EOID2", "status": "open"},
+            {"clientOrderId": client_order_ids[1], "uuid": "EOID1", "status": "rejected"},
+            {"clientOrderId": client_order_ids[0], "uuid": "EOID0", "status": "pending"},
+        ]
+        # Runs the batch placement batch_create_orders() scheduled.
+        self.ev_loop.run_until_complete(safe_ensure_future_mock.call_args[0][0])
+
+        self.assertEqual(["/order"], self.requests)
+        self.assertEqual(client_order_ids, [entry["clientOrderId"] for entry in self.request_data[0]])
+        # Identical orders are signed with distinct timestamps.
+        self.assertEqual(3, len(set(entry["timestamp"] for entry in self.request_data[0])))
+        self.assertEqual("EOID0", self.exchange.in_flight_orders[client_order_ids[0]].exchange_order_id)
+        self.assertEqual("EOID2", self.exchange.in_flight_orders[client_order_ids[2]].exchange_order_id)
+        self.assertNotIn(client_order_ids[1], self.exchange.in_flight_orders)
+        self.assertEqual({client_order_ids[0], client_order_ids[2]},
+                         set(event.order_id for event in created_logger.event_log))
+        self.assertEqual([client_order_ids[1]], [event.order_id for event in failure_logger.event_log])
+
+    def test_batch_cancel(self):
+        self.track_order("OID1", "EOID1")
+        self.track_order("OID2", "EOID2")
+
+        results = self.ev_loop.run_until_complete(self.exchange.batch_cancel(["OID1", "OID2", "OID3"]))
+
+        self.assertEqual(["/order/EOID1,EOID2"], self.requests)
+        self.assertEqual({"OID1": True, "OID2": True, "OID3": False}, results)
+
+    def test_batch_cancel_falls_back_to_single_cancels(self):
+        self.track_order("OID1", "EOID1")
+        self.track_order("OID2", "EOID2")
+        api_request = self.exchange.api_request
+
+        async def failing_batch_cancel(http_method: str, url: str, *args, **kwargs):
+            if http_method == "DELETE" and "," in url:
+                self.requests.append(url)
+                raise IOError("Error executing request DELETE. HTTP status is 400.")
+            return await api_request(http_method, url, *args, **kwargs)
+
+        self.exchange.api_request = failing_batch_cancel
+        results = self.ev_loop.run_until_complete(self.exchange.batch_cancel(["OID1", "OID2"]))
+
+        self.assertEqual(["/order/EOID1,EOID2", "/order/EOID1", "/order/EOID2"], self.requests)
+        self.assertEqual({"OID1": True, "OID2": True}, results)
+
+    def api_responses(self, responses: Dict[str, Dict[str, Any]]) -> MockClientSession:
+        """
+        Sends the requests through api_request() to a client session answering with the fixture responses.
+        """
+        del self.exchange.api_request
+        self.exchange._shared_client = MockClientSession({f"{self.exchange.API_REST_ENDPOINT}{url}": response
+                                                          for url, response in responses.items()})
+        return self.exchange._shared_client
+
+    @patch("hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_auth.LeverjPerpetualAuth."
+           "generate_request_headers", lambda *args, **kwargs: {})
+    def test_batch_cancel_request(self):
+        self.track_order("OID1", "EOID1")
+        self.track_order("OID2", "EOID2")
+        session = self.api_responses({"/order/EOID1,EOID2": Fixture.BatchCancel})
+
+        results = self.ev_loop.run_until_complete(self.exchange.batch_cancel(["OID1", "OID2"]))
+
+        self.assertEqual([("DELETE", f"{self.exchange.API_REST_ENDPOINT}/order/EOID1,EOID2")], session.requests)
+        self.assertEqual({"OID1": True, "OID2": True}, results)
+
+    @patch("hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_auth.LeverjPerpetualAuth."
+           "generate_request_headers", lambda *args, **kwargs: {})
+    def test_batch_cancel_error_response(self):
+        self.track_order("OID1", "EOID1")
+        self.track_order("OID2", "EOID2")
+        session = self.api_responses({"/order/EOID1,EOID2": Fixture.BatchCancelUnknownOrder,
+                                      "/order/EOID1": Fixture.Cancel,
+                                      "/order/EOID2": Fixture.BatchCancelUnknownOrder})
+
+        results = self.ev_loop.run_until_complete(self.exchange.batch_cancel(["OID1", "OID2"]))
+
+        self.assertEqual(["/order/EOID1,EOID2", "/order/EOID1", "/order/EOID2"],
+                         [url[len(self.exchange.API_REST_ENDPOINT):] for _, url in session.requests])
+        # The cancel of the order the exchange doesn't know fails on its own, without failing the other cancel.
+        self.assertEqual({"OID1": True, "OID2": False}, results)
+        self.assertIn("OID2", self.exchange.in_flight_orders)
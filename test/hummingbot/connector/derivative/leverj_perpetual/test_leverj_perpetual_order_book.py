@@ -0,0 +1,48 @@
+import time
+import unittest
+
+from hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_order_book import LeverjPerpetualOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+
+
+def levels(*price_amounts):
+    return {price: {"price": price, "totalQuantity": amount} for price, amount in price_amounts}
+
+
+class LeverjPerpetualOrderBookUnitTest(unittest.TestCase):
+    def snapshot(self):
+        return LeverjPerpetualOrderBook.snapshot_message_from_exchange({
+            "rest": True,
+            "trading_pair": "BTC-DAI",
+            "buy": [{"price": "99.5", "totalQuantity": "1"}, {"price": "99", "totalQuantity": "2"}],
+            "sell": [{"price": "100.5", "totalQuantity": "1.5"}],
+        }, time.time())
+
+    def diff(self, buy, sell):
+        return LeverjPerpetualOrderBook.diff_message_from_exchange({"instrument": "1", "buy": buy, "sell": sell},
+                                                                   time.time(), {"trading_pair": "BTC-DAI"})
+
+    def test_diff_message_arrays(self):
+        message = self.diff(levels(("99.5", "3"), ("98", 0)), levels(("100.5", "0.25")))
+
+        self.assertEqual("BTC-DAI", message.trading_pair)
+        self.assertEqual([[99.5, 3.0], [98.0, 0.0]], message.bids_array[:, :2].tolist())
+        self.assertEqual([[100.5, 0.25]], message.asks_array[:, :2].tolist())
+        self.assertEqual([message.update_id] * 2, message.bids_array[:, 2].tolist())
+        self.assertIsInstance(message.update_id, int)
+
+    def test_update_ids_increase(self):
+        snapshot = self.snapshot()
+        diffs = [self.diff(levels(("99.5", "3")), {}) for _ in range(5)]
+        update_ids = [snapshot.update_id] + [diff.update_id for diff in diffs]
+        self.assertEqual(sorted(set(update_ids)), update_ids)
+
+    def test_apply_messages(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot_message(self.snapshot())
+        diff = self.diff(levels(("99.5", "0"), ("99.25", "4")), {})
+        order_book.apply_diff_message(diff)
+
+        self.assertEqual([(99.25, 4.0), (99.0, 2.0)], [(row.price, row.amount) for row in order_book.bid_entries()])
+        self.assertEqual([(100.5, 1.5)], [(row.price, row.amount) for row in order_book.ask_entries()])
+        self.assertEqual(diff.update_id, order_book.last_diff_uid)
@@ -0,0 +1,62 @@
+import unittest
+from decimal import Decimal
+
+from hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_order_signer import (
+    LeverjPerpetualOrderSigner,
+    quantity_numerator_and_denominator,
+    sign_order,
+    to_lowest_denomination,
+)
+
+SECRET_KEY = "0x" + "4c" * 32
+
+
+def order(price: Decimal, quantity: Decimal, side: str = "buy", order_type: str = "LMT"):
+    return {
+        "accountId": "0x12C95E6F4fCe1C8a4C2a2C7F7bb5cA5b3C1E7B61",
+        "originator": "0x5f2a3C1E7B6112C95E6F4fCe1C8a4C2a2C7F7bb5",
+        "instrument": "1",
+        "price": float(price),
+        "triggerPrice": "",
+        "quantity": float(quantity),
+        "marginPerFraction": "12345678900",
+        "side": side,
+        "orderType": order_type,
+        "timestamp": "1618432000123456",
+        "quote": "0xdAC17F958D2ee523a2206206994597C13D831ec7",
+        "isPostOnly": False,
+        "reduceOnly": False,
+        "clientOrderId": "buy-BTC-DAI-1",
+    }
+
+
+class LeverjPerpetualOrderSignerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.signer = LeverjPerpetualOrderSigner(SECRET_KEY)
+
+    def tearDown(self):
+        self.signer.close()
+
+    def test_integer_conversions(self):
+        self.assertEqual(57123500000, to_lowest_denomination(Decimal("57123.5"), 6))
+        self.assertEqual(1, to_lowest_denomination(Decimal("0.0000019"), 6))
+        self.assertEqual(100000000, to_lowest_denomination(Decimal("1E+2"), 6))
+        self.assertEqual((15, 1000), quantity_numerator_and_denominator(Decimal("0.0150")))
+        self.assertEqual((2, 1), quantity_numerator_and_denominator(Decimal("2.000")))
+        self.assertEqual((1200, 1), quantity_numerator_and_denominator(Decimal("1.2E+3")))
+
+    def test_signatures_match_web3_signer(self):
+        for price, quantity, side, order_type in [(Decimal("57123.5"), Decimal("0.015"), "buy", "LMT"),
+                                                  (Decimal("0.12345678"), Decimal("1200"), "sell", "LMT"),
+                                                  (Decimal("1"), Decimal("3.25"), "sell", "MKT")]:
+            leverj_order = order(price, quantity, side, order_type)
+            for decimals in [6, 18]:
+                expected = sign_order(leverj_order, 1, decimals, SECRET_KEY)
+                self.assertEqual(expected, self.signer.sign_order(leverj_order, 1, decimals, price, quantity))
+                # Without the Decimal values, the order's float price and quantity are used.
+                self.assertEqual(expected, self.signer.sign_order(leverj_order, 1, decimals))
+
+    def test_sign_orders(self):
+        requests = [(order(Decimal(100 + i), Decimal("0.5")), 1, 6, Decimal(100 + i), Decimal("0.5")) for i in range(5)]
+        signatures = self.signer.sign_orders(requests)
+        self.assertEqual([sign_order(request[0], 1, 6, SECRET_KEY) for request in requests], signatures)
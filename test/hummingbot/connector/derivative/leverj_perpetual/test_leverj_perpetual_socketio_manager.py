@@ -0,0 +1,89 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock, patch
+
+from hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_socketio_manager import (
+    LeverjPerpetualSocketIOManager,
+)
+
+
+class MockSocketIOClient:
+    def __init__(self, manager: LeverjPerpetualSocketIOManager, fail: bool):
+        self.manager = manager
+        self.fail = fail
+        self.emitted = []
+
+    async def connect(self, *args, **kwargs):
+        if self.fail:
+            raise ConnectionError("connection refused")
+        await self.manager._on_connect()
+        # Drop the connection right away.
+        asyncio.get_event_loop().call_soon(lambda: asyncio.ensure_future(self.manager._on_disconnect()))
+
+    async def emit(self, event, data):
+        self.emitted.append(event)
+
+    async def disconnect(self):
+        pass
+
+    def on(self, event, handler):
+        pass
+
+
+class LeverjPerpetualSocketIOManagerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop = asyncio.get_event_loop()
+        self.manager = LeverjPerpetualSocketIOManager("https://test.leverj.io")
+
+    @patch.object(LeverjPerpetualSocketIOManager, "_run_session", lambda self: asyncio.sleep(0))
+    def test_routes_events_to_subscribed_consumers(self):
+        order_book_queue, user_queue = asyncio.Queue(), asyncio.Queue()
+        self.manager.subscribe("order_book", ["difforderbook"], order_book_queue)
+        self.manager.subscribe("user_stream", ["order_add", "account_balance"], user_queue)
+
+        self.ev_loop.run_until_complete(self.manager._event_handler("difforderbook")({"instrument": "1"}))
+        self.ev_loop.run_until_complete(self.manager._event_handler("order_add")({"uuid": "EOID1"}))
+        self.ev_loop.run_until_complete(self.manager._event_handler("index")({}))
+
+        self.assertEqual(("difforderbook", {"instrument": "1"}), order_book_queue.get_nowait())
+        self.assertTrue(order_book_queue.empty())
+        self.assertEqual(("order_add", {"uuid": "EOID1"}), user_queue.get_nowait())
+        self.assertEqual(1, self.manager.stream_stats["order_book"].messages_received)
+        self.assertEqual(1, self.manager.stream_stats["user_stream"].messages_received)
+
+        self.manager.unsubscribe("user_stream")
+        self.ev_loop.run_until_complete(self.manager._event_handler("order_add")({"uuid": "EOID2"}))
+        self.assertTrue(user_queue.empty())
+
+    @patch.object(LeverjPerpetualSocketIOManager, "logger", MagicMock())
+    def test_reconnect_with_backoff(self):
+        clients = []
+        delays = []
+
+        def create_client():
+            # The first two connection attempts fail, then every session drops right after connecting.
+            clients.append(MockSocketIOClient(self.manager, fail=len(clients) < 2))
+            return clients[-1]
+
+        real_sleep = asyncio.sleep
+
+        async def sleep(delay):
+            # asyncio.sleep is patched module wide, leave the sleeps of other tasks alone.
+            if asyncio.current_task() is not self.manager._session_task:
+                return await real_sleep(delay)
+            delays.append(delay)
+            if len(delays) == 4:
+                raise asyncio.CancelledError()
+
+        self.manager._create_client = create_client
+        self.manager.subscribe("order_book", ["difforderbook"], asyncio.Queue())
+        with patch("hummingbot.connector.derivative.leverj_perpetual.leverj_perpetual_socketio_manager.asyncio.sleep",
+                   sleep):
+            with self.assertRaises(asyncio.CancelledError):
+                self.ev_loop.run_until_complete(self.manager._session_task)
+
+        initial_delay = LeverjPerpetualSocketIOManager.INITIAL_RECONNECT_DELAY
+        self.assertEqual([initial_delay, initial_delay * 2, initial_delay, initial_delay], delays)
+        self.assertEqual(["GET /instrument"], clients[2].emitted)
+        self.assertEqual(1, self.manager.stream_stats["order_book"].reconnects)
+        self.assertFalse(self.manager.connected)
@@ -0,0 +1,242 @@
+import asyncio
+import math
+import unittest
+from decimal import Decimal
+from typing import Dict, List
+
+from hummingbot.connector.exchange.paper_trade.market_config import MarketConfig
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    MarketEvent,
+    OrderBookTradeEvent,
+    OrderType,
+    TradeType,
+)
+
+TRADING_PAIR = "COINALPHA-HBOT"
+START_TIMESTAMP = 1609459200.0
+
+
+class MockDataSource:
+    order_book_create_function = None
+
+
+class MockOrderBookTracker:
+    exchange_name = "binance"
+
+    def __init__(self):
+        self.data_source = MockDataSource()
+        self.order_books: Dict[str, CompositeOrderBook] = {TRADING_PAIR: CompositeOrderBook()}
+        self.ready = True
+
+
+class MockTargetMarket:
+    @staticmethod
+    def convert_from_exchange_trading_pair(trading_pair: str) -> str:
+        return trading_pair
+
+    @staticmethod
+    def convert_to_exchange_trading_pair(trading_pair: str) -> str:
+        return trading_pair
+
+    @staticmethod
+    def split_trading_pair(trading_pair: str):
+        return tuple(trading_pair.split("-"))
+
+
+class PaperTradeExchangeUnitTest(unittest.TestCase):
+    queue_position_fill = False
+
+    def setUp(self):
+        self.tracker = MockOrderBookTracker()
+        self.order_book = self.tracker.order_books[TRADING_PAIR]
+        self.set_book([99, 98, 97], [101, 102, 103])
+        self.exchange = PaperTradeExchange(self.tracker,
+                                           MarketConfig.default_config(),
+                                           MockTargetMarket,
+                                           queue_position_fill=self.queue_position_fill)
+        self.assertTrue(self.exchange.ready)
+        self.clock = Clock(ClockMode.BACKTEST, 1.0, START_TIMESTAMP, START_TIMESTAMP + 3600)
+        self.clock.add_iterator(self.exchange)
+        self.exchange.set_balance("COINALPHA", Decimal(100))
+        self.exchange.set_balance("HBOT", Decimal(10000))
+        self.event_logger = EventLogger()
+        for event_tag in (MarketEvent.OrderFilled, MarketEvent.OrderCancelled):
+            self.exchange.add_listener(event_tag, self.event_logger)
+
+    def set_book(self, bid_prices: List[float], ask_prices: List[float], update_id: int = 1):
+        self.order_book.apply_snapshot([OrderBookRow(price, 10, update_id) for price in bid_prices],
+                                       [OrderBookRow(price, 10, update_id) for price in ask_prices],
+                                       update_id)
+
+    def place_grid(self, levels: int) -> List[str]:
+        order_ids = []
+        for i in range(levels):
+            order_ids.append(self.exchange.buy(TRADING_PAIR, Decimal(1), OrderType.LIMIT, Decimal(90 - i)))
+            order_ids.append(self.exchange.sell(TRADING_PAIR, Decimal(1), OrderType.LIMIT, Decimal(110 + i)))
+        return order_ids
+
+    def filled_order_ids(self) -> List[str]:
+        return [event.order_id for event in self.event_logger.event_log
+                if event.__class__.__name__ == "OrderFilledEvent"]
+
+    def filled_amounts(self) -> List[Decimal]:
+        return [event.amount for event in self.event_logger.event_log
+                if event.__class__.__name__ == "OrderFilledEvent"]
+
+    def test_on_hold_balances(self):
+        order_ids = self.place_grid(3)
+        self.assertEqual(Decimal(90 + 89 + 88), self.exchange.on_hold_balances["HBOT"])
+        self.assertEqual(Decimal(3), self.exchange.on_hold_balances["COINALPHA"])
+        self.assertEqual(Decimal(10000 - 267), self.exchange.get_available_balance("HBOT"))
+        self.assertEqual(Decimal(97), self.exchange.available_balances["COINALPHA"])
+
+        self.exchange.cancel(TRADING_PAIR, order_ids[0])
+        self.assertEqual(Decimal(89 + 88), self.exchange.on_hold_balances["HBOT"])
+        asyncio.get_event_loop().run_until_complete(self.exchange.cancel_all(1))
+        self.assertEqual({}, dict(self.exchange.on_hold_balances))
+        self.assertEqual(Decimal(10000), self.exchange.get_available_balance("HBOT"))
+
+    def test_cancel_single_order(self):
+        order_ids = self.place_grid(5)
+        self.exchange.cancel(TRADING_PAIR, order_ids[5])
+        self.exchange.cancel(TRADING_PAIR, "sell://COINALPHA-HBOT/unknown")
+
+        cancelled = [event.order_id for event in self.event_logger.event_log]
+        self.assertEqual([order_ids[5]], cancelled)
+        self.assertEqual(9, len(self.exchange.limit_orders))
+        self.assertNotIn(order_ids[5], [order.client_order_id for order in self.exchange.limit_orders])
+
+    def test_crossed_orders_filled_best_first(self):
+        order_ids = self.place_grid(3)
+        # The best ask drops to 88.5, crossing the bids at 90 and 89.
+        self.set_book([88, 87], [88.5, 103], 2)
+        self.clock.backtest_til(START_TIMESTAMP + 1)
+
+        self.assertEqual([order_ids[0], order_ids[2]], self.filled_order_ids())
+        self.assertEqual(Decimal(88), self.exchange.on_hold_balances["HBOT"])
+        self.assertEqual(Decimal(10000 - 90 - 89), self.exchange.get_balance("HBOT"))
+        self.assertEqual(Decimal(102), self.exchange.get_balance("COINALPHA"))
+
+    def test_trade_matched_to_crossed_orders(self):
+        order_ids = self.place_grid(3)
+        self.exchange.match_trade_to_limit_orders(
+            OrderBookTradeEvent(TRADING_PAIR, 1, TradeType.BUY, Decimal(111.5), Decimal(2)))
+        # Only the asks below the trade price are filled.
+        self.assertEqual([order_ids[1], order_ids[3]], self.filled_order_ids())
+        self.assertEqual(Decimal(1), self.exchange.on_hold_balances["COINALPHA"])
+
+    def test_next_wakeup_time(self):
+        self.clock.backtest_til(START_TIMESTAMP + 1)
+        self.assertTrue(math.isnan(self.exchange.next_wakeup_time(START_TIMESTAMP + 1)))
+        # New limit orders are matched against the order book on the next tick.
+        self.place_grid(1)
+        self.assertEqual(START_TIMESTAMP + 1, self.exchange.next_wakeup_time(START_TIMESTAMP + 1))
+        self.clock.backtest_til(START_TIMESTAMP + 2)
+        self.assertTrue(math.isnan(self.exchange.next_wakeup_time(START_TIMESTAMP + 2)))
+        self.exchange.buy(TRADING_PAIR, Decimal(1), OrderType.MARKET)
+        self.assertEqual(START_TIMESTAMP + 2 + PaperTradeExchange.TRADE_EXECUTION_DELAY,
+                         self.exchange.next_wakeup_time(START_TIMESTAMP + 2))
+
+
+class PaperTradeExchangeQueuePositionUnitTest(PaperTradeExchangeUnitTest):
+    # Crossing the book or trading through the limit orders' prices fills them just the same, so the tests above are
+    # run again with queue position fills.
+    queue_position_fill = True
+
+    def sell_trade(self, price: float, amount: float) -> OrderBookTradeEvent:
+        return OrderBookTradeEvent(TRADING_PAIR, 1, TradeType.SELL, Decimal(price), Decimal(amount))
+
+    def test_trades_at_price_consume_queue_ahead(self):
+        order_id = self.exchange.buy(TRADING_PAIR, Decimal(1), OrderType.LIMIT, Decimal(99))
+        self.assertEqual(10, self.exchange.queue_ahead[order_id])
+
+        self.exchange.match_trade_to_limit_orders(self.sell_trade(99, 6))
+        self.assertEqual(4, self.exchange.queue_ahead[order_id])
+        self.assertEqual([], self.filled_order_ids())
+
+        self.exchange.match_trade_to_limit_orders(self.sell_trade(99, 4))
+        self.assertEqual(0, self.exchange.queue_ahead[order_id])
+        self.assertEqual([], self.filled_order_ids())
+
+        self.exchange.match_trade_to_limit_orders(self.sell_trade(99, 0.5))
+        self.assertEqual([Decimal("0.5")], self.filled_amounts())
+        self.assertEqual({order_id: 0}, self.exchange.queue_ahead)
+        self.assertEqual(Decimal("49.5"), self.exchange.on_hold_balances["HBOT"])
+
+        self.exchange.match_trade_to_limit_orders(self.sell_trade(99, 2))
+        self.assertEqual([order_id, order_id], self.filled_order_ids())
+        self.assertEqual([Decimal("0.5"), Decimal("0.5")], self.filled_amounts())
+        self.assertEqual({}, self.exchange.queue_ahead)
+        self.assertEqual({}, dict(self.exchange.on_hold_balances))
+        self.assertEqual(Decimal(10000 - 99), self.exchange.get_balance("HBOT"))
+
+    def test_trade_volume_shared_between_orders(self):
+        order_ids = [self.exchange.buy(TRADING_PAIR, Decimal(1), OrderType.LIMIT, Decimal(99)),
+                     self.exchange.buy(TRADING_PAIR, Decimal(1), OrderType.LIMIT, Decimal(99))]
+        # The first order placed is filled first, and what it takes of the trade doesn't reach the second.
+        self.exchange.match_trade_to_limit_orders(self.sell_trade(99, 11))
+        self.assertEqual([order_ids[0]], self.filled_order_ids())
+        self.assertEqual({order_ids[1]: 0}, self.exchange.queue_ahead)
+
+        self.exchange.match_trade_to_limit_orders(self.sell_trade(99, 0.5))
+        self.assertEqual([order_ids[0], order_ids[1]], self.filled_order_ids())
+        self.assertEqual([Decimal(1), Decimal("0.5")], self.filled_amounts())
+
+    def test_trade_through_prices_fills_up_to_volume(self):
+        order_ids = self.place_grid(3)
+        self.exchange.match_trade_to_limit_orders(
+            OrderBookTradeEvent(TRADING_PAIR, 1, TradeType.BUY, Decimal(113), Decimal("1.5")))
+        self.assertEqual([order_ids[1], order_ids[3]], self.filled_order_ids())
+        self.assertEqual([Decimal(1), Decimal("0.5")], self.filled_amounts())
+        self.assertEqual(Decimal("1.5"), self.exchange.on_hold_balances["COINALPHA"])
+
+    def test_new_price_level_has_no_queue_ahead(self):
+        order_id = self.exchange.buy(TRADING_PAIR, Decimal(1), OrderType.LIMIT, Decimal("99.5"))
+        self.assertEqual(0, self.exchange.queue_ahead[order_id])
+        self.exchange.match_trade_to_limit_orders(self.sell_trade(99.5, 0.1))
+        self.assertEqual([order_id], self.filled_order_ids())
+
+    def test_trade_through_price_fills(self):
+        order_id = self.exchange.sell(TRADING_PAIR, Decimal(1), OrderType.LIMIT, Decimal(102))
+        self.exchange.match_trade_to_limit_orders(
+            OrderBookTradeEvent(TRADING_PAIR, 1, TradeType.BUY, Decimal("102.5"), Decimal("0.1")))
+        self.assertEqual([order_id], self.filled_order_ids())
+
+    def test_diffs_cap_queue_ahead(self):
+        order_id = self.exchange.buy(TRADING_PAIR, Decimal(1), OrderType.LIMIT, Decimal(98))
+        self.order_book.apply_diffs([OrderBookRow(98, 3, 2), OrderBookRow(97, 1, 2)], [], 2)
+        self.assertEqual(3, self.exchange.queue_ahead[order_id])
+        # Volume joining the level behind the order doesn't move it back.
+        self.order_book.apply_diffs([OrderBookRow(98, 20, 3)], [], 3)
+        self.assertEqual(3, self.exchange.queue_ahead[order_id])
+
+        self.exchange.match_trade_to_limit_orders(self.sell_trade(98, 2))
+        self.assertEqual([], self.filled_order_ids())
+        self.exchange.match_trade_to_limit_orders(self.sell_trade(98, 2))
+        self.assertEqual([order_id], self.filled_order_ids())
+
+    def test_touch_fills_once_queue_ahead_is_gone(self):
+        order_ids = [self.exchange.buy(TRADING_PAIR, Decimal(1), OrderType.LIMIT, Decimal(99)),
+                     self.exchange.buy(TRADING_PAIR, Decimal(1), OrderType.LIMIT, Decimal(98))]
+        # The best ask touches the buy at 99, but there's still volume ahead of it.
+        self.set_book([99, 98], [99, 101], 2)
+        self.clock.backtest_til(START_TIMESTAMP + 1)
+        self.assertEqual([], self.filled_order_ids())
+
+        # The 99 bids are gone, the buy at 99 is at the front of the queue.
+        self.set_book([98, 97], [99, 101], 3)
+        self.clock.backtest_til(START_TIMESTAMP + 2)
+        self.assertEqual([order_ids[0]], self.filled_order_ids())
+        self.assertEqual({order_ids[1]: 10}, self.exchange.queue_ahead)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+import asyncio
+import csv
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+from unittest.mock import patch
+
+from hummingbot.connector.markets_recorder import MarketsRecorder, TradeFillCsvWriter
+from hummingbot.core.event.events import (
+    BuyOrderCreatedEvent,
+    MarketEvent,
+    OrderCancelledEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+from hummingbot.model.market_state import MarketState
+from hummingbot.model.order import Order
+from hummingbot.model.order_status import OrderStatus
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_fill import TradeFill
+
+
+class MockMarket:
+    def __init__(self):
+        self.display_name = "mock_exchange"
+        self.tracking_states_reads = 0
+
+    @property
+    def tracking_states(self):
+        self.tracking_states_reads += 1
+        return {"orders": self.tracking_states_reads}
+
+    def add_trade_fills_from_market_recorder(self, current_trade_fills):
+        pass
+
+    def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
+        pass
+
+    def add_listener(self, event_tag, listener):
+        pass
+
+    def remove_listener(self, event_tag, listener):
+        pass
+
+
+class MarketsRecorderUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop = asyncio.get_event_loop()
+        self.db_dir = tempfile.TemporaryDirectory()
+        self.sql = SQLConnectionManager(SQLConnectionType.TRADE_FILLS,
+                                        db_path=os.path.join(self.db_dir.name, "trades.sqlite"))
+        self.market = MockMarket()
+        self.recorder = MarketsRecorder(self.sql, [self.market], "test_config.yml", "test_strategy")
+        self.recorder.start()
+
+    def tearDown(self):
+        self.recorder.stop()
+        self.db_dir.cleanup()
+
+    def create_order(self, order_id: str):
+        self.recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self.market,
+                                        BuyOrderCreatedEvent(1, OrderType.LIMIT, "A-B", Decimal(1), Decimal(2),
+                                                             order_id, f"E{order_id}"))
+
+    def test_writes_are_batched_until_flush(self):
+        for i in range(5):
+            self.create_order(f"OID{i}")
+        self.recorder._did_cancel_order(MarketEvent.OrderCancelled.value, self.market, OrderCancelledEvent(1, "OID0"))
+
+        self.assertEqual(6, self.recorder.queue_stats.queue_depth)
+        self.assertEqual(0, self.sql.get_shared_session().query(Order).count())
+
+        self.recorder.flush(wait=True)
+        stats = self.recorder.queue_stats
+        self.assertEqual(0, stats.queue_depth)
+        self.assertEqual(1, stats.batches_written)
+        self.assertEqual(1, stats.market_state_writes)
+        # Tracking states are read once per flush, not once per event.
+        self.assertEqual(1, self.market.tracking_states_reads)
+
+        orders = self.recorder.get_orders_for_config_and_market("test_config.yml", self.market)
+        self.assertEqual(5, len(orders))
+        self.assertEqual("OrderCancelled", [o for o in orders if o.id == "OID0"][0].last_status)
+        self.assertEqual({"orders": 1}, self.recorder.get_market_states("test_config.yml", self.market).saved_state)
+
+    def test_status_of_unrecorded_order_is_skipped(self):
+        self.recorder._did_cancel_order(MarketEvent.OrderCancelled.value, self.market, OrderCancelledEvent(1, "OID1"))
+        with self.assertLogs(MarketsRecorder.logger(), "WARNING") as logs:
+            self.recorder.flush(wait=True)
+
+        self.assertIn("Order OID1 is not recorded", logs.output[0])
+        self.assertEqual(0, self.sql.get_shared_session().query(OrderStatus).count())
+
+    def test_flush_timer(self):
+        self.create_order("OID1")
+        self.ev_loop.run_until_complete(asyncio.sleep(MarketsRecorder.WRITE_BEHIND_INTERVAL + 0.1))
+        self.recorder.flush(wait=True)
+        self.assertEqual(1, self.recorder.queue_stats.batches_written)
+        self.assertGreater(self.recorder.queue_stats.max_lag, 0)
+
+    @patch("hummingbot.connector.markets_recorder.MarketsRecorder.append_to_csv")
+    def test_stop_commits_pending_writes(self, append_to_csv_mock):
+        self.create_order("OID1")
+        self.recorder._did_fill_order(MarketEvent.OrderFilled.value, self.market,
+                                      OrderFilledEvent(1, "OID1", "A-B", TradeType.BUY, OrderType.LIMIT, Decimal(2),
+                                                       Decimal(1), TradeFee(Decimal(0)), "T1"))
+        self.recorder.stop()
+
+        session = self.sql.get_shared_session()
+        self.assertEqual("OrderFilled", session.query(Order).one().last_status)
+        self.assertEqual(1, session.query(TradeFill).count())
+        self.assertEqual(1, session.query(MarketState).count())
+        append_to_csv_mock.assert_called_once()
+
+    def test_synchronous_writes(self):
+        recorder = MarketsRecorder(self.sql, [self.market], "test_config.yml", "test_strategy",
+                                   write_behind_interval=0)
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self.market,
+                                   BuyOrderCreatedEvent(1, OrderType.LIMIT, "A-B", Decimal(1), Decimal(2), "OID1"))
+        self.assertEqual(0, recorder.queue_stats.queue_depth)
+        self.assertEqual(1, self.sql.get_shared_session().query(Order).count())
+        recorder.stop()
+
+
+class TradeFillCsvWriterUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.csv_dir = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.csv_dir.name, "trades_test_config.csv")
+
+    def tearDown(self):
+        self.csv_dir.cleanup()
+
+    @staticmethod
+    def trade_fill(trade_id: int) -> TradeFill:
+        return TradeFill(id=trade_id, config_file_path="test_config.yml", strategy="test_strategy",
+                         market="mock_exchange", symbol="A-B", base_asset="A", quote_asset="B", timestamp=1000,
+                         order_id="OID//1", trade_type="BUY", order_type="LIMIT", price=2.0, amount=1.0, leverage=1,
+                         trade_fee={}, exchange_trade_id=f"T{trade_id}", position="NILL")
+
+    def read_rows(self):
+        with open(self.csv_path, newline="") as fd:
+            return list(csv.reader(fd))
+
+    def test_append_rows(self):
+        csv_writer = TradeFillCsvWriter(self.csv_path)
+        csv_writer.write_trade(self.trade_fill(1))
+        csv_writer.write_trade(self.trade_fill(2))
+        csv_writer.close()
+
+        # Reopening an export with a matching header appends to it.
+        csv_writer = TradeFillCsvWriter(self.csv_path)
+        csv_writer.write_trade(self.trade_fill(3))
+        csv_writer.close()
+
+        rows = self.read_rows()
+        self.assertEqual(list(TradeFillCsvWriter.FIELD_NAMES), rows[0])
+        self.assertEqual(["1", "2", "3"], [row[0] for row in rows[1:]])
+        self.assertEqual("n/a", rows[1][-1])
+        self.assertEqual("A-B", rows[1][TradeFillCsvWriter.FIELD_NAMES.index("symbol")])
+
+    def test_rotate_on_header_mismatch(self):
+        with open(self.csv_path, "w") as fd:
+            fd.write("id,price\n1,2.0\n")
+
+        csv_writer = TradeFillCsvWriter(self.csv_path)
+        csv_writer.write_trade(self.trade_fill(1))
+        csv_writer.close()
+
+        self.assertEqual(2, len(self.read_rows()))
+        self.assertEqual(2, len(os.listdir(self.csv_dir.name)))
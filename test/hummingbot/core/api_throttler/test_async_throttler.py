@@ -0,0 +1,130 @@
+import asyncio
+import time
+import unittest
+from typing import List
+
+from hummingbot.core.api_throttler.async_throttler import (
+    AsyncThrottler,
+    TokenBucket,
+)
+from hummingbot.core.api_throttler.data_types import (
+    LinkedLimitWeightPair,
+    RateLimit,
+    RequestPriority,
+)
+
+POOL = "pool"
+ORDER_PATH_URL = "/order"
+CANCEL_PATH_URL = "/cancel"
+TICKER_PATH_URL = "/ticker"
+
+RATE_LIMITS = [
+    RateLimit(4, 1.0, POOL),
+    RateLimit(2, 1.0, ORDER_PATH_URL, linked_limits=[LinkedLimitWeightPair(POOL, 1)]),
+    RateLimit(10, 1.0, CANCEL_PATH_URL, linked_limits=[LinkedLimitWeightPair(POOL, 2)]),
+    RateLimit(1, 0.2, TICKER_PATH_URL),
+]
+
+
+class AsyncThrottlerUnitTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.throttler = AsyncThrottler(RATE_LIMITS, period_safety_margin=0)
+        self.completed: List[str] = []
+
+    def run_async(self, coroutine, timeout: float = 1.0):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    async def request(self, path_url: str, name: str = "", priority: RequestPriority = RequestPriority.NORMAL):
+        async with self.throttler.execute_task(path_url, priority):
+            self.completed.append(name or path_url)
+
+    def test_token_bucket(self):
+        bucket = TokenBucket(RateLimit(5, 1.0), period_safety_margin=0.5)
+        self.assertEqual(5, bucket.capacity)
+        self.assertIsNone(bucket.next_return_time)
+        bucket.take(10, 2)
+        bucket.take(11, 3)
+        self.assertEqual(0, bucket.capacity)
+        self.assertEqual(11.5, bucket.next_return_time)
+        bucket.return_tokens(11.4)
+        self.assertEqual(0, bucket.capacity)
+        bucket.return_tokens(11.5)
+        self.assertEqual(2, bucket.capacity)
+        self.assertEqual(12.5, bucket.next_return_time)
+
+    def test_invalid_rate_limits(self):
+        with self.assertRaises(ValueError):
+            AsyncThrottler([RateLimit(1, 1.0, ORDER_PATH_URL, linked_limits=[LinkedLimitWeightPair(POOL)])])
+        with self.assertRaises(ValueError):
+            AsyncThrottler([RateLimit(1, 1.0, ORDER_PATH_URL, weight=2)])
+
+    def test_requests_within_limit_are_not_delayed(self):
+        self.run_async(asyncio.gather(self.request(ORDER_PATH_URL), self.request(ORDER_PATH_URL)), timeout=0.1)
+        self.assertEqual(2, len(self.completed))
+
+    def test_requests_above_limit_wait(self):
+        with self.assertRaises(asyncio.TimeoutError):
+            self.run_async(asyncio.gather(*[self.request(ORDER_PATH_URL) for _ in range(3)]), timeout=0.5)
+        self.assertEqual(2, len(self.completed))
+        self.assertEqual(0, self.throttler.waiting_requests)
+
+    def test_waiters_woken_when_tokens_are_returned(self):
+        start = time.time()
+        self.run_async(asyncio.gather(*[self.request(TICKER_PATH_URL) for _ in range(3)]))
+        elapsed = time.time() - start
+        # The third request waits for the first two 0.2 second intervals.
+        self.assertGreaterEqual(elapsed, 0.4)
+        self.assertLess(elapsed, 0.6)
+        self.assertEqual(3, len(self.completed))
+
+    def test_full_bucket_does_not_block_other_limits(self):
+        tasks = []
+
+        async def requests():
+            for i in range(3):
+                tasks.append(self.ev_loop.create_task(self.request(ORDER_PATH_URL, f"order {i}")))
+            await asyncio.sleep(0)
+            # The pool has capacity left, for one cancel.
+            await self.request(CANCEL_PATH_URL, "cancel")
+            await self.request(TICKER_PATH_URL, "ticker")
+
+        self.run_async(requests(), timeout=0.5)
+        self.assertEqual(["order 0", "order 1", "cancel", "ticker"], self.completed)
+        # order 2 waits on the order limit, and the pool is full now too.
+        self.assertEqual(1, self.throttler.waiting_requests)
+        with self.assertRaises(asyncio.TimeoutError):
+            self.run_async(self.request(CANCEL_PATH_URL), timeout=0.2)
+        tasks[2].cancel()
+
+    def test_priorities(self):
+        async def requests():
+            await self.request(TICKER_PATH_URL, "first")
+            tasks = [self.ev_loop.create_task(self.request(TICKER_PATH_URL, "low", RequestPriority.LOW)),
+                     self.ev_loop.create_task(self.request(TICKER_PATH_URL, "normal"))]
+            await asyncio.sleep(0)
+            await self.request(TICKER_PATH_URL, "high", RequestPriority.HIGH)
+            await asyncio.gather(*tasks)
+
+        self.run_async(requests())
+        self.assertEqual(["first", "high", "normal", "low"], self.completed)
+
+    def test_cancelled_waiter_lets_others_through(self):
+        async def requests():
+            await self.request(POOL, "first")
+            await self.request(POOL, "second")
+            await self.request(POOL, "third")
+            # Needs 2 of the pool's tokens, which are not returned before the timeout.
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(self.request(CANCEL_PATH_URL, "cancel"), timeout=0.1)
+            await self.request(POOL, "fourth")
+
+        self.run_async(requests())
+        self.assertEqual(["first", "second", "third", "fourth"], self.completed)
+        self.assertEqual(0, self.throttler.waiting_requests)
@@ -3,6 +3,8 @@
 import logging
 import unittest
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent
 import numpy as np
 
 
@@ -50,6 +52,86 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_depth_queries(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 2, 1], [3, 3, 1]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 2, 1], [6, 3, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        result = order_book.get_price_for_volume(True, 2)
+        self.assertEqual(5, result.result_price)
+        self.assertEqual(2, result.result_volume)
+        result = order_book.get_price_for_volume(False, 4)
+        self.assertEqual(2, result.result_price)
+        self.assertEqual(4, result.result_volume)
+        result = order_book.get_price_for_volume(True, 100)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(6, result.result_volume)
+
+        result = order_book.get_vwap_for_volume(True, 2)
+        self.assertAlmostEqual(4.5, result.result_price)
+        self.assertEqual(2, result.result_volume)
+        result = order_book.get_vwap_for_volume(False, 100)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(6, result.result_volume)
+
+        result = order_book.get_price_for_quote_volume(True, 14)
+        self.assertEqual(5, result.result_price)
+        self.assertEqual(14, result.result_volume)
+        result = order_book.get_price_for_quote_volume(False, 9)
+        self.assertEqual(3, result.result_price)
+        self.assertEqual(9, result.result_volume)
+
+        result = order_book.get_quote_volume_for_base_amount(True, 2)
+        self.assertEqual(9, result.result_volume)
+        result = order_book.get_quote_volume_for_base_amount(False, 100)
+        self.assertEqual(14, result.result_volume)
+
+        result = order_book.get_volume_for_price(True, 5.5)
+        self.assertEqual(5, result.result_price)
+        self.assertEqual(3, result.result_volume)
+        result = order_book.get_volume_for_price(False, 1.5)
+        self.assertEqual(2, result.result_price)
+        self.assertEqual(5, result.result_volume)
+        result = order_book.get_volume_for_price(True, 3)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(0, result.result_volume)
+
+        result = order_book.get_quote_volume_for_price(True, 6)
+        self.assertEqual(6, result.result_price)
+        self.assertEqual(32, result.result_volume)
+
+    def test_depth_queries_after_diffs(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 2, 1], [3, 3, 1]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 2, 1], [6, 3, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        self.assertEqual(5, order_book.get_price_for_volume(True, 2).result_price)
+
+        # Remove the best ask and add a deeper level, the index must be rebuilt on the next query.
+        order_book.apply_numpy_diffs(np.array([[2.5, 5, 2]], dtype=np.float64),
+                                     np.array([[4, 0, 2], [7, 4, 2]], dtype=np.float64))
+        self.assertEqual(5, order_book.get_price_for_volume(True, 2).result_price)
+        self.assertEqual(6, order_book.get_price_for_volume(True, 3).result_price)
+        self.assertEqual(7, order_book.get_price_for_volume(True, 9).result_price)
+        self.assertEqual(8, order_book.get_volume_for_price(False, 2.5).result_volume)
+        self.assertEqual(2.5, order_book.get_price_for_volume(False, 4).result_price)
+
+    def test_diff_event(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 1], [2, 2, 1]], dtype=np.float64),
+                                        np.array([[4, 1, 1], [5, 2, 1]], dtype=np.float64))
+        event_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.DiffEvent, event_logger)
+        order_book.apply_numpy_diffs(np.array([[2, 0, 2], [1.5, 3, 2]], dtype=np.float64),
+                                     np.array([[4, 2, 2]], dtype=np.float64))
+
+        self.assertEqual(1, len(event_logger.event_log))
+        diff_event = event_logger.event_log[0]
+        self.assertEqual(2, diff_event.update_id)
+        self.assertEqual([(2, 0), (1.5, 3)], diff_event.bids)
+        self.assertEqual([(4, 2)], diff_event.asks)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
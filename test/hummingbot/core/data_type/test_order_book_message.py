@@ -0,0 +1,62 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    NumpyOrderBookMessage,
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+class NumpyOrderBookMessageUnitTest(unittest.TestCase):
+    def _message(self, message_type: OrderBookMessageType, update_id: int, bids, asks) -> NumpyOrderBookMessage:
+        return NumpyOrderBookMessage(message_type, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": update_id,
+            "bids": bids,
+            "asks": asks
+        }, timestamp=1.0)
+
+    def test_entries_parsed_into_arrays(self):
+        message = self._message(OrderBookMessageType.DIFF, 5, [["10.5", "1.25"], ["10", "2", "extra"]], [])
+        self.assertEqual(np.float64, message.bids_array.dtype)
+        self.assertTrue(message.bids_array.flags["C_CONTIGUOUS"])
+        np.testing.assert_array_equal(np.array([[10.5, 1.25, 5], [10, 2, 5]]), message.bids_array)
+        self.assertEqual((0, 3), message.asks_array.shape)
+        self.assertEqual([OrderBookRow(10.5, 1.25, 5), OrderBookRow(10.0, 2.0, 5)], message.bids)
+        self.assertEqual(5, message.update_id)
+
+    def test_trade_message_content_untouched(self):
+        content = {"trading_pair": "COINALPHA-HBOT", "trade_id": 1, "price": "1", "amount": "2", "trade_type": 1.0}
+        message = NumpyOrderBookMessage(OrderBookMessageType.TRADE, content, timestamp=1.0)
+        self.assertEqual(content, message.content)
+
+    def test_messages_applied_from_arrays(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot_message(self._message(OrderBookMessageType.SNAPSHOT, 1,
+                                                        [["9", "1"], ["8", "1"]], [["11", "1"], ["12", "1"]]))
+        order_book.apply_diff_message(self._message(OrderBookMessageType.DIFF, 2, [["9", "0"]], [["11", "3"]]))
+        order_book.apply_diff_message(self._message(OrderBookMessageType.DIFF, 3, [], []))
+
+        self.assertEqual([(8.0, 1.0)], [(row.price, row.amount) for row in order_book.bid_entries()])
+        self.assertEqual([(11.0, 3.0), (12.0, 1.0)], [(row.price, row.amount) for row in order_book.ask_entries()])
+        self.assertEqual(1, order_book.snapshot_uid)
+        self.assertEqual(2, order_book.last_diff_uid)
+
+    def test_restore_from_snapshot_and_numpy_diffs(self):
+        order_book = OrderBook()
+        snapshot = self._message(OrderBookMessageType.SNAPSHOT, 2, [["9", "1"]], [["11", "1"]])
+        diffs = [
+            self._message(OrderBookMessageType.DIFF, 1, [["9", "5"]], []),
+            self._message(OrderBookMessageType.DIFF, 3, [["8", "2"]], []),
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "COINALPHA-HBOT", "update_id": 4, "bids": [], "asks": [["12", "1"]]
+            }, timestamp=1.0),
+        ]
+        order_book.restore_from_snapshot_and_diffs(snapshot, diffs)
+
+        self.assertEqual([(9.0, 1.0), (8.0, 2.0)], [(row.price, row.amount) for row in order_book.bid_entries()])
+        self.assertEqual([(11.0, 1.0), (12.0, 1.0)], [(row.price, row.amount) for row in order_book.ask_entries()])
@@ -0,0 +1,246 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    NumpyOrderBookMessage,
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_message_capture import (
+    OrderBookMessageCapture,
+    OrderBookMessageCaptureReader,
+    capture_segment_name,
+)
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.replay_order_book_tracker_data_source import ReplayOrderBookTrackerDataSource
+
+TRADING_PAIR = "COINALPHA-HBOT"
+CAPTURE_START = 1609459200.0
+
+
+def diff_message(update_id: int, bids, asks, trading_pair: str = TRADING_PAIR) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.DIFF, {
+        "trading_pair": trading_pair,
+        "update_id": update_id,
+        "bids": bids,
+        "asks": asks,
+    }, timestamp=float(update_id))
+
+
+def snapshot_message(update_id: int, bids, asks) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+        "trading_pair": TRADING_PAIR,
+        "update_id": update_id,
+        "bids": bids,
+        "asks": asks,
+    }, timestamp=float(update_id))
+
+
+def trade_message(trade_id, price: float, amount: float) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.TRADE, {
+        "trading_pair": TRADING_PAIR,
+        "trade_type": 2.0,
+        "trade_id": trade_id,
+        "update_id": 7,
+        "price": str(price),
+        "amount": str(amount),
+    }, timestamp=7.5)
+
+
+class OrderBookMessageCaptureUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.capture_dir = os.path.join(self.temp_dir.name, "binance")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def capture(self, messages, compress: bool = True, interval: float = 1.0):
+        capture = OrderBookMessageCapture(self.capture_dir, compress=compress)
+        for i, message in enumerate(messages):
+            capture.record(message, capture_time=CAPTURE_START + i * interval)
+        capture.stop()
+        return list(OrderBookMessageCaptureReader(self.capture_dir))
+
+    def assert_round_trip(self, compress: bool):
+        messages = [
+            snapshot_message(1, [["9", "1"], ["8", "2"]], [["11", "1.5"]]),
+            diff_message(2, [[9.5, 3]], []),
+            NumpyOrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": TRADING_PAIR,
+                "update_id": 3,
+                "first_update_id": 3,
+                "bids": [],
+                "asks": [[11, 0], [12, 4]],
+            }, timestamp=3.0),
+            trade_message(42, 9.5, 0.25),
+            trade_message("a1b2", 11, 1),
+        ]
+        captured = self.capture(messages, compress)
+        self.assertEqual([CAPTURE_START + i for i in range(5)], [c.capture_time for c in captured])
+
+        snapshot = captured[0].message
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, snapshot.type)
+        self.assertEqual(1, snapshot.update_id)
+        self.assertEqual([(9.0, 1.0, 1), (8.0, 2.0, 1)], [tuple(row) for row in snapshot.bids])
+        self.assertEqual([(11.0, 1.5, 1)], [tuple(row) for row in snapshot.asks])
+        self.assertEqual([(9.5, 3.0, 2)], [tuple(row) for row in captured[1].message.bids])
+        self.assertEqual([], captured[1].message.asks)
+        self.assertEqual(3, captured[2].message.first_update_id)
+        self.assertEqual([(11.0, 0.0, 3), (12.0, 4.0, 3)], [tuple(row) for row in captured[2].message.asks])
+
+        trade = captured[3].message
+        self.assertEqual(OrderBookMessageType.TRADE, trade.type)
+        self.assertEqual(7.5, trade.timestamp)
+        self.assertEqual({"trading_pair": TRADING_PAIR, "trade_type": 2.0, "trade_id": 42, "update_id": 7,
+                          "price": 9.5, "amount": 0.25}, trade.content)
+        self.assertEqual("a1b2", captured[4].message.trade_id)
+
+    def test_round_trip(self):
+        self.assert_round_trip(compress=False)
+
+    def test_round_trip_compressed(self):
+        self.assert_round_trip(compress=True)
+
+    def test_hourly_segments(self):
+        captured = self.capture([diff_message(update_id, [[9, update_id]], []) for update_id in range(1, 6)],
+                                interval=1800)
+        self.assertEqual([capture_segment_name(CAPTURE_START + hour * 3600) for hour in range(3)],
+                         sorted(os.listdir(self.capture_dir)))
+        self.assertEqual([1, 2, 3, 4, 5], [c.message.update_id for c in captured])
+
+    def test_append_to_existing_segment(self):
+        self.capture([diff_message(1, [[9, 1]], [])], compress=True)
+        # A capture restarted within the same hour keeps on using the segment's compression.
+        captured = self.capture([diff_message(2, [[9, 2]], [])], compress=False)
+        self.assertEqual([1, 2], [c.message.update_id for c in captured])
+
+    def test_truncated_record_ignored(self):
+        self.capture([diff_message(1, [[9, 1]], []), diff_message(2, [[9, 2]], [])], compress=False)
+        segment_path = os.path.join(self.capture_dir, capture_segment_name(CAPTURE_START))
+        with open(segment_path, "r+b") as fd:
+            fd.truncate(os.path.getsize(segment_path) - 3)
+        self.assertEqual([1], [c.message.update_id for c in OrderBookMessageCaptureReader(segment_path)])
+
+    def test_truncated_record_cut_off_before_appending(self):
+        self.capture([diff_message(1, [[9, 1]], []), diff_message(2, [[9, 2]], [])], compress=True)
+        segment_path = os.path.join(self.capture_dir, capture_segment_name(CAPTURE_START))
+        with open(segment_path, "r+b") as fd:
+            fd.truncate(os.path.getsize(segment_path) - 3)
+        captured = self.capture([diff_message(3, [[9, 3]], []), diff_message(4, [[9, 4]], [])])
+        self.assertEqual([1, 3, 4], [c.message.update_id for c in captured])
+
+
+class ReplayOrderBookTrackerDataSourceUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        capture = OrderBookMessageCapture(self.temp_dir.name)
+        messages = [
+            diff_message(1, [[9, 5]], [], trading_pair="OTHER-HBOT"),
+            snapshot_message(1, [[9, 1], [8, 1]], [[11, 1], [12, 1]]),
+            diff_message(2, [[9, 3]], [[11, 0]]),
+            trade_message(1, 10.5, 1),
+            diff_message(3, [[10, 2]], []),
+        ]
+        for i, message in enumerate(messages):
+            capture.record(message, capture_time=CAPTURE_START + i * 0.05)
+        capture.stop()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def replay(self, speed):
+        data_source = ReplayOrderBookTrackerDataSource(self.temp_dir.name, [TRADING_PAIR], speed=speed)
+        outputs = {message_type: asyncio.Queue() for message_type in OrderBookMessageType}
+
+        async def run():
+            tasks = [
+                asyncio.ensure_future(data_source.listen_for_order_book_diffs(
+                    self.ev_loop, outputs[OrderBookMessageType.DIFF])),
+                asyncio.ensure_future(data_source.listen_for_order_book_snapshots(
+                    self.ev_loop, outputs[OrderBookMessageType.SNAPSHOT])),
+                asyncio.ensure_future(data_source.listen_for_trades(
+                    self.ev_loop, outputs[OrderBookMessageType.TRADE])),
+            ]
+            await asyncio.wait_for(data_source.replay_finished.wait(), 5)
+            await asyncio.gather(*tasks)
+
+        self.ev_loop.run_until_complete(run())
+        return data_source, {message_type: [queue.get_nowait() for _ in range(queue.qsize())]
+                             for message_type, queue in outputs.items()}
+
+    def test_replay(self):
+        data_source, outputs = self.replay(speed=None)
+        self.assertEqual(4, data_source.messages_replayed)
+        self.assertEqual([2, 3], [message.update_id for message in outputs[OrderBookMessageType.DIFF]])
+        self.assertEqual([1], [message.update_id for message in outputs[OrderBookMessageType.SNAPSHOT]])
+        self.assertEqual([1], [message.trade_id for message in outputs[OrderBookMessageType.TRADE]])
+        self.assertEqual({TRADING_PAIR: 10.5},
+                         self.ev_loop.run_until_complete(data_source.get_last_traded_prices([TRADING_PAIR])))
+
+    def test_replay_keeps_capture_pace(self):
+        start = self.ev_loop.time()
+        self.replay(speed=2)
+        # The trading pair's messages were captured over 0.15s.
+        self.assertGreaterEqual(self.ev_loop.time() - start, 0.07)
+
+    def test_get_new_order_book(self):
+        data_source = ReplayOrderBookTrackerDataSource(self.temp_dir.name, [TRADING_PAIR], speed=None)
+        order_book: OrderBook = self.ev_loop.run_until_complete(data_source.get_new_order_book(TRADING_PAIR))
+        self.assertEqual(1, order_book.snapshot_uid)
+        self.assertEqual(11, order_book.get_price(True))
+        self.assertEqual(9, order_book.get_price(False))
+        with self.assertRaises(ValueError):
+            self.ev_loop.run_until_complete(data_source.get_new_order_book("OTHER-HBOT"))
+
+    def test_tracker_replay(self):
+        data_source = ReplayOrderBookTrackerDataSource(self.temp_dir.name, [TRADING_PAIR], speed=None)
+        tracker = OrderBookTracker(data_source, [TRADING_PAIR])
+
+        async def run():
+            tracker.start()
+            await asyncio.wait_for(data_source.replay_finished.wait(), 5)
+            await asyncio.wait_for(tracker._order_books_initialized.wait(), 5)
+            for _ in range(10):
+                await asyncio.sleep(0)
+            tracker.stop()
+
+        self.ev_loop.run_until_complete(run())
+        order_book: OrderBook = tracker.order_books[TRADING_PAIR]
+        self.assertEqual(3, order_book.last_diff_uid)
+        self.assertEqual(12, order_book.get_price(True))
+        self.assertEqual(10, order_book.get_price(False))
+        self.assertEqual(10.5, order_book.last_trade_price)
+
+    def test_tracker_capture(self):
+        capture_dir = os.path.join(self.temp_dir.name, "recaptured")
+        data_source = ReplayOrderBookTrackerDataSource(self.temp_dir.name, [TRADING_PAIR], speed=None)
+        tracker = OrderBookTracker(data_source, [TRADING_PAIR])
+        tracker.message_capture = OrderBookMessageCapture(capture_dir)
+
+        async def run():
+            tracker.start()
+            await asyncio.wait_for(data_source.replay_finished.wait(), 5)
+            await asyncio.wait_for(tracker._order_books_initialized.wait(), 5)
+            for _ in range(10):
+                await asyncio.sleep(0)
+            tracker.stop()
+
+        self.ev_loop.run_until_complete(run())
+        captured = [(c.message.type, c.message.update_id) for c in OrderBookMessageCaptureReader(capture_dir)]
+        # The order book initialized by get_new_order_book() is captured as a snapshot too.
+        self.assertEqual(2, captured.count((OrderBookMessageType.SNAPSHOT, 1)))
+        self.assertEqual([(OrderBookMessageType.DIFF, 2), (OrderBookMessageType.DIFF, 3)],
+                         [c for c in captured if c[0] is OrderBookMessageType.DIFF])
+        self.assertEqual(1, len([c for c in captured if c[0] is OrderBookMessageType.TRADE]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import asyncio
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+class OrderBookTrackerUnitTest(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.tracker = OrderBookTracker(data_source=None, trading_pairs=[self.trading_pair])
+        self.order_book = OrderBook()
+        self.order_book.apply_numpy_snapshot(np.array([[9, 1, 1], [8, 1, 1]], dtype=np.float64),
+                                             np.array([[11, 1, 1], [12, 1, 1]], dtype=np.float64))
+        self.tracker._order_books[self.trading_pair] = self.order_book
+        self.tracker._tracking_message_queues[self.trading_pair] = asyncio.Queue()
+
+    def _diff_message(self, update_id: int, bids, asks) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pair,
+            "update_id": update_id,
+            "bids": bids,
+            "asks": asks
+        }, timestamp=float(update_id))
+
+    def _run_tracking(self, messages):
+        queue: asyncio.Queue = self.tracker._tracking_message_queues[self.trading_pair]
+        for message in messages:
+            queue.put_nowait(message)
+
+        async def track():
+            task = asyncio.ensure_future(self.tracker._track_single_book(self.trading_pair))
+            while not queue.empty():
+                await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            task.cancel()
+
+        self.ev_loop.run_until_complete(track())
+
+    def test_merge_diff_messages_newest_wins(self):
+        bids, asks, update_id = OrderBookTracker._merge_diff_messages([
+            self._diff_message(2, [[9, 5]], [[11, 5]]),
+            self._diff_message(3, [[9, 0], [7, 1]], []),
+        ])
+        self.assertEqual(3, update_id)
+        self.assertEqual({9.0: 0.0, 7.0: 1.0}, {row.price: row.amount for row in bids})
+        self.assertEqual({11.0: 5.0}, {row.price: row.amount for row in asks})
+
+    def test_track_single_book_coalesces_queued_diffs(self):
+        self.tracker.COALESCE_DIFF_MESSAGES = True
+        self._run_tracking([
+            self._diff_message(2, [[9, 5]], [[11, 5]]),
+            self._diff_message(3, [[9, 0], [7, 1]], []),
+            self._diff_message(4, [], [[11, 2]]),
+        ])
+
+        bids = [(row.price, row.amount) for row in self.order_book.bid_entries()]
+        asks = [(row.price, row.amount) for row in self.order_book.ask_entries()]
+        self.assertEqual([(8.0, 1.0), (7.0, 1.0)], bids)
+        self.assertEqual([(11.0, 2.0), (12.0, 1.0)], asks)
+        self.assertEqual(4, self.order_book.last_diff_uid)
+
+        stats = self.tracker.diff_queue_stats[self.trading_pair]
+        self.assertEqual(3, stats.messages_applied)
+        self.assertEqual(1, stats.batches_applied)
+        self.assertEqual(3.0, stats.coalescing_ratio)
+        self.assertEqual(3, stats.max_queue_depth)
+        self.assertEqual(3, len(self.tracker._past_diffs_windows[self.trading_pair]))
+
+    def test_track_single_book_without_coalescing(self):
+        self._run_tracking([
+            self._diff_message(2, [[9, 5]], []),
+            self._diff_message(3, [[9, 0]], []),
+        ])
+
+        bids = [(row.price, row.amount) for row in self.order_book.bid_entries()]
+        self.assertEqual([(8.0, 1.0)], bids)
+        stats = self.tracker.diff_queue_stats[self.trading_pair]
+        self.assertEqual(2, stats.batches_applied)
+        self.assertEqual(1.0, stats.coalescing_ratio)
+
+    def test_snapshot_after_diffs_is_applied_in_order(self):
+        self.tracker.COALESCE_DIFF_MESSAGES = True
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": self.trading_pair,
+            "update_id": 5,
+            "bids": [[5, 1]],
+            "asks": [[6, 1]]
+        }, timestamp=5.0)
+        self._run_tracking([
+            self._diff_message(2, [[9, 5]], []),
+            snapshot,
+            self._diff_message(6, [[4, 1]], []),
+        ])
+
+        bids = [(row.price, row.amount) for row in self.order_book.bid_entries()]
+        self.assertEqual([(5.0, 1.0), (4.0, 1.0)], bids)
+        self.assertEqual(5, self.order_book.snapshot_uid)
@@ -0,0 +1,63 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.tick_order_book import TickOrderBook
+
+
+class TickOrderBookUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.order_book = TickOrderBook(price_increment=0.01)
+        self.order_book.apply_numpy_snapshot(np.array([[0.99, 1, 1], [0.98, 2, 1], [0.97, 3, 1]], dtype=np.float64),
+                                             np.array([[1.01, 1, 1], [1.02, 2, 1], [1.03, 3, 1]], dtype=np.float64))
+
+    def test_snapshot(self):
+        self.assertEqual([0.99, 0.98, 0.97], [row.price for row in self.order_book.bid_entries()])
+        self.assertEqual([1.01, 1.02, 1.03], [row.price for row in self.order_book.ask_entries()])
+        self.assertEqual(0.99, self.order_book.get_price(False))
+        self.assertEqual(1.01, self.order_book.get_price(True))
+        self.assertEqual(1, self.order_book.snapshot_uid)
+
+    def test_diffs_match_levels_exactly(self):
+        # 0.1 + 0.2 is not bit-identical to 0.3, but they are the same tick.
+        self.order_book.apply_numpy_snapshot(np.array([[0.3, 1, 1]], dtype=np.float64),
+                                             np.array([[0.5, 1, 1]], dtype=np.float64))
+        self.order_book.apply_numpy_diffs(np.array([[0.1 + 0.2, 0, 2]], dtype=np.float64),
+                                          np.empty((0, 3), dtype=np.float64))
+        self.assertEqual([], list(self.order_book.bid_entries()))
+        self.assertEqual(2, self.order_book.last_diff_uid)
+
+    def test_diffs_insert_update_and_delete(self):
+        self.order_book.apply_numpy_diffs(np.array([[0.98, 5, 2], [0.99, 0, 2], [0.97, 4, 2]], dtype=np.float64),
+                                          np.array([[1.04, 1, 2]], dtype=np.float64))
+        self.assertEqual([OrderBookRow(0.98, 5, 2), OrderBookRow(0.97, 4, 2)], list(self.order_book.bid_entries()))
+        self.assertEqual([1.01, 1.02, 1.03, 1.04], [row.price for row in self.order_book.ask_entries()])
+        self.assertEqual(0.98, self.order_book.get_price(False))
+
+    def test_truncate_overlap_entries(self):
+        self.order_book.apply_numpy_diffs(np.array([[1.02, 1, 2]], dtype=np.float64),
+                                          np.empty((0, 3), dtype=np.float64))
+        self.assertEqual(1.02, self.order_book.get_price(False))
+        self.assertEqual(1.03, self.order_book.get_price(True))
+
+    def test_depth_queries(self):
+        self.assertEqual(1.02, self.order_book.get_price_for_volume(True, 2).result_price)
+        self.assertEqual(3, self.order_book.get_volume_for_price(False, 0.98).result_volume)
+
+    def test_set_price_increment(self):
+        order_book = TickOrderBook()
+        order_book.apply_numpy_snapshot(np.array([[1.0, 1, 1], [0.98, 2, 1], [0.96, 3, 1]], dtype=np.float64),
+                                        np.array([[1.02, 1, 1]], dtype=np.float64))
+        order_book.set_price_increment(0.02)
+        self.assertEqual(0.02, order_book.price_increment)
+        self.assertEqual([1.0, 0.98, 0.96], [row.price for row in order_book.bid_entries()])
+        self.assertEqual(1.0, order_book.get_price(False))
+
+        # Diffs given at the new increment match the re-keyed levels.
+        order_book.apply_numpy_diffs(np.array([[0.98, 0, 2]], dtype=np.float64), np.empty((0, 3), dtype=np.float64))
+        self.assertEqual([1.0, 0.96], [row.price for row in order_book.bid_entries()])
+
+    def test_invalid_price_increment(self):
+        with self.assertRaises(ValueError):
+            TickOrderBook(price_increment=0)
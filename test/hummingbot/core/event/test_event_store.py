@@ -0,0 +1,74 @@
+import unittest
+from decimal import Decimal
+
+from hummingbot.core.event.event_store import EventStore
+from hummingbot.core.event.events import (
+    OrderCancelledEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+
+
+def fill(timestamp: float, trade_type: TradeType, price: str, amount: str) -> OrderFilledEvent:
+    return OrderFilledEvent(timestamp, f"OID{timestamp}", "BTC-USDT", trade_type, OrderType.LIMIT, Decimal(price),
+                            Decimal(amount), TradeFee(Decimal(0)))
+
+
+def scan_balances(events, starting_timestamp=0):
+    balances = {}
+    for event in events:
+        if event.timestamp <= starting_timestamp:
+            continue
+        sign = 1 if event.trade_type is TradeType.BUY else -1
+        balances["BTC"] = balances.get("BTC", Decimal(0)) + sign * event.amount
+        balances["USDT"] = balances.get("USDT", Decimal(0)) - sign * event.price * event.amount
+    return balances
+
+
+class EventStoreUnitTest(unittest.TestCase):
+    def test_retention_and_index(self):
+        store = EventStore(max_events=3)
+        for i in range(5):
+            store(OrderCancelledEvent(i, f"OID{i}"))
+        store(fill(5, TradeType.BUY, "100", "1"))
+
+        self.assertEqual([3, 4, 5], [event.timestamp for event in store.event_log])
+        self.assertEqual([2, 3, 4], [event.timestamp for event in store.events_of_type(OrderCancelledEvent)])
+        self.assertEqual([5], [event.timestamp for event in store.events_of_type(OrderFilledEvent)])
+
+    def test_order_filled_balances(self):
+        store = EventStore()
+        fills = [fill(i, TradeType.BUY, "100", "1") for i in range(1, 20)]
+        for event in fills[:10]:
+            store(event)
+
+        self.assertEqual(scan_balances(fills[:10]), store.order_filled_balances())
+        self.assertEqual(scan_balances(fills[:10], 4), store.order_filled_balances(4))
+        for event in fills[10:]:
+            store(event)
+        # Queries don't depend on the timestamps queried before them.
+        self.assertEqual({"BTC": Decimal(7), "USDT": Decimal(-700)}, store.order_filled_balances(12))
+        self.assertEqual({"BTC": Decimal(11), "USDT": Decimal(-1100)}, store.order_filled_balances(8))
+        self.assertEqual({"BTC": Decimal(7), "USDT": Decimal(-700)}, store.order_filled_balances(12))
+        self.assertEqual(scan_balances(fills), store.order_filled_balances())
+
+    def test_order_filled_balances_out_of_order(self):
+        store = EventStore()
+        fills = [fill(i, TradeType.BUY if i % 3 else TradeType.SELL, str(100 + i), "0.5") for i in range(1, 10)]
+        for event in fills[::2] + fills[1::2]:
+            store(event)
+
+        for starting_timestamp in (7, 2, 5, 0):
+            self.assertEqual(scan_balances(fills, starting_timestamp), store.order_filled_balances(starting_timestamp))
+
+    def test_order_filled_balances_are_bounded(self):
+        store = EventStore(max_events=5)
+        fills = [fill(i, TradeType.BUY, "100", "1") for i in range(1, 21)]
+        for event in fills:
+            store(event)
+
+        # The running totals cover all fills, even the ones no longer retained.
+        self.assertEqual(scan_balances(fills), store.order_filled_balances())
+        self.assertEqual(scan_balances(fills, 17), store.order_filled_balances(17))
@@ -6,7 +6,10 @@ import asyncio
 
 from yarl import URL
 
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import (
+    find_rate,
+    RateGraph,
+)
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.mock_api.mock_web_server import MockWebServer
 from .fixture import Fixture
@@ -105,6 +108,32 @@ class RateOracleTest(unittest.TestCase):
         rate = find_rate(prices, "HBOT-GBP")
         self.assertEqual(rate, Decimal("75"))
 
+    def test_rate_graph(self):
+        prices = {"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50"), "USDT-GBP": Decimal("0.75"),
+                  "GBP-EUR": Decimal("1.2"), "ZBOT-EUR": Decimal("3"), "FOO-BAR-USDT": Decimal("1")}
+        graph = RateGraph(prices)
+        for pair in ("HBOT-USDT", "ZBOT-EUR", "USDT-HBOT", "HBOT-AAVE", "AAVE-HBOT", "HBOT-GBP", "USDT-USDT"):
+            self.assertEqual(find_rate(prices, pair), graph.find_rate(pair))
+        # Through several pairs, in either direction.
+        self.assertEqual(Decimal("100") * Decimal("0.75") * Decimal("1.2"), graph.find_rate("HBOT-EUR"))
+        self.assertEqual(Decimal("100") * Decimal("0.75") * Decimal("1.2") / Decimal("3"), graph.find_rate("HBOT-ZBOT"))
+        self.assertEqual(Decimal("3") / Decimal("1.2") / Decimal("0.75") / Decimal("50"), graph.find_rate("ZBOT-AAVE"))
+        self.assertIsNone(graph.find_rate("HBOT-FOO"))
+        # The search from a currency continues where the last lookup left it.
+        self.assertEqual(Decimal("1") / Decimal("100"), graph.find_rate("USDT-HBOT"))
+        self.assertEqual(Decimal("1") / Decimal("1.2") / Decimal("0.75") / Decimal("50"), graph.find_rate("EUR-AAVE"))
+        self.assertEqual(Decimal("1") / Decimal("3"), graph.find_rate("EUR-ZBOT"))
+
+    def test_rate_graph_rebuilt_for_new_prices(self):
+        prices = {"HBOT-USDT": Decimal("100"), "USDT-GBP": Decimal("0.75")}
+        self.assertEqual(Decimal("75"), RateOracle.find_rate(prices, "HBOT-GBP"))
+        rate_graph = RateOracle._rate_graph
+        self.assertEqual(Decimal("0.01"), RateOracle.find_rate(prices, "USDT-HBOT"))
+        self.assertIs(rate_graph, RateOracle._rate_graph)
+        new_prices = {"HBOT-USDT": Decimal("200"), "USDT-GBP": Decimal("0.75")}
+        self.assertEqual(Decimal("150"), RateOracle.find_rate(new_prices, "HBOT-GBP"))
+        self.assertIsNot(rate_graph, RateOracle._rate_graph)
+
     def test_get_binance_prices(self):
         self.ev_loop.run_until_complete(self._test_get_binance_prices())
 
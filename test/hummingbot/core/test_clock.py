@@ -2,14 +2,73 @@ import unittest
 import asyncio
 import pandas as pd
 import time
+from types import SimpleNamespace
+from typing import Callable
+from unittest.mock import patch
 
 from hummingbot.core.clock import (
     Clock,
-    ClockMode
+    ClockMode,
+    ClockOverrunPolicy,
 )
+from hummingbot.core.py_time_iterator import PyTimeIterator
 from hummingbot.core.time_iterator import TimeIterator
 
 
+class ScheduledPyTimeIterator(PyTimeIterator):
+    def __init__(self, wakeup_times):
+        super().__init__()
+        self.wakeup_times = list(wakeup_times)
+        self.timestamps = []
+
+    def tick(self, timestamp: float):
+        self.timestamps.append(timestamp)
+        while len(self.wakeup_times) > 0 and self.wakeup_times[0] <= timestamp:
+            self.wakeup_times.pop(0)
+
+    def next_wakeup_time(self, timestamp: float) -> float:
+        return self.wakeup_times[0] if len(self.wakeup_times) > 0 else float("nan")
+
+
+class SlowPyTimeIterator(PyTimeIterator):
+    def __init__(self, slow_ticks: int, tick_duration: float, delay: Callable[[float], None] = time.sleep):
+        super().__init__()
+        self.slow_ticks = slow_ticks
+        self.tick_duration = tick_duration
+        self.delay = delay
+        self.timestamps = []
+
+    def tick(self, timestamp: float):
+        self.timestamps.append(timestamp)
+        if len(self.timestamps) <= self.slow_ticks:
+            self.delay(self.tick_duration)
+
+
+class VirtualTime:
+    """
+    Time source for the clock and its tick profiler, which only moves when the clock sleeps or a tick is delayed.
+    """
+    def __init__(self, start_ns: int):
+        self.start_ns = start_ns
+        self.now_ns = start_ns
+
+    def time_ns(self) -> int:
+        return self.now_ns
+
+    def time(self) -> float:
+        return self.now_ns / 1e9
+
+    def perf_counter(self) -> float:
+        return (self.now_ns - self.start_ns) / 1e9
+
+    def advance(self, seconds: float):
+        self.now_ns += round(seconds * 1e9)
+
+    async def sleep(self, seconds: float):
+        self.advance(seconds)
+        await asyncio.sleep(0)
+
+
 class ClockUnitTest(unittest.TestCase):
 
     backtest_start_timestamp: float = pd.Timestamp("2021-01-01", tz="UTC").timestamp()
@@ -124,3 +183,108 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def test_sub_second_ticks_do_not_drift(self):
+        clock = Clock(ClockMode.BACKTEST, 0.1, self.backtest_start_timestamp, self.backtest_end_timestamp)
+        iterator = SlowPyTimeIterator(0, 0)
+        clock.add_iterator(iterator)
+        clock.backtest()
+
+        self.assertEqual(36000, len(iterator.timestamps))
+        self.assertEqual(self.backtest_start_timestamp + 1000.1, iterator.timestamps[10000])
+        self.assertEqual(self.backtest_end_timestamp, clock.current_timestamp)
+
+    def test_invalid_tick_size(self):
+        with self.assertRaises(ValueError):
+            Clock(ClockMode.BACKTEST, 0)
+
+    def run_slow_iterator(self, overrun_policy: ClockOverrunPolicy) -> (Clock, SlowPyTimeIterator):
+        virtual_time = VirtualTime(int(self.backtest_start_timestamp) * 10 ** 9)
+        with patch("hummingbot.core.clock.time", virtual_time), \
+                patch("hummingbot.core.clock.asyncio", SimpleNamespace(sleep=virtual_time.sleep)), \
+                patch("hummingbot.core.clock_tick_profiler.time", virtual_time):
+            clock = Clock(ClockMode.REALTIME, 0.1, overrun_policy=overrun_policy)
+
+            def delay(seconds: float):
+                virtual_time.advance(seconds)
+                # Waits for the watchdog to sample the slow tick, which it does once the tick is past the tick size.
+                profiler = clock.tick_profiler
+                deadline = time.time() + 5
+                while profiler._sampled_seq != profiler._active_seq and time.time() < deadline:
+                    time.sleep(0.001)
+
+            # The first tick takes more than three tick sizes.
+            iterator = SlowPyTimeIterator(1, 0.35, delay)
+            clock.add_iterator(iterator)
+            with clock:
+                self.ev_loop.run_until_complete(clock.run_til(virtual_time.time() + 0.9))
+        return clock, iterator
+
+    def test_overrun_skip(self):
+        clock, iterator = self.run_slow_iterator(ClockOverrunPolicy.SKIP)
+        profiler = clock.tick_profiler
+
+        self.assertEqual(1, profiler.overruns)
+        self.assertEqual(3, profiler.skipped_ticks)
+        self.assertEqual(0, profiler.late_ticks)
+        self.assertAlmostEqual(0.4, iterator.timestamps[1] - iterator.timestamps[0], places=5)
+        # The ticks after the slow one are on time, up to the end time.
+        self.assertEqual(6, len(iterator.timestamps))
+
+        stats = profiler.iterator_stats[0]
+        self.assertEqual("SlowPyTimeIterator", stats.name)
+        self.assertEqual(len(iterator.timestamps), stats.ticks)
+        self.assertAlmostEqual(0.35, stats.max_time, places=6)
+        self.assertEqual(1, stats.histogram[stats.BUCKET_BOUNDS_MS.index(500)])
+
+        worst_offender = profiler.worst_offender
+        self.assertEqual(iterator.timestamps[0], worst_offender.timestamp)
+        self.assertAlmostEqual(0.35, worst_offender.elapsed, places=6)
+        # The watchdog sampled the slow tick while it was delayed.
+        self.assertIn("self.delay(self.tick_duration)", "".join(worst_offender.stack))
+
+    def test_overrun_catch_up(self):
+        clock, iterator = self.run_slow_iterator(ClockOverrunPolicy.CATCH_UP)
+        profiler = clock.tick_profiler
+
+        self.assertEqual(1, profiler.overruns)
+        self.assertEqual(0, profiler.skipped_ticks)
+        self.assertEqual(3, profiler.late_ticks)
+        # Every tick is run, with its own timestamp.
+        self.assertEqual(9, len(iterator.timestamps))
+        for previous, current in zip(iterator.timestamps, iterator.timestamps[1:]):
+            self.assertAlmostEqual(0.1, current - previous, places=5)
+
+    def test_fast_forward(self):
+        start = self.backtest_start_timestamp
+        clock = Clock(ClockMode.BACKTEST, 1.0, start, self.backtest_end_timestamp, fast_forward=True)
+        # Wake-ups between ticks are rounded up to the next tick.
+        market = ScheduledPyTimeIterator([start + 10, start + 10.5, start + 600])
+        strategy = ScheduledPyTimeIterator([start + 300])
+        clock.add_iterator(market)
+        clock.add_iterator(strategy)
+        clock.backtest()
+
+        expected = [start + 10, start + 11, start + 300, start + 600, self.backtest_end_timestamp]
+        self.assertEqual(expected, market.timestamps)
+        self.assertEqual(expected, strategy.timestamps)
+        self.assertEqual(5, clock.ticks)
+        self.assertEqual(self.backtest_end_timestamp, clock.current_timestamp)
+
+    def test_fast_forward_ticks_every_step_by_default(self):
+        clock = Clock(ClockMode.BACKTEST, 1.0, self.backtest_start_timestamp, self.backtest_start_timestamp + 100,
+                      fast_forward=True)
+        time_iterator = TimeIterator()
+        clock.add_iterator(time_iterator)
+        clock.add_iterator(ScheduledPyTimeIterator([]))
+        clock.backtest()
+        self.assertEqual(100, clock.ticks)
+
+    def test_fast_forward_without_end_time(self):
+        start = self.backtest_start_timestamp
+        clock = Clock(ClockMode.BACKTEST, 1.0, start, float("nan"), fast_forward=True)
+        market = ScheduledPyTimeIterator([start + 5, start + 50])
+        clock.add_iterator(market)
+        # Stops once no iterator has anything scheduled.
+        clock.backtest()
+        self.assertEqual([start + 5, start + 50], market.timestamps)
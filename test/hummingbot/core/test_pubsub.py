@@ -89,6 +89,37 @@ class PubSubTest(unittest.TestCase):
         listeners = self.pubsub.get_listeners(self.event_tag_zero)
         self.assertEqual(0, len(listeners))
 
+    def test_lapsed_listener_pruned_by_weakref_callback(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.listener_zero = None  # remove strong reference
+        gc.collect()
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(2, self.listener_one.events_count)
+        self.assertEqual([self.listener_one], self.pubsub.get_listeners(self.event_tag_zero))
+
+    def test_listeners_change_during_trigger(self):
+        pubsub = self.pubsub
+        listener_one = self.listener_one
+
+        class RemovingListener(MockEventListener):
+            def __call__(self, event):
+                super().__call__(event)
+                pubsub.remove_listener(MockEventType.EVENT_ZERO, self)
+                pubsub.add_listener(MockEventType.EVENT_ZERO, listener_one)
+
+        removing_listener = RemovingListener()
+        self.pubsub.add_listener(self.event_tag_zero, removing_listener)
+        # The listeners added while dispatching are only called for the next events.
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(1, removing_listener.events_count)
+        self.assertEqual(0, self.listener_one.events_count)
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(1, removing_listener.events_count)
+        self.assertEqual(1, self.listener_one.events_count)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+
+from hummingbot.core.utils.import_profiler import (
+    format_import_profile,
+    package_import_times,
+    parse_import_times,
+    profile_imports,
+)
+
+IMPORT_TIME_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       200 |        200 |       aiohttp.helpers
+import time:      1000 |       1200 |     aiohttp
+import time:       500 |       1700 |   hummingbot.client.settings
+import time:       300 |        300 |       aiohttp.client
+import time:       100 |        400 |     hummingbot.core.utils.json_utils
+import time:        50 |        450 |   hummingbot.core.utils
+import time:        20 |       2170 | hummingbot.client
+"""
+
+
+class ImportProfilerTest(unittest.TestCase):
+
+    def test_parse_import_times(self):
+        import_times = parse_import_times(IMPORT_TIME_OUTPUT)
+        self.assertEqual(7, len(import_times))
+        self.assertEqual(("aiohttp", 0.001, 0.0012, 2, "hummingbot.client.settings"), import_times[1])
+        self.assertEqual("hummingbot.core.utils.json_utils", import_times[3].importer)
+        self.assertEqual("hummingbot.client", import_times[5].importer)
+        self.assertIsNone(import_times[6].importer)
+
+    def test_package_import_times(self):
+        packages = package_import_times(parse_import_times(IMPORT_TIME_OUTPUT))
+        self.assertAlmostEqual(0.0015, packages["aiohttp"][0])
+        self.assertEqual("hummingbot.client.settings", packages["aiohttp"][1])
+        self.assertAlmostEqual(0.00067, packages["hummingbot"][0])
+        self.assertIsNone(packages["hummingbot"][1])
+
+    def test_format_import_profile(self):
+        profile = format_import_profile(parse_import_times(IMPORT_TIME_OUTPUT))
+        self.assertIn("Imported 7 modules in 0.00 s.", profile)
+        self.assertIn(f"{'aiohttp':<40}{2:>10}  hummingbot.client.settings", profile)
+        self.assertIn(f"{'hummingbot.client.settings':<60}{0:>10}{2:>12}", profile)
+
+    def test_profile_imports(self):
+        modules = [import_time.module for import_time in profile_imports(["json"])]
+        self.assertIn("json", modules)
+        self.assertIn("json.decoder", modules)
+        with self.assertRaises(ImportError):
+            profile_imports(["hummingbot.no_such_module"])
@@ -0,0 +1,76 @@
+import asyncio
+import json
+import math
+import threading
+import unittest
+from decimal import Decimal
+from unittest.mock import patch
+
+from hummingbot.core.utils import json_utils
+from hummingbot.core.utils.json_utils import (
+    available_decoders,
+    decoder_name,
+    json_loads,
+    json_loads_async,
+    register_decoder,
+    use_decoder,
+)
+
+MESSAGE = '{"stream": "ethbtc@depth", "data": {"E": 1594871960959, "b": [["0.02548000", "1.50000000"]], ' \
+          '"a": [], "f": 0.1, "x": null, "m": true}}'
+
+
+class JsonUtilsTest(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.default_decoder = decoder_name()
+
+    def tearDown(self):
+        use_decoder(self.default_decoder)
+        super().tearDown()
+
+    def test_default_decoder(self):
+        self.assertIn("json", available_decoders())
+        self.assertEqual("orjson" if "orjson" in available_decoders() else "json", decoder_name())
+
+    def test_decoders_agree(self):
+        expected = json.loads(MESSAGE)
+        for name in available_decoders():
+            use_decoder(name)
+            self.assertEqual(expected, json_loads(MESSAGE), name)
+            self.assertEqual(expected, json_loads(MESSAGE.encode()), name)
+
+    def test_documents_rejected_by_decoder_are_decoded_by_json(self):
+        for name in available_decoders():
+            use_decoder(name)
+            self.assertEqual({"id": 2 ** 70}, json_loads('{"id": 1180591620717411303424}'))
+            self.assertTrue(math.isnan(json_loads('{"price": NaN}')["price"]))
+            with self.assertRaises(ValueError):
+                json_loads("pong")
+
+    def test_use_decoder(self):
+        register_decoder("decimal", lambda data: json.loads(data, parse_float=Decimal))
+        use_decoder("decimal")
+        self.assertEqual("decimal", decoder_name())
+        self.assertEqual({"f": Decimal("0.1")}, json_loads('{"f": 0.1}'))
+        with self.assertRaises(ValueError):
+            use_decoder("simdjson")
+        self.assertEqual("decimal", decoder_name())
+        del json_utils._decoders["decimal"]
+
+    def test_large_payloads_decoded_in_worker_thread(self):
+        decoding_threads = []
+
+        def decoder(data):
+            decoding_threads.append(threading.current_thread())
+            return json.loads(data)
+
+        register_decoder("test", decoder)
+        use_decoder("test")
+        ev_loop = asyncio.get_event_loop()
+        with patch.object(json_utils, "LARGE_PAYLOAD_SIZE", len(MESSAGE)):
+            self.assertEqual({}, ev_loop.run_until_complete(json_loads_async("{}")))
+            self.assertEqual(json.loads(MESSAGE), ev_loop.run_until_complete(json_loads_async(MESSAGE)))
+        self.assertIs(threading.main_thread(), decoding_threads[0])
+        self.assertIsNot(threading.main_thread(), decoding_threads[1])
+        del json_utils._decoders["test"]
@@ -95,3 +95,33 @@ class RingBufferTest(unittest.TestCase):
         value = Decimal(3.141592653)
         self.buffer.add_value(value)
         self.assertAlmostEqual(float(value), self.buffer.get_last_value(), 6)
+
+    def test_running_statistics_match_numpy(self):
+        np.random.seed(123456789)
+        samples = np.random.normal(100, 0.01, self.BUFFER_LENGTH * 10)
+        for i, sample in enumerate(samples):
+            self.buffer.add_value(sample)
+            window = samples[max(0, i + 1 - self.BUFFER_LENGTH):i + 1]
+            self.assertAlmostEqual(np.mean(window), self.buffer.running_mean, 10)
+            self.assertAlmostEqual(np.var(window), self.buffer.running_variance, 10)
+        self.assertAlmostEqual(np.std(samples[-self.BUFFER_LENGTH:]), self.buffer.std_dev, 10)
+
+    def test_running_statistics_recover_from_nan(self):
+        self.buffer.add_value(np.nan)
+        self.assertTrue(np.isnan(self.buffer.running_mean))
+        for i in range(self.BUFFER_LENGTH):
+            self.buffer.add_value(1)
+        self.assertEqual(1, self.buffer.mean_value)
+        self.assertEqual(0, self.buffer.variance)
+
+    def test_long_buffer(self):
+        length = 40000
+        buffer = RingBuffer(length)
+        for i in range(length + 10):
+            buffer.add_value(i)
+        values = buffer.get_as_numpy_array()
+        self.assertEqual(length, values.size)
+        self.assertEqual(10, values[0])
+        self.assertEqual(length + 9, values[-1])
+        self.assertEqual(10, buffer.get_first_value())
+        self.assertAlmostEqual(np.mean(values), buffer.mean_value, 6)
@@ -0,0 +1,23 @@
+import unittest
+import numpy as np
+import pandas as pd
+from hummingbot.strategy.__utils__.trailing_indicators.exponential_moving_average import \
+    ExponentialMovingAverageIndicator
+
+
+class ExponentialMovingAverageTest(unittest.TestCase):
+    INITIAL_RANDOM_SEED = 123456789
+    BUFFER_LENGTH = 30
+
+    def setUp(self) -> None:
+        np.random.seed(self.INITIAL_RANDOM_SEED)
+
+    def test_matches_pandas_ewm_over_sampling_window(self):
+        samples = np.random.normal(100, 1, self.BUFFER_LENGTH * 5)
+        indicator = ExponentialMovingAverageIndicator(self.BUFFER_LENGTH, 1)
+
+        for i, sample in enumerate(samples):
+            indicator.add_sample(sample)
+            window = samples[max(0, i + 1 - self.BUFFER_LENGTH):i + 1]
+            expected = pd.Series(window).ewm(span=self.BUFFER_LENGTH, adjust=True).mean().iloc[-1]
+            self.assertAlmostEqual(expected, indicator.current_value, 8)